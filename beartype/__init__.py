@@ -32,8 +32,15 @@ automation.
 
 # ....................{ IMPORTS                           }....................
 # Publicize the private @beartype._decor.beartype decorator as
-# @beartype.beartype, preserving all implementation details as private.
-from beartype._decor.main import beartype
+# @beartype.beartype and the private beartype._decor.beartype_all() and
+# beartype._decor.clear_protocol_types() functions as beartype.beartype_all()
+# and beartype.clear_protocol_types(), preserving all implementation details
+# as private.
+from beartype._decor.main import beartype, beartype_all, clear_protocol_types
+
+# Publicize the private beartype._decor.conf.BeartypeConf class as
+# beartype.BeartypeConf, configuring the @beartype decorator.
+from beartype._decor.conf import BeartypeConf
 
 # For PEP 8 compliance, versions constants expected by external automation are
 # imported under their PEP 8-mandated names.
@@ -62,7 +69,8 @@ For PEP 8 compliance, this specifier has the canonical name
 '''
 
 
-__all__ = ['beartype',]
+__all__ = [
+    'BeartypeConf', 'beartype', 'beartype_all', 'clear_protocol_types',]
 '''
 Special list global of the unqualified names of all public package attributes
 explicitly exported by and thus safely importable from this package.
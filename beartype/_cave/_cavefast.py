@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype fast cave** (i.e., private subset of the public :mod:`beartype.cave`
+submodule internally required by the :func:`beartype.beartype` decorator).
+
+This submodule declares *only* types trivially derivable from builtins and the
+stdlib :mod:`types` module, enabling the :func:`beartype.beartype` decorator to
+access these types *without* importing the public :mod:`beartype.cave`
+submodule, whose optional third-party dependencies (e.g., :mod:`numpy`,
+:mod:`pkg_resources`) are comparatively expensive to import. The
+:mod:`beartype.cave` submodule then imports these types from this submodule
+for importation as public types by downstream callers.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype.roar import BeartypeCallUnavailableTypeException
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
+from types import (
+    CodeType,
+    FunctionType as _FunctionType,
+    ModuleType as _ModuleType,
+)
+from typing import Any
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ TYPES ~ unavailable               }....................
+# Unavailable types are defined *BEFORE* any subsequent types, as the latter
+# commonly leverage the former.
+
+class UnavailableType(object):
+    '''
+    **Unavailable type** (i.e., type *not* available under the active Python
+    interpreter, typically due to insufficient Python version or non-installed
+    third-party dependencies).
+    '''
+
+    def __instancecheck__(self, obj) -> None:
+        raise BeartypeCallUnavailableTypeException(
+            f'{self} not passable as the second parameter to isinstance().')
+
+    def __subclasscheck__(self, cls) -> None:
+        raise BeartypeCallUnavailableTypeException(
+            f'{self} not passable as the second parameter to issubclass().')
+
+# ....................{ TYPES ~ core                      }....................
+NoneType: Any = type(None)
+'''
+Type of the ``None`` singleton.
+
+See Also
+----------
+:class:`beartype.cave.NoneType`
+    Further details.
+'''
+
+# ....................{ TYPES ~ py                        }....................
+ModuleType = _ModuleType
+'''
+Type of all **C- and Python-based modules** (i.e., importable files implemented
+either as C extensions or in pure Python).
+'''
+
+# ....................{ TYPES ~ call                      }....................
+CallableCodeObjectType: Any = CodeType
+'''
+Type of all **code objects** (i.e., C-based objects underlying all pure-Python
+callables to which those callables are compiled for efficiency).
+'''
+
+
+FunctionType = _FunctionType
+'''
+Type of all **pure-Python functions** (i.e., functions implemented in Python
+*not* associated with an owning class or instance of a class).
+
+See Also
+----------
+:class:`beartype.cave.FunctionType`
+    Further details.
+'''
+
+# ....................{ TYPES ~ hint                      }....................
+HintGenericSubscriptedType: Any = UnavailableType
+'''
+C-based type of all subscripted generics if the active Python interpreter
+targets Python >= 3.9 *or* :class:`UnavailableType` otherwise.
+
+See Also
+----------
+:class:`beartype.cave.HintGenericSubscriptedType`
+    Further details.
+'''
+
+# If the active Python interpreter targets at least Python >= 3.9 and thus
+# supports PEP 585, correctly declare this type.
+if IS_PYTHON_AT_LEAST_3_9:
+    HintGenericSubscriptedType = type(list[str])  # type: ignore[misc]
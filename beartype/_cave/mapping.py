@@ -34,7 +34,7 @@ from beartype.roar import (
 )
 from beartype._util.hint.nonpep.utilhintnonpeptest import (
     die_unless_hint_nonpep)
-from typing import Union, Optional
+from typing import Any, Optional, Union
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -188,3 +188,21 @@ class _NoneTypeOrType(dict):
         # the passed missing key to this new tuple of types by effectively:
         #     self[hint] = hint_or_none
         return hint_or_none
+
+# ....................{ SINGLETONS                        }....................
+NoneTypeOr: Any = _NoneTypeOrType()
+'''
+:class:`NoneType` **tuple factory** (i.e., dictionary mapping from arbitrary
+types or tuples of types to the same types or tuples of types concatenated with
+the type of the ``None`` singleton).
+
+This singleton is defined here rather than in the public :mod:`beartype.cave`
+submodule to enable the :func:`beartype.beartype` decorator to access this
+singleton *without* importing that submodule, which then imports this
+singleton for importation as a public attribute by downstream callers.
+
+See Also
+----------
+:class:`beartype.cave.NoneTypeOr`
+    Full documentation for this singleton.
+'''
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype record field checker cache** (i.e., weak dictionary mapping from
+each **record** (i.e., :class:`typing.NamedTuple` subclass or dataclass)
+deeply type-checked by wrapper functions generated by the
+:func:`beartype.beartype` decorator to a callable type-checking all annotated
+fields of instances of that record).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype.roar import BeartypeCallHintPepParamException
+from beartype._decor._cache.cacheglobal import register_wrapper_global
+from beartype._util.cls.utilclsrecord import (
+    get_type_record_field_hints,
+    is_type_record,
+)
+from threading import local
+from typing import Callable, Set
+from weakref import WeakKeyDictionary
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+IS_RECORD_FIELDS_VALID_NAME = '__beartype_is_record_fields_valid'
+'''
+Name of the global variable referring to the :func:`is_record_fields_valid`
+tester in the bodies of wrapper functions generated by the
+:func:`beartype.beartype` decorator.
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_FIELDS_CHECKER_NAME = '__beartype_check_fields'
+'''
+Unqualified name of each **fields checker** (i.e., synthetic callable
+accepting one parameter for each annotated field of a record, annotated by the
+type hint annotating that field) decorated by the :func:`beartype.beartype`
+decorator.
+'''
+
+
+_FIELDS_VALIDATOR_CODE = '''
+def is_fields_valid(record, __beartype_check_fields=__beartype_check_fields):
+    try:
+        __beartype_check_fields({fields_expr})
+    except BeartypeCallHintPepParamException:
+        return False
+    return True
+'''
+'''
+Code snippet declaring a **fields validator** (i.e., callable returning
+``True`` only if all annotated fields of the passed record satisfy the type
+hints annotating those fields), deferring to the beartyped fields checker of
+that record.
+
+This snippet expects to be formatted with these named interpolations:
+
+* ``{fields_expr}``, a comma-delimited list of Python expressions accessing
+  each annotated field of the passed record (e.g., ``record.x, record.y``).
+'''
+
+# ....................{ PRIVATE ~ mappings                }....................
+_TYPE_RECORD_TO_IS_FIELDS_VALID: 'WeakKeyDictionary[type, Callable]' = (
+    WeakKeyDictionary())
+'''
+**Fields validator cache** (i.e., weak dictionary mapping from the type of
+each record previously passed to the :func:`is_record_fields_valid` tester to
+the fields validator compiled for that type).
+
+This dictionary is weak to avoid preventing records dynamically defined at
+runtime (e.g., in closures) from being garbage-collected.
+'''
+
+
+_RECORD_IDS_VALIDATING = local()
+'''
+**Record validation stack** (i.e., thread-local object whose ``ids``
+attribute, if set, is the set of the object identifiers of all records whose
+fields are currently being type-checked by the current thread).
+
+This stack enables the :func:`is_record_fields_valid` tester and the
+type-checking error handler describing invalid record fields to terminate on
+**self-referential records** (i.e., records directly or indirectly containing
+themselves, e.g., a tree node whose parent field refers to that node), which
+would otherwise recurse infinitely. This stack is thread-local to avoid one
+thread erroneously skipping records currently being validated by another.
+'''
+
+# ....................{ GETTERS                           }....................
+def get_record_ids_validating() -> Set[int]:
+    '''
+    Set of the object identifiers of all records whose fields are currently
+    being type-checked by the current thread.
+
+    Callers type-checking the fields of a record should add the identifier of
+    that record to this set before doing so and remove that identifier after
+    doing so, treating a record whose identifier is already in this set as
+    valid. Since that record is already being type-checked by a parent call,
+    deferring to that call preserves correctness.
+
+    Returns
+    ----------
+    Set[int]
+        Set of these identifiers.
+    '''
+
+    # Set of these identifiers if previously created by this thread *OR*
+    # "None" otherwise.
+    record_ids = getattr(_RECORD_IDS_VALIDATING, 'ids', None)
+
+    # If this thread has yet to create this set, do so.
+    if record_ids is None:
+        record_ids = _RECORD_IDS_VALIDATING.ids = set()
+
+    # Return this set.
+    return record_ids
+
+# ....................{ TESTERS                           }....................
+def is_record_fields_valid(record: object) -> bool:
+    '''
+    ``True`` only if all annotated fields declared by the type of the passed
+    **record** (i.e., instance of a :class:`typing.NamedTuple` subclass or
+    dataclass) satisfy the type hints annotating those fields.
+
+    This tester is called by wrapper functions generated by the
+    :func:`beartype.beartype` decorator under configurations enabling the
+    :attr:`beartype.BeartypeConf.is_check_fields` option *after* those
+    functions have already validated this record to be an instance of the
+    class annotating this record. This tester compiles the fields validator
+    for the type of this record on the first call passed an instance of that
+    type and reduces to a dictionary lookup and a call to that validator on
+    each subsequent such call.
+
+    This tester intentionally dispatches on the type of this record rather
+    than the class annotating this record, which may be a superclass of that
+    type. Doing so type-checks *all* annotated fields of records passed where
+    a record superclass is expected, including fields declared only by
+    subclasses of that superclass.
+
+    This tester also intentionally treats records currently being validated
+    by a parent call in the current thread as valid, terminating on
+    **self-referential records** (e.g., a tree node whose parent field refers
+    to that node) that would otherwise recurse infinitely.
+
+    Parameters
+    ----------
+    record : object
+        Record to be type-checked. If the type of this object is *not* a
+        record (e.g., as an instance of the class referred to by a forward
+        reference whose referent was unknown at decoration time), this tester
+        trivially reduces to a noop returning ``True``.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if all annotated fields of this record are valid.
+    '''
+
+    # Type of this record.
+    cls = record.__class__
+
+    # Fields validator previously compiled for this type if any *OR* "None".
+    is_fields_valid = _TYPE_RECORD_TO_IS_FIELDS_VALID.get(cls)
+
+    # If this class has yet to be validated, compile and cache this validator.
+    #
+    # Note that this is technically non-thread-safe, as multiple threads could
+    # concurrently compile multiple validators for the same class. Since each
+    # such validator is functionally equivalent and compiling a validator is
+    # idempotent, this race is harmless and thus permitted for efficiency.
+    if is_fields_valid is None:
+        is_fields_valid = _TYPE_RECORD_TO_IS_FIELDS_VALID[cls] = (
+            _make_is_fields_valid(cls))
+
+    # If this validator trivially validates all records, return true.
+    if is_fields_valid is _is_fields_valid_trivially:
+        return True
+    # Else, this validator type-checks one or more fields.
+
+    # Set of the identifiers of all records currently being validated by this
+    # thread and the identifier of this record.
+    record_ids = get_record_ids_validating()
+    record_id = id(record)
+
+    # If this record is currently being validated by a parent call, this
+    # record is self-referential. In this case, defer to that call.
+    if record_id in record_ids:
+        return True
+    # Else, this record is *NOT* currently being validated.
+
+    # Return true only if all annotated fields of this record are valid,
+    # recording this record as currently being validated while doing so.
+    record_ids.add(record_id)
+    try:
+        return is_fields_valid(record)
+    finally:
+        record_ids.discard(record_id)
+
+# ....................{ PRIVATE ~ factories               }....................
+def _is_fields_valid_trivially(record: object) -> bool:
+    '''
+    Fields validator trivially validating *all* objects, compiled for classes
+    that are either *not* records *or* records declaring *no* unignorable
+    annotated fields.
+    '''
+
+    return True
+
+
+def _make_is_fields_valid(cls: type) -> Callable[[object], bool]:
+    '''
+    Fields validator type-checking all annotated fields of instances of the
+    passed class.
+
+    Parameters
+    ----------
+    cls : type
+        Class to compile this validator for.
+
+    Returns
+    ----------
+    Callable[[object], bool]
+        Fields validator for this record.
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._decor.conf import BeartypeConf
+    from beartype._decor.main import beartype
+
+    # If this class is *NOT* a record, trivially succeed.
+    if not is_type_record(cls):
+        return _is_fields_valid_trivially
+    # Else, this class is a record.
+
+    # Tuple of the names and hints of all annotated fields of this record.
+    field_names_hints = get_type_record_field_hints(cls)
+
+    # If this record declares no annotated fields, trivially succeed.
+    if not field_names_hints:
+        return _is_fields_valid_trivially
+    # Else, this record declares one or more annotated fields.
+
+    # Synthetic fields checker accepting one parameter named after each
+    # annotated field of this record.
+    check_fields_locals = {}
+    exec(
+        f'def {_FIELDS_CHECKER_NAME}('
+        f'{", ".join(field_name for field_name, _ in field_names_hints)}): '
+        f'pass',
+        {},
+        check_fields_locals,
+    )
+    check_fields = check_fields_locals[_FIELDS_CHECKER_NAME]
+
+    # Annotate each such parameter by the hint annotating this field. Also
+    # associate this checker with the module declaring this record, enabling
+    # relative forward references in these hints to be resolved against that
+    # module.
+    check_fields.__annotations__ = dict(field_names_hints)
+    check_fields.__module__ = cls.__module__
+    check_fields.__qualname__ = f'{cls.__qualname__}.{_FIELDS_CHECKER_NAME}'
+
+    # Decorate this checker, deeply type-checking records nested in these
+    # fields as well.
+    check_fields_beartyped = beartype(
+        check_fields, conf=BeartypeConf(is_check_fields=True))
+
+    # If all these hints are ignorable, this checker is undecorated. In this
+    # case, trivially succeed.
+    if check_fields_beartyped is check_fields:
+        return _is_fields_valid_trivially
+    # Else, one or more of these hints are unignorable.
+
+    # Compile a validator deferring to this checker.
+    is_fields_valid_locals = {}
+    exec(
+        _FIELDS_VALIDATOR_CODE.format(fields_expr=', '.join(
+            f'record.{field_name}' for field_name, _ in field_names_hints)),
+        {
+            _FIELDS_CHECKER_NAME: check_fields_beartyped,
+            'BeartypeCallHintPepParamException': (
+                BeartypeCallHintPepParamException),
+        },
+        is_fields_valid_locals,
+    )
+
+    # Return this validator.
+    return is_fields_valid_locals['is_fields_valid']
+
+# ....................{ REGISTRATION                      }....................
+# Expose this tester as a global to wrapper functions. See the
+# "beartype._decor._cache.cacheglobal" submodule for further details.
+register_wrapper_global(
+    IS_RECORD_FIELDS_VALID_NAME, is_record_fields_valid)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype wrapper global scope** (i.e., dictionary mapping from the name to
+value of all attributes accessed as globals in the bodies of wrapper
+functions generated by the :func:`beartype.beartype` decorator).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from typing import Dict
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ GLOBALS                           }....................
+wrapper_globals: Dict[str, object] = {}
+'''
+**Wrapper global scope** (i.e., dictionary mapping from the name to value of
+all attributes accessed as globals in the bodies of wrapper functions
+generated by the :func:`beartype.beartype` decorator), shared as the global
+scope of *all* such functions.
+
+Since these functions access this dictionary by reference, attributes
+registered with this dictionary *after* these functions are created remain
+accessible to these functions. Submodules defining attributes accessed only by
+code type-checking comparatively uncommon hints (e.g., unions dispatched on
+the types of objects, typed dictionaries) thus register these attributes on
+their first importation, which the code generator defers until first
+generating code accessing these attributes. Since the
+:mod:`beartype._decor.main` submodule registers all other attributes on its
+importation, *all* attributes accessed by a wrapper function are guaranteed to
+be registered by the time that function is created.
+'''
+
+# ....................{ REGISTRARS                        }....................
+def register_wrapper_global(name: str, value: object) -> None:
+    '''
+    Register the passed attribute under the passed name with the
+    :data:`wrapper_globals` dictionary, exposing this attribute as a global
+    to all wrapper functions generated by the :func:`beartype.beartype`
+    decorator.
+
+    Parameters
+    ----------
+    name : str
+        Name of this global, which *must* be prefixed by ``__beartype_`` to
+        avoid colliding with the names of arbitrary caller-defined
+        parameters.
+    value : object
+        Value of this global.
+    '''
+    assert isinstance(name, str), f'{repr(name)} not string.'
+    assert name.startswith('__beartype_'), (
+        f'Wrapper global name "{name}" not prefixed by "__beartype_".')
+    assert wrapper_globals.get(name, value) is value, (
+        f'Wrapper global "{name}" already registered as '
+        f'{repr(wrapper_globals[name])}.')
+
+    # Register this global.
+    wrapper_globals[name] = value
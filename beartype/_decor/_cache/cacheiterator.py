@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype iterator proxier cache** (i.e., singleton dictionary mapping from
+strings uniquely identifying each **iterator hint** (i.e., subscription of
+either :class:`typing.Iterator`, :class:`typing.Iterable`, or
+:class:`typing.Generator` *or* the :mod:`collections.abc` equivalents of those
+hints) annotating a parameter or return value of a callable decorated by the
+:func:`beartype.beartype` decorator under configurations enabling the
+:attr:`beartype.BeartypeConf.is_proxy_iterators` option to a callable
+replacing iterators by proxies lazily type-checking their items against that
+hint).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype.roar import (
+    BeartypeCallHintPepParamException,
+    BeartypeCallHintPepReturnException,
+)
+from beartype._decor._cache.cacheglobal import register_wrapper_global
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.cls.utilclsrecord import is_type_record
+from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
+    HINT_PEP484_BASE_FORWARDREF)
+from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_ITERATOR)
+from beartype._util.hint.pep.utilhintpepget import (
+    get_hint_pep_args,
+    get_hint_pep_sign,
+)
+from beartype._util.hint.pep.utilhintpeptest import is_hint_pep
+from beartype._util.text.utiltextlabel import (
+    label_callable_decorated_param,
+    label_callable_decorated_return,
+)
+from collections.abc import (
+    Generator as _Generator,
+    Iterator as _Iterator,
+    Sequence as _Sequence,
+)
+from random import getrandbits
+from threading import Lock
+from typing import Callable, Dict, Generator, Iterator, Optional, Tuple
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+ITERATOR_PROXIERS_NAME = '__beartype_iterator_proxiers'
+'''
+Name of the global variable referring to the :data:`iterator_proxiers`
+singleton in the bodies of wrapper functions generated by the
+:func:`beartype.beartype` decorator.
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_ITEM_CHECKER_NAME = '__beartype_check_item'
+'''
+Unqualified name of each **item checker** (i.e., synthetic callable accepting
+one parameter annotated by the type hint constraining the items of an
+iterator) decorated by the :func:`beartype.beartype` decorator.
+'''
+
+
+_PROXIER_NAME_FIELDS_SUFFIX = '?fields'
+'''
+Substring suffixing the names of all proxiers deeply type-checking annotated
+fields of records yielded by iterators, distinguishing these names from those
+of proxiers shallowly type-checking these records.
+'''
+
+# ....................{ PRIVATE ~ mappings                }....................
+_PROXIER_NAME_TO_HINT_CONF: Dict[
+    str, Tuple[object, bool, Optional[str]]] = {}
+'''
+Dictionary mapping from the name of each iterator proxier registered by the
+:func:`register_iterator_proxier` function to a 3-tuple ``(hint,
+is_check_fields, module_name)`` of the iterator hint, record field checking
+flag, and fully-qualified name of the module relative to which forward
+references in that hint are resolved that proxier is to be compiled for on
+first access.
+'''
+
+# ....................{ TESTERS                           }....................
+def is_hint_iterator_proxiable(hint: object) -> bool:
+    '''
+    ``True`` only if the passed type hint is a **proxiable iterator hint**
+    (i.e., subscription of either :class:`typing.Iterator`,
+    :class:`typing.Iterable`, or :class:`typing.Generator` *or* the
+    :mod:`collections.abc` equivalents of those hints whose first subscripted
+    argument is unignorable).
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as this tester is only called once
+    for each decorated parameter or return value.
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this hint is a proxiable iterator hint.
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.utilhinttest import is_hint_ignorable
+
+    # If this hint is *NOT* an iterator hint, return false.
+    if not (is_hint_pep(hint) and get_hint_pep_sign(hint) in (
+        HINT_PEP_SIGNS_ITERATOR)):
+        return False
+    # Else, this hint is an iterator hint.
+
+    # Tuple of all arguments subscripting this hint.
+    hint_args = get_hint_pep_args(hint)
+
+    # Return true only if this hint is subscripted by an unignorable item hint.
+    return bool(hint_args) and not is_hint_ignorable(hint_args[0])
+
+# ....................{ REGISTRARS                        }....................
+@callable_cached
+def register_iterator_proxier(
+    hint: object, is_check_fields: bool, module_name: Optional[str]) -> str:
+    '''
+    Register the passed **proxiable iterator hint** (i.e., type hint
+    satisfying the :func:`is_hint_iterator_proxiable` tester) with the
+    :data:`iterator_proxiers` singleton *and* return a Python expression
+    evaluating to the proxier replacing iterators annotated by this hint when
+    accessed from the body of a wrapper function generated by the
+    :func:`beartype.beartype` decorator.
+
+    The proxier this expression evaluates to accepts exactly three
+    parameters:
+
+    * ``pith``, the iterator to be proxied.
+    * ``func``, the decorated callable accepting or returning this iterator.
+    * ``pith_name``, either the name of the parameter passing this iterator
+      *or* ``return`` if this iterator is returned.
+
+    This function is memoized for both efficiency *and* safety, preventing
+    accidental reregistration.
+
+    Parameters
+    ----------
+    hint : object
+        Proxiable iterator hint to be registered.
+    is_check_fields : bool
+        ``True`` only if the proxier deeply type-checks all annotated fields
+        of records yielded by these iterators.
+    module_name : Optional[str]
+        Fully-qualified name of the module declaring the decorated callable
+        annotated by this hint, relative to which forward references in this
+        hint are resolved, if any *or* ``None`` otherwise.
+
+    Returns
+    ----------
+    str
+        Python expression evaluating to this proxier.
+    '''
+    assert isinstance(is_check_fields, bool), (
+        f'{repr(is_check_fields)} not boolean.')
+
+    # Name of this proxier, defaulting to the machine-readable representation
+    # of this hint suffixed by a substring identifying deep proxiers.
+    proxier_name_prefix = repr(hint)
+    if is_check_fields:
+        proxier_name_prefix += _PROXIER_NAME_FIELDS_SUFFIX
+    proxier_name = proxier_name_prefix
+
+    # Register this hint under this name, uniquifying this name by an integer
+    # suffix if this name was previously registered. Since this function is
+    # memoized, this only occurs when either distinct hints share the same
+    # representation *OR* the same hint annotates callables declared by
+    # different modules.
+    with _iterator_proxiers_lock:
+        proxier_name_suffix = 1
+        while proxier_name in _PROXIER_NAME_TO_HINT_CONF:
+            proxier_name_suffix += 1
+            proxier_name = f'{proxier_name_prefix}#{proxier_name_suffix}'
+        _PROXIER_NAME_TO_HINT_CONF[proxier_name] = (
+            hint, is_check_fields, module_name)
+
+    # Return a Python expression evaluating to this proxier.
+    return f'{ITERATOR_PROXIERS_NAME}[{repr(proxier_name)}]'
+
+# ....................{ CLASSES                           }....................
+class IteratorProxiers(dict):
+    '''
+    **Iterator proxier cache** (i.e., singleton dictionary mapping from the
+    names of all iterator proxiers registered by the
+    :func:`register_iterator_proxier` function to those proxiers).
+
+    This dictionary lazily compiles each proxier on the first attempt to
+    access that proxier by defining a :meth:`__missing__` dunder method.
+    Deferring compilation until call time enables iterator hints to be
+    subscripted by forward references to classes that have yet to be defined
+    at decoration time.
+    '''
+
+    # ..................{ DUNDERS                           }..................
+    def __missing__(self, proxier_name: str) -> Callable:
+        '''
+        Dunder method explicitly called by the superclass
+        :meth:`dict.__getitem__` method implicitly called on getting the
+        passed missing key with ``[``- and ``]``-delimited syntax.
+
+        This method compiles and caches the proxier with this name.
+
+        Parameters
+        ----------
+        proxier_name : str
+            Name of the proxier to be compiled.
+
+        Returns
+        ----------
+        Callable
+            Proxier with this name.
+        '''
+
+        # Iterator hint, flag, and module name this proxier was registered
+        # with.
+        hint, is_check_fields, module_name = _PROXIER_NAME_TO_HINT_CONF[
+            proxier_name]
+
+        # Compile and cache this proxier.
+        #
+        # Note that this is technically non-thread-safe, as multiple threads
+        # could concurrently compile multiple proxiers for the same name.
+        # Since each such proxier is functionally equivalent and compiling a
+        # proxier is idempotent, this race is harmless and thus permitted.
+        proxier = self[proxier_name] = _make_proxy_iterator(
+            hint, is_check_fields, module_name)
+
+        # Return this proxier.
+        return proxier
+
+
+class GeneratorProxy(object):
+    '''
+    **Generator proxy** (i.e., object wrapping a generator annotated by a
+    subscription of the :class:`typing.Generator` type hint, type-checking
+    each item yielded by that generator as that item is consumed).
+
+    Unlike the :func:`map` builtin that iterator proxies defer to, this proxy
+    also forwards the :meth:`send`, :meth:`throw`, and :meth:`close` methods
+    to that generator and thus satisfies the
+    :class:`collections.abc.Generator` protocol.
+
+    Attributes (Private)
+    ----------
+    _check_item : Callable[[object], object]
+        Item checker returning the passed item as is if that item satisfies
+        the hint constraining the items of this generator *or* raising an
+        exception otherwise.
+    _generator : Generator
+        Generator to be proxied.
+    '''
+
+    # ..................{ CLASS VARIABLES                   }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables.
+    __slots__ = ('_check_item', '_generator')
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(
+        self,
+        generator: _Generator,
+        check_item: Callable[[object], object],
+    ) -> None:
+
+        self._check_item = check_item
+        self._generator = generator
+
+    # ..................{ DUNDERS                           }..................
+    def __iter__(self) -> 'GeneratorProxy':
+        return self
+
+
+    def __next__(self) -> object:
+        return self._check_item(next(self._generator))
+
+    # ..................{ GENERATORS                        }..................
+    def send(self, value: object) -> object:
+        return self._check_item(self._generator.send(value))
+
+
+    def throw(self, *args) -> object:
+        return self._check_item(self._generator.throw(*args))
+
+
+    def close(self) -> None:
+        self._generator.close()
+
+# ....................{ PRIVATE ~ raisers                 }....................
+def _raise_item_exception(
+    func: Callable,
+    pith_name: str,
+    hint: object,
+    item_hint: object,
+    item: object,
+    is_check_fields: bool,
+) -> None:
+    '''
+    Raise a human-readable exception detailing the failure of the passed item
+    yielded by an iterator passed as the parameter with the passed name *or*
+    returned if this name is ``return`` from the passed decorated callable to
+    satisfy the passed item hint constraining the items of that iterator.
+
+    Parameters
+    ----------
+    func : Callable
+        Decorated callable to raise this exception from.
+    pith_name : str
+        Either the name of the parameter passing this iterator *or* ``return``
+        if this iterator was returned.
+    hint : object
+        Iterator hint annotating this parameter or return value.
+    item_hint : object
+        Type hint constraining the items of this iterator.
+    item : object
+        Item violating this item hint.
+    is_check_fields : bool
+        ``True`` only if the annotated fields of records in this item were
+        type-checked.
+
+    Raises
+    ----------
+    BeartypeCallHintPepParamException
+        If this iterator was passed as a parameter.
+    BeartypeCallHintPepReturnException
+        If this iterator was returned.
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+    from beartype._util.text.utiltextmunge import suffix_unless_suffixed
+    from beartype._util.text.utiltextrepr import get_object_representation
+
+    # Type of exception to be raised and human-readable label describing this
+    # parameter or return value.
+    exception_cls: type = None  # type: ignore[assignment]
+    pith_label: str = None  # type: ignore[assignment]
+    if pith_name == 'return':
+        exception_cls = BeartypeCallHintPepReturnException
+        pith_label = label_callable_decorated_return(func).rstrip()
+    else:
+        exception_cls = BeartypeCallHintPepParamException
+        pith_label = label_callable_decorated_param(func, pith_name)
+
+    # Human-readable label describing this item.
+    item_label = (
+        f'{pith_label} {repr(hint)} item {get_object_representation(item)}')
+
+    # Human-readable string describing the failure of this item to satisfy
+    # this item hint. Since the item checker that rejected this item may have
+    # type-checked only a pseudo-randomly selected subset of this item, this
+    # sleuth exhaustively type-checks this item.
+    exception_cause = CauseSleuth(
+        func=func,
+        pith=item,
+        hint=item_hint,
+        cause_indent='',
+        exception_label=item_label,
+        random_int=None,
+        is_check_fields=is_check_fields,
+    ).get_cause_or_none()
+
+    # Raise an exception embedding this cause.
+    raise exception_cls(  # type: ignore[misc]
+        f'{item_label} violates type hint {repr(item_hint)}' + (
+            f', as {suffix_unless_suffixed(text=exception_cause, suffix=".")}'
+            if exception_cause else
+            '.'
+        )
+    )
+
+# ....................{ PRIVATE ~ factories               }....................
+def _make_proxy_iterator(
+    hint: object,
+    is_check_fields: bool,
+    module_name: Optional[str],
+) -> Callable[[object, Callable, str], object]:
+    '''
+    Iterator proxier replacing iterators annotated by the passed proxiable
+    iterator hint by proxies type-checking each item of these iterators as
+    that item is consumed.
+
+    Parameters
+    ----------
+    hint : object
+        Proxiable iterator hint to compile this proxier for.
+    is_check_fields : bool
+        ``True`` only if this proxier deeply type-checks all annotated fields
+        of records yielded by these iterators.
+    module_name : Optional[str]
+        Fully-qualified name of the module relative to which forward
+        references in this hint are resolved if any *or* ``None`` otherwise.
+
+    Returns
+    ----------
+    Callable[[object, Callable, str], object]
+        Iterator proxier for this hint.
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._decor.conf import BeartypeConf
+    from beartype._decor.main import beartype
+
+    # Sign uniquely identifying this hint.
+    hint_sign = get_hint_pep_sign(hint)
+
+    # Type hint constraining the items of these iterators.
+    item_hint = get_hint_pep_args(hint)[0]
+
+    # If this item hint is a PEP 585-compliant forward reference (e.g., the
+    # "'MuhClass'" in "collections.abc.Iterator['MuhClass']"), coerce this
+    # string into a PEP 484-compliant forward reference. Annotating the
+    # synthetic item checker defined below by this string would otherwise
+    # erroneously imply that checker to be postponed under PEP 563.
+    if isinstance(item_hint, str):
+        item_hint = HINT_PEP484_BASE_FORWARDREF(item_hint)
+
+    # Callable returning the passed item as is if that item satisfies this
+    # item hint *OR* raising an exception otherwise, to be defined below.
+    make_check_item: Callable[[Callable, str], Callable[[object], object]] = (
+        None)  # type: ignore[assignment]
+
+    # If this item hint is a PEP-noncompliant class *NOT* requiring deeper
+    # type-checking, type-check each item with a single isinstance() call.
+    # Combined with the C-based map() builtin deferred to below, this fast
+    # path type-checks each valid item with only a single Python frame.
+    if (
+        isinstance(item_hint, type) and
+        not is_hint_pep(item_hint) and
+        not (is_check_fields and is_type_record(item_hint))
+    ):
+        def make_check_item(func, pith_name):
+            def check_item(item):
+                if isinstance(item, item_hint):
+                    return item
+                _raise_item_exception(
+                    func, pith_name, hint, item_hint, item, is_check_fields)
+            return check_item
+    # Else, this item hint requires deeper type-checking. In this case, defer
+    # to a synthetic item checker decorated by @beartype.
+    else:
+        # Synthetic item checker accepting one parameter.
+        def check_item_beartyped(item):
+            pass
+
+        # Annotate this parameter by this item hint. Also associate this
+        # checker with the module declaring the decorated callable, enabling
+        # relative forward references in this hint to be resolved against
+        # that module.
+        check_item_beartyped.__annotations__ = {'item': item_hint}
+        check_item_beartyped.__module__ = module_name
+        check_item_beartyped.__name__ = _ITEM_CHECKER_NAME
+        check_item_beartyped.__qualname__ = _ITEM_CHECKER_NAME
+        check_item_beartyped = beartype(
+            check_item_beartyped,
+            conf=BeartypeConf(is_check_fields=is_check_fields),
+        )
+
+        def make_check_item(func, pith_name):
+            def check_item(item):
+                try:
+                    check_item_beartyped(item)
+                except BeartypeCallHintPepParamException:
+                    _raise_item_exception(
+                        func, pith_name, hint, item_hint, item,
+                        is_check_fields)
+                return item
+            return check_item
+
+    # If this hint is a generator hint, proxy generators with generator
+    # proxies preserving the generator API.
+    if hint_sign in _HINT_SIGNS_GENERATOR:
+        def proxy_iterator(pith, func, pith_name):
+            return GeneratorProxy(pith, make_check_item(func, pith_name))
+    # Else if this hint is an iterator hint, proxy iterators with the C-based
+    # map() builtin.
+    elif hint_sign in _HINT_SIGNS_ITERATOR:
+        def proxy_iterator(pith, func, pith_name):
+            return map(make_check_item(func, pith_name), pith)
+    # Else, this hint is an iterable hint. Since iterables that are *NOT*
+    # iterators are reiterable containers (e.g., lists) whose identities and
+    # APIs callers expect to be preserved, proxy only iterators. Instead,
+    # type-check a single pseudo-randomly indexed item of each non-empty
+    # sequence in constant time, mirroring the code generated for sequence
+    # hints. Other reiterable containers (e.g., sets, dictionaries) are
+    # *NOT* indexable and thus passed as is.
+    else:
+        def proxy_iterator(pith, func, pith_name):
+            if isinstance(pith, _Iterator):
+                return map(make_check_item(func, pith_name), pith)
+            elif isinstance(pith, _Sequence) and pith:
+                make_check_item(func, pith_name)(
+                    pith[getrandbits(32) % len(pith)])
+            return pith
+
+    # Return this proxier.
+    return proxy_iterator
+
+# ....................{ PRIVATE ~ sets                    }....................
+# Note that the "collections.abc" signs below are signs only under Python >=
+# 3.9, but are harmlessly included under older Python versions as well.
+_HINT_SIGNS_GENERATOR = frozenset((_Generator, Generator))
+'''
+Frozen set of all **generator signs** (i.e., iterator signs whose compliant
+objects are generators).
+'''
+
+
+_HINT_SIGNS_ITERATOR = frozenset((_Iterator, Iterator))
+'''
+Frozen set of all **iterator signs** (i.e., iterator signs whose compliant
+objects are iterators but *not* necessarily generators).
+'''
+
+# ....................{ SINGLETONS                        }....................
+_iterator_proxiers_lock = Lock()
+'''
+Non-reentrant thread lock serializing the registration of iterator hints by
+the :func:`register_iterator_proxier` function.
+'''
+
+
+iterator_proxiers = IteratorProxiers()
+'''
+**Iterator proxier cache** (i.e., singleton dictionary mapping from the names
+of all iterator proxiers registered by the :func:`register_iterator_proxier`
+function to those proxiers).
+
+See Also
+----------
+:class:`IteratorProxiers`
+    Further details.
+'''
+
+# ....................{ REGISTRATION                      }....................
+# Expose this cache as a global to wrapper functions. See the
+# "beartype._decor._cache.cacheglobal" submodule for further details.
+register_wrapper_global(ITERATOR_PROXIERS_NAME, iterator_proxiers)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype postponed hint cache** (i.e., weak dictionary mapping from each
+module declaring one or more callables decorated by the
+:func:`beartype.beartype` decorator under `PEP 563`_ to a dictionary mapping
+from each postponed annotation string previously evaluated against the global
+scope of that module to the hint to which that string evaluated).
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 563:
+   https://www.python.org/dev/peps/pep-0563
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._util.utilobject import SENTINEL
+from sys import modules as sys_modules
+from types import CodeType, ModuleType
+from typing import Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ PRIVATE ~ hints                   }....................
+_HintPostponedEntry = Tuple[object, CodeType, Tuple[object, ...]]
+'''
+PEP-compliant type hint matching each value of the dictionaries cached by the
+:data:`_MODULE_TO_HINT_POSTPONED_TO_ENTRY` dictionary, a 3-tuple
+``(hint, hint_code, hint_globals)`` such that:
+
+* ``hint`` is the hint to which the postponed annotation string evaluated.
+* ``hint_code`` is the code object compiled from that string.
+* ``hint_globals`` is the tuple of the values of all global variables
+  referenced by that code object (i.e., listed in its ``co_names`` tuple) in
+  the global scope of that module at evaluation time, with the
+  :data:`SENTINEL` placeholder standing in for undefined globals.
+'''
+
+# ....................{ PRIVATE ~ mappings                }....................
+_MODULE_TO_HINT_POSTPONED_TO_ENTRY: (
+    'WeakKeyDictionary[ModuleType, Dict[str, _HintPostponedEntry]]') = (
+    WeakKeyDictionary())
+'''
+**Postponed hint cache** (i.e., weak dictionary mapping from each module
+previously passed to the :func:`eval_hint_postponed` function to a dictionary
+mapping from each postponed annotation string previously evaluated against the
+global scope of that module to the metadata describing that evaluation).
+
+This dictionary is weak to avoid preventing modules dynamically created at
+runtime (e.g., by instantiating the :class:`types.ModuleType` type) from
+being garbage-collected.
+Since the global scope of a module is a :class:`dict` and thus *not* weakly
+referenceable, this dictionary is keyed by the module owning that scope.
+'''
+
+# ....................{ EVALUATORS                        }....................
+def eval_hint_postponed(
+    hint: str, func_globals: dict, func_module_name: Optional[str]) -> object:
+    '''
+    Hint to which the passed `PEP 563`_-postponed annotation string evaluates
+    against the passed global scope of the callable annotated by that string.
+
+    This evaluator memoizes each such evaluation against the module owning
+    this global scope, reducing the evaluation of an annotation string
+    repeatedly annotating callables declared by the same module (e.g.,
+    ``"Optional[UserId]"``) to a dictionary lookup and one identity test for
+    each global variable referenced by that string. Since module globals may
+    be freely rebound at any time, each cached evaluation is validated against
+    the current values of these globals and transparently re-evaluated if any
+    of these globals has since been rebound. Note that mutating the objects
+    these globals refer to (e.g., rebinding a module attribute referenced by
+    ``"typing.Optional[int]"``) is intentionally *not* detected.
+
+    Parameters
+    ----------
+    hint : str
+        Postponed annotation string to be evaluated.
+    func_globals : dict
+        Global scope of the callable annotated by this string.
+    func_module_name : Optional[str]
+        Fully-qualified name of the module declaring this callable if any *or*
+        ``None`` otherwise. If this module is unimported *or* its global scope
+        is *not* this global scope (e.g., as with callables dynamically
+        declared by the :func:`exec` builtin), this evaluation is uncached.
+
+    Returns
+    ----------
+    object
+        Hint to which this string evaluates.
+
+    Raises
+    ----------
+    Exception
+        If evaluating this string raises an exception, which this evaluator
+        intentionally propagates as is to the caller.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+    assert isinstance(hint, str), f'{repr(hint)} not string.'
+    assert isinstance(func_globals, dict), f'{repr(func_globals)} not dict.'
+
+    # Module declaring this callable if any *OR* "None" otherwise.
+    func_module = sys_modules.get(func_module_name)  # type: ignore[arg-type]
+
+    # If this global scope is *NOT* the global scope of this module, this
+    # evaluation is uncacheable. In this case, evaluate this string as is.
+    if getattr(func_module, '__dict__', None) is not func_globals:
+        return eval(hint, func_globals)
+    # Else, this global scope is the global scope of this module.
+
+    # Dictionary mapping from each postponed annotation string previously
+    # evaluated against this scope to the metadata describing that evaluation.
+    hint_to_entry = _MODULE_TO_HINT_POSTPONED_TO_ENTRY.get(func_module)
+
+    # If this is the first such evaluation, cache a new such dictionary.
+    #
+    # Note that this is technically non-thread-safe, as multiple threads could
+    # concurrently create multiple dictionaries for the same module. Since
+    # this cache is purely an optimization, this race is harmless and thus
+    # permitted for efficiency.
+    if hint_to_entry is None:
+        hint_to_entry = _MODULE_TO_HINT_POSTPONED_TO_ENTRY[func_module] = {}
+
+    # Metadata describing the prior evaluation of this string if any *OR*
+    # "None" otherwise.
+    hint_entry = hint_to_entry.get(hint)
+
+    # If this string has been previously evaluated...
+    if hint_entry is not None:
+        hint_evaled, hint_code, hint_globals = hint_entry
+
+        # If *NO* global referenced by this string has since been rebound,
+        # return the hint to which this string previously evaluated.
+        for hint_name, hint_global in zip(hint_code.co_names, hint_globals):
+            if func_globals.get(hint_name, SENTINEL) is not hint_global:
+                break
+        else:
+            return hint_evaled
+        # Else, one or more such globals have since been rebound. In this
+        # case, re-evaluate the previously compiled code object below.
+    # Else, this string has yet to be evaluated. In this case, compile this
+    # string into a code object to be evaluated below.
+    else:
+        hint_code = compile(hint, '<string>', 'eval')
+
+    # Hint to which this string evaluates against the current global scope.
+    hint_evaled = eval(hint_code, func_globals)
+
+    # Cache this hint alongside the current values of these globals.
+    hint_to_entry[hint] = (
+        hint_evaled,
+        hint_code,
+        tuple(
+            func_globals.get(hint_name, SENTINEL)
+            for hint_name in hint_code.co_names
+        ),
+    )
+
+    # Return this hint.
+    return hint_evaled
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype protocol conformance cache** (i.e., singleton list of weak sets of
+the types of objects previously found to satisfy `PEP 544`_-compliant
+runtime-checkable protocols, enabling wrapper functions generated by the
+:func:`beartype.beartype` decorator to type-check objects against these
+protocols with a single set lookup rather than the :func:`isinstance` builtin,
+which inefficiently inspects *all* members of these protocols on each call).
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 544:
+    https://www.python.org/dev/peps/pep-0544
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._decor._cache.cacheglobal import register_wrapper_global
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.hint.pep.proposal.utilhintpep544 import (
+    is_hint_pep544_protocol_cacheable)
+from threading import Lock
+from typing import List, Optional
+from weakref import WeakSet
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+PROTOCOL_TYPES_NAME = '__beartype_protocol_types'
+'''
+Name of the global variable referring to the :data:`protocol_types` singleton
+in the bodies of wrapper functions generated by the :func:`beartype.beartype`
+decorator.
+'''
+
+
+PROTOCOL_INSTANCE_TESTER_NAME = '__beartype_is_protocol_instance'
+'''
+Name of the global variable referring to the :func:`is_protocol_instance`
+tester in the bodies of wrapper functions generated by the
+:func:`beartype.beartype` decorator.
+'''
+
+# ....................{ SINGLETONS                        }....................
+protocol_types: List[WeakSet] = []
+'''
+**Protocol conformance cache** (i.e., singleton list of weak sets, each
+containing the exact types of all objects previously found to satisfy a
+cacheable protocol).
+
+Each weak set is accessed by the 0-based index returned by the
+:func:`register_protocol_types` function. Since these sets only weakly refer
+to these types, these sets silently discard types on their garbage collection
+(e.g., types dynamically defined in local scopes), preventing memory leaks.
+
+Caveats
+----------
+**These sets are never invalidated on monkey-patching these types.** Deleting
+a method required by a protocol from a type previously found to satisfy that
+protocol preserves that type in this cache. This cache thus shares the caveats
+of the positive cache internally maintained by the :func:`issubclass` builtin
+for each protocol, which equally fails to invalidate itself on class mutation.
+Callers monkey-patching types after type-checking instances of those types
+should call the public :func:`beartype.clear_protocol_types` function, which
+defers to the :func:`clear_protocol_types` function defined below.
+'''
+
+
+_protocol_hints: List[type] = []
+'''
+List of all cacheable protocols registered by the
+:func:`register_protocol_types` function, such that each item of this list is
+the protocol whose weak set is the item of the :data:`protocol_types` list at
+the same 0-based index.
+
+Since the :func:`register_protocol_types` function is memoized and thus
+already strongly refers to these protocols, this list preserves no protocols
+that would otherwise be garbage-collected.
+'''
+
+
+_protocol_types_lock = Lock()
+'''
+Non-reentrant lock serializing appends to the :data:`protocol_types` and
+:data:`_protocol_hints` lists.
+'''
+
+# ....................{ REGISTRARS                        }....................
+@callable_cached
+def register_protocol_types(hint: type) -> Optional[str]:
+    '''
+    Python expression evaluating to the weak set of the exact types of all
+    objects previously found to satisfy the passed `PEP 544`_-compliant
+    protocol when accessed from the body of a wrapper function generated by the
+    :func:`beartype.beartype` decorator if this protocol is cacheable *or*
+    ``None`` otherwise.
+
+    This function is memoized for both efficiency *and* safety, guaranteeing
+    that *all* wrapper functions type-checking objects against the same
+    protocol share the same weak set.
+
+    Parameters
+    ----------
+    hint : type
+        Protocol to be registered.
+
+    Returns
+    ----------
+    Optional[str]
+        Either:
+
+        * If this protocol is cacheable, Python expression evaluating to this
+          weak set.
+        * Else, ``None``.
+
+    See Also
+    ----------
+    :func:`beartype._util.hint.pep.proposal.utilhintpep544.is_hint_pep544_protocol_cacheable`
+        Further details.
+
+    .. _PEP 544:
+       https://www.python.org/dev/peps/pep-0544
+    '''
+
+    # If this protocol is uncacheable, silently reduce to a noop.
+    if not is_hint_pep544_protocol_cacheable(hint):
+        return None
+    # Else, this protocol is cacheable.
+
+    # Register a new weak set, returning a Python expression evaluating to it.
+    with _protocol_types_lock:
+        protocol_types.append(WeakSet())
+        _protocol_hints.append(hint)
+        return f'{PROTOCOL_TYPES_NAME}[{len(protocol_types) - 1}]'
+
+# ....................{ TESTERS                           }....................
+def is_protocol_instance(
+    pith: object, hint: type, hint_types: WeakSet) -> bool:
+    '''
+    ``True`` only if the passed object satisfies the passed cacheable `PEP
+    544`_-compliant protocol, caching the type of this object in the passed
+    weak set if this type satisfies this protocol.
+
+    This tester is called by wrapper functions generated by the
+    :func:`beartype.beartype` decorator *only* on cache misses (i.e., *only*
+    if this weak set does *not* already contain the exact type of this
+    object). Objects of types satisfying this protocol are thus inspected by
+    this tester at most once per type.
+
+    Parameters
+    ----------
+    pith : object
+        Object to be inspected.
+    hint : type
+        Cacheable protocol to inspect this object against.
+    hint_types : WeakSet
+        Weak set of the exact types of all objects previously found to satisfy
+        this protocol.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object satisfies this protocol.
+
+    .. _PEP 544:
+       https://www.python.org/dev/peps/pep-0544
+    '''
+
+    # Exact type of this object.
+    pith_type = type(pith)
+
+    # If this type satisfies this protocol, then *ALL* objects of this type
+    # also satisfy this protocol. In this case, cache this type and return
+    # true.
+    if issubclass(pith_type, hint):
+        hint_types.add(pith_type)
+        return True
+    # Else, this type fails to satisfy this protocol. Since this object could
+    # still satisfy this protocol via instance variables, this object *MUST*
+    # be inspected directly. Since this outcome depends on this object rather
+    # than the type of this object, this outcome is intentionally uncached.
+
+    # Return true only if this object satisfies this protocol.
+    return isinstance(pith, hint)
+
+# ....................{ CLEARERS                          }....................
+def clear_protocol_types() -> None:
+    '''
+    Clear the protocol conformance cache, forcing wrapper functions generated
+    by the :func:`beartype.beartype` decorator to reinspect the types of *all*
+    objects subsequently type-checked against cacheable protocols.
+
+    This function should be called after monkey-patching types previously
+    found to satisfy one or more cacheable protocols to no longer do so.
+
+    This function also clears the positive and negative caches internally
+    maintained by the :class:`abc.ABCMeta` metaclass for each such protocol,
+    which would otherwise continue to report these types as satisfying these
+    protocols on reinspection by the :func:`issubclass` builtin.
+    '''
+
+    # For each weak set in this cache and the protocol this set caches
+    # types for, clear this set in-place *WITHOUT* removing this set from
+    # this cache. Existing wrapper functions refer to these sets by their
+    # 0-based indices.
+    with _protocol_types_lock:
+        for hint_types, hint in zip(protocol_types, _protocol_hints):
+            hint_types.clear()
+            hint._abc_caches_clear()  # type: ignore[attr-defined]
+
+# ....................{ REGISTRATION                      }....................
+# Expose this cache and tester as globals to wrapper functions. See the
+# "beartype._decor._cache.cacheglobal" submodule for further details.
+register_wrapper_global(PROTOCOL_TYPES_NAME, protocol_types)
+register_wrapper_global(PROTOCOL_INSTANCE_TESTER_NAME, is_protocol_instance)
@@ -46,6 +46,7 @@ from beartype._util.utilobject import (
     get_object_type_name,
     get_object_type_basename,
 )
+from threading import Lock
 from typing import Tuple
 
 # See the "beartype.cave" submodule for further commentary.
@@ -248,9 +249,14 @@ def register_typistry_type(hint: type) -> str:
     # Note that the beartypistry singleton's __setitem__() dunder method
     # intentionally raises exceptions on attempts to re-register the same
     # object twice, as tuple re-registration requires special handling to avoid
-    # hash collisions. Nonetheless, this is a non-issue. Why? Since this
-    # function is memoized, re-registration should *NEVER* happen.
-    bear_typistry[hint_classname] = hint
+    # hash collisions. Although this function is memoized, multiple threads
+    # concurrently calling this function with the same type (e.g., by
+    # concurrently decorating callables with the @beartype decorator) may
+    # nonetheless both miss that cache. Ergo, this type is only registered
+    # under a thread lock if this type has yet to be registered.
+    with _bear_typistry_lock:
+        if bear_typistry.get(hint_classname) is not hint:
+            bear_typistry[hint_classname] = hint
 
     # Return a Python expression evaluating to this type.
     return (
@@ -408,16 +414,28 @@ def register_typistry_tuple(
     # registered with the beartypistry singleton, iteratively disambiguate this
     # name by appending an arbitrary character to this name.
     #
-    # Note that, if this name *DOES* collide with one or more existing names of
-    # tuples previously registered with the beartypistry singleton, the passed
-    # tuple is guaranteed to *NOT* be those tuples. Why? Because this function
-    # is memoized, the passed tuple is necessarily distinct from those passed
-    # to all prior calls of this function and thus requires registration.
-    while hint_name in bear_typistry:
-        hint_name += '~'
-
-    # Register this tuple with the beartypistry singleton.
-    bear_typistry[hint_name] = hint
+    # Note that, if this name collides with the name of a tuple previously
+    # registered with the beartypistry singleton that is equal to the passed
+    # tuple, that registration is silently reused. Although this function is
+    # memoized, this edge case arises when either:
+    #
+    # * Different tuples coerce to the same duplicate-free tuple above.
+    # * Multiple threads concurrently call this function with the same tuple
+    #   (e.g., by concurrently decorating callables with the @beartype
+    #   decorator) and thus all miss the cache of this function. For safety,
+    #   this iteration and registration are thus performed under a thread lock.
+    with _bear_typistry_lock:
+        while hint_name in bear_typistry:
+            # If the tuple previously registered under this name is the same
+            # as the passed tuple, reuse that registration.
+            if bear_typistry[hint_name] == hint:
+                break
+            # Else, this is a hash collision between different tuples.
+
+            hint_name += '~'
+        # Else, this name is unique. Register this tuple under this name.
+        else:
+            bear_typistry[hint_name] = hint
 
     # Return a Python expression evaluating to this tuple.
     return (
@@ -675,6 +693,14 @@ class Beartypistry(dict):
         return hint_class  # type: ignore[return-value]
 
 # ....................{ SINGLETONS                        }....................
+_bear_typistry_lock = Lock()
+'''
+Non-reentrant thread lock serializing the registration of types and tuples
+with the :data:`bear_typistry` singleton by the :func:`register_typistry_type`
+and :func:`register_typistry_tuple` functions.
+'''
+
+
 bear_typistry = Beartypistry()
 '''
 **Beartypistry** (i.e., singleton dictionary mapping from the fully-qualified
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype typed dictionary validator cache** (i.e., singleton dictionary
+mapping from strings uniquely identifying each `PEP 589`_-compliant **typed
+dictionary** (i.e., :class:`typing.TypedDict` subclass) deeply type-checked by
+wrapper functions generated by the :func:`beartype.beartype` decorator to a
+callable type-checking the keys and values of dictionaries against that typed
+dictionary).
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 589:
+    https://www.python.org/dev/peps/pep-0589
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype.roar import BeartypeCallHintPepParamException
+from beartype._decor._cache.cacheglobal import register_wrapper_global
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.hint.pep.proposal.utilhintpep589 import (
+    get_hint_pep589_key_hints,
+    get_hint_pep589_keys_required,
+    is_hint_pep589,
+)
+from beartype._util.utilobject import get_object_type_name
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+TYPEDDICT_VALIDATORS_NAME = '__beartype_typeddict_validators'
+'''
+Name of the global variable referring to the :data:`typeddict_validators`
+singleton in the bodies of wrapper functions generated by the
+:func:`beartype.beartype` decorator.
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_KEY_CHECKER_NAME = '__beartype_check_key'
+'''
+Unqualified name of each **key checker** (i.e., synthetic callable accepting
+one parameter annotated by the type hint annotating a key of a typed
+dictionary) decorated by the :func:`beartype.beartype` decorator.
+'''
+
+
+_VALIDATOR_NAME_FIELDS_SUFFIX = '?fields'
+'''
+Substring suffixing the names of all validators type-checking *all* keys of
+dictionaries, distinguishing these names from those of validators
+type-checking only a single pseudo-randomly selected key.
+
+Since fully-qualified classnames are guaranteed to *never* contain this
+substring, this substring prevents collisions between these two kinds of
+validators.
+'''
+
+
+_VALIDATOR_CODE_PREFIX = '''
+def is_typeddict_valid(
+    pith,
+    random_int,
+    __beartype_keys_required=__beartype_keys_required,
+    __beartype_key_checkers=__beartype_key_checkers,
+    __beartype_key_names_checkers=__beartype_key_names_checkers,
+):
+    if not __beartype_keys_required <= pith.keys():
+        return False'''
+'''
+Code snippet prefixing the declaration of each **typed dictionary validator**
+(i.e., callable returning ``True`` only if the passed dictionary both contains
+all required keys of a typed dictionary *and* maps all checked keys to values
+satisfying the type hints annotating those keys).
+'''
+
+
+_VALIDATOR_CODE_KEYS_NONE = '''
+    return True
+'''
+'''
+Code snippet suffixing the declaration of each typed dictionary validator for
+a typed dictionary declaring *no* unignorable keys.
+'''
+
+
+_VALIDATOR_CODE_KEYS_ALL_PREFIX = '''
+    try:'''
+'''
+Code snippet prefixing the code type-checking *all* keys of the passed
+dictionary in each typed dictionary validator.
+'''
+
+
+_VALIDATOR_CODE_KEYS_ALL_SUFFIX = '''
+    except BeartypeCallHintPepParamException:
+        return False
+    return True
+'''
+'''
+Code snippet suffixing the code type-checking *all* keys of the passed
+dictionary in each typed dictionary validator.
+'''
+
+
+_VALIDATOR_CODE_KEY_REQUIRED = '''
+        __beartype_key_checkers[{key_index}](pith[{key_name_expr}])'''
+'''
+Code snippet type-checking the value of the current **required key** (i.e.,
+key guaranteed to exist in the passed dictionary) in each typed dictionary
+validator type-checking *all* keys.
+'''
+
+
+_VALIDATOR_CODE_KEY_OPTIONAL = '''
+        if {key_name_expr} in pith:
+            __beartype_key_checkers[{key_index}](pith[{key_name_expr}])'''
+'''
+Code snippet type-checking the value of the current **optional key** (i.e.,
+key *not* guaranteed to exist in the passed dictionary) in each typed
+dictionary validator type-checking *all* keys.
+'''
+
+
+_VALIDATOR_CODE_KEY_SAMPLED = '''
+    key_name, key_checker = __beartype_key_names_checkers[
+        random_int % {key_names_checkers_len}]
+    if key_name in pith:
+        try:
+            key_checker(pith[key_name])
+        except BeartypeCallHintPepParamException:
+            return False
+    return True
+'''
+'''
+Code snippet suffixing the declaration of each typed dictionary validator
+type-checking only the single key of the passed dictionary pseudo-randomly
+selected by the passed integer in ``O(1)`` time.
+'''
+
+# ....................{ PRIVATE ~ mappings                }....................
+_VALIDATOR_NAME_TO_HINT_CONF: Dict[str, Tuple[type, bool]] = {}
+'''
+Dictionary mapping from the name of each typed dictionary validator registered
+by the :func:`register_typeddict` function to a 2-tuple ``(hint,
+is_check_fields)`` of the typed dictionary and record field checking flag
+that validator is to be compiled for on first access.
+'''
+
+# ....................{ REGISTRARS                        }....................
+@callable_cached
+def register_typeddict(hint: type, is_check_fields: bool) -> str:
+    '''
+    Register the passed `PEP 589`_-compliant **typed dictionary** (i.e.,
+    :class:`typing.TypedDict` subclass) with the :data:`typeddict_validators`
+    singleton *and* return a Python expression evaluating to the validator
+    type-checking dictionaries against this typed dictionary when accessed
+    from the body of a wrapper function generated by the
+    :func:`beartype.beartype` decorator.
+
+    The validator this expression evaluates to accepts exactly two
+    parameters:
+
+    * ``pith``, the dictionary to be type-checked.
+    * ``random_int``, either:
+
+      * If this validator type-checks only a single key, a pseudo-random
+        integer selecting that key.
+      * Else, ``None``.
+
+    This function is memoized for both efficiency *and* safety, preventing
+    accidental reregistration.
+
+    Parameters
+    ----------
+    hint : type
+        Typed dictionary to be registered.
+    is_check_fields : bool
+        ``True`` only if the validator type-checks *all* keys of dictionaries
+        and deeply type-checks all annotated fields of records nested in the
+        values of those keys. If ``False``, the validator type-checks only a
+        single pseudo-randomly selected key of each dictionary in ``O(1)``
+        time.
+
+    Returns
+    ----------
+    str
+        Python expression evaluating to this validator.
+
+    .. _PEP 589:
+        https://www.python.org/dev/peps/pep-0589
+    '''
+    assert is_hint_pep589(hint), f'{repr(hint)} not typed dictionary.'
+    assert isinstance(is_check_fields, bool), (
+        f'{repr(is_check_fields)} not boolean.')
+
+    # Name of this validator, defaulting to the fully-qualified name of this
+    # typed dictionary suffixed by a substring identifying full validators.
+    validator_name_prefix = get_object_type_name(hint)
+    if is_check_fields:
+        validator_name_prefix += _VALIDATOR_NAME_FIELDS_SUFFIX
+    validator_name = validator_name_prefix
+
+    # Register this typed dictionary under this name, preventing this
+    # registration from accidentally reregistering a different typed
+    # dictionary previously registered under the same name. Since this
+    # function is memoized, this only occurs when two or more typed
+    # dictionaries share the same fully-qualified name (e.g., typed
+    # dictionaries dynamically declared in closures). In this case, uniquify
+    # this name by an integer suffix.
+    with _typeddict_validators_lock:
+        validator_name_suffix = 1
+        while validator_name in _VALIDATOR_NAME_TO_HINT_CONF:
+            validator_name_suffix += 1
+            validator_name = f'{validator_name_prefix}#{validator_name_suffix}'
+        _VALIDATOR_NAME_TO_HINT_CONF[validator_name] = (hint, is_check_fields)
+
+    # Return a Python expression evaluating to this validator.
+    return f'{TYPEDDICT_VALIDATORS_NAME}[{repr(validator_name)}]'
+
+# ....................{ CLASSES                           }....................
+class TypedDictValidators(dict):
+    '''
+    **Typed dictionary validator cache** (i.e., singleton dictionary mapping
+    from the names of all typed dictionary validators registered by the
+    :func:`register_typeddict` function to those validators).
+
+    This dictionary lazily compiles each validator on the first attempt to
+    access that validator by defining a :meth:`__missing__` dunder method.
+    Deferring compilation until call time enables typed dictionaries to be
+    annotated by forward references to classes that have yet to be defined at
+    decoration time, including self-referential typed dictionaries.
+    '''
+
+    # ..................{ DUNDERS                           }..................
+    def __missing__(self, validator_name: str) -> Callable:
+        '''
+        Dunder method explicitly called by the superclass
+        :meth:`dict.__getitem__` method implicitly called on getting the
+        passed missing key with ``[``- and ``]``-delimited syntax.
+
+        This method compiles and caches the validator with this name.
+
+        Parameters
+        ----------
+        validator_name : str
+            Name of the validator to be compiled.
+
+        Returns
+        ----------
+        Callable
+            Validator with this name.
+        '''
+
+        # Typed dictionary and flag this validator was registered with.
+        hint, is_check_fields = _VALIDATOR_NAME_TO_HINT_CONF[validator_name]
+
+        # Compile and cache this validator.
+        #
+        # Note that this is technically non-thread-safe, as multiple threads
+        # could concurrently compile multiple validators for the same name.
+        # Since each such validator is functionally equivalent and compiling a
+        # validator is idempotent, this race is harmless and thus permitted.
+        validator = self[validator_name] = _make_is_typeddict_valid(
+            hint, is_check_fields)
+
+        # Return this validator.
+        return validator
+
+# ....................{ PRIVATE ~ factories               }....................
+def _make_key_checker(
+    hint: type,
+    key_name: str,
+    key_hint: object,
+    is_check_fields: bool,
+) -> Callable[[object], None]:
+    '''
+    Key checker type-checking the passed value against the type hint
+    annotating the key with the passed name of the passed typed dictionary.
+
+    Parameters
+    ----------
+    hint : type
+        Typed dictionary declaring this key.
+    key_name : str
+        Name of this key.
+    key_hint : object
+        Type hint annotating this key, assumed to be unignorable.
+    is_check_fields : bool
+        ``True`` only if this checker deeply type-checks all annotated fields
+        of records nested in this value.
+
+    Returns
+    ----------
+    Callable[[object], None]
+        Key checker raising a :class:`BeartypeCallHintPepParamException` if
+        the passed value violates this hint.
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._decor.conf import BeartypeConf
+    from beartype._decor.main import beartype
+
+    # Synthetic key checker accepting one parameter.
+    def check_key(value):
+        pass
+
+    # Annotate this parameter by this hint. Also associate this checker with
+    # the module declaring this typed dictionary, enabling relative forward
+    # references in this hint to be resolved against that module.
+    check_key.__annotations__ = {'value': key_hint}
+    check_key.__module__ = hint.__module__
+    check_key.__name__ = _KEY_CHECKER_NAME
+    check_key.__qualname__ = f'{hint.__qualname__}[{repr(key_name)}]'
+
+    # Return this checker decorated by @beartype.
+    return beartype(
+        check_key, conf=BeartypeConf(is_check_fields=is_check_fields))
+
+
+def _make_is_typeddict_valid(
+    hint: type, is_check_fields: bool) -> Callable[[dict, Optional[int]], bool]:
+    '''
+    Typed dictionary validator type-checking the keys and values of passed
+    dictionaries against the passed typed dictionary.
+
+    Parameters
+    ----------
+    hint : type
+        Typed dictionary to compile this validator for.
+    is_check_fields : bool
+        ``True`` only if this validator type-checks *all* keys. See the
+        :func:`register_typeddict` function for further details.
+
+    Returns
+    ----------
+    Callable[[dict, Optional[int]], bool]
+        Validator for this typed dictionary.
+    '''
+
+    # Frozen set of the names of all required keys of this typed dictionary.
+    keys_required = get_hint_pep589_keys_required(hint)
+
+    # Tuple of the names and checkers of all unignorable keys of this typed
+    # dictionary.
+    key_names_checkers = tuple(
+        (key_name, _make_key_checker(
+            hint, key_name, key_hint, is_check_fields))
+        for key_name, key_hint in get_hint_pep589_key_hints(hint)
+    )
+
+    # Python code declaring this validator.
+    validator_code = _VALIDATOR_CODE_PREFIX
+
+    # If this typed dictionary declares no unignorable keys, this validator
+    # only tests this dictionary to contain all required keys.
+    if not key_names_checkers:
+        validator_code += _VALIDATOR_CODE_KEYS_NONE
+    # Else if this validator type-checks all keys, generate code type-checking
+    # the value of each such key in declaration order.
+    elif is_check_fields:
+        validator_code += _VALIDATOR_CODE_KEYS_ALL_PREFIX
+        for key_index, (key_name, _) in enumerate(key_names_checkers):
+            validator_code += (
+                _VALIDATOR_CODE_KEY_REQUIRED
+                if key_name in keys_required else
+                _VALIDATOR_CODE_KEY_OPTIONAL
+            ).format(key_index=key_index, key_name_expr=repr(key_name))
+        validator_code += _VALIDATOR_CODE_KEYS_ALL_SUFFIX
+    # Else, this validator type-checks only a single pseudo-randomly selected
+    # key in constant time.
+    else:
+        validator_code += _VALIDATOR_CODE_KEY_SAMPLED.format(
+            key_names_checkers_len=len(key_names_checkers))
+
+    # Compile this validator.
+    validator_locals: dict = {}
+    exec(
+        validator_code,
+        {
+            '__beartype_keys_required': keys_required,
+            '__beartype_key_checkers': tuple(
+                key_checker for _, key_checker in key_names_checkers),
+            '__beartype_key_names_checkers': key_names_checkers,
+            'BeartypeCallHintPepParamException': (
+                BeartypeCallHintPepParamException),
+        },
+        validator_locals,
+    )
+
+    # Return this validator.
+    return validator_locals['is_typeddict_valid']
+
+# ....................{ SINGLETONS                        }....................
+_typeddict_validators_lock = Lock()
+'''
+Non-reentrant thread lock serializing the registration of typed dictionaries
+by the :func:`register_typeddict` function.
+'''
+
+
+typeddict_validators = TypedDictValidators()
+'''
+**Typed dictionary validator cache** (i.e., singleton dictionary mapping from
+the names of all typed dictionary validators registered by the
+:func:`register_typeddict` function to those validators).
+
+See Also
+----------
+:class:`TypedDictValidators`
+    Further details.
+'''
+
+# ....................{ REGISTRATION                      }....................
+# Expose this cache as a global to wrapper functions. See the
+# "beartype._decor._cache.cacheglobal" submodule for further details.
+register_wrapper_global(
+    TYPEDDICT_VALIDATORS_NAME, typeddict_validators)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype union type mask cache** (i.e., singleton list of dictionaries
+mapping from the exact types of objects to **type masks** (i.e., bit masks
+selecting the child hints of a `PEP 484`_-compliant union that objects of
+those types could possibly satisfy), enabling wrapper functions generated by
+the :func:`beartype.beartype` decorator to dispatch on the type of each pith
+type-checked against a wide union rather than linearly testing that pith
+against each child hint of that union).
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 484:
+    https://www.python.org/dev/peps/pep-0484
+'''
+
+# ....................{ IMPORTS                           }....................
+from abc import ABCMeta
+from beartype._decor._cache.cacheglobal import register_wrapper_global
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.hint.pep.utilhintpepget import (
+    get_hint_pep_stdlib_type_or_none)
+from beartype._util.hint.pep.utilhintpeptest import is_hint_pep
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+UNION_TYPE_MASKS_NAME = '__beartype_union_type_masks'
+'''
+Name of the global variable referring to the :data:`union_type_masks`
+singleton in the bodies of wrapper functions generated by the
+:func:`beartype.beartype` decorator.
+'''
+
+
+UNION_TYPE_MASK_NONPEP = 1
+'''
+Bit selecting the PEP-noncompliant child hints of a union in each type mask,
+which are type-checked together by a single :func:`isinstance` call.
+
+The PEP-compliant child hints of that union are selected by successively
+higher bits (i.e., ``2``, ``4``, ``8``, and so on) in iteration order.
+'''
+
+
+UNION_TYPE_MASK_ALL = -1
+'''
+Type mask selecting *all* child hints of a union, returned by wrapper functions
+on looking up the type mask of an object whose exact type is unknown to that
+union (e.g., a subclass of the origin type of a child hint).
+'''
+
+
+UNION_DISPATCH_PEP_CHILDS_LEN_MIN = 3
+'''
+Minimum number of PEP-compliant child hints a union must be subscripted by to
+dispatch on the types of piths type-checked against that union.
+
+The type mask lookup dispatching on these types is marginally more expensive
+than a single :func:`isinstance` call. Since narrow unions are efficiently
+type-checked by merely testing each child hint in turn, only unions wider than
+this minimum benefit from dispatching.
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_INSTANCECHECKS_STANDARD = frozenset((
+    type.__instancecheck__,
+    ABCMeta.__instancecheck__,
+))
+'''
+Frozen set of all **standard instance checkers** (i.e., ``__instancecheck__``
+dunder methods of metaclasses guaranteeing that an object is an instance of a
+class with this metaclass if the exact type of that object is a subclass of
+that class).
+
+Classes whose metaclasses override this method with non-standard logic (e.g.,
+:class:`typing.Protocol` subclasses, whose instance checks inspect the
+attributes of objects rather than the types of those objects) *cannot* be
+safely dispatched on.
+'''
+
+# ....................{ SINGLETONS                        }....................
+union_type_masks: List[Dict[type, int]] = []
+'''
+**Union type mask cache** (i.e., singleton list of dictionaries, each mapping
+from the exact type of an object to the type mask selecting the child hints of
+a union that objects of that type could possibly satisfy).
+
+Each dictionary is accessed by the 0-based index returned by the
+:func:`register_union_type_masks` function.
+'''
+
+
+_union_type_masks_lock = Lock()
+'''
+Non-reentrant lock serializing appends to the :data:`union_type_masks` list.
+'''
+
+# ....................{ REGISTRARS                        }....................
+@callable_cached
+def register_union_type_masks(
+    hint_childs_nonpep: Tuple[type, ...],
+    hint_childs_pep: Tuple[object, ...],
+) -> Optional[str]:
+    '''
+    Python expression evaluating to the dictionary mapping from the exact types
+    of objects to the type masks selecting the child hints of the union
+    subscripted by the passed child hints that objects of those types could
+    possibly satisfy when accessed from the body of a wrapper function
+    generated by the :func:`beartype.beartype` decorator if that union is
+    efficiently dispatchable on the types of objects *or* ``None`` otherwise.
+
+    A union is dispatchable only if that union is subscripted by at least
+    :data:`UNION_DISPATCH_PEP_CHILDS_LEN_MIN` PEP-compliant child hints, each
+    of which originates from a standard library type, *and* the metaclasses of
+    all of these types and of all PEP-noncompliant child hints perform standard
+    instance checks.
+
+    This function is memoized for both efficiency *and* safety, preventing
+    accidental reregistration.
+
+    Parameters
+    ----------
+    hint_childs_nonpep : Tuple[type, ...]
+        Tuple of all PEP-noncompliant child hints of this union.
+    hint_childs_pep : Tuple[object, ...]
+        Tuple of all PEP-compliant child hints of this union in the same order
+        as the wrapper function type-checks these hints, such that the type
+        mask bit ``2 << index`` selects the child hint with this 0-based
+        index.
+
+    Returns
+    ----------
+    Optional[str]
+        Either:
+
+        * If this union is dispatchable, Python expression evaluating to this
+          dictionary.
+        * Else, ``None``.
+    '''
+    assert isinstance(hint_childs_nonpep, tuple), (
+        f'{repr(hint_childs_nonpep)} not tuple.')
+    assert isinstance(hint_childs_pep, tuple), (
+        f'{repr(hint_childs_pep)} not tuple.')
+
+    # If this union is too narrow to benefit from dispatching, silently reduce
+    # to a noop.
+    if len(hint_childs_pep) < UNION_DISPATCH_PEP_CHILDS_LEN_MIN:
+        return None
+    # Else, this union is sufficiently wide.
+
+    # List of the origin types of all PEP-compliant child hints of this union.
+    hint_childs_pep_type = []
+
+    # For each PEP-compliant child hint of this union...
+    for hint_child in hint_childs_pep:
+        # Origin type of this child hint if any *OR* "None" otherwise.
+        #
+        # Note that non-PEP records whose annotated fields are to be
+        # type-checked are *NOT* dispatched on. Although these records are
+        # technically classes, the instance checks for these classes are
+        # performed by arbitrary user-defined metaclasses.
+        hint_child_type = (
+            get_hint_pep_stdlib_type_or_none(hint_child)
+            if is_hint_pep(hint_child) else
+            None
+        )
+
+        # If this child hint originates from *NO* standard library type (e.g.,
+        # user-defined generic, type variable, forward reference), this child
+        # hint could be satisfied by objects of arbitrary types. In this case,
+        # this union is *NOT* dispatchable.
+        if (
+            hint_child_type is None or
+            not _is_type_instancecheck_standard(hint_child_type)
+        ):
+            return None
+        # Else, this child hint originates from a standard library type.
+
+        hint_childs_pep_type.append(hint_child_type)
+
+    # If any PEP-noncompliant child hint of this union performs non-standard
+    # instance checks, this union is *NOT* dispatchable.
+    for hint_child in hint_childs_nonpep:
+        if not _is_type_instancecheck_standard(hint_child):
+            return None
+
+    # Dictionary mapping from the origin type of each PEP-compliant child hint
+    # to the type mask selecting all child hints that objects of exactly that
+    # type could possibly satisfy.
+    #
+    # Note that this dictionary is intentionally keyed *ONLY* on these origin
+    # types. Piths of any other types (e.g., subclasses of these types)
+    # default to the type mask selecting all child hints and are thus
+    # type-checked against each child hint in turn.
+    type_masks = {}
+    for hint_child_type in hint_childs_pep_type:
+        # If this type has already been masked, continue to the next.
+        if hint_child_type in type_masks:
+            continue
+        # Else, this type has yet to be masked.
+
+        # Type mask selecting the PEP-noncompliant child hints if objects of
+        # this type satisfy any of these hints *OR* no such hints otherwise.
+        type_mask = (
+            UNION_TYPE_MASK_NONPEP
+            if any(
+                issubclass(hint_child_type, hint_child_nonpep)
+                for hint_child_nonpep in hint_childs_nonpep
+            ) else
+            0
+        )
+
+        # For the 0-based index and origin type of each PEP-compliant child
+        # hint, select that child hint if objects of this type are instances
+        # of that origin type.
+        for hint_child_index, hint_child_type_other in enumerate(
+            hint_childs_pep_type):
+            if issubclass(hint_child_type, hint_child_type_other):
+                type_mask |= 2 << hint_child_index
+
+        type_masks[hint_child_type] = type_mask
+
+    # Register this dictionary, returning a Python expression evaluating to it.
+    with _union_type_masks_lock:
+        union_type_masks.append(type_masks)
+        return f'{UNION_TYPE_MASKS_NAME}[{len(union_type_masks) - 1}]'
+
+# ....................{ PRIVATE ~ testers                 }....................
+def _is_type_instancecheck_standard(cls: type) -> bool:
+    '''
+    ``True`` only if the metaclass of the passed class performs a standard
+    instance check (i.e., only if objects whose exact types subclass this
+    class are necessarily instances of this class).
+
+    Parameters
+    ----------
+    cls : type
+        Class to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this class performs a standard instance check.
+    '''
+
+    return type(cls).__instancecheck__ in _INSTANCECHECKS_STANDARD
+
+# ....................{ REGISTRATION                      }....................
+# Expose this cache as a global to wrapper functions. See the
+# "beartype._decor._cache.cacheglobal" submodule for further details.
+register_wrapper_global(UNION_TYPE_MASKS_NAME, union_type_masks)
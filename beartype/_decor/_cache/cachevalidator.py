@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype validator cache** (i.e., singleton list of all validator testers
+subscripting beartype validators (e.g., ``beartype.vale.Is[...]``) that are
+*not* inlinable, enabling wrapper functions generated by the
+:func:`beartype.beartype` decorator to call these testers by index).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+import builtins
+from beartype._decor._cache.cacheglobal import register_wrapper_global
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.func.utilfunclambda import get_func_lambda_expr_or_none
+from beartype.vale._valeis import _SubscriptedIs
+from collections.abc import Callable
+from threading import Lock
+from typing import List
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+VALIDATORS_NAME = '__beartype_validators'
+'''
+Name of the global variable referring to the :data:`validators` singleton in
+the bodies of wrapper functions generated by the :func:`beartype.beartype`
+decorator.
+'''
+
+
+VALIDATOR_BUILTINS_NAME = '__beartype_builtins'
+'''
+Name of the global variable referring to the :mod:`builtins` module in the
+bodies of wrapper functions generated by the :func:`beartype.beartype`
+decorator, accessed by inlined validator testers referencing builtins.
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_PITH_PLACEHOLDER = '\0'
+'''
+Placeholder substring temporarily replacing the parameter accepted by each
+inlined validator tester in the Python expression inlining that tester.
+
+Since the null character is *never* embedded as is in the source code unparsed
+from abstract syntax trees, this placeholder is guaranteed to be unique.
+'''
+
+# ....................{ SINGLETONS                        }....................
+validators: List[Callable] = []
+'''
+**Validator tester cache** (i.e., singleton list of all validator testers
+*not* inlinable into wrapper functions).
+
+Each tester is accessed by the 0-based index embedded in the Python expression
+returned by the :func:`get_validator_code` function.
+'''
+
+
+_validators_lock = Lock()
+'''
+Non-reentrant lock serializing appends to the :data:`validators` list.
+'''
+
+# ....................{ GETTERS                           }....................
+def get_validator_code(validator: _SubscriptedIs, pith_expr: str) -> str:
+    '''
+    Python expression validating the object to which the passed Python
+    expression evaluates against the passed beartype validator when accessed
+    from the body of a wrapper function generated by the
+    :func:`beartype.beartype` decorator.
+
+    Each validator tester encapsulated by this validator is either:
+
+    * If that tester is safely inlinable (i.e., an expression-only lambda
+      function referencing no names other than its parameter and builtins),
+      inlined directly into this expression.
+    * Else, registered with the :data:`validators` list and called from this
+      expression.
+
+    Parameters
+    ----------
+    validator : _SubscriptedIs
+        Beartype validator to generate this expression for.
+    pith_expr : str
+        Python expression evaluating to the object to be validated. Since this
+        expression may be embedded in the returned expression multiple times,
+        this expression should be a local variable name.
+
+    Returns
+    ----------
+    str
+        Python expression validating this object against this validator.
+    '''
+    assert isinstance(validator, _SubscriptedIs), (
+        f'{repr(validator)} not beartype validator.')
+    assert isinstance(pith_expr, str), f'{repr(pith_expr)} not string.'
+
+    # Operator combining the validators combined by this validator if any.
+    validator_operator = validator._is_valid_operator
+
+    # If this validator encapsulates a single tester, return an expression
+    # either inlining or calling this tester.
+    if validator_operator is None:
+        return _get_validator_tester_code(validator.is_valid).replace(
+            _PITH_PLACEHOLDER, pith_expr)
+    # Else, this validator combines one or more other validators.
+    #
+    # If this validator negates another validator, return an expression
+    # negating the expression validating against that validator.
+    elif len(validator._is_valid_operands) == 1:
+        return (
+            f'({validator_operator} '
+            f'{get_validator_code(validator._is_valid_operands[0], pith_expr)})'
+        )
+    # Else, this validator combines two or more other validators.
+
+    # Return an expression combining the expressions validating against these
+    # validators by this operator.
+    return '({})'.format(f' {validator_operator} '.join(
+        get_validator_code(validator_operand, pith_expr)
+        for validator_operand in validator._is_valid_operands
+    ))
+
+# ....................{ PRIVATE ~ getters                 }....................
+@callable_cached
+def _get_validator_tester_code(is_valid: Callable) -> str:
+    '''
+    Python expression validating the object to which the
+    :data:`_PITH_PLACEHOLDER` substring is subsequently replaced against the
+    passed validator tester, either inlining that tester if safely inlinable
+    *or* registering that tester with the :data:`validators` list and calling
+    that tester otherwise.
+
+    This getter is memoized for both efficiency *and* safety, preventing
+    accidental reregistration.
+
+    Parameters
+    ----------
+    is_valid : Callable
+        Validator tester to generate this expression for.
+
+    Returns
+    ----------
+    str
+        Python expression validating this placeholder against this tester.
+    '''
+
+    # Python expression inlining this tester if safely inlinable *OR* "None".
+    is_valid_expr = get_func_lambda_expr_or_none(
+        is_valid, _PITH_PLACEHOLDER, VALIDATOR_BUILTINS_NAME)
+
+    # If this tester is safely inlinable, return this expression.
+    if is_valid_expr is not None:
+        return is_valid_expr
+    # Else, this tester is *NOT* safely inlinable.
+
+    # Register this tester, returning an expression calling this tester.
+    with _validators_lock:
+        validators.append(is_valid)
+        return (
+            f'{VALIDATORS_NAME}[{len(validators) - 1}]({_PITH_PLACEHOLDER})')
+
+# ....................{ REGISTRATION                      }....................
+# Expose this cache and the builtins module as globals to wrapper functions.
+# See the "beartype._decor._cache.cacheglobal" submodule for further details.
+register_wrapper_global(VALIDATORS_NAME, validators)
+register_wrapper_global(VALIDATOR_BUILTINS_NAME, builtins)
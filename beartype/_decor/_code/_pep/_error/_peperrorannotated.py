@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant type hint call-time utilities** (i.e., callables
+operating on PEP-compliant type hints intended to be called by dynamically
+generated wrapper functions wrapping decorated callables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._util.hint.data.pep.proposal.utilhintdatapep593 import (
+    HINT_PEP593_SIGN_ANNOTATED)
+from beartype._util.hint.pep.proposal.utilhintpep593 import (
+    get_hint_pep593_hint,
+    get_hint_pep593_metadata_validators,
+)
+from beartype._util.hint.utilhinttest import is_hint_ignorable
+from beartype._util.text.utiltextrepr import get_object_representation
+from typing import Optional
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ GETTERS                           }....................
+def get_cause_or_none_annotated(sleuth: CauseSleuth) -> Optional[str]:
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed `PEP 593`_-compliant **beartype type metahint**
+    (i.e., subscription of the :attr:`typing.Annotated` singleton by one or
+    more beartype validators) if this object actually fails to satisfy this
+    hint *or* ``None`` otherwise (i.e., if this object satisfies this hint).
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+
+    .. _PEP 593:
+       https://www.python.org/dev/peps/pep-0593
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert sleuth.hint_sign is HINT_PEP593_SIGN_ANNOTATED, (
+        f'{repr(sleuth.hint_sign)} not "typing.Annotated".')
+
+    # Type hint annotated by this metahint.
+    hint_child = get_hint_pep593_hint(sleuth.hint)
+
+    # If this type hint is unignorable...
+    if not is_hint_ignorable(hint_child):
+        # Human-readable string describing the failure of this pith to satisfy
+        # this type hint if this pith actually fails to satisfy this type hint
+        # *OR* "None" otherwise.
+        pith_cause = sleuth.permute(hint=hint_child).get_cause_or_none()
+
+        # If this pith fails to satisfy this type hint, return this cause.
+        if pith_cause is not None:
+            return pith_cause
+        # Else, this pith satisfies this type hint.
+    # Else, this type hint is ignorable.
+
+    # For each beartype validator subscripting this metahint...
+    for hint_validator in get_hint_pep593_metadata_validators(sleuth.hint):
+        # If this pith fails to satisfy this validator, return a substring
+        # describing this failure.
+        if not hint_validator.is_valid(sleuth.pith):
+            # Truncated representation of this pith.
+            pith_repr = get_object_representation(sleuth.pith)
+
+            # Return a substring describing this failure.
+            return f'value {pith_repr} violates validator {repr(hint_validator)}'
+        # Else, this pith satisfies this validator. Continue to the next.
+
+    # Return "None", as this pith satisfies both this type hint *AND* all
+    # validators subscripting this metahint, implying this pith to deeply
+    # satisfy this metahint.
+    return None
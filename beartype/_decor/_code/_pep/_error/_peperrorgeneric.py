@@ -15,13 +15,10 @@ This private submodule is *not* intended for importation by downstream callers.
 from beartype._decor._code._pep._error._peperrortype import (
     get_cause_or_none_type)
 from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
-from beartype._util.hint.utilhinttest import is_hint_ignorable
-from beartype._util.hint.pep.proposal.utilhintpep484 import (
-    get_hint_pep484_generic_base_erased_from_unerased)
-from beartype._util.hint.pep.proposal.utilhintpep585 import is_hint_pep585_builtin
 from beartype._util.hint.pep.utilhintpepget import (
-    get_hint_pep_generic_type_or_none)
-from beartype._util.hint.pep.utilhintpeptest import is_hint_pep_typing
+    get_hint_pep_generic_bases_checkable,
+    get_hint_pep_generic_type_or_none,
+)
 from typing import Generic, Optional
 
 # See the "beartype.cave" submodule for further commentary.
@@ -47,6 +44,12 @@ def get_cause_or_none_generic(sleuth: CauseSleuth) -> Optional[str]:
     assert sleuth.hint_sign is Generic, (
         f'{repr(sleuth.hint_sign)} not generic.')
 
+    # Tuple of the zero or more checkable pseudo-superclasses of this generic,
+    # propagating all child hints subscripting this generic if any to these
+    # pseudo-superclasses *BEFORE* reducing this generic below. See the
+    # get_hint_pep_generic_bases_checkable() getter for details.
+    hint_bases = get_hint_pep_generic_bases_checkable(sleuth.hint)
+
     # If this hint is *NOT* a class, reduce this hint to the object originating
     # this hint if any. See the is_hint_pep484_generic() tester for details.
     sleuth.hint = get_hint_pep_generic_type_or_none(sleuth.hint)
@@ -58,31 +61,8 @@ def get_cause_or_none_generic(sleuth: CauseSleuth) -> Optional[str]:
         return get_cause_or_none_type(sleuth)
     # Else, this pith is an instance of this generic.
 
-    # For each pseudo-superclass of this generic...
-    for hint_base in sleuth.hint_childs:
-        # If this pseudo-superclass is an actual superclass, this
-        # pseudo-superclass is effectively ignorable. Why? Because the
-        # isinstance() call above already type-checked this pith against the
-        # generic subclassing this superclass and thus this superclass as well.
-        # In this case, skip to the next pseudo-superclass.
-        if isinstance(hint_base, type):
-            continue
-        # Else, this pseudo-superclass is *NOT* an actual class.
-        #
-        # If this pseudo-superclass is neither a PEP 585-compliant type hint
-        # *NOR* a PEP-compliant type hint defined by the "typing" module,
-        # reduce this pseudo-superclass to a real superclass originating this
-        # pseudo-superclass. See commentary in the "_pephint" submodule.
-        elif not (is_hint_pep585_builtin(hint_base) and is_hint_pep_typing(hint_base)):
-            hint_base = get_hint_pep484_generic_base_erased_from_unerased(
-                hint_base)
-        # Else, this pseudo-superclass is defined by the "typing" module.
-
-        # If this superclass is ignorable, do so.
-        if is_hint_ignorable(hint_base):
-            continue
-        # Else, this superclass is unignorable.
-
+    # For each checkable pseudo-superclass of this generic...
+    for hint_base in hint_bases:
         # Human-readable string describing the failure of this pith to satisfy
         # this pseudo-superclass if this pith actually fails to satisfy
         # this pseudo-superclass *or* "None" otherwise.
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :mod:`numpy` **type hint call-time utilities** (i.e., callables
+operating on :mod:`numpy`-specific type hints intended to be called by
+dynamically generated wrapper functions wrapping decorated callables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._util.hint.data.pep.mod.utilhintdatamodnumpy import (
+    HINT_NUMPY_SIGN_NDARRAY)
+from beartype._util.hint.pep.mod.utilhintmodnumpy import (
+    get_hint_numpy_ndarray_dtype_type_or_none,
+    get_hint_numpy_ndarray_ndim_or_none,
+)
+from beartype._util.text.utiltextcause import get_cause_object_not_type
+from beartype._util.text.utiltextlabel import label_class
+from beartype._util.text.utiltextrepr import get_object_representation
+from typing import Optional
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ GETTERS                           }....................
+def get_cause_or_none_numpy_ndarray(sleuth: CauseSleuth) -> Optional[str]:
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed :mod:`numpy`-specific **array type hint** (i.e.,
+    subscription of the :class:`numpy.ndarray` type, including
+    ``numpy.typing.NDArray[...]`` type hints) if this object actually fails to
+    satisfy this hint *or* ``None`` otherwise (i.e., if this object satisfies
+    this hint).
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert sleuth.hint_sign is HINT_NUMPY_SIGN_NDARRAY, (
+        f'{repr(sleuth.hint_sign)} not NumPy array sign.')
+
+    # "numpy.ndarray" type originating this hint.
+    hint_type = sleuth.hint.__origin__
+
+    # If this pith is *NOT* a NumPy array, return a substring describing this
+    # failure.
+    if not isinstance(sleuth.pith, hint_type):
+        return get_cause_object_not_type(pith=sleuth.pith, hint=hint_type)
+    # Else, this pith is a NumPy array.
+
+    # Scalar type and dimensionality constrained by this hint if any *OR*
+    # "None" otherwise.
+    hint_dtype_type = get_hint_numpy_ndarray_dtype_type_or_none(sleuth.hint)
+    hint_ndim = get_hint_numpy_ndarray_ndim_or_none(sleuth.hint)
+
+    # If this hint constrains the dtype of this array *AND* the scalar type of
+    # this array's dtype violates that constraint, return a substring
+    # describing this failure.
+    if hint_dtype_type is not None and not issubclass(
+        sleuth.pith.dtype.type, hint_dtype_type):
+        return (
+            f'array {get_object_representation(sleuth.pith)} dtype '
+            f'"{sleuth.pith.dtype}" not {label_class(hint_dtype_type)}'
+        )
+    # Else, this array's dtype satisfies this hint.
+    #
+    # If this hint constrains the dimensionality of this array *AND* this
+    # array violates that constraint, return a substring describing this
+    # failure.
+    elif hint_ndim is not None and sleuth.pith.ndim != hint_ndim:
+        return (
+            f'array {get_object_representation(sleuth.pith)} '
+            f'{sleuth.pith.ndim}-dimensional rather than '
+            f'{hint_ndim}-dimensional'
+        )
+    # Else, this array's dimensionality satisfies this hint.
+
+    # Return "None", as this array satisfies this hint.
+    return None
@@ -16,6 +16,7 @@ from beartype._decor._code._pep._error._peperrortype import (
     get_cause_or_none_type)
 from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
 from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_SEQUENCE_ENDS,
     HINT_PEP_SIGNS_SEQUENCE_STANDARD,
     HINT_PEP_SIGNS_TUPLE,
 )
@@ -68,6 +69,76 @@ def get_cause_or_none_sequence_standard(sleuth: CauseSleuth) -> Optional[str]:
     return _get_cause_or_none_sequence(sleuth)
 
 
+def get_cause_or_none_sequence_ends(sleuth: CauseSleuth) -> Optional[str]:
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed **PEP-compliant end-indexable sequence type hint**
+    (i.e., PEP-compliant type hint accepting exactly one subscripted type hint
+    argument constraining *all* items of this object, which guarantees
+    ``O(1)`` indexation of only its first and last items) if this object
+    actually fails to satisfy this hint *or* ``None`` otherwise (i.e., if this
+    object satisfies this hint).
+
+    Since the parent @beartype-generated wrapper function type-checks only the
+    first and last items of this sequence, this getter type-checks only those
+    items as well.
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert sleuth.hint_sign in HINT_PEP_SIGNS_SEQUENCE_ENDS, (
+        f'{repr(sleuth.hint)} not end-indexable sequence hint.')
+
+    # Assert this sequence was subscripted by exactly one argument. Note that
+    # the "typing" module should have already guaranteed this on our behalf.
+    assert len(sleuth.hint_childs) == 1, (
+        f'End-indexable sequence hint {repr(sleuth.hint)} subscripted by '
+        f'multiple arguments.')
+
+    # Non-"typing" class originating this attribute (e.g., "deque" for
+    # "Deque").
+    hint_type_origin = get_hint_pep_stdlib_type(sleuth.hint)
+
+    # If this pith is *NOT* an instance of this class, defer to the getter
+    # function handling non-"typing" classes.
+    if not isinstance(sleuth.pith, hint_type_origin):
+        return get_cause_or_none_type(sleuth.permute(hint=hint_type_origin))
+    # Else, this pith is an instance of this class and is thus a sequence.
+
+    # Lone child hint of this hint.
+    hint_child = sleuth.hint_childs[0]
+
+    # If this sequence is non-empty *AND* this child hint is unignorable...
+    if sleuth.pith and not is_hint_ignorable(hint_child):
+        # For the 0-based index of the first and last items of this sequence
+        # (which reduce to the same index for single-item sequences)...
+        for pith_item_index in (0, len(sleuth.pith) - 1):
+            # Human-readable string describing the failure of this item to
+            # satisfy this child hint if this item actually fails to satisfy
+            # this child hint *or* "None" otherwise.
+            pith_item_cause = sleuth.permute(
+                pith=sleuth.pith[pith_item_index],
+                hint=hint_child,
+            ).get_cause_or_none()
+
+            # If this item is the cause of this failure, return a substring
+            # describing this failure.
+            if pith_item_cause is not None:
+                return (
+                    f'{sleuth.pith.__class__.__name__} item '
+                    f'{pith_item_index} {pith_item_cause}')
+            # Else, this item is *NOT* the cause of this failure. Silently
+            # continue to the next.
+    # Else, this sequence is either empty *OR* this child hint is ignorable.
+
+    # Return "None", as both the first and last items of this sequence are
+    # valid, implying this pith to deeply satisfy this hint.
+    return None
+
+
 def get_cause_or_none_tuple(sleuth: CauseSleuth) -> Optional[str]:
     '''
     Human-readable string describing the failure of the passed arbitrary object
@@ -13,7 +13,8 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                           }....................
-from beartype.cave import NoneType, NoneTypeOr
+from beartype._cave._cavefast import NoneType
+from beartype._cave.mapping import NoneTypeOr
 from beartype.roar import _BeartypeCallHintPepRaiseException
 from beartype._util.hint.pep.proposal.utilhintpep484 import (
     get_hint_pep484_newtype_class,
@@ -23,9 +24,11 @@ from beartype._util.hint.pep.proposal.utilhintpep544 import (
     get_hint_pep544_io_protocol_from_generic,
     is_hint_pep544_io_generic,
 )
+from beartype._util.hint.pep.proposal.utilhintpep589 import is_hint_pep589
 from beartype._util.hint.pep.proposal.utilhintpep593 import (
     get_hint_pep593_hint,
     is_hint_pep593,
+    is_hint_pep593_beartype,
 )
 from beartype._util.hint.pep.utilhintpepget import (
     get_hint_pep_args,
@@ -95,6 +98,12 @@ class CauseSleuth(object):
         such integer). See the same parameter accepted by the higher-level
         :func:`beartype._decor._code._pep._error.peperror.raise_pep_call_exception`
         function for further details.
+    is_check_fields : bool
+        ``True`` only if annotated fields of **records** (i.e.,
+        :class:`typing.NamedTuple` subclasses and dataclasses) are also to be
+        validated. See the same parameter accepted by the higher-level
+        :func:`beartype._decor._code._pep._error.peperror.raise_pep_call_exception`
+        function for further details.
 
     Attributes (Private)
     ----------
@@ -112,6 +121,7 @@ class CauseSleuth(object):
         'func',
         'hint_sign',
         'hint_childs',
+        'is_check_fields',
         'pith',
         'random_int',
         '_hint',
@@ -123,6 +133,7 @@ class CauseSleuth(object):
         'exception_label',
         'func',
         'hint',
+        'is_check_fields',
         'pith',
         'random_int',
     ))
@@ -144,6 +155,7 @@ class CauseSleuth(object):
         cause_indent: str,
         exception_label: str,
         random_int: int,
+        is_check_fields: bool = False,
     ) -> None:
         '''
         Initialize this object.
@@ -155,6 +167,8 @@ class CauseSleuth(object):
             f'{repr(exception_label)} not string.')
         assert isinstance(random_int, NoneTypeOr[int]), (
             f'{repr(random_int)} not integer or "None".')
+        assert isinstance(is_check_fields, bool), (
+            f'{repr(is_check_fields)} not boolean.')
 
         # Classify all passed parameters.
         self.func = func
@@ -162,6 +176,7 @@ class CauseSleuth(object):
         self.cause_indent = cause_indent
         self.exception_label = exception_label
         self.random_int = random_int
+        self.is_check_fields = is_check_fields
 
         # Nullify all remaining parameters for safety.
         self.hint_sign: Any = None
@@ -224,10 +239,11 @@ class CauseSleuth(object):
         elif is_hint_pep544_io_generic(hint):
             hint = get_hint_pep544_io_protocol_from_generic(hint)
         # ................{ REDUCTION ~ pep 593               }................
-        # If this is a PEP 593-compliant type metahint, ignore all annotations
-        # on this hint (i.e., "hint_curr.__metadata__" tuple) by reducing this
-        # hint to its origin (e.g., "str" in "Annotated[str, 50, False]").
-        elif is_hint_pep593(hint):
+        # If this is a PEP 593-compliant type metahint subscripted by *NO*
+        # beartype validators, ignore all annotations on this hint (i.e.,
+        # "hint_curr.__metadata__" tuple) by reducing this hint to its origin
+        # (e.g., "str" in "Annotated[str, 50, False]").
+        elif is_hint_pep593(hint) and not is_hint_pep593_beartype(hint):
             hint = get_hint_pep593_hint(hint)
         # ................{ REDUCTION ~ end                   }................
 
@@ -363,9 +379,12 @@ class CauseSleuth(object):
                 is_hint_pep_tuple_empty(self.hint) or
                 # A forward reference nor type variable, whose designs reside
                 # well outside the standard "typing" dunder variable API and
-                # are thus *NEVER* subscripted by child hints...
+                # are thus *NEVER* subscripted by child hints *NOR*...
                 is_hint_forwardref(self.hint) or
-                is_hint_pep_typevar(self.hint)
+                is_hint_pep_typevar(self.hint) or
+                # A typed dictionary, whose keys are annotated by type hints
+                # also residing outside that API...
+                is_hint_pep589(self.hint)
             ):
             # Then this hint should have been subscripted by one or more child
             # hints but wasn't. In this case, raise an exception.
@@ -14,6 +14,10 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                           }....................
 from beartype.roar import _BeartypeCallHintPepRaiseException
 from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._util.cls.utilclsrecord import (
+    get_type_record_field_hints,
+    is_type_record,
+)
 from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_BASE_FORWARDREF)
 from beartype._util.hint.utilhintget import (
@@ -85,9 +89,21 @@ def get_cause_or_none_type(sleuth: CauseSleuth) -> Optional[str]:
         )
     # Else, this hint is a class.
     #
-    # If this pith is an instance of this class, return "None".
+    # If this pith is an instance of this class, return either...
     elif isinstance(sleuth.pith, sleuth.hint):
-        return None
+        return (
+            # If annotated fields of records are to be validated *AND* the
+            # type of this pith is a record, a substring describing the first
+            # field of this pith violating its type hint if any *OR* "None"
+            # otherwise.
+            _get_cause_or_none_record_fields(sleuth)
+            if (
+                sleuth.is_check_fields and
+                is_type_record(sleuth.pith.__class__)
+            ) else
+            # Else, "None".
+            None
+        )
     # Else, this pith is *NOT* an instance of this type.
 
     # Return a substring describing this failure intended to be embedded in a
@@ -123,3 +139,77 @@ def get_cause_or_none_type_origin(sleuth: CauseSleuth) -> Optional[str]:
 
     # Defer to the getter function handling non-"typing" classes. Presto!
     return get_cause_or_none_type(sleuth.permute(hint=hint_type_origin))
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_cause_or_none_record_fields(sleuth: CauseSleuth) -> Optional[str]:
+    '''
+    Human-readable string describing the failure of an annotated field of the
+    passed **record** (i.e., instance of a :class:`typing.NamedTuple` subclass
+    or dataclass) to satisfy the type hint annotating that field if any field
+    of this record fails to do so *or* ``None`` otherwise.
+
+    As with the
+    :func:`beartype._decor._cache.cachefield.is_record_fields_valid` tester,
+    this getter inspects all annotated fields declared by the type of this
+    record rather than the class annotating this record *and* treats records
+    currently being inspected by a parent call as valid.
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth whose pith is this record.
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+
+    # Defer heavyweight imports, avoiding increasing the import time of the
+    # "beartype" package for callers never type-checking record fields.
+    from beartype._decor._cache.cachefield import get_record_ids_validating
+
+    # Type of this record.
+    record_cls = sleuth.pith.__class__
+
+    # Set of the identifiers of all records currently being inspected by this
+    # thread and the identifier of this record.
+    record_ids = get_record_ids_validating()
+    record_id = id(sleuth.pith)
+
+    # If this record is currently being inspected by a parent call, this
+    # record is self-referential. In this case, defer to that call.
+    if record_id in record_ids:
+        return None
+    # Else, this record is *NOT* currently being inspected.
+
+    # Record this record as currently being inspected while inspecting it.
+    record_ids.add(record_id)
+    try:
+        # For the name and hint of each annotated field declared by this
+        # record type...
+        for field_name, field_hint in get_type_record_field_hints(record_cls):
+            # Human-readable string describing the failure of this field to
+            # satisfy this hint if this field fails to do so *OR* "None".
+            #
+            # Note that this field is type-checked in linear rather than
+            # constant time, as the pseudo-random integer (if any) passed by
+            # the parent wrapper function governs only items of containers
+            # type-checked by that function rather than items of containers
+            # nested in this field.
+            field_cause = sleuth.permute(
+                pith=getattr(sleuth.pith, field_name),
+                hint=field_hint,
+                random_int=None,
+            ).get_cause_or_none()
+
+            # If this field is the cause of this failure, return a substring
+            # describing this failure embedding this cause.
+            if field_cause is not None:
+                return (
+                    f'{record_cls.__name__} field "{field_name}" '
+                    f'{field_cause}'
+                )
+            # Else, this field is *NOT* the cause of this failure. Silently
+            # continue to the next.
+    finally:
+        record_ids.discard(record_id)
+
+    # Return "None", as all fields of this record satisfy their hints.
+    return None
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant type hint call-time utilities** (i.e., callables
+operating on PEP-compliant type hints intended to be called by dynamically
+generated wrapper functions wrapping decorated callables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._decor._code._pep._error._peperrortype import (
+    get_cause_or_none_type)
+from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._util.hint.data.pep.proposal.utilhintdatapep589 import (
+    HINT_PEP589_SIGN_TYPEDDICT)
+from beartype._util.hint.pep.proposal.utilhintpep589 import (
+    get_hint_pep589_key_hints,
+    get_hint_pep589_keys_required,
+)
+from beartype._util.text.utiltextrepr import get_object_representation
+from typing import Optional
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ GETTERS                           }....................
+def get_cause_or_none_typeddict(sleuth: CauseSleuth) -> Optional[str]:
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed `PEP 589`_-compliant **typed dictionary** (i.e.,
+    :class:`typing.TypedDict` subclass) if this object actually fails to
+    satisfy this hint *or* ``None`` otherwise (i.e., if this object satisfies
+    this hint).
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+
+    .. _PEP 589:
+        https://www.python.org/dev/peps/pep-0589
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert sleuth.hint_sign is HINT_PEP589_SIGN_TYPEDDICT, (
+        f'{repr(sleuth.hint_sign)} not typed dictionary hint.')
+
+    # If this pith is *NOT* a dictionary, defer to the getter function handling
+    # non-"typing" classes.
+    if not isinstance(sleuth.pith, dict):
+        return get_cause_or_none_type(sleuth.permute(hint=dict))
+    # Else, this pith is a dictionary.
+
+    # Frozen set of the names of all required keys of this typed dictionary.
+    keys_required = get_hint_pep589_keys_required(sleuth.hint)
+
+    # If this dictionary fails to contain one or more of these keys...
+    if not keys_required <= sleuth.pith.keys():
+        # Truncated representation of this dictionary.
+        pith_repr = get_object_representation(sleuth.pith)
+
+        # Sorted tuple of the names of all such keys, sorted for determinism.
+        keys_missing = sorted(keys_required - sleuth.pith.keys())
+
+        # Return a substring describing this failure.
+        return (
+            f'dict {pith_repr} missing {sleuth.hint.__name__} required '
+            f'key(s) {", ".join(repr(key) for key in keys_missing)}'
+        )
+    # Else, this dictionary contains all required keys.
+
+    # Tuple of the names and hints of all unignorable keys of this typed
+    # dictionary.
+    key_hints = get_hint_pep589_key_hints(sleuth.hint)
+
+    # If this typed dictionary declares one or more such keys *AND* the parent
+    # wrapper function type-checked only the single key pseudo-randomly
+    # selected by the pseudo-random integer passed by that function, reduce
+    # these keys to that key. See the
+    # "beartype._decor._cache.cachetypeddict" submodule for the corresponding
+    # logic generating that code.
+    #
+    # Note that, if that function passed *NO* such integer, that function
+    # either type-checked *ALL* keys of this dictionary or this dictionary is
+    # nested in a record field or typed dictionary value type-checked by a
+    # separate wrapper function. In either case, type-check *ALL* keys.
+    if key_hints and not sleuth.is_check_fields and (
+        sleuth.random_int is not None):
+        key_hints = (key_hints[sleuth.random_int % len(key_hints)],)
+
+    # For the name and hint of each such key...
+    for key_name, key_hint in key_hints:
+        # If this dictionary fails to contain this optional key, silently
+        # continue to the next.
+        if key_name not in sleuth.pith:
+            continue
+        # Else, this dictionary contains this key.
+
+        # Human-readable string describing the failure of the value of this key
+        # to satisfy this hint if this value fails to do so *OR* "None".
+        #
+        # Note that this value is type-checked in linear rather than constant
+        # time, as this value was type-checked by a separate wrapper function
+        # with its own pseudo-random integer.
+        key_cause = sleuth.permute(
+            pith=sleuth.pith[key_name],
+            hint=key_hint,
+            random_int=None,
+        ).get_cause_or_none()
+
+        # If this value is the cause of this failure, return a substring
+        # describing this failure embedding this cause.
+        if key_cause is not None:
+            return f'{sleuth.hint.__name__} key {repr(key_name)} {key_cause}'
+        # Else, this value is *NOT* the cause of this failure. Silently
+        # continue to the next.
+
+    # Return "None", as all checked keys of this dictionary are valid.
+    return None
@@ -15,6 +15,7 @@ This private submodule is *not* intended for importation by downstream callers.
 from beartype.roar import _BeartypeCallHintPepRaiseException
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._util.cls.utilclsrecord import is_type_record
 from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_SIGNS_UNION)
 from beartype._util.hint.pep.utilhintpepget import (
@@ -120,10 +121,34 @@ def get_cause_or_none_union(sleuth: CauseSleuth) -> Optional[str]:
                 f'(i.e., neither PEP type hint nor non-"typing" class).')
             # Else, this child hint is a non-"typing" type.
 
-            # If this pith is an instance of this class, this pith satisfies
-            # this hint. In this case, return "None".
+            # If this pith is an instance of this class...
             if isinstance(sleuth.pith, hint_child):
-                return None
+                # If annotated fields of records are *NOT* to be validated *OR*
+                # this class is *NOT* a record, this pith satisfies this hint.
+                # In this case, return "None".
+                if not (sleuth.is_check_fields and is_type_record(hint_child)):
+                    return None
+                # Else, this class is a record whose fields are to be
+                # validated.
+
+                # Human-readable string describing the failure of a field of
+                # this pith to satisfy its hint if any *OR* "None" otherwise.
+                pith_cause_hint_child = sleuth.permute(
+                    hint=hint_child,
+                    cause_indent=CAUSE_INDENT_CHILD,
+                ).get_cause_or_none()
+
+                # If all fields of this pith satisfy their hints, this pith
+                # satisfies this hint. In this case, return "None".
+                if pith_cause_hint_child is None:
+                    return None
+                # Else, one or more fields of this pith violate their hints.
+
+                # Append a cause as a discrete bullet-prefixed line.
+                causes_union.append(pith_cause_hint_child)
+
+                # Continue to the next child hint.
+                continue
 
             # Else, this pith is *NOT* an instance of this class, implying this
             # pith to *NOT* satisfy this hint. In this case, add this class to
@@ -64,7 +64,7 @@ This private submodule is *not* intended for importation by downstream callers.
 #  containers in the exact same order as visited by our testing algorithm.
 
 # ....................{ IMPORTS                           }....................
-from beartype.cave import NoneTypeOr
+from beartype._cave.mapping import NoneTypeOr
 from beartype.meta import URL_ISSUES
 from beartype.roar import (
     BeartypeCallHintPepParamException,
@@ -72,13 +72,20 @@ from beartype.roar import (
     _BeartypeCallHintPepRaiseException,
     _BeartypeCallHintPepRaiseDesynchronizationException,
 )
+from beartype._decor._code._pep._error._peperrorannotated import (
+    get_cause_or_none_annotated)
 from beartype._decor._code._pep._error._peperrorgeneric import (
     get_cause_or_none_generic)
+from beartype._decor._code._pep._error._peperrornumpy import (
+    get_cause_or_none_numpy_ndarray)
 from beartype._decor._code._pep._error._peperrorsequence import (
+    get_cause_or_none_sequence_ends,
     get_cause_or_none_sequence_standard,
     get_cause_or_none_tuple,
 )
 from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._decor._code._pep._error._peperrortypeddict import (
+    get_cause_or_none_typeddict)
 from beartype._decor._code._pep._error._peperrortype import (
     get_cause_or_none_forwardref,
     get_cause_or_none_type_origin,
@@ -87,6 +94,7 @@ from beartype._decor._code._pep._error._peperrorunion import (
     get_cause_or_none_union,
 )
 from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_SEQUENCE_ENDS,
     HINT_PEP_SIGNS_SEQUENCE_STANDARD,
     HINT_PEP_SIGNS_TUPLE,
     HINT_PEP_SIGNS_TYPE_ORIGIN_STDLIB,
@@ -95,10 +103,19 @@ from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_BASE_FORWARDREF,
     HINT_PEP484_SIGNS_UNION,
 )
+from beartype._util.hint.data.pep.proposal.utilhintdatapep589 import (
+    HINT_PEP589_SIGNS_SUPPORTED_DEEP)
+from beartype._util.hint.data.pep.proposal.utilhintdatapep593 import (
+    HINT_PEP593_SIGNS_SUPPORTED_DEEP)
+from beartype._util.hint.data.pep.mod.utilhintdatamodnumpy import (
+    HINT_NUMPY_SIGNS_SUPPORTED_DEEP)
+from beartype._util.hint.pep.proposal.utilhintpep484 import (
+    reduce_hint_pep484_typevars)
 from beartype._util.hint.utilhinttest import die_unless_hint
 from beartype._util.text.utiltextlabel import (
     label_callable_decorated_param_value,
     label_callable_decorated_return_value,
+    label_class,
 )
 from beartype._util.text.utiltextmunge import suffix_unless_suffixed
 from beartype._util.text.utiltextrepr import get_object_representation
@@ -140,6 +157,8 @@ def raise_pep_call_exception(
 
     # Optional parameters.
     random_int: Optional[int] = None,
+    is_check_fields: bool = False,
+    is_check_typevars: bool = False,
 ) -> None:
     '''
     Raise a human-readable exception detailing the failure of the parameter
@@ -208,6 +227,18 @@ def raise_pep_call_exception(
 
         Defaults to ``None``, implying this exception handler runs in linear
         time by default.
+    is_check_fields : bool
+        ``True`` only if the parent :func:`beartype.beartype` wrapper function
+        deeply type-checked all annotated fields of **records** (i.e.,
+        :class:`typing.NamedTuple` subclasses and dataclasses) visitable from
+        this hint, in which case this handler also describes violations of
+        these fields. Defaults to ``False``.
+    is_check_typevars : bool
+        ``True`` only if the parent :func:`beartype.beartype` wrapper function
+        type-checked this pith against the hint reduced from this hint by
+        replacing all bounded and constrained type variables with the hints
+        constraining these variables, in which case this handler reduces this
+        hint in the same way. Defaults to ``False``.
 
     Raises
     ----------
@@ -233,6 +264,10 @@ def raise_pep_call_exception(
     assert isinstance(pith_name, str), f'{repr(pith_name)} not string.'
     assert isinstance(random_int, NoneTypeOr[int]), (
         f'{repr(random_int)} not integer or "None".')
+    assert isinstance(is_check_fields, bool), (
+        f'{repr(is_check_fields)} not boolean.')
+    assert isinstance(is_check_typevars, bool), (
+        f'{repr(is_check_typevars)} not boolean.')
     # print('''raise_pep_call_exception(
     #     func={!r},
     #     pith_name={!r},
@@ -278,6 +313,14 @@ def raise_pep_call_exception(
     die_unless_hint(hint=hint, hint_label=f'{pith_label} type hint')
     # Else, this type hint is supported.
 
+    # If the parent wrapper function type-checked this pith against the hint
+    # reduced from this hint by replacing all bounded and constrained type
+    # variables, reduce this hint in the same way. Failing to do so would
+    # describe this failure against the wrong hint *AND* raise a
+    # desynchronization exception for piths violating only these bounds.
+    if is_check_typevars:
+        hint = reduce_hint_pep484_typevars(hint)
+
     # Human-readable string describing the failure of this pith to satisfy this
     # hint if this pith fails to satisfy this hint *OR* "None" otherwise (i.e.,
     # if this pith satisfies this hint).
@@ -288,6 +331,7 @@ def raise_pep_call_exception(
         cause_indent='',
         exception_label=pith_label,
         random_int=random_int,
+        is_check_fields=is_check_fields,
     ).get_cause_or_none()
 
     # If this pith does *NOT* satisfy this hint...
@@ -320,6 +364,72 @@ def raise_pep_call_exception(
         f'accompanying exception traceback:\n{pith_value_repr}'
     )
 
+
+def raise_pep_call_typevar_exception(
+    func: Callable,
+    pith_name: str,
+    pith_value: object,
+    typevar_type: type,
+) -> None:
+    '''
+    Raise a human-readable exception detailing the failure of the parameter
+    with the passed name *or* return value if this name is the magic string
+    ``return`` of the passed decorated function to be of the type previously
+    bound by the current call to the type variable annotating this parameter
+    or return value, enabled by the
+    :attr:`beartype.BeartypeConf.is_check_typevar_bindings` option.
+
+    Parameters
+    ----------
+    func : CallableTypes
+        Decorated callable to raise this exception from.
+    pith_name : str
+        Either:
+
+        * If the object failing to be of this type is a passed parameter, the
+          name of this parameter.
+        * Else, the magic string ``return`` implying this object to be the
+          value returned from this callable.
+    pith_value : object
+        Passed parameter or returned value failing to be of this type.
+    typevar_type : type
+        Type bound to this type variable by a prior parameter of this call.
+
+    Raises
+    ----------
+    BeartypeCallHintPepParamException
+        If the object failing to be of this type is a parameter.
+    BeartypeCallHintPepReturnException
+        If the object failing to be of this type is a return value.
+    '''
+    assert callable(func), f'{repr(func)} uncallable.'
+    assert isinstance(pith_name, str), f'{repr(pith_name)} not string.'
+    assert isinstance(typevar_type, type), f'{repr(typevar_type)} not type.'
+
+    # Type of exception to be raised and human-readable label describing this
+    # parameter or return value.
+    exception_cls: type = None  # type: ignore[assignment]
+    pith_label: str = None  # type: ignore[assignment]
+    if pith_name == 'return':
+        exception_cls = BeartypeCallHintPepReturnException
+        pith_label = label_callable_decorated_return_value(
+            func=func, return_value=pith_value)
+    else:
+        exception_cls = BeartypeCallHintPepParamException
+        pith_label = label_callable_decorated_param_value(
+            func=func,
+            param_name =pith_name,
+            param_value=pith_value,
+        )
+
+    # Raise an exception of the desired class describing this binding.
+    raise exception_cls(  # type: ignore[misc]
+        f'{pith_label} violates type variable '
+        f'{repr(func.__annotations__.get(pith_name))} bound to '
+        f'{label_class(typevar_type)} earlier in this call, as '
+        f'{label_class(type(pith_value))} is not {label_class(typevar_type)}.'
+    )
+
 # ....................{ INITIALIZERS                      }....................
 def _init() -> None:
     '''
@@ -338,6 +448,11 @@ def _init() -> None:
         PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_sequence_standard] = (
             get_cause_or_none_sequence_standard)
 
+    # Map each end-indexable sequence attribute to the appropriate getter.
+    for pep_sign_sequence_ends in HINT_PEP_SIGNS_SEQUENCE_ENDS:
+        PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_sequence_ends] = (
+            get_cause_or_none_sequence_ends)
+
     # Map each tuple "typing" attribute to the appropriate getter.
     for pep_sign_tuple in HINT_PEP_SIGNS_TUPLE:
         PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_tuple] = (
@@ -348,6 +463,21 @@ def _init() -> None:
         PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_type_union] = (
             get_cause_or_none_union)
 
+    # Map each typed dictionary sign to the appropriate getter.
+    for pep_sign_typeddict in HINT_PEP589_SIGNS_SUPPORTED_DEEP:
+        PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_typeddict] = (
+            get_cause_or_none_typeddict)
+
+    # Map each type metahint sign to the appropriate getter.
+    for pep_sign_annotated in HINT_PEP593_SIGNS_SUPPORTED_DEEP:
+        PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_annotated] = (
+            get_cause_or_none_annotated)
+
+    # Map each NumPy array sign to its corresponding getter.
+    for pep_sign_numpy_ndarray in HINT_NUMPY_SIGNS_SUPPORTED_DEEP:
+        PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_numpy_ndarray] = (
+            get_cause_or_none_numpy_ndarray)
+
     # Map each "typing" attribute validated by a unique getter specific to that
     # attribute to that getter.
     PEP_HINT_SIGN_TO_GET_CAUSE_FUNC.update({
@@ -1633,33 +1633,8 @@ This private submodule is *not* intended for importation by downstream callers.
 #
 #Since we pass "func_data" everywhere, we get configuration for free. Muhaha!
 
-#FIXME: Propagate generic subscriptions both to *AND* from pseudo-superclasses.
-#First, consider the simpler case of propagating a generic subscription to
-#pseudo-superclasses: e.g.,
-#    from typing import List
-#    class MuhList(List): pass
-#
-#    @beartype
-#    def muh_lister(muh_list: MuhList[int]) -> None: pass
-#
-#During internal type hint visitation, @beartype should propagate the "int"
-#child type hint subscripting the "MuhList" type hint up to the "List"
-#pseudo-superclass under Python >= 3.9. Under older Python versions, leaving
-#"List" unsubscripted appears to raise exceptions at parse time. *shrug*
-#
-#Of the two cases, this first case is *SIGNIFICANTLY* more important than the
-#second case documented below. Why? Because mypy (probably) supports this first
-#but *NOT* second case, for  which mypy explicitly raises an "error". Since
-#mypy has effectively defined the standard interpretation of type hints,
-#there's little profit in contravening that ad-hoc standard by supporting
-#something unsupported under mypy -- especially because doing so would then
-#expose end user codebases to mypy errors. Sure, that's "not our problem, man,"
-#but it kind of is, because community standards exist for a reason -- even if
-#they're ad-hoc community standards we politely disagree with.
-#
-#Nonetheless, here's the second case. Consider the reverse case of propagating
-#a generic subscription from a pseudo-superclass down to its unsubscripted
-#generic: e.g.,
+#FIXME: Propagate generic subscriptions from pseudo-superclasses down to
+#their unsubscripted generics: e.g.,
 #    from typing import Generic, TypeVar
 #
 #    T = TypeVar('T')
@@ -1744,7 +1719,7 @@ This private submodule is *not* intended for importation by downstream callers.
 #    by presumably compiling to C is intriguing, if tangential to our concerns.
 
 # ....................{ IMPORTS                           }....................
-from beartype.cave import NoneType
+from beartype._cave._cavefast import NoneType
 from beartype.roar import (
     BeartypeDecorHintPepException,
     BeartypeDecorHintPepUnsupportedException,
@@ -1755,10 +1730,15 @@ from beartype._decor._cache.cachetype import (
     register_typistry_type,
     register_typistry_tuple,
 )
-from beartype._decor._code.codesnip import CODE_INDENT_1, CODE_INDENT_2
+from beartype._decor._code.codesnip import (
+    CODE_INDENT_1,
+    CODE_INDENT_2,
+    VAR_NAME_RANDOM_INT,
+)
 from beartype._decor._code._pep._pepsnip import (
     PEP_CODE_CHECK_HINT_GENERIC_PREFIX,
     PEP_CODE_CHECK_HINT_GENERIC_SUFFIX,
+    PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC_TYPES_NAME_PREFIX,
     PEP_CODE_CHECK_HINT_ROOT_PREFIX,
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_PREFIX,
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_SUFFIX,
@@ -1768,13 +1748,28 @@ from beartype._decor._code._pep._pepsnip import (
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX,
     PEP_CODE_PITH_NAME_PREFIX,
     PEP_CODE_PITH_ROOT_NAME,
+    PEP_CODE_RAISE_PEP_CALL_EXCEPTION_IS_CHECK_FIELDS,
+    PEP_CODE_RAISE_PEP_CALL_EXCEPTION_IS_CHECK_TYPEVARS,
     PEP_CODE_RAISE_PEP_CALL_EXCEPTION_RANDOM_INT,
+    NUMPY_CODE_CHECK_HINT_NDARRAY_DTYPE_format,
+    NUMPY_CODE_CHECK_HINT_NDARRAY_NDIM_format,
+    NUMPY_CODE_CHECK_HINT_NDARRAY_PREFIX_format,
+    NUMPY_CODE_CHECK_HINT_NDARRAY_SUFFIX_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_SUFFIX,
     PEP484_CODE_CHECK_HINT_UNION_PREFIX,
     PEP484_CODE_CHECK_HINT_UNION_SUFFIX,
+    PEP544_CODE_CHECK_HINT_PROTOCOL_CACHED_PREFIX,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_RANDOM_INT_NONE,
+    PEP593_CODE_CHECK_HINT_VALIDATOR_PREFIX,
 
     # Bound format methods.
     PEP_CODE_CHECK_HINT_NONPEP_TYPE_format,
+    PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC_format,
+    PEP_CODE_CHECK_HINT_NONPEP_TYPE_RECORD_format,
     PEP_CODE_CHECK_HINT_ROOT_SUFFIX_format,
+    PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_format,
+    PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_FIRST_EXPR_format,
+    PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_LAST_EXPR_format,
     PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_format,
     PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_CHILD_EXPR_format,
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_EMPTY_format,
@@ -1783,23 +1778,30 @@ from beartype._decor._code._pep._pepsnip import (
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format,
     PEP_CODE_CHECK_HINT_GENERIC_CHILD_format,
     PEP_CODE_PITH_ASSIGN_EXPR_format,
+    PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE_format,
     PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP_format,
     PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_TYPE_MASK_NAME_format,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_format,
+    PEP593_CODE_CHECK_HINT_VALIDATOR_CHILD_format,
+    PEP593_CODE_CHECK_HINT_VALIDATOR_HINT_format,
+    PEP593_CODE_CHECK_HINT_VALIDATOR_SUFFIX_format,
 )
 from beartype._util.cache.utilcachecall import callable_cached
-from beartype._util.cache.pool.utilcachepoollistfixed import (
-    SIZE_BIG,
-    acquire_fixed_list,
-    release_fixed_list,
-)
 from beartype._util.cache.pool.utilcachepoolobjecttyped import (
     acquire_object_typed,
     release_object_typed,
 )
 from beartype._util.cache.utilcacheerror import (
     EXCEPTION_CACHED_PLACEHOLDER)
+from beartype._util.cls.utilclsabc import TYPE_ABC_TO_TYPES_CONCRETE
+from beartype._util.cls.utilclsrecord import is_type_record
 from beartype._util.hint.data.pep.utilhintdatapep import (
     HINT_PEP_SIGNS_SUPPORTED_DEEP,
+    HINT_PEP_SIGNS_SEQUENCE_ENDS,
     HINT_PEP_SIGNS_SEQUENCE_STANDARD,
     HINT_PEP_SIGNS_TUPLE,
 )
@@ -1807,11 +1809,16 @@ from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_BASE_FORWARDREF,
     HINT_PEP484_SIGNS_UNION,
 )
+from beartype._util.hint.data.pep.proposal.utilhintdatapep589 import (
+    HINT_PEP589_SIGN_TYPEDDICT)
+from beartype._util.hint.data.pep.proposal.utilhintdatapep593 import (
+    HINT_PEP593_SIGN_ANNOTATED)
+from beartype._util.hint.data.pep.mod.utilhintdatamodnumpy import (
+    HINT_NUMPY_SIGN_NDARRAY)
 from beartype._util.hint.data.utilhintdata import HINTS_IGNORABLE_SHALLOW
 from beartype._util.hint.utilhintget import get_hint_forwardref_classname
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._util.hint.pep.proposal.utilhintpep484 import (
-    get_hint_pep484_generic_base_erased_from_unerased,
     get_hint_pep484_newtype_class,
     is_hint_pep484_newtype,
 )
@@ -1819,14 +1826,19 @@ from beartype._util.hint.pep.proposal.utilhintpep544 import (
     get_hint_pep544_io_protocol_from_generic,
     is_hint_pep544_io_generic,
 )
-from beartype._util.hint.pep.proposal.utilhintpep585 import is_hint_pep585_builtin
 from beartype._util.hint.pep.proposal.utilhintpep593 import (
     get_hint_pep593_hint,
+    get_hint_pep593_metadata_validators,
     is_hint_pep593,
+    is_hint_pep593_beartype,
+)
+from beartype._util.hint.pep.mod.utilhintmodnumpy import (
+    get_hint_numpy_ndarray_dtype_type_or_none,
+    get_hint_numpy_ndarray_ndim_or_none,
 )
 from beartype._util.hint.pep.utilhintpepget import (
     get_hint_pep_args,
-    get_hint_pep_generic_bases_unerased,
+    get_hint_pep_generic_bases_checkable,
     get_hint_pep_sign,
     get_hint_pep_stdlib_type,
     get_hint_pep_generic_type_or_none,
@@ -1835,128 +1847,136 @@ from beartype._util.hint.pep.utilhintpeptest import (
     die_if_hint_pep_unsupported,
     die_if_hint_pep_sign_unsupported,
     is_hint_pep,
+    is_hint_pep_supported,
     is_hint_pep_tuple_empty,
-    is_hint_pep_typing,
     warn_if_hint_pep_sign_deprecated,
 )
 from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
-from beartype._util.text.utiltextmunge import replace_str_substrs
-from itertools import count
-from typing import Generic, Tuple, NoReturn
+from re import compile as re_compile, escape as re_escape
+from typing import Generic, List, Tuple, NoReturn
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
-# ....................{ CONSTANTS ~ hint : meta           }....................
-# Iterator yielding the next integer incrementation starting at 0, to be safely
-# deleted *AFTER* defining the following 0-based indices via this iterator.
-__hint_meta_index_counter = count(start=0, step=1)
+# ....................{ CLASSES                           }....................
+class _HintsMeta(object):
+    '''
+    **Hint metadata arena** (i.e., reusable object aggregating *all* metadata
+    describing *all* hints visitable by the breadth-first search (BFS)
+    performed by the :func:`pep_code_check_hint` function as parallel lists,
+    such that the metadata describing the hint with 0-based index ``i`` in
+    that search is the ``i``-th item of each such list).
+
+    For both space and time efficiency, this metadata is intentionally stored
+    as parallel lists rather than as one list of per-hint records (e.g.,
+    tuples, named tuples, tiny fixed lists). Enqueueing a child hint thus
+    reduces to assigning one item of each list, avoiding *all* per-hint object
+    allocation. Since instances of this class are pooled via the
+    :mod:`beartype._util.cache.pool.utilcachepoolobjecttyped` submodule, these
+    lists also retain their capacity across calls to that function, avoiding
+    *all* per-call list allocation in the common case.
+
+    These lists are **preallocated** to an initial length sufficient for all
+    hints of real-world interest and grown in-place on demand, imposing *no*
+    upper bound on the number of hints transitively visitable from any root
+    hint. Since these lists are grown in-place, callers may safely localize
+    these lists for efficiency.
+
+    Attributes
+    ----------
+    hints : list
+        List of all visitable hints.
+    pith_exprs : list
+        List of all **pith expressions** (i.e., Python code snippets evaluating
+        to the possibly nested objects of the passed parameter or return value
+        to be type-checked against the corresponding visitable hints).
+    indents : list
+        List of all **indentations** (i.e., Python code snippets expanding to
+        the levels of indentation appropriate for the corresponding visitable
+        hints).
+    codes : list
+        List of all Python code snippets type-checking the pith expressions
+        against the corresponding visited hints. See the
+        :func:`_join_hint_codes` function for further details.
+    size : int
+        Current length of each of these lists.
+    '''
 
+    # ..................{ CLASS VARIABLES                   }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables.
+    __slots__ = (
+        'codes',
+        'hints',
+        'indents',
+        'pith_exprs',
+        'size',
+    )
 
-_HINT_META_INDEX_HINT = next(__hint_meta_index_counter)
-'''
-0-based index into each tuple of hint metadata providing the currently
-visited hint.
-
-For both space and time efficiency, this metadata is intentionally stored as
-0-based integer indices of an unnamed tuple rather than:
-
-* Human-readable fields of a named tuple, which incurs space and time costs we
-  would rather *not* pay.
-* 0-based integer indices of a tiny fixed list. Previously, this metadata was
-  actually stored as a fixed list. However, exhaustive profiling demonstrated
-  that reinitializing each such list by slice-assigning that list's items from
-  a tuple to be faster than individually assigning these items:
-
-  .. code-block:: shell-session
-
-     $ echo 'Slice w/ tuple:' && command python3 -m timeit -s \
-          'muh_list = ["a", "b", "c", "d",]' \
-          'muh_list[:] = ("e", "f", "g", "h",)'
-     Slice w/ tuple:
-     2000000 loops, best of 5: 131 nsec per loop
-     $ echo 'Slice w/o tuple:' && command python3 -m timeit -s \
-          'muh_list = ["a", "b", "c", "d",]' \
-          'muh_list[:] = "e", "f", "g", "h"'
-     Slice w/o tuple:
-     2000000 loops, best of 5: 138 nsec per loop
-     $ echo 'Separate:' && command python3 -m timeit -s \
-          'muh_list = ["a", "b", "c", "d",]' \
-          'muh_list[0] = "e"
-     muh_list[1] = "f"
-     muh_list[2] = "g"
-     muh_list[3] = "h"'
-     Separate:
-     2000000 loops, best of 5: 199 nsec per loop
-
-  So, not only does there exist no performance benefit to smaller fixed lists,
-  there exists demonstrable performance costs.
-'''
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self) -> None:
+        '''
+        Initialize this arena by preallocating all lists to their initial
+        length.
+        '''
 
+        self.size = _HINTS_META_SIZE_INITIAL
+        self.codes = [None]*_HINTS_META_SIZE_INITIAL
+        self.hints = [None]*_HINTS_META_SIZE_INITIAL
+        self.indents = [None]*_HINTS_META_SIZE_INITIAL
+        self.pith_exprs = [None]*_HINTS_META_SIZE_INITIAL
 
-_HINT_META_INDEX_PLACEHOLDER = next(__hint_meta_index_counter)
-'''
-0-based index into each tuple of hint metadata providing the **current
-placeholder type-checking substring** (i.e., placeholder to be globally
-replaced by a Python code snippet type-checking the current pith expression
-against the hint described by this metadata on visiting that hint).
-
-This substring provides indirection enabling the currently visited parent hint
-to defer and delegate the generation of code type-checking each child argument
-of that hint to the later time at which that child argument is visited.
-
-Example
-----------
-For example, the :func:`pep_code_check_hint` function might generate
-intermediary code resembling the following on visiting the :data:`Union` parent
-of a ``Union[int, str]`` object *before* visiting either the :class:`int` or
-:class:`str` children of that object:
-
-    if not (
-        @{0}! or
-        @{1}!
-    ):
-        raise __beartype_raise_pep_call_exception(
-            func=__beartype_func,
-            pith_name=$%PITH_ROOT_NAME/~,
-            pith_value=__beartype_pith_root,
-        )
+    # ..................{ MUTATORS                          }..................
+    def grow(self) -> None:
+        '''
+        Double the length of all lists in this arena *in-place*, preserving
+        the identities of these lists.
+        '''
 
-Note the unique substrings "@{0}!" and "@{1}!" in that code, which that
-function iteratively replaces with code type-checking each of the child
-arguments of that :data:`Union` parent (i.e., :class:`int`, :class:`str`). The
-final code memoized by that function might then resemble:
-
-    if not (
-        isinstance(__beartype_pith_root, int) or
-        isinstance(__beartype_pith_root, str)
-    ):
-        raise __beartype_raise_pep_call_exception(
-            func=__beartype_func,
-            pith_name=$%PITH_ROOT_NAME/~,
-            pith_value=__beartype_pith_root,
-        )
-'''
+        # Tuple of "None" singletons with which to extend these lists.
+        nones = (None,)*self.size
 
+        # Extend these lists in-place.
+        self.codes.extend(nones)
+        self.hints.extend(nones)
+        self.indents.extend(nones)
+        self.pith_exprs.extend(nones)
+        self.size *= 2
 
-_HINT_META_INDEX_PITH_EXPR = next(__hint_meta_index_counter)
-'''
-0-based index into each tuple of hint metadata providing the **current
-pith expression** (i.e., Python code snippet evaluating to the current possibly
-nested object of the passed parameter or return value to be type-checked
-against the currently visited hint).
-'''
 
+    def clear(self, size_used: int) -> None:
+        '''
+        Nullify the passed number of leading items of all lists in this arena
+        for safety, releasing all references to previously visited hints and
+        previously generated code *without* reducing the capacity of these
+        lists.
 
-_HINT_META_INDEX_INDENT = next(__hint_meta_index_counter)
-'''
-0-based index into each tuple of hint metadata providing **current
-indentation** (i.e., Python code snippet expanding to the current level of
-indentation appropriate for the currently visited hint).
+        Parameters
+        ----------
+        size_used : int
+            Number of leading items of these lists previously used.
+        '''
+        assert 0 <= size_used <= self.size, (
+            f'{size_used} not in range [0, {self.size}].')
+
+        # Tuple of "None" singletons with which to nullify these items.
+        nones = (None,)*size_used
+
+        # Nullify these items.
+        self.codes[:size_used] = nones
+        self.hints[:size_used] = nones
+        self.indents[:size_used] = nones
+        self.pith_exprs[:size_used] = nones
+
+# ....................{ CONSTANTS ~ hint : meta           }....................
+_HINTS_META_SIZE_INITIAL = 64
 '''
+Initial length of all lists preallocated by each :class:`_HintsMeta` arena.
 
-# Delete the above counter for safety and sanity in equal measure.
-del __hint_meta_index_counter
+This length is intentionally chosen to exceed the number of hints transitively
+visitable from most real-world root hints, avoiding growth in the common case.
+This length is *not* a limit; arenas are grown on demand.
+'''
 
 # ....................{ CONSTANTS ~ operator              }....................
 _OPERATOR_SUFFIX_LEN_AND = len(' and')
@@ -1972,9 +1992,29 @@ Length of the builtin ``or`` operator when suffixing Python code snippets
 generated by the :func:`pep_code_check_hint` function.
 '''
 
+# ....................{ CONSTANTS ~ regex                 }....................
+_HINT_CHILD_PLACEHOLDER_REGEX = re_compile(
+    f'{re_escape(PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX)}'
+    r'(\d+)'
+    f'{re_escape(PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX)}'
+)
+'''
+Compiled regular expression matching each **placeholder hint child
+type-checking substring** embedded in Python code snippets generated by the
+:func:`pep_code_check_hint` function, capturing the 0-based index of the child
+hint whose snippet is to replace that placeholder.
+'''
+
 # ....................{ CODERS                            }....................
 @callable_cached
-def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
+def pep_code_check_hint(
+    # Mandatory parameters.
+    hint: object,
+
+    # Optional parameters.
+    is_check_fields: bool = False,
+    is_check_typevars: bool = False,
+) -> Tuple[str, bool, Tuple[str, ...]]:
     '''
     Python code type-checking the previously localized parameter or return
     value annotated by the passed PEP-compliant type hint against this hint of
@@ -2007,6 +2047,21 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
     ----------
     hint : object
         PEP-compliant type hint to be type-checked.
+    is_check_fields : bool
+        ``True`` only if this code is to deeply type-check all annotated fields
+        of **records** (i.e., :class:`typing.NamedTuple` subclasses and
+        dataclasses) visitable from this hint rather than only shallowly
+        type-checking these records as instances of their classes. See the
+        :attr:`beartype.BeartypeConf.is_check_fields` option. Defaults to
+        ``False``.
+    is_check_typevars : bool
+        ``True`` only if the caller has already reduced all bounded and
+        constrained type variables parametrizing this hint to the type hints
+        constraining these variables, in which case the function raising
+        exceptions on type-checking failures is instructed to reduce the
+        original hint in the same way. See the
+        :attr:`beartype.BeartypeConf.is_check_typevars` option. Defaults to
+        ``False``.
 
     Returns
     ----------
@@ -2076,12 +2131,6 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
     # originates from such a superclass.
     # hint_curr_type_origin = None
 
-    # Placeholder string to be globally replaced in the Python code snippet to
-    # be returned (i.e., "func_code") by a Python code snippet type-checking
-    # the current pith expression (i.e., "pith_curr_assigned_expr") against the
-    # currently visited hint (i.e., "hint_curr").
-    hint_curr_placeholder = None
-
     # Full Python expression evaluating to the value of the current pith (i.e.,
     # possibly nested object of the passed parameter or return value to be
     # type-checked against the currently visited hint).
@@ -2159,13 +2208,13 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
     # hint.
     hint_childs_len: int = None  # type: ignore[assignment]
 
-    # Set of all PEP-noncompliant child hints subscripting the currently
+    # List of all PEP-noncompliant child hints subscripting the currently
     # visited hint.
-    hint_childs_nonpep: set = None  # type: ignore[assignment]
+    hint_childs_nonpep: list = None  # type: ignore[assignment]
 
-    # Set of all PEP-compliant child hints subscripting the currently visited
+    # List of all PEP-compliant child hints subscripting the currently visited
     # hint.
-    hint_childs_pep: set = None  # type: ignore[assignment]
+    hint_childs_pep: list = None  # type: ignore[assignment]
 
     # ..................{ HINT ~ pep 484 : forwardref       }..................
     # Set of the unqualified classnames referred to by all relative forward
@@ -2273,34 +2322,47 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
     hint_curr_label = None
 
     # ..................{ METADATA                          }..................
-    # Tuple of metadata describing the currently visited hint, appended by
-    # the previously visited parent hint to the "hints_meta" stack.
-    hint_curr_meta: tuple = None  # type: ignore[assignment]
-
-    # Fixed list of all metadata describing all visitable hints currently
-    # discovered by the breadth-first search (BFS) below. This lists acts as a
-    # standard First In First Out (FILO) queue, enabling this BFS to be
-    # implemented as an efficient imperative algorithm rather than an
+    # Arena of all metadata describing all visitable hints currently discovered
+    # by the breadth-first search (BFS) below. The parallel lists of this arena
+    # act as a standard First In First Out (FIFO) queue, enabling this BFS to
+    # be implemented as an efficient imperative algorithm rather than an
     # inefficient (and dangerous, due to both unavoidable stack exhaustion and
     # avoidable infinite recursion) recursive algorithm.
     #
-    # Note that this list is guaranteed by the previously called
-    # _die_if_hint_repr_exceeds_child_limit() function to be larger than the
-    # number of hints transitively visitable from this root hint. Ergo, *ALL*
-    # indexation into this list performed by this BFS is guaranteed to be safe.
-    # Ergo, avoid explicitly testing below that the "hints_meta_index_last"
-    # integer maintained by this BFS is strictly less than "SIZE_BIG", as this
-    # constraint is already guaranteed to be the case.
-    hints_meta = acquire_fixed_list(SIZE_BIG)
+    # Note that this arena is grown on demand by the _enqueue_hint_child()
+    # closure defined below, imposing *NO* upper bound on the number of hints
+    # transitively visitable from this root hint.
+    hints_meta = acquire_object_typed(_HintsMeta)
+
+    # Parallel lists of this arena, localized for efficiency. Since this arena
+    # is only ever grown in-place, these lists remain valid across growth.
+    hints_meta_hint = hints_meta.hints
+    hints_meta_pith_expr = hints_meta.pith_exprs
+    hints_meta_indent = hints_meta.indents
+
+    # List of Python code snippets such that each item is the snippet
+    # type-checking the pith against the hint visited by the breadth-first
+    # search performed below at the same 0-based index. Each such snippet
+    # contains one placeholder substring for each child hint of that hint,
+    # deferred for replacement by the _join_hint_codes() function in a single
+    # linear pass *AFTER* this search completes.
+    #
+    # Note that these snippets are intentionally *NOT* iteratively injected
+    # into their parent snippets during this search (e.g., by calling the
+    # replace_str_substrs() function), as doing so would rescan the entire
+    # snippet generated thus far on visiting each hint, which is quadratic in
+    # the length of that snippet and thus prohibitively expensive for deeply
+    # nested hints.
+    hints_meta_code = hints_meta.codes
 
     # 0-based index of metadata describing the currently visited hint in the
-    # "hints_meta" list.
+    # parallel lists of this arena.
     hints_meta_index_curr = 0
 
     # 0-based index of metadata describing the last visitable hint in the
-    # "hints_meta" list, initialized to "-1" to ensure that the initial
-    # incrementation of this index by the _enqueue_hint_child() directly called
-    # below initializes index 0 of the "hints_meta" fixed list.
+    # parallel lists of this arena, initialized to "-1" to ensure that the
+    # initial incrementation of this index by the _enqueue_hint_child()
+    # directly called below initializes index 0 of these lists.
     hints_meta_index_last = -1
 
     # ..................{ CLOSURES ~ hint : child           }..................
@@ -2310,8 +2372,8 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
 
     def _enqueue_hint_child(pith_child_expr: str) -> str:
         '''
-        **Enqueue** (i.e., append) a new tuple of metadata describing the
-        currently iterated child hint to the end of the ``hints_meta`` queue,
+        **Enqueue** (i.e., append) metadata describing the currently
+        iterated child hint to the end of the ``hints_meta`` queue,
         enabling this hint to be visited by the ongoing breadth-first search
         (BFS) traversing over this queue.
 
@@ -2341,13 +2403,16 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             hints_meta_index_last
 
         # Increment the 0-based index of metadata describing the last visitable
-        # hint in the "hints_meta" list *BEFORE* overwriting the existing
+        # hint in the "hints_meta" arena *BEFORE* overwriting the existing
         # metadata at this index.
-        #
-        # Note this index is guaranteed to *NOT* exceed the fixed length of
-        # this list, by prior validation.
         hints_meta_index_last += 1
 
+        # If this index exceeds the current length of this arena, grow this
+        # arena in-place. Since this arena doubles in length on each growth,
+        # the amortized cost of this growth is constant.
+        if hints_meta_index_last == hints_meta.size:
+            hints_meta.grow()
+
         # Increment the unique identifier of the currently iterated child hint.
         hint_child_placeholder_id += 1
 
@@ -2372,17 +2437,12 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             f'{PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX}'
         )
 
-        # Create and insert a new tuple of metadata describing this child hint
-        # at this index of this list.
-        #
-        # Note that this assignment is guaranteed to be safe, as "SIZE_BIG" is
-        # guaranteed to be substantially larger than "hints_meta_index_last".
-        hints_meta[hints_meta_index_last] = (
-            hint_child,
-            hint_child_placeholder,
-            pith_child_expr,
-            indent_child,
-        )
+        # Record metadata describing this child hint at this index of the
+        # parallel lists of this arena, avoiding allocating a new container
+        # (e.g., tuple) aggregating this metadata.
+        hints_meta_hint[hints_meta_index_last] = hint_child
+        hints_meta_pith_expr[hints_meta_index_last] = pith_child_expr
+        hints_meta_indent[hints_meta_index_last] = indent_child
 
         # Return this placeholder string.
         return hint_child_placeholder
@@ -2401,11 +2461,9 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
     func_root_code = (
         f'{PEP_CODE_CHECK_HINT_ROOT_PREFIX}{hint_child_placeholder}')
 
-    # Python code snippet to be returned, seeded with a placeholder to be
-    # subsequently replaced on the first iteration of the breadth-first search
-    # performed below with a snippet type-checking the root pith against the
-    # root hint.
-    func_code = func_root_code
+    # Python code snippet to be returned, assembled *AFTER* the breadth-first
+    # search performed below from the "hints_meta_code" list.
+    func_code = None
 
     # True only if one or more PEP-compliant type hints visitable from this
     # root hint require a pseudo-random integer. If true, the higher-level
@@ -2413,28 +2471,22 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
     # of this wrapper function with code generating such an integer.
     is_func_code_needs_random_int = False
 
+    # True only if one or more records visitable from this root hint are
+    # deeply type-checked by this code. If true, this code instructs the
+    # function raising exceptions on type-checking failures to also describe
+    # violations of annotated fields of these records.
+    is_func_code_checks_fields = False
+
     # ..................{ SEARCH                            }..................
     # While the 0-based index of metadata describing the next visited hint in
-    # the "hints_meta" list does *NOT* exceed that describing the last
-    # visitable hint in this list, there remains at least one hint to be
+    # the "hints_meta" arena does *NOT* exceed that describing the last
+    # visitable hint in this arena, there remains at least one hint to be
     # visited in the breadth-first search performed by this iteration.
     while hints_meta_index_curr <= hints_meta_index_last:
-        # Metadata describing the currently visited hint.
-        hint_curr_meta = hints_meta[hints_meta_index_curr]
-
-        # Assert this metadata is a tuple as expected. This enables us to
-        # distinguish between proper access of used items and improper access
-        # of unused items of the parent fixed list containing this tuple, since
-        # an unused item of this list is initialized to "None" by default.
-        assert hint_curr_meta.__class__ is tuple, (
-            f'Current hint metadata {repr(hint_curr_meta)} at '
-            f'index {hints_meta_index_curr} not tuple.')
-
         # Localize metadatum for both efficiency and f-string purposes.
-        hint_curr             = hint_curr_meta[_HINT_META_INDEX_HINT]
-        hint_curr_placeholder = hint_curr_meta[_HINT_META_INDEX_PLACEHOLDER]
-        pith_curr_expr        = hint_curr_meta[_HINT_META_INDEX_PITH_EXPR]
-        indent_curr           = hint_curr_meta[_HINT_META_INDEX_INDENT]
+        hint_curr      = hints_meta_hint[hints_meta_index_curr]
+        pith_curr_expr = hints_meta_pith_expr[hints_meta_index_curr]
+        indent_curr    = hints_meta_indent[hints_meta_index_curr]
 
         #FIXME: This test can be trivially avoided by:
         #* Initializing "hint_curr_label = HINT_ROOT_LABEL" above.
@@ -2498,10 +2550,13 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
         elif is_hint_pep544_io_generic(hint_curr):
             hint_curr = get_hint_pep544_io_protocol_from_generic(hint_curr)
         # ................{ REDUCTION ~ pep 593               }................
-        # If this is a PEP 593-compliant type metahint, ignore all annotations
-        # on this hint (i.e., "hint_curr.__metadata__" tuple) by reducing this
-        # hint to its origin (e.g., "str" in "Annotated[str, 50, False]").
-        elif is_hint_pep593(hint_curr):
+        # If this is a PEP 593-compliant type metahint subscripted by *NO*
+        # beartype validators, ignore all annotations on this hint (i.e.,
+        # "hint_curr.__metadata__" tuple) by reducing this hint to its origin
+        # (e.g., "str" in "Annotated[str, 50, False]"). Metahints subscripted
+        # by one or more beartype validators are type-checked below instead.
+        elif is_hint_pep593(hint_curr) and not is_hint_pep593_beartype(
+            hint_curr):
             hint_curr = get_hint_pep593_hint(hint_curr)
         # ................{ REDUCTION ~ end                   }................
 
@@ -2842,22 +2897,34 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
                 #     >>> typing.Union[int]
                 #     int
 
-                # Acquire a pair of sets for use in prefiltering child hints
+                # Acquire a pair of lists for use in prefiltering child hints
                 # into the subset of all PEP-noncompliant and -compliant child
                 # hints subscripting this union. For efficiency, reuse
-                # previously created sets if available.
+                # previously created lists if available.
                 #
                 # Since these child hints require fundamentally different forms
-                # of type-checking, prefiltering child hints into these sets
+                # of type-checking, prefiltering child hints into these lists
                 # *BEFORE* generating code type-checking these child hints
-                # improves both efficiency and maintainability below.
-                hint_childs_nonpep = acquire_object_typed(set)
-                hint_childs_pep = acquire_object_typed(set)
-
-                # Clear these sets prior to use below.
+                # improves both efficiency and maintainability below. Lists
+                # rather than sets are intentionally used here, preserving the
+                # order in which this union is subscripted by these child hints
+                # and thus guaranteeing the code generated below to be
+                # deterministic across Python processes. Since the "typing"
+                # module already omits duplicate child hints from unions, these
+                # lists contain *NO* duplicates.
+                hint_childs_nonpep = acquire_object_typed(list)
+                hint_childs_pep = acquire_object_typed(list)
+
+                # Clear these lists prior to use below.
                 hint_childs_nonpep.clear()
                 hint_childs_pep.clear()
 
+                # True only if this union is subscripted by the type of the
+                # "None" singleton (e.g., "typing.Optional[int]"), efficiently
+                # type-checked by an identity test rather than an isinstance()
+                # call.
+                is_hint_child_none = False
+
                 # For each subscripted argument of this union...
                 for hint_child in hint_childs:
                     # Assert that this child hint is *NOT* shallowly ignorable.
@@ -2870,138 +2937,160 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
                         f'{hint_curr_label} ignorable PEP union type hint '
                         f'{repr(hint_curr)} not ignored.')
 
-                    # If this child hint is PEP-compliant...
-                    if is_hint_pep(hint_child):
-                        # Filter this child hint into the set of PEP-compliant
-                        # child hints.
+                    # If this child hint is a new type, reduce this child hint
+                    # to the class ultimately aliased by this new type
+                    # *BEFORE* filtering this child hint below. Doing so
+                    # type-checks this class together with all other
+                    # PEP-noncompliant child hints in a single isinstance()
+                    # call rather than as a separate PEP-compliant child hint.
+                    if is_hint_pep484_newtype(hint_child):
+                        hint_child = get_hint_pep484_newtype_class(hint_child)
+
+                    # If this child hint is the type of the "None" singleton,
+                    # record this fact.
+                    if hint_child is NoneType:
+                        is_hint_child_none = True
+                    # Else if this child hint is either PEP-compliant *OR* a
+                    # record whose annotated fields are to be type-checked...
+                    elif is_hint_pep(hint_child) or (
+                        is_check_fields and
+                        isinstance(hint_child, type) and
+                        is_type_record(hint_child)
+                    ):
+                        # Filter this child hint into the list of PEP-compliant
+                        # child hints, type-checked individually below.
                         #
                         # Note that this PEP-compliant child hint *CANNOT* also
-                        # be filtered into the set of PEP-noncompliant child
+                        # be filtered into the list of PEP-noncompliant child
                         # hints, even if this child hint originates from a
                         # non-"typing" type (e.g., "List[int]" from "list").
                         # Why? Because that would then induce false positives
                         # when the current pith shallowly satisfies this
                         # non-"typing" type but does *NOT* deeply satisfy this
                         # child hint.
-                        hint_childs_pep.add(hint_child)
+                        hint_childs_pep.append(hint_child)
                     # Else, this child hint is PEP-noncompliant. In this case,
                     # filter this child hint into the list of PEP-noncompliant
                     # arguments.
                     else:
-                        hint_childs_nonpep.add(hint_child)
+                        hint_childs_nonpep.append(hint_child)
+
+                # Stably sort these child hints by the estimated cost of
+                # type-checking these child hints, generating code testing
+                # cheaper child hints *BEFORE* more expensive child hints and
+                # thus short-circuiting as early as feasible. Since these sorts
+                # are stable, child hints of the same cost are type-checked in
+                # the order this union is subscripted by these child hints,
+                # enabling callers to list the child hints most commonly
+                # satisfied by their objects first.
+                hint_childs_nonpep.sort(key=_get_hint_union_child_nonpep_cost)
+                hint_childs_pep.sort(key=_get_hint_union_child_pep_cost)
+
+                # Python expression yielding the value of the current pith in
+                # the first code type-checking a child hint generated below.
+                # Specifically, if this union generates code type-checking...
+                pith_curr_union_expr = (
+                    # Multiple child hints, prefer the expression assigning
+                    # this value to a local variable efficiently reused by
+                    # subsequent code generated for subsequent child hints.
+                    pith_curr_assign_expr
+                    if (
+                        is_hint_child_none +
+                        bool(hint_childs_nonpep) +
+                        len(hint_childs_pep)
+                    ) > 1 else
+                    # Else, this union generates code type-checking only one
+                    # child hint. Since this is the first and only test
+                    # generated for this union, prefer the expression yielding
+                    # the value of the current pith *WITHOUT* assigning this
+                    # value to a local variable, which would otherwise
+                    # pointlessly go unused.
+                    pith_curr_expr
+                )
 
                 # Initialize the code type-checking the current pith against
                 # these arguments to the substring prefixing all such code.
                 func_curr_code = PEP484_CODE_CHECK_HINT_UNION_PREFIX
 
-                # If this union is subscripted by one or more PEP-noncompliant
-                # child hints, generate and append efficient code type-checking
-                # these child hints *BEFORE* less efficient code type-checking
-                # any PEP-compliant child hints subscripting this union.
-                if hint_childs_nonpep:
+                # If this union is subscripted by the type of the "None"
+                # singleton, generate and append efficient code identifying
+                # this pith with that singleton *BEFORE* all other code.
+                if is_hint_child_none:
+                    func_curr_code += PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE_format(
+                        pith_curr_expr=pith_curr_union_expr)
+                    pith_curr_union_expr = pith_curr_assigned_expr
+
+                # Defer heavyweight imports, avoiding increasing the import
+                # time of the "beartype" package for callers never
+                # type-checking unions. Importing this submodule also
+                # registers the wrapper global referenced by this code.
+                from beartype._decor._cache.cacheunion import (
+                    UNION_TYPE_MASK_NONPEP,
+                    register_union_type_masks,
+                )
+
+                # Python expression evaluating to the dictionary mapping from
+                # the exact types of objects to the type masks selecting the
+                # child hints of this union that objects of those types could
+                # satisfy if this union is dispatchable on these types *OR*
+                # "None" otherwise. Since dispatching assigns these type masks
+                # to local variables via assignment expressions, only unions
+                # type-checked under Python >= 3.8 are dispatchable.
+                union_type_masks_expr = (
+                    register_union_type_masks(
+                        tuple(hint_childs_nonpep), tuple(hint_childs_pep))
+                    if IS_PYTHON_AT_LEAST_3_8 else
+                    None
+                )
+
+                # If this union is dispatchable, generate code type-checking
+                # the current pith against only the child hints selected by
+                # the type mask of this pith. Specifically...
+                if union_type_masks_expr is not None:
+                    # Name of the local variable to which this type mask is
+                    # assigned.
+                    union_type_mask_name = (
+                        PEP484_CODE_CHECK_HINT_UNION_DISPATCH_TYPE_MASK_NAME_format(
+                            pith_curr_assigned_expr=pith_curr_assigned_expr))
+
+                    # Append code assigning this type mask to a local variable
+                    # efficiently reused by all subsequent code generated for
+                    # these child hints.
                     func_curr_code += (
-                        PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP_format(
-                            # Python expression yielding the value of the
-                            # current pith. Specifically...
-                            pith_curr_expr=(
-                                # If this union is subscripted by one or more
-                                # PEP-compliant child hints, prefer the
-                                # expression assigning this value to a local
-                                # variable efficiently reused by subsequent
-                                # code generated for PEP-compliant child hints.
-                                pith_curr_assign_expr if hint_childs_pep else
-                                # Else, this union is *NOT* subscripted by one
-                                # or more PEP-compliant child hints. Since this
-                                # is the first and only test generated for this
-                                # union, prefer the expression yielding the
-                                # value of the current pith *WITHOUT* assigning
-                                # this value to a local variable, which would
-                                # otherwise pointlessly go unused.
-                                pith_curr_expr
-                            ),
-                            # Python expression evaluating to a tuple of these
-                            # arguments when accessed via the private
-                            # "__beartypistry" parameter.
-                            #
-                            # Note that:
-                            # * We would ideally avoid coercing this set into a
-                            #   tuple when this set only contains one type by
-                            #   passing that type directly to the
-                            #   register_typistry_type() function. Sadly, the
-                            #   "set" class defines no convenient or efficient
-                            #   means of retrieving the only item of a 1-set.
-                            #   Indeed, the most efficient means of doing so is
-                            #   to iterate over that set and immediately break:
-                            #     for first_item in muh_set: break
-                            #   While we *COULD* technically leverage that
-                            #   approach here, doing so would also mandate
-                            #   adding a number of intermediate tests, which
-                            #   would certainly reduce any performance gains.
-                            #   Ultimately, we avoid doing so by falling back
-                            #   to the standard approach. See also this
-                            #   relevant self-StackOverflow post:
-                            #       https://stackoverflow.com/a/40054478/2809027
-                            # * These parameters are intentionally passed as
-                            #   positional rather than keyword arguments for
-                            #   optimal memoization efficiency.
-                            hint_curr_expr=register_typistry_tuple(
-                                tuple(hint_childs_nonpep),
-                                # Inform this function it needn't attempt to
-                                # uselessly omit duplicates, since the "typing"
-                                # module already does so for all "Union"
-                                # arguments. Well, that's nice.
-                                True,
-                            )
+                        PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX_format(
+                            union_type_mask_name=union_type_mask_name,
+                            union_type_masks_expr=union_type_masks_expr,
+                            pith_curr_expr=pith_curr_union_expr,
                         ))
 
-                # For each PEP-compliant child hint of this union, generate and
-                # append code type-checking this child hint.
-                for hint_child_index, hint_child in enumerate(hint_childs_pep):
-                    func_curr_code += (
-                        PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP_format(
-                            # Python expression yielding the value of the
-                            # current pith.
-                            hint_child_placeholder=_enqueue_hint_child(
-                                # If this union is subscripted by either...
-                                #
-                                # Then prefer the expression efficiently
-                                # reusing the value previously assigned to a
-                                # local variable by either the above
-                                # conditional or prior iteration of the current
-                                # conditional.
-                                pith_curr_assigned_expr
-                                if (
-                                    # One or more PEP-noncompliant child hints
-                                    # *OR*...
-                                    hint_childs_nonpep or
-                                    # This is any PEP-compliant child hint but
-                                    # the first...
-                                    hint_child_index > 1
-                                ) else
-                                # Else, this union is both subscripted by no
-                                # PEP-noncompliant child hints *AND* this is
-                                # the first PEP-compliant child hint, prefer
-                                # the expression assigning this value to a
-                                # local variable efficiently reused by code
-                                # generated by the following "else" condition
-                                # under subsequent iteration.
-                                #
-                                # Note this child hint is guaranteed to be at
-                                # least one more child hint. Why? Because the
-                                # "typing" module forces unions to be
-                                # subscripted by two or more child hints. By
-                                # deduction, this union must thus be
-                                # subscripted by two or more PEP-compliant
-                                # child hints. Ergo, we needn't explicitly
-                                # validate that constraint here.
-                                pith_curr_assign_expr
-                            )))
-
-                # If this code is *NOT* its initial value, this union is
-                # subscripted by one or more unignorable child hints and the
-                # above logic generated code type-checking these child hints.
-                # In this case...
-                if func_curr_code is not PEP484_CODE_CHECK_HINT_UNION_PREFIX:
+                    # If this union is subscripted by one or more
+                    # PEP-noncompliant child hints, generate and append
+                    # efficient code type-checking these child hints *BEFORE*
+                    # less efficient code type-checking any PEP-compliant
+                    # child hints subscripting this union.
+                    if hint_childs_nonpep:
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP_format(
+                                union_type_mask_name=union_type_mask_name,
+                                union_type_mask_bit=UNION_TYPE_MASK_NONPEP,
+                                pith_curr_expr=pith_curr_assigned_expr,
+                                hint_curr_expr=register_typistry_tuple(
+                                    tuple(hint_childs_nonpep), True),
+                            ))
+
+                    # For each PEP-compliant child hint of this union, generate
+                    # and append code type-checking this child hint only if
+                    # the type mask of this pith selects this child hint.
+                    for hint_child_index, hint_child in enumerate(
+                        hint_childs_pep):
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP_format(
+                                union_type_mask_name=union_type_mask_name,
+                                union_type_mask_bit=2 << hint_child_index,
+                                hint_child_placeholder=_enqueue_hint_child(
+                                    pith_curr_assigned_expr),
+                            ))
+
                     # Munge this code to...
                     func_curr_code = (
                         # Strip the erroneous " or" suffix appended by the
@@ -3009,13 +3098,74 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
                         func_curr_code[:-_OPERATOR_SUFFIX_LEN_OR] +
                         # Suffix this code by the substring suffixing all such
                         # code.
-                        PEP484_CODE_CHECK_HINT_UNION_SUFFIX
+                        PEP484_CODE_CHECK_HINT_UNION_DISPATCH_SUFFIX
                     # Format the "indent_curr" prefix into this code deferred
                     # above for efficiency.
                     ).format(indent_curr=indent_curr)
-                # Else, this snippet is its initial value and thus ignorable.
+                # Else, this union is *NOT* dispatchable. In this case,
+                # generate code type-checking the current pith against each
+                # child hint of this union in turn.
+                else:
+                    # If this union is subscripted by one or more
+                    # PEP-noncompliant child hints, generate and append
+                    # efficient code type-checking these child hints *BEFORE*
+                    # less efficient code type-checking any PEP-compliant
+                    # child hints subscripting this union.
+                    if hint_childs_nonpep:
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP_format(
+                                # Python expression yielding the value of the
+                                # current pith.
+                                pith_curr_expr=pith_curr_union_expr,
+                                # Python expression evaluating to a tuple of
+                                # these arguments when accessed via the private
+                                # "__beartypistry" parameter.
+                                #
+                                # Note that these parameters are intentionally
+                                # passed as positional rather than keyword
+                                # arguments for optimal memoization efficiency.
+                                hint_curr_expr=register_typistry_tuple(
+                                    tuple(hint_childs_nonpep),
+                                    # Inform this function it needn't attempt
+                                    # to uselessly omit duplicates, since the
+                                    # "typing" module already does so for all
+                                    # "Union" arguments. Well, that's nice.
+                                    True,
+                                )
+                            ))
+                        pith_curr_union_expr = pith_curr_assigned_expr
 
-                # Release this pair of sets back to their respective pools.
+                    # For each PEP-compliant child hint of this union, generate
+                    # and append code type-checking this child hint.
+                    for hint_child in hint_childs_pep:
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP_format(
+                                # Python expression yielding the value of the
+                                # current pith.
+                                hint_child_placeholder=_enqueue_hint_child(
+                                    pith_curr_union_expr)))
+                        pith_curr_union_expr = pith_curr_assigned_expr
+
+                    # If this code is *NOT* its initial value, this union is
+                    # subscripted by one or more unignorable child hints and
+                    # the above logic generated code type-checking these child
+                    # hints. In this case...
+                    if func_curr_code is not PEP484_CODE_CHECK_HINT_UNION_PREFIX:
+                        # Munge this code to...
+                        func_curr_code = (
+                            # Strip the erroneous " or" suffix appended by the
+                            # last child hint from this code.
+                            func_curr_code[:-_OPERATOR_SUFFIX_LEN_OR] +
+                            # Suffix this code by the substring suffixing all
+                            # such code.
+                            PEP484_CODE_CHECK_HINT_UNION_SUFFIX
+                        # Format the "indent_curr" prefix into this code
+                        # deferred above for efficiency.
+                        ).format(indent_curr=indent_curr)
+                    # Else, this snippet is its initial value and thus
+                    # ignorable.
+
+                # Release this pair of lists back to their respective pools.
                 release_object_typed(hint_childs_nonpep)
                 release_object_typed(hint_childs_pep)
             # Else, this hint is *NOT* a union.
@@ -3032,16 +3182,18 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             #   at least one non-class PEP 585-compliant pseudo-superclasses).
             # Then this hint is a PEP-compliant generic. In this case...
             elif hint_curr_sign is Generic:
-                #FIXME: *THIS IS NON-IDEAL.* Ideally, we should propagate *ALL*
-                #child type hints subscripting a generic up to *ALL*
-                #pseudo-superclasses of that generic (e.g., the "int" child
-                #hint subscripting a parent hint "MuhGeneric[int]" of type
-                #"class MuhGeneric(list[T]): pass" up to its "list[T]"
-                #pseudo-superclass).
+                # Tuple of the zero or more checkable pseudo-superclasses of
+                # this generic, propagating all child hints subscripting this
+                # generic if any to the pseudo-superclasses parametrized by
+                # the same type variables (e.g., the "int" child hint
+                # subscripting a parent hint "MuhGeneric[int]" of type "class
+                # MuhGeneric(list[T]): pass" up to its "list[T]"
+                # pseudo-superclass). Since this getter is memoized, these
+                # pseudo-superclasses are computed only once per generic.
                 #
-                #For now, we just strip *ALL* child type hints subscripting a
-                #generic with the following call. This suffices, because we
-                #just need this to work. So it goes, uneasy code bedfellows.
+                # Note that this *MUST* be called before reducing this hint to
+                # its unsubscripted generic below, which strips these hints.
+                hint_childs = get_hint_pep_generic_bases_checkable(hint_curr)
 
                 # If this hint is *NOT* a class, this hint is *NOT* an
                 # unsubscripted generic but could still be a generic
@@ -3059,117 +3211,33 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
                     f'{hint_curr_label} PEP generic type hint '
                     f'{repr(hint_curr)} not class.')
 
-                # Tuple of the one or more unerased pseudo-superclasses
-                # originally listed as superclasses prior to their type erasure
-                # subclassed by this generic.
-                hint_childs = get_hint_pep_generic_bases_unerased(hint_curr)
+                # Defer heavyweight imports. See above.
+                from beartype._decor._cache.cacheprotocol import (
+                    register_protocol_types)
+
+                # Python expression evaluating to the weak set of the types of
+                # all objects previously found to satisfy this generic if this
+                # generic is a cacheable protocol *OR* "None" otherwise.
+                hint_curr_types_expr = register_protocol_types(hint_curr)
 
                 # Initialize the code type-checking the current pith against
-                # this generic to the substring prefixing all such code.
-                func_curr_code = PEP_CODE_CHECK_HINT_GENERIC_PREFIX
+                # this generic to the substring prefixing all such code,
+                # either by looking up the type of this pith in this weak set
+                # if this generic is a cacheable protocol *OR* by deferring
+                # to the isinstance() builtin otherwise.
+                func_curr_code = (
+                    PEP544_CODE_CHECK_HINT_PROTOCOL_CACHED_PREFIX
+                    if hint_curr_types_expr is not None else
+                    PEP_CODE_CHECK_HINT_GENERIC_PREFIX
+                )
 
-                # For each pseudo-superclass subclassed by this generic...
+                # For each checkable pseudo-superclass of this generic,
+                # generate and append code type-checking this pith against
+                # this pseudo-superclass. Since pseudo-superclasses that are
+                # sequences are visited like any other sequence hint, items of
+                # user-defined sequence generics are deeply type-checked in
+                # O(1) time by pseudo-random indexation as well.
                 for hint_child in hint_childs:
-                    # print(f'hint_child: {repr(hint_child)} {is_hint_pep_type_typing(hint_child)}')
-
-                    # If this pseudo-superclass is an actual class, this class
-                    # is effectively ignorable. Why? Because the
-                    # "PEP_CODE_CHECK_HINT_GENERIC_PREFIX" snippet leveraged
-                    # above already type-checks this pith against the generic
-                    # subclassing this superclass and thus this superclass as
-                    # well with a trivial isinstance() call. In this case, skip
-                    # to the next pseudo-superclass.
-                    if isinstance(hint_child, type):
-                        continue
-                    # Else, this pseudo-superclass is *NOT* an actual class.
-                    #
-                    # If this pseudo-superclass is neither a PEP 585-compliant
-                    # type hint *NOR* a PEP-compliant type hint defined by the
-                    # "typing" module, this pseudo-superclass *MUST* be a PEP
-                    # 585-noncompliant user-defined pseudo-superclass. In this
-                    # case, reduce this pseudo-superclass to the corresponding
-                    # actual superclass originating this pseudo-superclass.
-                    #
-                    # Note that:
-                    # * This horrible, irrational, and unintuitive edge case
-                    #   arises *ONLY* for user-defined PEP 484-compliant
-                    #   generics and PEP 544-compliant protocols subclassing
-                    #   another user-defined generic or protocol superclass
-                    #   subscripted by one or more type variables: e.g.,
-                    #     >>> import typing as t
-                    #     >>> class UserProtocol(t.Protocol[t.AnyStr]): pass
-                    #     >>> class UserSubprotocol(UserProtocol[str], t.Protocol): pass
-                    #     >>> UserSubprotocol.__orig_bases__
-                    #     (UserProtocol[bytes], typing.Protocol)
-                    #     >>> UserProtocolUnerased = UserSubprotocol.__orig_bases__[0]
-                    #     >>> UserProtocolUnerased is UserProtocol
-                    #     False
-                    #     >>> isinstance(UserProtocolUnerased, type)
-                    #     False
-                    # * PEP 585-compliant generics suffer no such issues:
-                    #     >>> from beartype._util.hint.pep.proposal.utilhintpep585 import is_hint_pep585_builtin
-                    #     >>> class UserGeneric(list[int]): pass
-                    #     >>> class UserSubgeneric(UserGeneric[int]): pass
-                    #     >>> UserSubgeneric.__orig_bases__
-                    #     (UserGeneric[int],)
-                    #     >>> UserGenericUnerased = UserSubgeneric.__orig_bases__[0]
-                    #     >>> isinstance(UserGenericUnerased, type)
-                    #     True
-                    #     >>> UserGenericUnerased.__mro__
-                    #     (UserGeneric, list, object)
-                    #     >>> is_hint_pep585_builtin(UserGenericUnerased)
-                    #     True
-                    #
-                    # Walking up the unerased inheritance hierarchy for this
-                    # generic or protocol iteratively visits the user-defined
-                    # generic or protocol pseudo-superclass subscripted by one
-                    # or more type variable. Due to poorly defined obscurities
-                    # in the "typing" implementation, this pseudo-superclass is
-                    # *NOT* actually a class but rather an instance of a
-                    # private "typing" class (e.g., "typing._SpecialForm").
-                    #
-                    # Ergo, this pseudo-superclass will be subsequently
-                    # detected as neither a generic nor "typing" object and
-                    # thus raise exceptions. Our only recourse is to silently
-                    # reduce this hint into the erased superclass to which the
-                    # "typing" module previously transformed this hint (e.g.,
-                    # "UserProtocol" above). This is slightly non-ideal, as
-                    # this erased superclass is an actual class that should
-                    # ideally be ignored rather than redundantly tested against
-                    # the current pith again. Nonetheless, there exists no
-                    # other means of recursing into the possibly relevant
-                    # superclasses of this erased superclass.
-                    #
-                    # Note that, in theory, we could deeply refactor this
-                    # algorithm to support the notion of child hints that
-                    # should be ignored for purposes of type-checking but
-                    # nonetheless recursed into. In practice, the current
-                    # approach only introduces mild runtime inefficiencies
-                    # while preserving sanity throughout this algorithm.
-                    #
-                    # Specifically, perform this awful reduction *ONLY* if
-                    # this child hint is a PEP 484- or 544-compliant
-                    # user-defined pseudo-superclass that is neither...
-                    elif not (
-                        # A PEP 585-compliant pseudo-superclass *NOR*...
-                        is_hint_pep585_builtin(hint_child) and
-                        # A PEP 484- or 544-compliant pseudo-superclass defined
-                        # by the "typing" module.
-                        is_hint_pep_typing(hint_child)
-                    ):
-                        hint_child = (
-                            get_hint_pep484_generic_base_erased_from_unerased(
-                                hint_child))
-                    # Else, this pseudo-superclass is defined by the "typing"
-                    # module.
-
-                    # If this superclass is ignorable, do so.
-                    if is_hint_ignorable(hint_child):
-                        continue
-                    # Else, this superclass is unignorable.
-
-                    # Generate and append code type-checking this pith against
-                    # this superclass.
                     func_curr_code += (
                         PEP_CODE_CHECK_HINT_GENERIC_CHILD_format(
                             hint_child_placeholder=_enqueue_hint_child(
@@ -3192,9 +3260,11 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
                     # Indentation deferred above for efficiency.
                     indent_curr=indent_curr,
                     pith_curr_assign_expr=pith_curr_assign_expr,
+                    pith_curr_assigned_expr=pith_curr_assigned_expr,
                     # Python expression evaluating to this user-defined type
                     # when accessed via the private "__beartypistry" parameter.
                     hint_curr_expr=register_typistry_type(hint_curr),
+                    hint_curr_types_expr=hint_curr_types_expr,
                 )
                 # print(f'{hint_curr_label} PEP generic {repr(hint)} handled.')
             # Else, this hint is *NOT* a generic.
@@ -3237,13 +3307,246 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
                         f'{PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX}'
                     )
 
-                # Code type-checking the current pith against this class.
-                func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
-                    pith_curr_expr=pith_curr_expr,
-                    hint_curr_expr=hint_curr_expr,
-                )
+                # If annotated fields of records are to be type-checked...
+                if is_check_fields:
+                    # Since whether the class referred to by this forward
+                    # reference is a record is unknowable until call time,
+                    # unconditionally type-check the fields of this pith. If
+                    # this class is *NOT* a record, the tester type-checking
+                    # these fields trivially reduces to a noop.
+                    is_func_code_checks_fields = True
+
+                    # If all conditions needed to assign the current pith to a
+                    # unique local variable via a Python >= 3.8-specific
+                    # assignment expression are satisfied, do so. See similar
+                    # logic above for further commentary.
+                    if (
+                        IS_PYTHON_AT_LEAST_3_8 and
+                        pith_curr_expr != pith_root_expr
+                    ):
+                        pith_curr_assign_expr_name_counter += 1
+                        pith_curr_assigned_expr = (
+                            PEP_CODE_PITH_NAME_PREFIX +
+                            str(pith_curr_assign_expr_name_counter))
+                        pith_curr_assign_expr = (
+                            PEP_CODE_PITH_ASSIGN_EXPR_format(
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr),
+                                pith_curr_expr=pith_curr_expr,
+                            ))
+                    # Else, preserve the Python code snippet evaluating to the
+                    # current pith as is.
+                    else:
+                        pith_curr_assign_expr = pith_curr_assigned_expr = (
+                            pith_curr_expr)
+
+                    # Defer heavyweight imports. See above.
+                    from beartype._decor._cache.cachefield import (
+                        IS_RECORD_FIELDS_VALID_NAME)
+
+                    # Code type-checking the current pith against this class
+                    # *AND* the annotated fields of this class if any.
+                    func_curr_code = (
+                        PEP_CODE_CHECK_HINT_NONPEP_TYPE_RECORD_format(
+                            pith_curr_assign_expr=pith_curr_assign_expr,
+                            pith_curr_assigned_expr=pith_curr_assigned_expr,
+                            hint_curr_expr=hint_curr_expr,
+                            is_record_fields_valid_name=(
+                                IS_RECORD_FIELDS_VALID_NAME),
+                        ))
+                # Else, only type-check the current pith against this class.
+                else:
+                    func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+                        pith_curr_expr=pith_curr_expr,
+                        hint_curr_expr=hint_curr_expr,
+                    )
             # Else, this hint is *NOT* a forward reference.
 
+            # ..............{ TYPEDDICT                         }..............
+            # If this hint is a PEP 589-compliant typed dictionary...
+            elif hint_curr_sign is HINT_PEP589_SIGN_TYPEDDICT:
+                # If annotated fields of records are to be type-checked, the
+                # validator generated below type-checks *ALL* keys of this
+                # pith. In this case, instruct the function raising exceptions
+                # on type-checking failures to describe all keys as well.
+                if is_check_fields:
+                    is_func_code_checks_fields = True
+                # Else, this validator type-checks only a single key of this
+                # pith pseudo-randomly selected in constant time. In this case,
+                # record that a pseudo-random integer is now required.
+                else:
+                    is_func_code_needs_random_int = True
+
+                # Defer heavyweight imports. See above.
+                from beartype._decor._cache.cachetypeddict import (
+                    register_typeddict)
+
+                # Code type-checking the current pith against this typed
+                # dictionary by deferring to the validator compiled once for
+                # this typed dictionary on the first call to this validator.
+                func_curr_code = PEP589_CODE_CHECK_HINT_TYPEDDICT_format(
+                    indent_curr=indent_curr,
+                    pith_curr_assign_expr=pith_curr_assign_expr,
+                    pith_curr_assigned_expr=pith_curr_assigned_expr,
+                    hint_curr_validator_expr=register_typeddict(
+                        hint_curr, is_check_fields),
+                    random_int_expr=(
+                        PEP589_CODE_CHECK_HINT_TYPEDDICT_RANDOM_INT_NONE
+                        if is_check_fields else
+                        VAR_NAME_RANDOM_INT
+                    ),
+                )
+            # Else, this hint is *NOT* a typed dictionary.
+
+            # ..............{ ANNOTATED                         }..............
+            # If this hint is a PEP 593-compliant type metahint, this metahint
+            # is guaranteed by the reduction performed above to be subscripted
+            # by one or more beartype validators. In this case...
+            elif hint_curr_sign is HINT_PEP593_SIGN_ANNOTATED:
+                # Type hint annotated by this metahint.
+                hint_child = get_hint_pep593_hint(hint_curr)
+
+                # Initialize the code type-checking the current pith against
+                # this metahint to the substring prefixing all such code.
+                func_curr_code = PEP593_CODE_CHECK_HINT_VALIDATOR_PREFIX
+
+                # If this type hint is ignorable, validate the current pith
+                # against these validators by the full Python expression
+                # evaluating to this pith. Since *NO* prior code assigns this
+                # pith to a local variable, these validators may *NOT* access
+                # this pith by that variable.
+                if is_hint_ignorable(hint_child):
+                    pith_curr_validated_expr = pith_curr_expr
+                # Else, this type hint is unignorable. In this case...
+                else:
+                    # Python expression evaluating to the current pith passed
+                    # to the code type-checking this type hint, parenthesized
+                    # to embed the assignment expression assigning this pith
+                    # to a local variable if any. Since that code is
+                    # guaranteed to evaluate this expression *BEFORE*
+                    # validating this pith against these validators, these
+                    # validators efficiently access this pith by that variable.
+                    pith_curr_validated_expr = pith_curr_assigned_expr
+
+                    # Generate and append code type-checking this pith against
+                    # this type hint *BEFORE* these validators.
+                    func_curr_code += (
+                        PEP593_CODE_CHECK_HINT_VALIDATOR_HINT_format(
+                            indent_curr=indent_curr,
+                            hint_child_placeholder=_enqueue_hint_child(
+                                f'({pith_curr_assign_expr})'
+                                if pith_curr_assign_expr != (
+                                    pith_curr_assigned_expr) else
+                                pith_curr_expr
+                            ),
+                        ))
+
+                # Defer heavyweight imports. See above.
+                from beartype._decor._cache.cachevalidator import (
+                    get_validator_code)
+
+                # For each beartype validator subscripting this metahint,
+                # generate and append code validating this pith against this
+                # validator.
+                #
+                # Note that this code is intentionally formatted immediately
+                # rather than deferred, as validators may inline arbitrary
+                # user-defined source code embedding braces.
+                for hint_validator in get_hint_pep593_metadata_validators(
+                    hint_curr):
+                    func_curr_code += (
+                        PEP593_CODE_CHECK_HINT_VALIDATOR_CHILD_format(
+                            indent_curr=indent_curr,
+                            validator_code=get_validator_code(
+                                hint_validator, pith_curr_validated_expr),
+                        ))
+
+                # Munge this code to...
+                func_curr_code = (
+                    # Strip the erroneous " and" suffix appended by the last
+                    # validator from this code.
+                    func_curr_code[:-_OPERATOR_SUFFIX_LEN_AND] +
+                    # Suffix this code by the substring suffixing all such
+                    # code.
+                    PEP593_CODE_CHECK_HINT_VALIDATOR_SUFFIX_format(
+                        indent_curr=indent_curr)
+                )
+            # Else, this hint is *NOT* a metahint.
+
+            # ..............{ NUMPY                             }..............
+            # If this hint is a NumPy array type hint (e.g.,
+            # "numpy.typing.NDArray[numpy.float64]"), generate code
+            # type-checking only the metadata of the current pith in constant
+            # time. Since NumPy arrays are sequences of possibly billions of
+            # unboxed items, type-checking even one pseudo-randomly selected
+            # item would needlessly box that item into a new Python object.
+            elif hint_curr_sign is HINT_NUMPY_SIGN_NDARRAY:
+                # Scalar type and dimensionality constrained by this hint if
+                # any *OR* "None" otherwise.
+                hint_dtype_type = get_hint_numpy_ndarray_dtype_type_or_none(
+                    hint_curr)
+                hint_ndim = get_hint_numpy_ndarray_ndim_or_none(hint_curr)
+
+                # If this hint constrains neither the dtype nor shape of these
+                # arrays, generate trivial code shallowly type-checking the
+                # current pith as an instance of the "numpy.ndarray" type.
+                if hint_dtype_type is None and hint_ndim is None:
+                    func_curr_code = _get_code_check_type(
+                        hint_type=hint_curr.__origin__,
+                        pith_curr_expr=pith_curr_expr,
+                        pith_curr_assign_expr=pith_curr_assign_expr,
+                        pith_curr_assigned_expr=pith_curr_assigned_expr,
+                    )
+                # Else, this hint constrains either the dtype or shape of these
+                # arrays. In this case...
+                else:
+                    # Initialize the code type-checking the current pith
+                    # against this hint to the substring prefixing all such
+                    # code, type-checking this pith to be a NumPy array.
+                    func_curr_code = (
+                        NUMPY_CODE_CHECK_HINT_NDARRAY_PREFIX_format(
+                            indent_curr=indent_curr,
+                            pith_curr_assign_expr=pith_curr_assign_expr,
+                            hint_curr_expr=register_typistry_type(
+                                hint_curr.__origin__),
+                        ))
+
+                    # If this hint constrains the dtype of these arrays,
+                    # generate and append code type-checking that dtype.
+                    if hint_dtype_type is not None:
+                        func_curr_code += (
+                            NUMPY_CODE_CHECK_HINT_NDARRAY_DTYPE_format(
+                                indent_curr=indent_curr,
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr),
+                                hint_dtype_type_expr=register_typistry_type(
+                                    hint_dtype_type),
+                            ))
+
+                    # If this hint constrains the shape of these arrays,
+                    # generate and append code type-checking the
+                    # dimensionality of these arrays.
+                    if hint_ndim is not None:
+                        func_curr_code += (
+                            NUMPY_CODE_CHECK_HINT_NDARRAY_NDIM_format(
+                                indent_curr=indent_curr,
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr),
+                                hint_ndim=hint_ndim,
+                            ))
+
+                    # Munge this code to...
+                    func_curr_code = (
+                        # Strip the erroneous " and" suffix appended by the
+                        # last child snippet from this code.
+                        func_curr_code[:-_OPERATOR_SUFFIX_LEN_AND] +
+                        # Suffix this code by the substring suffixing all such
+                        # code.
+                        NUMPY_CODE_CHECK_HINT_NDARRAY_SUFFIX_format(
+                            indent_curr=indent_curr)
+                    )
+            # Else, this hint is *NOT* a NumPy array type hint.
+
             # ..............{ NORETURN                          }..............
             # If this hint is the PEP 484-compliant "NoReturn" singleton valid
             # *ONLY* as the non-nested return annotation of a callable, raise
@@ -3279,15 +3582,14 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             # hint "typing.List[int]").
 
                 # Code type-checking the current pith against this origin type.
-                func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+                func_curr_code = _get_code_check_type(
+                    # Origin type of this hint if any *OR* raise an exception
+                    # -- which should *NEVER* happen, as this hint was
+                    # validated above to be supported.
+                    hint_type=get_hint_pep_stdlib_type(hint_curr),
                     pith_curr_expr=pith_curr_expr,
-                    # Python expression evaluating to this origin type when
-                    # accessed via the private "__beartypistry" parameter.
-                    hint_curr_expr=register_typistry_type(
-                        # Origin type of this hint if any *OR* raise an
-                        # exception -- which should *NEVER* happen, as this
-                        # hint was validated above to be supported.
-                        get_hint_pep_stdlib_type(hint_curr)),
+                    pith_curr_assign_expr=pith_curr_assign_expr,
+                    pith_curr_assigned_expr=pith_curr_assigned_expr,
                 )
             # Else, this hint is *NOT* its own unsubscripted "typing" attribute
             # (e.g., "typing.List") and is thus subscripted by one or more
@@ -3318,13 +3620,10 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             # semantically resembling a standard sequence, subscripted by one
             # or more child hints.
 
-                # Python expression evaluating to this origin type when
-                # accessed with the private "__beartypistry" parameter.
-                hint_curr_expr = register_typistry_type(
-                    # Origin type of this attribute if any *OR* raise an
-                    # exception -- which should *NEVER* happen, as all standard
-                    # sequences originate from an origin type.
-                    get_hint_pep_stdlib_type(hint_curr))
+                # Origin type of this attribute if any *OR* raise an exception
+                # -- which should *NEVER* happen, as all standard sequences
+                # originate from an origin type.
+                hint_curr_type = get_hint_pep_stdlib_type(hint_curr)
 
                 # Assert this sequence is either subscripted by exactly one
                 # argument *OR* a non-standard sequence (e.g., "typing.Tuple").
@@ -3354,9 +3653,17 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
                     func_curr_code = (
                         PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_format(
                             indent_curr=indent_curr,
-                            pith_curr_assign_expr=pith_curr_assign_expr,
                             pith_curr_assigned_expr=pith_curr_assigned_expr,
-                            hint_curr_expr=hint_curr_expr,
+                            # Code shallowly type-checking the current pith
+                            # against this origin type, localizing this pith
+                            # to a local variable if needed.
+                            hint_curr_check_type_expr=_get_code_check_type(
+                                hint_type=hint_curr_type,
+                                pith_curr_expr=pith_curr_assign_expr,
+                                pith_curr_assign_expr=pith_curr_assign_expr,
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr),
+                            ),
                             hint_child_placeholder=_enqueue_hint_child(
                                 # Python expression yielding the value of a
                                 # randomly indexed item of the current pith
@@ -3371,13 +3678,72 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
                 # type-checking the current pith as an instance of this
                 # origin type.
                 else:
-                    func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+                    func_curr_code = _get_code_check_type(
+                        hint_type=hint_curr_type,
                         pith_curr_expr=pith_curr_expr,
-                        hint_curr_expr=hint_curr_expr,
+                        pith_curr_assign_expr=pith_curr_assign_expr,
+                        pith_curr_assigned_expr=pith_curr_assigned_expr,
                     )
             # Else, this hint is neither a standard sequence *NOR* variadic
             # tuple.
 
+            # ..............{ SEQUENCES ~ ends                  }..............
+            # If this hint is an end-indexable sequence (e.g.,
+            # "typing.Deque[int]"), this hint is subscripted by exactly one
+            # child hint constraining *ALL* items of this sequence. Since
+            # indexing an arbitrary item of this sequence is O(n), deeply
+            # type-check only the first and last items of this sequence, both
+            # of which are guaranteed to be indexable in O(1) time.
+            elif hint_curr_sign in HINT_PEP_SIGNS_SEQUENCE_ENDS:
+                # Origin type of this attribute.
+                hint_curr_type = get_hint_pep_stdlib_type(hint_curr)
+
+                # Assert this sequence is subscripted by exactly one argument.
+                assert hint_childs_len == 1, (
+                    f'{hint_curr_label} PEP sequence type hint '
+                    f'{repr(hint_curr)} subscripted by multiple arguments.')
+
+                # Lone child hint of this parent hint.
+                hint_child = hint_childs[0]
+
+                # If this child hint is *NOT* ignorable, deeply type-check both
+                # the type of the current pith *AND* the first and last items
+                # of this pith.
+                if not is_hint_ignorable(hint_child):
+                    # Code type-checking the current pith against this type.
+                    func_curr_code = PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_format(
+                        indent_curr=indent_curr,
+                        pith_curr_assigned_expr=pith_curr_assigned_expr,
+                        # Code shallowly type-checking the current pith against
+                        # this origin type, localizing this pith to a local
+                        # variable if needed.
+                        hint_curr_check_type_expr=_get_code_check_type(
+                            hint_type=hint_curr_type,
+                            pith_curr_expr=pith_curr_assign_expr,
+                            pith_curr_assign_expr=pith_curr_assign_expr,
+                            pith_curr_assigned_expr=pith_curr_assigned_expr,
+                        ),
+                        hint_child_placeholder_first=_enqueue_hint_child(
+                            PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_FIRST_EXPR_format(
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr))),
+                        hint_child_placeholder_last=_enqueue_hint_child(
+                            PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_LAST_EXPR_format(
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr))),
+                    )
+                # Else, this child hint is ignorable. In this case, fallback to
+                # generating trivial code shallowly type-checking the current
+                # pith as an instance of this origin type.
+                else:
+                    func_curr_code = _get_code_check_type(
+                        hint_type=hint_curr_type,
+                        pith_curr_expr=pith_curr_expr,
+                        pith_curr_assign_expr=pith_curr_assign_expr,
+                        pith_curr_assigned_expr=pith_curr_assigned_expr,
+                    )
+            # Else, this hint is *NOT* an end-indexable sequence.
+
             # ..............{ SEQUENCES ~ tuple : fixed         }..............
             # If this hint is a tuple, this tuple is *NOT* of the variadic form
             # and *MUST* thus be of the fixed-length form.
@@ -3527,12 +3893,48 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             # CAVEATS: Synchronize changes here with similar logic above.
             #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
+            # True only if this class is a record whose annotated fields are
+            # to be type-checked.
+            is_hint_curr_record = is_check_fields and is_type_record(hint_curr)
+            is_func_code_checks_fields = (
+                is_func_code_checks_fields or is_hint_curr_record)
+
+            # If this class is either a standard ABC to which one or more
+            # common concrete types are subclasses *OR* a record whose fields
+            # are to be type-checked *AND* all conditions needed to assign the
+            # current pith to a unique local variable via a Python >=
+            # 3.8-specific assignment expression are satisfied, do so. See
+            # similar logic above for further commentary.
+            if (
+                (
+                    hint_curr in TYPE_ABC_TO_TYPES_CONCRETE or
+                    is_hint_curr_record
+                ) and
+                IS_PYTHON_AT_LEAST_3_8 and
+                pith_curr_expr != pith_root_expr
+            ):
+                pith_curr_assign_expr_name_counter += 1
+                pith_curr_assigned_expr = (
+                    PEP_CODE_PITH_NAME_PREFIX +
+                    str(pith_curr_assign_expr_name_counter))
+                pith_curr_assign_expr = (
+                    PEP_CODE_PITH_ASSIGN_EXPR_format(
+                        pith_curr_assigned_expr=pith_curr_assigned_expr,
+                        pith_curr_expr=pith_curr_expr,
+                    ))
+            # Else, preserve the Python code snippet evaluating to the current
+            # pith as is.
+            else:
+                pith_curr_assign_expr = pith_curr_assigned_expr = (
+                    pith_curr_expr)
+
             # Code type-checking the current pith against this class.
-            func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+            func_curr_code = _get_code_check_type(
+                hint_type=hint_curr,
                 pith_curr_expr=pith_curr_expr,
-                # Python expression evaluating to this class when accessed via
-                # the private "__beartypistry" parameter.
-                hint_curr_expr=register_typistry_type(hint_curr),
+                pith_curr_assign_expr=pith_curr_assign_expr,
+                pith_curr_assigned_expr=pith_curr_assigned_expr,
+                is_record=is_hint_curr_record,
             )
 
         # Else, this hint is neither PEP-compliant *NOR* a class. In this
@@ -3554,37 +3956,45 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             )
 
         # ................{ CLEANUP                           }................
-        # Inject this code into the body of this wrapper.
-        func_code = replace_str_substrs(
-            text=func_code, old=hint_curr_placeholder, new=func_curr_code)
-
-        # Nullify the metadata describing the previously visited hint in this
-        # list for safety.
-        hints_meta[hints_meta_index_curr] = None
+        # Record this code for subsequent injection into the code type-checking
+        # the parent hint of this hint.
+        hints_meta_code[hints_meta_index_curr] = func_curr_code
 
         # Increment the 0-based index of metadata describing the next visited
-        # hint in the "hints_meta" list *BEFORE* visiting this hint but *AFTER*
+        # hint in the "hints_meta" arena *BEFORE* visiting this hint but *AFTER*
         # performing all other logic for the currently visited hint, implying
         # this should be the last statement of this iteration.
         hints_meta_index_curr += 1
 
     # ..................{ CLEANUP                           }..................
-    # Release the fixed list of all such metadata.
-    release_fixed_list(hints_meta)
+    # Number of leading items of the parallel lists of this arena used by the
+    # breadth-first search above.
+    hints_meta_size_used = hints_meta_index_last + 1
 
-    # If the Python code snippet to be returned remains unchanged from its
-    # initial value, the breadth-first search above failed to generate code. In
-    # this case, raise an exception.
+    # If the breadth-first search above failed to generate code for one or
+    # more visited hints, release this arena and raise an exception.
     #
-    # Note that this test is inexpensive, as the third character of the
-    # "func_root_code" code snippet is guaranteed to differ from that of
-    # "func_code" code snippet if this function behaved as expected, which it
-    # absolutely should have... but may not have, which is why we're testing.
-    if func_code == func_root_code:
+    # Note that this test is inexpensive, as this search is guaranteed to have
+    # generated exactly one snippet for each visited hint if this function
+    # behaved as expected, which it absolutely should have... but may not
+    # have, which is why we're testing.
+    if None in hints_meta_code[:hints_meta_size_used]:
+        hints_meta.clear(hints_meta_size_used)
+        release_object_typed(hints_meta)
         raise BeartypeDecorHintPepException(
             f'{HINT_ROOT_LABEL} {repr(hint_root)} not type-checked.')
     # Else, the breadth-first search above successfully generated code.
 
+    # Python code snippet type-checking the root pith against the root hint,
+    # assembled in a single linear pass from all snippets generated above.
+    func_code = func_root_code.replace(
+        hint_child_placeholder, _join_hint_codes(hints_meta_code))
+
+    # Nullify all metadata describing all visited hints for safety *BEFORE*
+    # releasing this arena, preserving the capacity of this arena for reuse.
+    hints_meta.clear(hints_meta_size_used)
+    release_object_typed(hints_meta)
+
     # Suffix this code by a Python code snippet raising a human-readable
     # exception when the root pith violates the root type hint.
     func_code += PEP_CODE_CHECK_HINT_ROOT_SUFFIX_format(
@@ -3596,6 +4006,22 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             # Else, call that function *WITHOUT* passing that integer.
             ''
         ),
+        is_check_fields_if_any=(
+            # If this code deeply type-checks one or more records, instruct
+            # the function raising this exception to do so as well.
+            PEP_CODE_RAISE_PEP_CALL_EXCEPTION_IS_CHECK_FIELDS
+            if is_func_code_checks_fields else
+            # Else, call that function *WITHOUT* passing that flag.
+            ''
+        ),
+        is_check_typevars_if_any=(
+            # If this code type-checks bounded and constrained type variables,
+            # instruct the function raising this exception to do so as well.
+            PEP_CODE_RAISE_PEP_CALL_EXCEPTION_IS_CHECK_TYPEVARS
+            if is_check_typevars else
+            # Else, call that function *WITHOUT* passing that flag.
+            ''
+        ),
     )
 
     # Return all metadata required by higher-level callers.
@@ -3614,3 +4040,237 @@ def pep_code_check_hint(hint: object) -> Tuple[str, bool, Tuple[str, ...]]:
             tuple(hints_forwardref_class_basename)
         ),
     )
+
+# ....................{ PRIVATE ~ getters : union         }....................
+def _get_hint_union_child_nonpep_cost(hint: type) -> int:
+    '''
+    Estimated relative cost of type-checking objects against the passed
+    PEP-noncompliant child hint of a union, used to order the types of the
+    tuple passed to the :func:`isinstance` builtin such that the cheapest types
+    are tested first.
+
+    Parameters
+    ----------
+    hint : type
+        PEP-noncompliant child hint to be inspected.
+
+    Returns
+    ----------
+    int
+        Either:
+
+        * ``0`` if this child hint is a builtin type (e.g., :class:`int`), whose
+          instance checks reduce to a fast traversal of the method resolution
+          order of the type of that object.
+        * ``1`` otherwise (e.g., if this child hint is an abstract base class
+          (ABC) whose instance checks call the ``__instancecheck__`` dunder
+          method of its metaclass).
+    '''
+
+    return 0 if getattr(hint, '__module__', None) == 'builtins' else 1
+
+
+def _get_hint_union_child_pep_cost(hint: object) -> int:
+    '''
+    Estimated relative cost of type-checking objects against the passed
+    PEP-compliant child hint of a union, used to order the code type-checking
+    these child hints such that the cheapest child hints are tested first.
+
+    Parameters
+    ----------
+    hint : object
+        PEP-compliant child hint to be inspected.
+
+    Returns
+    ----------
+    int
+        Either:
+
+        * ``0`` if this child hint is shallowly type-checked (e.g.,
+          :class:`typing.Callable`), reducing to a single instance check.
+        * ``1`` otherwise (e.g., if this child hint is deeply type-checked
+          *or* is a record whose annotated fields are to be type-checked).
+    '''
+
+    return 0 if (
+        # This child hint is PEP-compliant *AND*...
+        is_hint_pep(hint) and
+        # This child hint is supported *AND*...
+        is_hint_pep_supported(hint) and
+        # This child hint is only shallowly type-checked.
+        get_hint_pep_sign(hint) not in HINT_PEP_SIGNS_SUPPORTED_DEEP
+    ) else 1
+
+# ....................{ PRIVATE ~ coders                  }....................
+def _get_code_check_type(
+    hint_type: type,
+    pith_curr_expr: str,
+    pith_curr_assign_expr: str,
+    pith_curr_assigned_expr: str,
+    is_record: bool = False,
+) -> str:
+    '''
+    Python expression type-checking the current pith to be an instance of the
+    passed class.
+
+    If this class is a **record** (i.e., :class:`typing.NamedTuple` subclass or
+    dataclass) whose annotated fields are to be type-checked, this expression
+    additionally type-checks all annotated fields of this pith.
+
+    If this class is a standard **abstract base class (ABC)** (e.g.,
+    :class:`collections.abc.Sequence`) to which one or more common concrete
+    standard types are subclasses (e.g., :class:`list`), this expression first
+    tests whether the type of this pith is one of those types in constant time
+    *before* deferring to the comparatively slow :func:`isinstance` builtin.
+    Else, this expression reduces to a call to that builtin.
+
+    Parameters
+    ----------
+    hint_type : type
+        Class to type-check this pith against.
+    pith_curr_expr : str
+        Python expression evaluating to this pith, embedded as is when this
+        class is *not* such an ABC.
+    pith_curr_assign_expr : str
+        Python expression evaluating to this pith while assigning this pith to
+        a local variable if needed, embedded when this class is such an ABC.
+    pith_curr_assigned_expr : str
+        Python expression evaluating to this pith after evaluating the
+        ``pith_curr_assign_expr`` expression, embedded when this class is such
+        an ABC.
+    is_record : bool
+        ``True`` only if this class is a record whose annotated fields are to
+        be type-checked. Defaults to ``False``.
+
+    Returns
+    ----------
+    str
+        Python expression type-checking this pith against this class.
+    '''
+
+    # Python expression evaluating to this class when accessed via the private
+    # "__beartypistry" parameter.
+    hint_type_expr = register_typistry_type(hint_type)
+
+    # If this class is a record whose fields are to be type-checked, return
+    # code deferring to the tester type-checking these fields *AFTER*
+    # type-checking this pith to be an instance of this class.
+    if is_record:
+        # Defer heavyweight imports, avoiding increasing the import time of the
+        # "beartype" package for callers never type-checking record fields.
+        # Importing this submodule also registers the wrapper global
+        # referenced by this code.
+        from beartype._decor._cache.cachefield import (
+            IS_RECORD_FIELDS_VALID_NAME)
+
+        return PEP_CODE_CHECK_HINT_NONPEP_TYPE_RECORD_format(
+            pith_curr_assign_expr=pith_curr_assign_expr,
+            pith_curr_assigned_expr=pith_curr_assigned_expr,
+            hint_curr_expr=hint_type_expr,
+            is_record_fields_valid_name=IS_RECORD_FIELDS_VALID_NAME,
+        )
+    # Else, this class is *NOT* such a record.
+    #
+    # If this class is *NOT* such an ABC, trivially defer to isinstance().
+    if hint_type not in TYPE_ABC_TO_TYPES_CONCRETE:
+        return PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+            pith_curr_expr=pith_curr_expr,
+            hint_curr_expr=hint_type_expr,
+        )
+    # Else, this class is such an ABC.
+
+    # Return code first testing the type of this pith against the global
+    # frozen set of all concrete types subclassing this ABC.
+    return PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC_format(
+        pith_curr_assign_expr=pith_curr_assign_expr,
+        pith_curr_assigned_expr=pith_curr_assigned_expr,
+        hint_curr_types_concrete_expr=(
+            PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC_TYPES_NAME_PREFIX +
+            hint_type.__name__),
+        hint_curr_expr=hint_type_expr,
+    )
+
+# ....................{ PRIVATE ~ joiners                 }....................
+def _join_hint_codes(hints_code: List[str]) -> str:
+    '''
+    Python code snippet type-checking the root pith against the root hint,
+    assembled from the passed list of all snippets generated by the
+    breadth-first search performed by the :func:`pep_code_check_hint` function
+    by recursively replacing each child hint placeholder substring embedded in
+    each such snippet with the snippet type-checking that child hint.
+
+    This function is linear in the total length of all passed snippets.
+    Specifically, this function:
+
+    #. Splits each snippet exactly once on child hint placeholder substrings.
+    #. Appends each resulting fragment exactly once to an append-only list of
+       fragments, descending into the snippet of each child hint in-place via
+       an explicit stack rather than recursion.
+    #. Joins that list into the returned string exactly once.
+
+    Parameters
+    ----------
+    hints_code : List[str]
+        List of Python code snippets such that each item is the snippet
+        type-checking the hint with the same 0-based index in the
+        breadth-first search performed by the :func:`pep_code_check_hint`
+        function. The first item is thus the snippet type-checking the root
+        hint.
+
+    Returns
+    ----------
+    str
+        Python code snippet type-checking the root pith against the root hint.
+    '''
+    assert isinstance(hints_code, list), f'{repr(hints_code)} not list.'
+    assert hints_code, 'Hint snippets empty.'
+
+    # Append-only list of all code fragments to be joined into the returned
+    # snippet.
+    func_code_frags: List[str] = []
+
+    # Stack of 2-tuples "(hint_code_frags, hint_code_frag_index)" describing
+    # each partially expanded snippet, where "hint_code_frags" is the list of
+    # fragments split from that snippet and "hint_code_frag_index" is the
+    # 0-based index of the next fragment in that list to be expanded.
+    hints_code_frags_stack = []
+
+    # List of fragments split from the currently expanded snippet, seeded with
+    # the snippet type-checking the root hint. Since the regular expression
+    # splitting this snippet captures the 0-based index embedded in each
+    # placeholder, items with even indices in this list are literal code
+    # fragments while items with odd indices are the stringified 0-based
+    # indices of child hint snippets.
+    hint_code_frags = _HINT_CHILD_PLACEHOLDER_REGEX.split(hints_code[0])
+
+    # 0-based index of the next fragment in this list to be expanded.
+    hint_code_frag_index = 0
+
+    # While one or more snippets remain to be expanded...
+    while True:
+        # If this snippet has been fully expanded...
+        if hint_code_frag_index >= len(hint_code_frags):
+            # If *NO* parent snippets remain to be expanded, halt.
+            if not hints_code_frags_stack:
+                break
+            # Else, one or more parent snippets remain to be expanded.
+
+            # Resume expanding the parent snippet of this snippet.
+            hint_code_frags, hint_code_frag_index = (
+                hints_code_frags_stack.pop())
+        # Else if this fragment is literal code, append this fragment as is.
+        elif not (hint_code_frag_index & 1):
+            func_code_frags.append(hint_code_frags[hint_code_frag_index])
+            hint_code_frag_index += 1
+        # Else, this fragment is the 0-based index of a child hint snippet. In
+        # this case, defer the remainder of this snippet *BEFORE* expanding
+        # that child snippet in-place.
+        else:
+            hints_code_frags_stack.append(
+                (hint_code_frags, hint_code_frag_index + 1))
+            hint_code_frags = _HINT_CHILD_PLACEHOLDER_REGEX.split(
+                hints_code[int(hint_code_frags[hint_code_frag_index])])
+            hint_code_frag_index = 0
+
+    # Return these fragments joined into a single snippet.
+    return ''.join(func_code_frags)
@@ -28,12 +28,18 @@ from beartype._decor._code.codesnip import (
 from inspect import Parameter
 
 # ....................{ PITH                              }....................
-PEP_CODE_PITH_ASSIGN_EXPR = '''{pith_curr_assigned_expr} := {pith_curr_expr}'''
+PEP_CODE_PITH_ASSIGN_EXPR = (
+    '''{pith_curr_assigned_expr} := ({pith_curr_expr})''')
 '''
 Python >= 3.8-specific assignment expression assigning the full Python
 expression yielding the value of the current pith to a unique local variable,
 enabling PEP-compliant child hints to obtain this pith via this efficient
 variable rather than via this inefficient full Python expression.
+
+That expression is parenthesized, as that expression may itself be an
+assignment expression (e.g., when type-checking the first child hint of a
+union subscripting a container) and Python prohibits unparenthesized chained
+assignment expressions (e.g., ``a := b := c``).
 '''
 
 
@@ -108,10 +114,43 @@ PARAM_KIND_TO_PEP_CODE_GET = {
     # If this parameter was passed...
     if {PEP_CODE_PITH_ROOT_NAME} is not {ARG_NAME_TYPISTRY}:''',
 
+    # Snippet localizing any positional-only parameter by indexation into the
+    # wrapper's variadic "*args" tuple. Since positional-only parameters are
+    # *NEVER* passable by keyword, this snippet avoids the wrapper's variadic
+    # "**kwargs" dictionary altogether. (See above.)
+    Parameter.POSITIONAL_ONLY: f'''
+    # Localize this positional-only parameter if passed *OR* to the sentinel
+    # value "__beartypistry" guaranteed to never be passed otherwise.
+    {PEP_CODE_PITH_ROOT_NAME} = (
+        args[{{arg_index}}] if {VAR_NAME_ARGS_LEN} > {{arg_index}} else
+        {ARG_NAME_TYPISTRY}
+    )
+
+    # If this parameter was passed...
+    if {PEP_CODE_PITH_ROOT_NAME} is not {ARG_NAME_TYPISTRY}:''',
+
     # Snippet iteratively localizing all variadic positional parameters.
     Parameter.VAR_POSITIONAL: f'''
     # For all passed positional variadic parameters...
     for {PEP_CODE_PITH_ROOT_NAME} in args[{{arg_index!r}}:]:''',
+
+    # Snippet localizing the first variadic keyword parameter (i.e., the first
+    # item of the wrapper's variadic "**kwargs" dictionary *NOT* passing a
+    # named parameter, whose names are formatted into this snippet as either a
+    # set or tuple literal). Since Python compiles tests of membership in set
+    # literals into tests of membership in frozen set constants, each such
+    # test is O(1).
+    Parameter.VAR_KEYWORD: f'''
+    # Localize the first passed variadic keyword parameter if any *OR* the
+    # sentinel value "__beartypistry" guaranteed to never be passed otherwise.
+    {PEP_CODE_PITH_ROOT_NAME} = next((
+        __beartype_kwarg_value
+        for __beartype_kwarg_name, __beartype_kwarg_value in kwargs.items()
+        if __beartype_kwarg_name not in {{arg_names_keyword}}
+    ), {ARG_NAME_TYPISTRY})
+
+    # If this parameter was passed...
+    if {PEP_CODE_PITH_ROOT_NAME} is not {ARG_NAME_TYPISTRY}:''',
 }
 '''
 Dictionary mapping from the type of each callable parameter supported by the
@@ -119,11 +158,180 @@ Dictionary mapping from the type of each callable parameter supported by the
 that callable's next parameter to be type-checked.
 '''
 
+PARAM_KIND_TO_PEP_CODE_LOCALIZE = {
+    # Snippet localizing any positional-only, positional or keyword, or
+    # keyword-only parameter *WITHOUT* a default value, which the caller is
+    # thus guaranteed to have passed to the wrapper function as the fast local
+    # of the same name mirroring that parameter.
+    Parameter.POSITIONAL_ONLY: f'''
+    # Localize this parameter.
+    {PEP_CODE_PITH_ROOT_NAME} = {{arg_name}}
+
+    # Noop required to artifically increase indentation level. Note that
+    # CPython implicitly optimizes this conditional away - which is nice.
+    if True:''',
+
+    # Snippet iteratively localizing all variadic positional parameters.
+    Parameter.VAR_POSITIONAL: f'''
+    # For all passed positional variadic parameters...
+    for {PEP_CODE_PITH_ROOT_NAME} in {{arg_name}}:''',
+
+    # Snippet localizing the first variadic keyword parameter in O(1) time.
+    # Since dictionaries are *NOT* efficiently indexable, this parameter is
+    # the first rather than a pseudo-randomly selected such parameter.
+    Parameter.VAR_KEYWORD: f'''
+    # If one or more variadic keyword parameters were passed...
+    if {{arg_name}}:
+        # Localize the first such parameter.
+        {PEP_CODE_PITH_ROOT_NAME} = next(iter({{arg_name}}.values()))''',
+}
+'''
+Dictionary mapping from the type of each callable parameter supported by the
+:func:`beartype.beartype` decorator to a PEP-compliant code snippet localizing
+that callable's next parameter to be type-checked from the fast local of the
+same name declared by **mirroring wrapper functions** (i.e., wrapper functions
+whose signatures mirror the signature of the decorated callable).
+
+Unlike the :data:`PARAM_KIND_TO_PEP_CODE_GET` dictionary, the snippets provided
+by this dictionary neither index the variadic ``*args`` tuple nor look up the
+variadic ``**kwargs`` dictionary, both of which mirroring wrapper functions
+avoid packing on each call.
+'''
+
+# Positional or keyword and keyword-only parameters *WITHOUT* default values
+# are localized in the same manner as positional-only parameters.
+PARAM_KIND_TO_PEP_CODE_LOCALIZE[Parameter.POSITIONAL_OR_KEYWORD] = (
+    PARAM_KIND_TO_PEP_CODE_LOCALIZE[Parameter.POSITIONAL_ONLY])
+PARAM_KIND_TO_PEP_CODE_LOCALIZE[Parameter.KEYWORD_ONLY] = (
+    PARAM_KIND_TO_PEP_CODE_LOCALIZE[Parameter.POSITIONAL_ONLY])
+
+
+PEP_CODE_GET_PARAM_VAR_KEYWORD_ALL = f'''
+    # For all passed variadic keyword parameters...
+    for {PEP_CODE_PITH_ROOT_NAME} in (
+        __beartype_kwarg_value
+        for __beartype_kwarg_name, __beartype_kwarg_value in kwargs.items()
+        if __beartype_kwarg_name not in {{arg_names_keyword}}
+    ):'''
+'''
+PEP-compliant code snippet iteratively localizing *all* variadic keyword
+parameters passed to **repacking wrapper functions** (i.e., wrapper functions
+accepting all parameters passed by the caller as the variadic ``*args`` and
+``**kwargs`` parameters), enabled by the
+:attr:`beartype.BeartypeConf.is_check_kwargs_all` option.
+'''
+
+
+PEP_CODE_LOCALIZE_PARAM_VAR_KEYWORD_ALL = f'''
+    # For all passed variadic keyword parameters...
+    for {PEP_CODE_PITH_ROOT_NAME} in {{arg_name}}.values():'''
+'''
+PEP-compliant code snippet iteratively localizing *all* variadic keyword
+parameters passed to mirroring wrapper functions, enabled by the
+:attr:`beartype.BeartypeConf.is_check_kwargs_all` option.
+'''
+
+
+PEP_CODE_LOCALIZE_PARAM_DEFAULT = f'''
+    # Localize this optional parameter if passed *OR* to the sentinel value
+    # "__beartypistry" defaulting this parameter otherwise.
+    {PEP_CODE_PITH_ROOT_NAME} = {{arg_name}}
+
+    # If this parameter was passed...
+    if {PEP_CODE_PITH_ROOT_NAME} is not {ARG_NAME_TYPISTRY}:'''
+'''
+PEP-compliant code snippet localizing the next **optional parameter** (i.e.,
+parameter with a default value) to be type-checked from the fast local of the
+same name declared by mirroring wrapper functions.
+
+Mirroring wrapper functions default each such parameter to the private
+``__beartypistry`` singleton guaranteed to *never* be passed by callers rather
+than to the default value of that parameter, preserving the longstanding
+guarantee that :mod:`beartype` only type-checks passed parameters (e.g., the
+``None`` default of a parameter annotated as ``muh_param: int = None``). This
+singleton is subsequently replaced by the current default value of that
+parameter when passing that parameter to the decorated callable (see the
+:data:`beartype._decor._code.codesnip.CODE_CALL_ARG_DEFAULT` snippet).
+'''
+
+
+# ....................{ PARAM ~ iterator                  }....................
+PEP_CODE_PROXY_PARAM_ITERATOR = f'''
+        # Replace this iterator by a proxy type-checking each item of this
+        # iterator as that item is consumed.
+        {{arg_name}} = {{proxier_expr}}(
+            {PEP_CODE_PITH_ROOT_NAME}, {ARG_NAME_FUNC}, {{arg_name!r}})'''
+'''
+PEP-compliant code snippet replacing the successfully type-checked iterator
+passed as the current parameter by a proxy lazily type-checking the items of
+that iterator, enabled by the :attr:`beartype.BeartypeConf.is_proxy_iterators`
+option.
+
+This snippet expects to be formatted with these named interpolations:
+
+* ``{arg_name}``, the name of this parameter as a fast local of mirroring
+  wrapper functions.
+* ``{proxier_expr}``, a Python expression evaluating to the proxier
+  registered for the iterator hint annotating this parameter.
+'''
+
+# ....................{ PARAM ~ typevar                   }....................
+PEP484_CODE_CHECK_TYPEVAR_BINDING = f'''
+        # If this type variable has yet to be bound by this call, bind this
+        # type variable to the type of this pith.
+        if {{typevar_var_name}} is None:
+            {{typevar_var_name}} = type({PEP_CODE_PITH_ROOT_NAME})
+        # Else, this type variable was bound by a prior parameter of this
+        # call. If this pith is *NOT* of that exact type, raise an exception.
+        elif type({PEP_CODE_PITH_ROOT_NAME}) is not {{typevar_var_name}}:
+            __beartype_raise_pep_call_typevar_exception(
+                func={ARG_NAME_FUNC},
+                pith_name={PEP_CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER},
+                pith_value={PEP_CODE_PITH_ROOT_NAME},
+                typevar_type={{typevar_var_name}},
+            )'''
+'''
+`PEP 484`_-compliant code snippet binding the type variable annotating the
+current parameter or return to the type of that parameter or return if that
+variable has yet to be bound by the current call *or* requiring that
+parameter or return to be of that type otherwise, enabled by the
+:attr:`beartype.BeartypeConf.is_check_typevar_bindings` option.
+
+This snippet expects to be formatted with this named interpolation:
+
+* ``{typevar_var_name}``, the name of the local variable to which the type
+  bound to this type variable is assigned, initialized to ``None`` by the
+  :data:`PEP484_CODE_INIT_TYPEVAR_BINDING` snippet.
+
+.. _PEP 484:
+   https://www.python.org/dev/peps/pep-0484
+'''
+
+
+PEP484_CODE_INIT_TYPEVAR_BINDING = '''
+    {typevar_var_name} = None'''
+'''
+`PEP 484`_-compliant code snippet initializing the local variable to which
+the type bound to a type variable by the current call is assigned to
+``None``, implying this type variable to have yet to be bound.
+
+.. _PEP 484:
+   https://www.python.org/dev/peps/pep-0484
+'''
+
+
+PEP484_CODE_TYPEVAR_BINDING_VAR_NAME_PREFIX = '__beartype_typevar_'
+'''
+Substring prefixing the names of all local variables to which the types bound
+to type variables by the current call are assigned, suffixed by the 0-based
+index of each such type variable in the signature of the decorated callable.
+'''
+
 # ....................{ RETURN                            }....................
 PEP_CODE_CHECK_RETURN_PREFIX = f'''
     # Call this function with all passed parameters and localize the value
     # returned from this call.
-    {PEP_CODE_PITH_ROOT_NAME} = {ARG_NAME_FUNC}(*args, **kwargs)
+    {PEP_CODE_PITH_ROOT_NAME} = {ARG_NAME_FUNC}({{func_call_args}})
 
     # Noop required to artifically increase indentation level. Note that
     # CPython implicitly optimizes this conditional away - which is nice.
@@ -159,11 +367,26 @@ Note that this snippet intentionally terminates on a line containing only the
 :data:`PEP_CODE_GET_RETURN` snippet.
 '''
 
+PEP_CODE_CHECK_RETURN_SUFFIX_PROXY_ITERATOR = f'''
+    return {{proxier_expr}}(
+        {PEP_CODE_PITH_ROOT_NAME}, {ARG_NAME_FUNC}, 'return')'''
+'''
+PEP-compliant code snippet returning from the wrapper function a proxy lazily
+type-checking the items of the successfully type-checked iterator returned
+from the decorated callable, enabled by the
+:attr:`beartype.BeartypeConf.is_proxy_iterators` option.
+
+This snippet expects to be formatted with these named interpolations:
+
+* ``{proxier_expr}``, a Python expression evaluating to the proxier
+  registered for the iterator hint annotating this return.
+'''
+
 # ....................{ RETURN ~ noreturn                 }....................
 PEP484_CODE_CHECK_NORETURN = f'''
     # Call this function with all passed parameters and localize the value
     # returned from this call.
-    {PEP_CODE_PITH_ROOT_NAME} = {ARG_NAME_FUNC}(*args, **kwargs)
+    {PEP_CODE_PITH_ROOT_NAME} = {ARG_NAME_FUNC}({{func_call_args}})
 
     # Since this function annotated by "typing.NoReturn" successfully returned
     # a value rather than raising an exception or halting the active Python
@@ -239,13 +462,14 @@ This prefix is intended to be locally suffixed in the
 '''
 
 
-PEP_CODE_CHECK_HINT_ROOT_SUFFIX = f''':
+PEP_CODE_CHECK_HINT_ROOT_SUFFIX = (f''':
             __beartype_raise_pep_call_exception(
                 func={ARG_NAME_FUNC},
                 pith_name={PEP_CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER},
-                pith_value={PEP_CODE_PITH_ROOT_NAME},{{random_int_if_any}}
+                pith_value={PEP_CODE_PITH_ROOT_NAME},'''
+    '''{random_int_if_any}{is_check_fields_if_any}{is_check_typevars_if_any}
             )
-'''
+''')
 '''
 PEP-compliant code snippet suffixing all code type-checking the **root pith**
 (i.e., value of the current parameter or return value) against the root
@@ -259,6 +483,18 @@ This snippet expects to be formatted with these named interpolations:
     :data:`PEP_CODE_RAISE_PEP_CALL_EXCEPTION_RANDOM_INT`.
   * Else, the empty substring.
 
+* ``{is_check_fields_if_any}``, whose value is either:
+
+  * If type-checking the current type hint deeply type-checks the fields of
+    one or more records, :data:`PEP_CODE_RAISE_PEP_CALL_EXCEPTION_IS_CHECK_FIELDS`.
+  * Else, the empty substring.
+
+* ``{is_check_typevars_if_any}``, whose value is either:
+
+  * If type-checking the current type hint type-checks bounded or constrained
+    type variables, :data:`PEP_CODE_RAISE_PEP_CALL_EXCEPTION_IS_CHECK_TYPEVARS`.
+  * Else, the empty substring.
+
 Design
 ----------
 **This string is the only code snippet defined by this submodule to raise an
@@ -277,6 +513,26 @@ PEP-compliant code snippet suffixing all code type-checking the **root pith**
 PEP-compliant type hint annotating that pith.
 '''
 
+
+PEP_CODE_RAISE_PEP_CALL_EXCEPTION_IS_CHECK_FIELDS = '''
+                is_check_fields=True,'''
+'''
+PEP-compliant code snippet passing the **record field checking flag** to the
+function raising a human-readable exception when the root pith violates the
+root PEP-compliant type hint annotating that pith, instructing that function
+to also describe violations of annotated fields of records.
+'''
+
+
+PEP_CODE_RAISE_PEP_CALL_EXCEPTION_IS_CHECK_TYPEVARS = '''
+                is_check_typevars=True,'''
+'''
+PEP-compliant code snippet passing the **type variable checking flag** to the
+function raising a human-readable exception when the root pith violates the
+root PEP-compliant type hint annotating that pith, instructing that function
+to also reduce bounded and constrained type variables in that hint.
+'''
+
 # ....................{ HINT ~ nonpep                     }....................
 PEP_CODE_CHECK_HINT_NONPEP_TYPE = (
     '''isinstance({pith_curr_expr}, {hint_curr_expr})''')
@@ -286,6 +542,55 @@ current child PEP-compliant type expected to be a trivial non-:mod:`typing`
 type (e.g., :class:`int`, :class:`str`).
 '''
 
+
+PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC = (
+    '''(type({pith_curr_assign_expr}) in {hint_curr_types_concrete_expr} or '''
+    '''isinstance({pith_curr_assigned_expr}, {hint_curr_expr}))''')
+'''
+PEP-compliant code snippet type-checking the current pith against the
+current child PEP-compliant type expected to be a standard **abstract base
+class (ABC)** (e.g., :class:`collections.abc.Sequence`) to which one or more
+common concrete standard types are subclasses (e.g., :class:`list`).
+
+This snippet first tests whether the type of this pith is one of these
+concrete types in constant time *before* deferring to the comparatively slow
+:meth:`abc.ABCMeta.__instancecheck__` dunder method implicitly called by the
+:func:`isinstance` builtin.
+
+See Also
+----------
+:data:`beartype._util.cls.utilclsabc.TYPE_ABC_TO_TYPES_CONCRETE`
+    Further details.
+'''
+
+
+PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC_TYPES_NAME_PREFIX = (
+    '__beartype_types_concrete_')
+'''
+Substring prefixing the name of each global frozen set of common concrete
+standard types subclassing a standard ABC, suffixed by the unqualified name of
+that ABC (e.g., ``__beartype_types_concrete_Sequence``) and referenced by the
+:data:`PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC` code snippet.
+'''
+
+
+
+PEP_CODE_CHECK_HINT_NONPEP_TYPE_RECORD = (
+    '''(isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and '''
+    '''{is_record_fields_valid_name}({pith_curr_assigned_expr}))''')
+'''
+PEP-compliant code snippet type-checking the current pith against the
+current child PEP-compliant type expected to be a **record** (i.e.,
+:class:`typing.NamedTuple` subclass or dataclass) *or* forward reference to a
+possible record under configurations enabling the
+:attr:`beartype.BeartypeConf.is_check_fields` option.
+
+This snippet first tests whether this pith is an instance of this record
+*before* deferring to the
+:func:`beartype._decor._cache.cachefield.is_record_fields_valid` tester
+type-checking all annotated fields declared by the type of this pith.
+'''
+
 # ....................{ HINT ~ generic                    }....................
 PEP_CODE_CHECK_HINT_GENERIC_PREFIX = '''(
 {indent_curr}    # True only if this pith is an instance of this generic.
@@ -342,10 +647,38 @@ snippet type-checking the current pith against *all* subscripted arguments of
 this parent type has been generated.
 '''
 
+# ....................{ HINT ~ pep544 : protocol          }....................
+PEP544_CODE_CHECK_HINT_PROTOCOL_CACHED_PREFIX = '''(
+{indent_curr}    # True only if this pith is an instance of this protocol, either
+{indent_curr}    # as previously cached for the type of this pith *OR* as decided
+{indent_curr}    # by inspecting this pith on a cache miss.
+{indent_curr}    (
+{indent_curr}        __beartype_type({pith_curr_assign_expr}) in {hint_curr_types_expr} or
+{indent_curr}        __beartype_is_protocol_instance(
+{indent_curr}            {pith_curr_assigned_expr}, {hint_curr_expr}, {hint_curr_types_expr})
+{indent_curr}    ) and'''
+'''
+`PEP 544`_-compliant code snippet prefixing all code type-checking the current
+pith against each unerased pseudo-superclass subclassed by a **cacheable
+protocol** (i.e., runtime-checkable protocol declaring *only* callable
+members), replacing the :func:`isinstance` call performed by the
+:data:`PEP_CODE_CHECK_HINT_GENERIC_PREFIX` snippet for all other generics with
+a lookup of the exact type of this pith in the weak set of the types of all
+objects previously found to satisfy this protocol.
+
+See Also
+----------
+:mod:`beartype._decor._cache.cacheprotocol`
+    Further details.
+
+.. _PEP 544:
+   https://www.python.org/dev/peps/pep-0544
+'''
+
 # ....................{ HINT ~ sequence : standard        }....................
 PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD = '''(
 {indent_curr}    # True only if this pith shallowly satisfies this hint.
-{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    {hint_curr_check_type_expr} and
 {indent_curr}    # True only if either this pith is empty *OR* this pith is
 {indent_curr}    # both non-empty and deeply satisfies this hint.
 {indent_curr}    (not {pith_curr_assigned_expr} or {hint_child_placeholder})
@@ -393,6 +726,47 @@ PEP-compliant Python expression yielding the value of a randomly indexed item
 of the current pith (which, by definition, *must* be a standard sequence).
 '''
 
+# ....................{ HINT ~ sequence : ends            }....................
+PEP_CODE_CHECK_HINT_SEQUENCE_ENDS = '''(
+{indent_curr}    # True only if this pith shallowly satisfies this hint.
+{indent_curr}    {hint_curr_check_type_expr} and
+{indent_curr}    # True only if either this pith is empty *OR* this pith is
+{indent_curr}    # both non-empty and both the first and last items of this pith
+{indent_curr}    # deeply satisfy this hint.
+{indent_curr}    (not {pith_curr_assigned_expr} or (
+{indent_curr}        {hint_child_placeholder_first} and
+{indent_curr}        {hint_child_placeholder_last}
+{indent_curr}    ))
+{indent_curr})'''
+'''
+PEP-compliant code snippet type-checking the current pith against a parent
+**end-indexable sequence type** (i.e., PEP-compliant type hint accepting
+exactly one subscripted type hint unconditionally constraining *all* items of
+this pith, which guarantees ``O(1)`` indexation of only its first and last
+items).
+
+Since pseudo-randomly indexing an item of this pith would require ``O(n)``
+time, this snippet type-checks both the first and last items of this pith
+instead. Like :data:`PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD`, this snippet
+cannot contain ternary conditionals.
+'''
+
+
+PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_FIRST_EXPR = (
+    '''{pith_curr_assigned_expr}[0]''')
+'''
+PEP-compliant Python expression yielding the value of the first item of the
+current pith (which, by definition, *must* be an end-indexable sequence).
+'''
+
+
+PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_LAST_EXPR = (
+    '''{pith_curr_assigned_expr}[-1]''')
+'''
+PEP-compliant Python expression yielding the value of the last item of the
+current pith (which, by definition, *must* be an end-indexable sequence).
+'''
+
 # ....................{ HINT ~ sequence : tuple           }....................
 PEP_CODE_CHECK_HINT_TUPLE_FIXED_PREFIX = '''(
 {indent_curr}    # True only if this pith is a tuple.
@@ -509,6 +883,28 @@ this parent type has been generated.
 '''
 
 
+PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE = '''
+{{indent_curr}}    ({pith_curr_expr}) is None or'''
+'''
+PEP-compliant code snippet type-checking the current pith against the type of
+the ``None`` singleton subscripting a parent :class:`typing.Union` type (e.g.,
+:class:`typing.Optional`).
+
+Since that type has exactly one instance, this snippet efficiently reduces to
+an identity test preceding all other code type-checking this pith against the
+other child arguments of this union.
+
+The ``{pith_curr_expr}`` format variable is intentionally parenthesized, as
+the assignment expression this variable may be formatted with binds less
+tightly than the ``is`` operator.
+
+See Also
+----------
+:data:`PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
+
 PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP = '''
 {{indent_curr}}    isinstance({pith_curr_expr}, {hint_curr_expr}) or'''
 '''
@@ -522,6 +918,227 @@ See Also
     Further details.
 '''
 
+# ....................{ HINT ~ pep484 : union : dispatch  }....................
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX = '''
+{{indent_curr}}    # Type mask selecting all child hints this pith could satisfy,
+{{indent_curr}}    # looked up by the exact type of this pith.
+{{indent_curr}}    ({union_type_mask_name} := {union_type_masks_expr}.get(
+{{indent_curr}}        __beartype_type({pith_curr_expr}), -1)) and ('''
+'''
+PEP-compliant code snippet prefixing all code type-checking the current pith
+against each subscripted argument of a :class:`typing.Union` type dispatchable
+on the exact type of this pith, following the
+:data:`PEP484_CODE_CHECK_HINT_UNION_PREFIX` snippet and the
+:data:`PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE` snippet if this union is
+subscripted by the type of the ``None`` singleton.
+
+This snippet assigns the **type mask** (i.e., bit mask selecting the child
+hints of this union that objects of the exact type of this pith could possibly
+satisfy) to a local variable, enabling code generated for each child hint to
+skip that child hint unless selected by that mask in ``O(1)`` time. Piths of
+types unknown to this union (e.g., subclasses of the origin types of these
+child hints) default to the type mask selecting *all* child hints and are thus
+type-checked against each child hint in turn.
+
+The :class:`type` builtin is accessed as the ``__beartype_type`` global rather
+than by its standard name, which parameters of decorated callables exposed as
+locals of the same names by mirrored wrapper functions could shadow.
+
+See Also
+----------
+:mod:`beartype._decor._cache.cacheunion`
+    Further details.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_SUFFIX = '''
+{indent_curr}    )
+{indent_curr})'''
+'''
+PEP-compliant code snippet suffixing all code type-checking the current pith
+against each subscripted argument of a :class:`typing.Union` type dispatchable
+on the exact type of this pith.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP = '''
+{{indent_curr}}        ({union_type_mask_name} & {union_type_mask_bit} and
+{{indent_curr}}         {hint_child_placeholder}) or'''
+'''
+PEP-compliant code snippet type-checking the current pith against the current
+PEP-compliant child argument subscripting a parent :class:`typing.Union` type
+dispatchable on the exact type of this pith.
+
+See Also
+----------
+:data:`PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP = '''
+{{indent_curr}}        ({union_type_mask_name} & {union_type_mask_bit} and
+{{indent_curr}}         isinstance({pith_curr_expr}, {hint_curr_expr})) or'''
+'''
+PEP-compliant code snippet type-checking the current pith against all
+PEP-noncompliant child arguments subscripting a parent :class:`typing.Union`
+type dispatchable on the exact type of this pith.
+
+See Also
+----------
+:data:`PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_TYPE_MASK_NAME = (
+    '''{pith_curr_assigned_expr}_union_type_mask''')
+'''
+Name of the local variable to which the type mask of the current pith is
+assigned, uniquified by the name of the local variable to which this pith is
+assigned.
+'''
+
+# ....................{ HINT ~ pep593 : annotated         }....................
+PEP593_CODE_CHECK_HINT_VALIDATOR_PREFIX = '''('''
+'''
+`PEP 593`_-compliant code snippet prefixing all code type-checking the current
+pith against a :attr:`typing.Annotated` type metahint subscripted by one or
+more beartype validators (e.g., ``beartype.vale.Is[...]``).
+
+.. _PEP 593:
+   https://www.python.org/dev/peps/pep-0593
+'''
+
+
+PEP593_CODE_CHECK_HINT_VALIDATOR_SUFFIX = '''
+{indent_curr})'''
+'''
+`PEP 593`_-compliant code snippet suffixing all code type-checking the current
+pith against a :attr:`typing.Annotated` type metahint subscripted by one or
+more beartype validators.
+
+.. _PEP 593:
+   https://www.python.org/dev/peps/pep-0593
+'''
+
+
+PEP593_CODE_CHECK_HINT_VALIDATOR_HINT = '''
+{indent_curr}    # True only if this pith satisfies the type hint annotated by
+{indent_curr}    # this metahint.
+{indent_curr}    {hint_child_placeholder} and'''
+'''
+`PEP 593`_-compliant code snippet type-checking the current pith against the
+type hint annotated by a :attr:`typing.Annotated` type metahint subscripted by
+one or more beartype validators *before* validating this pith against these
+validators, which may thus safely assume this pith to satisfy that type hint.
+
+.. _PEP 593:
+   https://www.python.org/dev/peps/pep-0593
+'''
+
+
+PEP593_CODE_CHECK_HINT_VALIDATOR_CHILD = '''
+{indent_curr}    # True only if this pith satisfies this beartype validator.
+{indent_curr}    {validator_code} and'''
+'''
+`PEP 593`_-compliant code snippet validating the current pith against the
+current beartype validator subscripting a :attr:`typing.Annotated` type
+metahint.
+
+Caveats
+----------
+Unlike most other child snippets, the ``{indent_curr}`` format variable is
+intentionally *not* brace-protected. Since the ``{validator_code}`` format
+variable may inline arbitrary user-defined source code embedding braces (e.g.,
+dictionary and set displays), this snippet *must* be formatted exactly once.
+
+.. _PEP 593:
+   https://www.python.org/dev/peps/pep-0593
+'''
+
+# ....................{ HINT ~ pep589 : typeddict         }....................
+PEP589_CODE_CHECK_HINT_TYPEDDICT = '''(
+{indent_curr}    # True only if this pith is a dictionary.
+{indent_curr}    isinstance({pith_curr_assign_expr}, dict) and
+{indent_curr}    # True only if this dictionary contains all required keys and
+{indent_curr}    # maps all checked keys to values satisfying their hints.
+{indent_curr}    {hint_curr_validator_expr}({pith_curr_assigned_expr}, {random_int_expr})
+{indent_curr})'''
+'''
+PEP-compliant code snippet type-checking the current pith against a `PEP
+589`_-compliant **typed dictionary** (i.e., :class:`typing.TypedDict`
+subclass).
+
+This snippet first tests whether this pith is a dictionary *before* deferring
+to the validator compiled for this typed dictionary by the
+:mod:`beartype._decor._cache.cachetypeddict` submodule, type-checking either
+a single pseudo-randomly selected key or all keys of this dictionary.
+
+.. _PEP 589:
+    https://www.python.org/dev/peps/pep-0589
+'''
+
+
+PEP589_CODE_CHECK_HINT_TYPEDDICT_RANDOM_INT_NONE = 'None'
+'''
+PEP-compliant Python expression passed as the pseudo-random integer to
+validators type-checking *all* keys of dictionaries against typed
+dictionaries, which require no such integer.
+'''
+
+# ....................{ HINT ~ numpy : ndarray            }....................
+NUMPY_CODE_CHECK_HINT_NDARRAY_PREFIX = '''(
+{indent_curr}    # True only if this pith is a NumPy array.
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and'''
+'''
+:mod:`numpy`-specific code snippet prefixing all code type-checking the
+current pith against a :mod:`numpy` array type hint constraining the dtype
+and/or dimensionality of these arrays (e.g.,
+``numpy.typing.NDArray[numpy.float64]``).
+
+Since :mod:`numpy` arrays may contain arbitrarily many items, this and all
+other :mod:`numpy`-specific snippets inspect *only* array metadata and thus
+type-check these arrays in constant time without boxing *any* array items.
+'''
+
+
+NUMPY_CODE_CHECK_HINT_NDARRAY_SUFFIX = '''
+{indent_curr})'''
+'''
+:mod:`numpy`-specific code snippet suffixing all code type-checking the
+current pith against a :mod:`numpy` array type hint.
+'''
+
+
+NUMPY_CODE_CHECK_HINT_NDARRAY_DTYPE = '''
+{indent_curr}    # True only if the scalar type of this array's dtype is that
+{indent_curr}    # constrained by this hint.
+{indent_curr}    issubclass({pith_curr_assigned_expr}.dtype.type, {hint_dtype_type_expr}) and'''
+'''
+:mod:`numpy`-specific code snippet type-checking the dtype of the current
+pith, guaranteed to be a :mod:`numpy` array, against the scalar type
+constrained by a :mod:`numpy` array type hint (e.g., ``numpy.float64`` for
+``numpy.typing.NDArray[numpy.float64]``).
+
+Since this scalar type may be an abstract superclass of one or more concrete
+scalar types (e.g., ``numpy.floating``), this snippet tests subclassing rather
+than identity.
+'''
+
+
+NUMPY_CODE_CHECK_HINT_NDARRAY_NDIM = '''
+{indent_curr}    # True only if this array has the dimensionality constrained by
+{indent_curr}    # this hint.
+{indent_curr}    {pith_curr_assigned_expr}.ndim == {hint_ndim} and'''
+'''
+:mod:`numpy`-specific code snippet type-checking the dimensionality of the
+current pith, guaranteed to be a :mod:`numpy` array, against the
+dimensionality constrained by the fixed-length tuple shape hint subscripting
+a :mod:`numpy` array type hint (e.g., ``2`` for
+``numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float64]]``).
+'''
+
 # ....................{ FORMATTERS                        }....................
 # Bound format methods of string globals defined above, preserved as discrete
 # global variables for efficient lookup elsewhere.
@@ -529,10 +1146,20 @@ See Also
 # Bound format methods of string globals imported above.
 PEP_CODE_CHECK_HINT_NONPEP_TYPE_format = (
     PEP_CODE_CHECK_HINT_NONPEP_TYPE.format)
+PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC_format = (
+    PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC.format)
+PEP_CODE_CHECK_HINT_NONPEP_TYPE_RECORD_format = (
+    PEP_CODE_CHECK_HINT_NONPEP_TYPE_RECORD.format)
 PEP_CODE_CHECK_HINT_GENERIC_CHILD_format = (
     PEP_CODE_CHECK_HINT_GENERIC_CHILD.format)
 PEP_CODE_CHECK_HINT_ROOT_SUFFIX_format = (
     PEP_CODE_CHECK_HINT_ROOT_SUFFIX.format)
+PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_format = (
+    PEP_CODE_CHECK_HINT_SEQUENCE_ENDS.format)
+PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_FIRST_EXPR_format = (
+    PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_FIRST_EXPR.format)
+PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_LAST_EXPR_format = (
+    PEP_CODE_CHECK_HINT_SEQUENCE_ENDS_PITH_CHILD_LAST_EXPR.format)
 PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_format = (
     PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD.format)
 PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_CHILD_EXPR_format = (
@@ -545,8 +1172,34 @@ PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format = (
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_CHILD.format)
 PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format = (
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_TYPE_MASK_NAME_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_TYPE_MASK_NAME.format)
+PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE_format = (
+    PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE.format)
 PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP_format = (
     PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP.format)
 PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP_format = (
     PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP.format)
+PEP589_CODE_CHECK_HINT_TYPEDDICT_format = (
+    PEP589_CODE_CHECK_HINT_TYPEDDICT.format)
+PEP593_CODE_CHECK_HINT_VALIDATOR_CHILD_format = (
+    PEP593_CODE_CHECK_HINT_VALIDATOR_CHILD.format)
+PEP593_CODE_CHECK_HINT_VALIDATOR_HINT_format = (
+    PEP593_CODE_CHECK_HINT_VALIDATOR_HINT.format)
+PEP593_CODE_CHECK_HINT_VALIDATOR_SUFFIX_format = (
+    PEP593_CODE_CHECK_HINT_VALIDATOR_SUFFIX.format)
+NUMPY_CODE_CHECK_HINT_NDARRAY_DTYPE_format = (
+    NUMPY_CODE_CHECK_HINT_NDARRAY_DTYPE.format)
+NUMPY_CODE_CHECK_HINT_NDARRAY_NDIM_format = (
+    NUMPY_CODE_CHECK_HINT_NDARRAY_NDIM.format)
+NUMPY_CODE_CHECK_HINT_NDARRAY_PREFIX_format = (
+    NUMPY_CODE_CHECK_HINT_NDARRAY_PREFIX.format)
+NUMPY_CODE_CHECK_HINT_NDARRAY_SUFFIX_format = (
+    NUMPY_CODE_CHECK_HINT_NDARRAY_SUFFIX.format)
 PEP_CODE_PITH_ASSIGN_EXPR_format = PEP_CODE_PITH_ASSIGN_EXPR.format
@@ -28,11 +28,18 @@ from beartype.roar import (
 )
 from beartype._decor._code._pep._pepsnip import (
     PARAM_KIND_TO_PEP_CODE_GET,
+    PARAM_KIND_TO_PEP_CODE_LOCALIZE,
     PEP_CODE_CHECK_RETURN_PREFIX,
     PEP_CODE_CHECK_RETURN_SUFFIX,
+    PEP_CODE_CHECK_RETURN_SUFFIX_PROXY_ITERATOR,
+    PEP_CODE_GET_PARAM_VAR_KEYWORD_ALL,
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX,
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX,
+    PEP_CODE_LOCALIZE_PARAM_DEFAULT,
+    PEP_CODE_LOCALIZE_PARAM_VAR_KEYWORD_ALL,
+    PEP_CODE_PROXY_PARAM_ITERATOR,
     PEP484_CODE_CHECK_NORETURN,
+    PEP484_CODE_CHECK_TYPEVAR_BINDING,
 )
 from beartype._decor._code._pep._pephint import pep_code_check_hint
 from beartype._decor._code._pep._pepsnip import (
@@ -43,7 +50,10 @@ from beartype._util.cache.utilcacheerror import reraise_exception_cached
 from beartype._util.hint.utilhintget import (
     get_hint_forwardref_classname_relative_to_obj,
 )
-from beartype._util.hint.utilhinttest import die_unless_hint
+from beartype._util.hint.utilhinttest import (
+    die_unless_hint,
+    is_hint_ignorable,
+)
 from beartype._util.text.utiltextlabel import (
     label_callable_decorated_param,
     label_callable_decorated_return,
@@ -51,12 +61,42 @@ from beartype._util.text.utiltextlabel import (
 from beartype._util.text.utiltextmunge import replace_str_substrs
 from collections.abc import Callable, Iterable
 from inspect import Parameter
-from typing import NoReturn, Tuple, Union
+from typing import NoReturn, Optional, Tuple, Union
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
 # ....................{ CONSTANTS                         }....................
+_PARAM_KINDS_KEYWORD_NAMED = frozenset((
+    Parameter.POSITIONAL_OR_KEYWORD,
+    Parameter.KEYWORD_ONLY,
+))
+'''
+Frozen set of all :attr:`Parameter.kind` constants of **named keyword
+parameters** (i.e., non-variadic parameters passable by keyword).
+'''
+
+
+_PARAM_KINDS_PROXIABLE = frozenset((
+    Parameter.POSITIONAL_ONLY,
+    Parameter.POSITIONAL_OR_KEYWORD,
+    Parameter.KEYWORD_ONLY,
+))
+'''
+Frozen set of all :attr:`Parameter.kind` constants of **proxiable
+parameters** (i.e., non-variadic parameters localized by mirroring wrapper
+functions as fast locals of the same name and thus replaceable by proxies
+before being passed to the decorated callable).
+'''
+
+
+_PARAM_DEFAULT_EMPTY = Parameter.empty
+'''
+:mod:`inspect`-specific sentinel value indicating a **mandatory parameter**
+(i.e., parameter *without* a default value).
+'''
+
+
 _RETURN_REPR = repr('return')
 '''
 Object representation of the magic string implying a return value in various
@@ -153,10 +193,14 @@ def coerce_hint_pep(
 
 # ....................{ CODERS                            }....................
 def pep_code_check_param(
+    # Mandatory parameters.
     data: BeartypeData,
     hint: object,
     param: Parameter,
     param_index: int,
+
+    # Optional parameters.
+    typevar_var_name: Optional[str] = None,
 ) -> Tuple[str, bool]:
     '''
     Python code type-checking the parameter with the passed signature and index
@@ -174,6 +218,11 @@ def pep_code_check_param(
         :mod:`inspect`-specific object describing this parameter.
     param_index : int
         0-based index of this parameter in this callable's signature.
+    typevar_var_name : Optional[str]
+        Name of the local variable to which the type bound to the type
+        variable directly annotating this parameter by the current call is
+        assigned if this parameter is to be type-checked against that binding
+        *or* ``None`` otherwise. Defaults to ``None``.
 
     Returns
     ----------
@@ -198,8 +247,39 @@ def pep_code_check_param(
 
     # Python code template localizing this parameter if this kind of parameter
     # is supported *OR* "None" otherwise.
-    get_arg_code_template = PARAM_KIND_TO_PEP_CODE_GET.get(
-        param.kind, None)
+    get_arg_code_template = (
+        # If this parameter is variadic keyword and all such parameters are to
+        # be type-checked in linear time, a snippet iterating these parameters
+        # that is specific to the signature of the wrapper function.
+        (
+            PEP_CODE_LOCALIZE_PARAM_VAR_KEYWORD_ALL
+            if data.is_func_wrapper_sig_mirrored else
+            PEP_CODE_GET_PARAM_VAR_KEYWORD_ALL
+        )
+        if (
+            param.kind is Parameter.VAR_KEYWORD and
+            data.conf.is_check_kwargs_all
+        ) else
+        # Else if the wrapper function mirrors the signature of the decorated
+        # callable, either...
+        (
+            # If this parameter is optional (i.e., has a default value) and
+            # thus defaults to a sentinel value in that signature, a snippet
+            # localizing this parameter only if passed.
+            PEP_CODE_LOCALIZE_PARAM_DEFAULT
+            if (
+                param.default is not _PARAM_DEFAULT_EMPTY and
+                param.kind is not Parameter.VAR_POSITIONAL
+            ) else
+            # Else, a snippet localizing this parameter as is.
+            PARAM_KIND_TO_PEP_CODE_LOCALIZE.get(param.kind, None)
+        )
+        if data.is_func_wrapper_sig_mirrored else
+        # Else, that function repacks all passed parameters into the variadic
+        # "*args" and "**kwargs" parameters. In this case, a snippet indexing
+        # this parameter from those parameters.
+        PARAM_KIND_TO_PEP_CODE_GET.get(param.kind, None)
+    )
 
     # If this kind of parameter is unsupported...
     #
@@ -236,12 +316,26 @@ def pep_code_check_param(
     # Attempt to...
     try:
         # Generate memoized parameter-agnostic Python code type-checking a
-        # parameter or return value with an arbitrary name.
+        # parameter or return value with an arbitrary name. If this hint is
+        # ignorable, this parameter is type-checked only against the binding
+        # of the unbounded type variable annotating this parameter.
         (
             func_code,
             is_func_code_needs_random_int,
             hints_forwardref_class_basename,
-        ) = pep_code_check_hint(hint)
+        ) = (
+            ('', False, ())
+            if is_hint_ignorable(hint) else
+            pep_code_check_hint(
+                hint, data.conf.is_check_fields, data.conf.is_check_typevars)
+        )
+
+        # If this parameter is annotated by a type variable to be bound by
+        # this call, append code binding that type variable to the type of
+        # this parameter *OR* type-checking this parameter against that type.
+        if typevar_var_name is not None:
+            func_code += PEP484_CODE_CHECK_TYPEVAR_BINDING.format(
+                typevar_var_name=typevar_var_name)
 
         # Generate unmemoized parameter-specific Python code type-checking this
         # exact parameter by globally replacing in this parameter-agnostic
@@ -265,6 +359,32 @@ def pep_code_check_param(
                 hints_forwardref_class_basename=(
                     hints_forwardref_class_basename),
             )
+
+        # If iterators are to be proxied and this parameter is a fast local
+        # of the wrapper function...
+        if (
+            data.conf.is_proxy_iterators and
+            data.is_func_wrapper_sig_mirrored and
+            param.kind in _PARAM_KINDS_PROXIABLE
+        ):
+            # Defer heavyweight imports, avoiding increasing the import time
+            # of the "beartype" package for callers never proxying iterators.
+            # Importing this submodule also registers the wrapper global
+            # referenced by this code.
+            from beartype._decor._cache.cacheiterator import (
+                is_hint_iterator_proxiable,
+                register_iterator_proxier,
+            )
+
+            # If this hint is a proxiable iterator hint, append code replacing
+            # this parameter by a proxy lazily type-checking the items of this
+            # iterator.
+            if is_hint_iterator_proxiable(hint):
+                func_code += PEP_CODE_PROXY_PARAM_ITERATOR.format(
+                    arg_name=param.name,
+                    proxier_expr=register_iterator_proxier(
+                        hint, data.conf.is_check_fields, data.func.__module__),
+                )
     # If the prior call to the memoized _pep_code_check() function raises a
     # cached exception...
     except Exception as exception:
@@ -282,7 +402,14 @@ def pep_code_check_param(
         (
             # Localize this parameter *AND*...
             get_arg_code_template.format(
-                arg_name=param.name, arg_index=param_index) +
+                arg_name=param.name,
+                arg_index=param_index,
+                arg_names_keyword=(
+                    _get_arg_names_keyword(data)
+                    if param.kind is Parameter.VAR_KEYWORD else
+                    ''
+                ),
+            ) +
             # Type-check this parameter.
             func_code
         ),
@@ -293,8 +420,12 @@ def pep_code_check_param(
 
 
 def pep_code_check_return(
+    # Mandatory parameters.
     data: BeartypeData,
     hint: object,
+
+    # Optional parameters.
+    typevar_var_name: Optional[str] = None,
 ) -> Tuple[str, bool]:
     '''
     Python code type-checking the return value annotated with a **PEP-compliant
@@ -307,6 +438,11 @@ def pep_code_check_return(
         Decorated callable to be type-checked.
     hint : object
         PEP-compliant type hint annotating this return.
+    typevar_var_name : Optional[str]
+        Name of the local variable to which the type bound to the type
+        variable directly annotating this return by the current call is
+        assigned if this return is to be type-checked against that binding
+        *or* ``None`` otherwise. Defaults to ``None``.
 
     Returns
     ----------
@@ -338,7 +474,8 @@ def pep_code_check_return(
     # *ONLY* as a return annotation, prefer pregenerated code type-checking
     # this peculiar type hint against this hint.
     if hint is NoReturn:
-        func_code = PEP484_CODE_CHECK_NORETURN
+        func_code = PEP484_CODE_CHECK_NORETURN.format(
+            func_call_args=data.func_wrapper_code_call_args)
     # Else, this is a standard PEP-compliant type hint. In this case...
     else:
         # Attempt to generate memoized parameter-agnostic Python code
@@ -348,7 +485,15 @@ def pep_code_check_return(
                 func_code,
                 is_func_code_needs_random_int,
                 hints_forwardref_class_basename,
-            ) = pep_code_check_hint(hint)
+            ) = (
+                ('', False, ())
+                if is_hint_ignorable(hint) else
+                pep_code_check_hint(
+                    hint,
+                    data.conf.is_check_fields,
+                    data.conf.is_check_typevars,
+                )
+            )
 
             # If this code contains one or more relative forward reference
             # placeholder substrings memoized into this code, unmemoize this
@@ -362,14 +507,46 @@ def pep_code_check_return(
                         hints_forwardref_class_basename),
                 )
 
+            # If this return is annotated by a type variable bound by this
+            # call, append code type-checking this return against that type.
+            if typevar_var_name is not None:
+                func_code += PEP484_CODE_CHECK_TYPEVAR_BINDING.format(
+                    typevar_var_name=typevar_var_name)
+
+            # Python code returning this value from this wrapper function,
+            # defaulting to returning this value as is.
+            func_code_return_suffix = PEP_CODE_CHECK_RETURN_SUFFIX
+
+            # If iterators are to be proxied...
+            if data.conf.is_proxy_iterators:
+                # Defer heavyweight imports. See above.
+                from beartype._decor._cache.cacheiterator import (
+                    is_hint_iterator_proxiable,
+                    register_iterator_proxier,
+                )
+
+                # If this hint is a proxiable iterator hint, return this value
+                # replaced by a proxy lazily type-checking the items of this
+                # value instead.
+                if is_hint_iterator_proxiable(hint):
+                    func_code_return_suffix = (
+                        PEP_CODE_CHECK_RETURN_SUFFIX_PROXY_ITERATOR.format(
+                            proxier_expr=register_iterator_proxier(
+                                hint,
+                                data.conf.is_check_fields,
+                                data.func.__module__,
+                            )))
+
             # Python code to:
             # * Call the decorated callable and localize its return value
             #   *AND*...
             # * Type-check this return value *AND*...
             # * Return this value from this wrapper function.
             func_code = (
-                f'{PEP_CODE_CHECK_RETURN_PREFIX}{func_code}'
-                f'{PEP_CODE_CHECK_RETURN_SUFFIX}'
+                PEP_CODE_CHECK_RETURN_PREFIX.format(
+                    func_call_args=data.func_wrapper_code_call_args) +
+                func_code +
+                func_code_return_suffix
             )
         # If the prior call to the memoized _pep_code_check() function raises a
         # cached exception...
@@ -464,3 +641,45 @@ def resolve_pep_code_hints_forwardref_class_basename(
 
     # Return this unmemoized callable-specific Python code.
     return func_code
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_arg_names_keyword(data: BeartypeData) -> str:
+    '''
+    Python expression evaluating to a container of the names of all
+    **named keyword parameters** (i.e., positional or keyword and keyword-only
+    parameters) accepted by the decorated callable.
+
+    Repacking wrapper functions pass these parameters in the same variadic
+    ``**kwargs`` dictionary as all variadic keyword parameters, which the code
+    generated for the latter thus excludes by testing membership in this
+    container. Positional-only parameters are intentionally excluded, as the
+    names of these parameters are also valid names of variadic keyword
+    parameters (e.g., ``def muh_func(muh_arg, /, **kwargs)`` accepts
+    ``muh_func(0, muh_arg=1)``).
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    str
+        Either:
+
+        * If the decorated callable accepts one or more named keyword
+          parameters, a set literal of these names.
+        * Else, the empty tuple literal.
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+
+    # Object representations of the names of all named keyword parameters.
+    arg_names_keyword = [
+        repr(param.name)
+        for param in data.func_sig.parameters.values()
+        if param.kind in _PARAM_KINDS_KEYWORD_NAMED
+    ]
+
+    # Return a Python expression evaluating to a container of these names.
+    return (
+        f'{{{", ".join(arg_names_keyword)}}}' if arg_names_keyword else '()')
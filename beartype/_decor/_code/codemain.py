@@ -587,12 +587,27 @@ This private submodule is *not* intended for importation by downstream callers.
 #All in all, this requires funding. Technically feasible, but cray-cray.
 
 # ....................{ IMPORTS                           }....................
+import builtins
 from beartype.roar import BeartypeDecorParamNameException
+from beartype._decor._cache.cachetype import bear_typistry
 from beartype._decor._code.codesnip import (
+    CODE_ARG_DEFAULT_KEYWORD,
+    CODE_ARG_DEFAULT_POSITIONAL,
+    CODE_CALL_ARG_DEFAULT,
+    CODE_CALL_ARGS_VARIADIC,
     CODE_INIT_ARGS_LEN,
     CODE_INIT_RANDOM_INT,
     CODE_RETURN_UNCHECKED,
+    CODE_SAMPLE_EVERY,
+    CODE_SAMPLE_RATIO,
     CODE_SIGNATURE,
+    CODE_SIGNATURE_ARG_CALL_COUNTER,
+    CODE_SIGNATURE_PARAMS_VARIADIC,
+    CODE_SIGNATURE_PARAMS_VARIADIC_KW,
+)
+from beartype._decor._code._pep._pepsnip import (
+    PEP484_CODE_INIT_TYPEVAR_BINDING,
+    PEP484_CODE_TYPEVAR_BINDING_VAR_NAME_PREFIX,
 )
 from beartype._decor._code._pep.pepcode import (
     coerce_hint_pep,
@@ -600,34 +615,63 @@ from beartype._decor._code._pep.pepcode import (
     pep_code_check_return,
 )
 from beartype._decor._data import BeartypeData
+from beartype._util.hint.pep.proposal.utilhintpep484 import (
+    reduce_hint_pep484_typevars)
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._util.text.utiltextlabel import (
     label_callable_decorated_param,
     label_callable_decorated_return,
 )
 from inspect import Parameter, Signature
-from typing import Tuple
+from typing import Tuple, TypeVar
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
 # ....................{ CONSTANTS ~ private               }....................
-_PARAM_KINDS_IGNORABLE = {Parameter.POSITIONAL_ONLY, Parameter.VAR_KEYWORD}
+_PARAM_KINDS_VARIADIC = frozenset((
+    Parameter.VAR_POSITIONAL,
+    Parameter.VAR_KEYWORD,
+))
+'''
+Frozen set of all :attr:`Parameter.kind` constants of **variadic parameters**
+(i.e., parameters accepting zero or more arguments), whose type hints annotate
+each such argument rather than the parameter itself and thus bind *no* type
+variables.
 '''
-Set of all :attr:`Parameter.kind` constants to be ignored during
-annotation-based type checking in the :func:`beartype` decorator.
 
-This includes:
 
-* Constants specific to variadic keyword parameters (e.g., ``**kwargs``), which
-  are currently unsupported by :func:`beartype`.
-* Constants specific to positional-only parameters, which apply only to
-  non-pure-Python callables (e.g., defined by C extensions). The
-  :func:`beartype` decorator applies *only* to pure-Python callables, which
-  provide no syntactic means for specifying positional-only parameters.
+_PARAM_KINDS_POSITIONAL = frozenset((
+    Parameter.POSITIONAL_ONLY,
+    Parameter.POSITIONAL_OR_KEYWORD,
+))
+'''
+Frozen set of all :attr:`Parameter.kind` constants of **non-variadic
+positional parameters** (i.e., parameters passable by position), which
+repacking wrapper functions localize by indexation into the variadic ``*args``
+parameter.
+'''
+
+
+_PARAM_NAMES_UNMIRRORABLE = frozenset(dir(builtins))
+'''
+Frozen set of the names of all parameters preventing the signature of the
+wrapper function from mirroring the signature of the decorated callable.
+
+This includes the names of all builtins (e.g., :func:`isinstance`,
+:func:`len`), which type-checking code embedded in that function references as
+globals. Mirroring a parameter of the same name would erroneously shadow that
+builtin with a local of the same name.
 '''
 
 # ....................{ CONSTANTS ~ private : empty       }....................
+_PARAM_DEFAULT_EMPTY = Parameter.empty
+'''
+:mod:`inspect`-specific sentinel value indicating a **mandatory parameter**
+(i.e., parameter *without* a default value).
+'''
+
+
 _PARAM_HINT_EMPTY = Parameter.empty
 '''
 :mod:`inspect`-specific sentinel value indicating an **unannotated parameter**
@@ -722,30 +766,107 @@ def generate_code(data: BeartypeData) -> Tuple[str, bool]:
     '''
     assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
 
-    # Python code snippet declaring the signature of this wrapper.
-    code_sig = CODE_SIGNATURE.format(func_wrapper_name=data.func_wrapper_name)
+    # Beartype configuration configuring this decoration.
+    conf = data.conf
+
+    # Decide whether the signature of this wrapper mirrors the signature of
+    # this callable *BEFORE* generating snippets type-checking parameters and
+    # return values, both of which localize parameters and call this callable
+    # in a manner specific to that decision.
+    _init_sig_mirrored(data)
+
+    # Decide which type variables are bound by each call to this wrapper
+    # *BEFORE* generating snippets type-checking parameters and return values,
+    # both of which type-check these bindings.
+    _init_typevar_bindings(data)
 
     # Python code snippet type-checking all parameters annotated on this
-    # callable if any *or* the empty string otherwise.
+    # callable if any *OR* the empty string otherwise.
     code_params, is_code_params_needs_random_int = _code_check_params(data)
 
     # Python code snippet type-checking the return value annotated on this
     # callable if any *or* the empty string otherwise.
     code_return, is_code_return_needs_random_int = _code_check_return(data)
 
+    # Python code snippet calling this callable *WITHOUT* type-checking.
+    code_return_unchecked = CODE_RETURN_UNCHECKED.format(
+        func_call_args=data.func_wrapper_code_call_args)
+
+    # True only if this code proxies this callable *WITHOUT* type checking.
+    # Note this is decided *BEFORE* prefixing code sampling calls below, which
+    # would otherwise erroneously prevent this wrapper from reducing to a noop.
+    is_func_code_noop = (
+        not code_params and code_return == code_return_unchecked)
+
+    # True only if the body of this wrapper requires a pseudo-random integer.
+    is_func_code_needs_random_int = (
+        is_code_params_needs_random_int or is_code_return_needs_random_int)
+
+    # Python code snippets declaring the public parameters of this wrapper,
+    # preceding and following its private parameters respectively.
+    code_sig_params, code_sig_params_var_kw = _code_sig_params(data)
+
+    # Python code snippet declaring the signature of this wrapper, accepting
+    # the private call counter parameter only if this wrapper type-checks
+    # only every N-th call.
+    code_sig = CODE_SIGNATURE.format(
+        func_wrapper_name=data.func_wrapper_name,
+        func_wrapper_params=code_sig_params,
+        func_wrapper_args_private=(
+            CODE_SIGNATURE_ARG_CALL_COUNTER
+            if conf.sample_every != 1 else
+            ''
+        ),
+        func_wrapper_params_var_kw=code_sig_params_var_kw,
+    )
+
     # Python code snippet declaring the signature of this wrapper followed by
     # preliminary statements (e.g., assignment initializations) if desired
     # *AFTER* generating snippets type-checking parameters and return values,
     # both of which modify instance variables of the dataclass tested below.
-    code_init = (
+    code_init = None
+
+    # If this wrapper type-checks only every N-th call, append code calling
+    # this callable unchecked on all unsampled calls to this signature.
+    if conf.sample_every != 1:
+        code_init = code_sig + CODE_SAMPLE_EVERY.format(
+            sample_every=conf.sample_every,
+            func_call_args=data.func_wrapper_code_call_args,
+        )
+
         # If the body of this wrapper requires a pseudo-random integer, append
-        # code generating and localizing such an integer to this signature.
-        f'{code_sig}{CODE_INIT_RANDOM_INT}'
-        if (is_code_params_needs_random_int or is_code_return_needs_random_int)
-        else
-        # Else, this body requires *NO* such integer. In this case, preserve
-        # this signature as is.
-        code_sig
+        # code generating and localizing such an integer. Since that integer
+        # is required *ONLY* by sampled calls, do so *AFTER* the above code.
+        if is_func_code_needs_random_int:
+            code_init += CODE_INIT_RANDOM_INT
+    # Else if this wrapper type-checks only a pseudo-random fraction of calls,
+    # append code calling this callable unchecked on all unsampled calls to
+    # this signature. Since this code generates and localizes a pseudo-random
+    # integer, this code also satisfies snippets requiring such an integer.
+    elif conf.sample_ratio != 1.0:
+        code_init = code_sig + CODE_SAMPLE_RATIO.format(
+            sample_ratio_bound=conf.sample_ratio_bound,
+            func_call_args=data.func_wrapper_code_call_args,
+        )
+    # Else, this wrapper type-checks all calls. If the body of this wrapper
+    # requires a pseudo-random integer, append code generating and localizing
+    # such an integer to this signature.
+    elif is_func_code_needs_random_int:
+        code_init = f'{code_sig}{CODE_INIT_RANDOM_INT}'
+    # Else, this body requires *NO* such integer. In this case, preserve this
+    # signature as is.
+    else:
+        code_init = code_sig
+
+    # Python code snippet initializing the local variables to which the types
+    # bound to type variables by each call are assigned if any *OR* the empty
+    # string otherwise. Since these variables are required *ONLY* by sampled
+    # calls, these variables are initialized *AFTER* the above code.
+    code_typevars = ''.join(
+        PEP484_CODE_INIT_TYPEVAR_BINDING.format(
+            typevar_var_name=typevar_var_name)
+        for typevar_var_name in sorted(set(
+            data.func_pith_name_to_typevar_var_name.values()))
     )
 
     # Python code defining the wrapper type-checking this callable.
@@ -760,10 +881,7 @@ def generate_code(data: BeartypeData) -> Tuple[str, bool]:
     #
     # Since string concatenation is heavily optimized by the official CPython
     # interpreter, the simplest approach is the most ideal.
-    func_code = f'{code_init}{code_params}{code_return}'
-
-    # True only if this code proxies this callable *WITHOUT* type checking.
-    is_func_code_noop = (func_code == f'{code_sig}{CODE_RETURN_UNCHECKED}')
+    func_code = f'{code_init}{code_typevars}{code_params}{code_return}'
 
     # Return this code and accompanying boolean.
     return func_code, is_func_code_noop
@@ -865,11 +983,7 @@ def _code_check_params(data: BeartypeData) -> Tuple[str, bool]:
         if param_name.startswith('__bear'):
             raise BeartypeDecorParamNameException(
                 f'{pith_label} reserved by @beartype.')
-        # If either the type of this parameter is silently ignorable, continue
-        # to the next parameter.
-        elif param_kind in _PARAM_KINDS_IGNORABLE:
-            continue
-        # Else, this parameter is non-ignorable.
+        # Else, this parameter's name is unreserved.
 
         # PEP-compliant type hint converted from this PEP-noncompliant type
         # hint if this hint is PEP-noncompliant, this hint as is if this hint
@@ -885,12 +999,25 @@ def _code_check_params(data: BeartypeData) -> Tuple[str, bool]:
             hint_label=f'{pith_label} type hint',
         )
 
-        # If this hint is ignorable, continue to the next parameter.
+        # Name of the local variable to which the type bound to the type
+        # variable annotating this parameter by each call is assigned if any
+        # *OR* "None" otherwise.
+        typevar_var_name = data.func_pith_name_to_typevar_var_name.get(
+            param_name)
+
+        # If bounded and constrained type variables are to be type-checked,
+        # reduce all such type variables parametrizing this hint to the hints
+        # constraining these variables.
+        if data.conf.is_check_typevars:
+            hint = reduce_hint_pep484_typevars(hint)
+
+        # If this hint is ignorable *AND* this parameter binds *NO* type
+        # variable, continue to the next parameter.
         #
         # Note that this is intentionally tested *AFTER* this hint has been
         # coerced into a PEP-compliant type hint to implicitly ignore
         # PEP-noncompliant type hints as well (e.g., "(object, int, str)").
-        if is_hint_ignorable(hint):
+        if is_hint_ignorable(hint) and typevar_var_name is None:
             # print(f'Ignoring {data.func_name} parameter {param_name} hint {repr(hint)}...')
             continue
         # Else, this hint is unignorable.
@@ -901,7 +1028,7 @@ def _code_check_params(data: BeartypeData) -> Tuple[str, bool]:
         # branch were instead nested *BEFORE* validating this parameter to be
         # unignorable, @beartype would fail to reduce to a noop for otherwise
         # ignorable callables -- which would be rather bad, really.
-        elif param_kind is Parameter.POSITIONAL_OR_KEYWORD:
+        elif param_kind in _PARAM_KINDS_POSITIONAL:
             is_params_positional = True
 
         # Python code snippet type-checking this parameter against this hint.
@@ -911,6 +1038,7 @@ def _code_check_params(data: BeartypeData) -> Tuple[str, bool]:
                 hint=hint,
                 param=param,
                 param_index=param_index,
+                typevar_var_name=typevar_var_name,
             ))
 
         # Append code type-checking this parameter against this hint.
@@ -927,13 +1055,16 @@ def _code_check_params(data: BeartypeData) -> Tuple[str, bool]:
     return (
         # Python code, defined as either...
         (
-            # If this callable accepts one or more positional parameters, this
-            # snippet preceded by code localizing the number of these
-            # parameters.
+            # If this callable accepts one or more positional parameters
+            # repacked into the variadic "*args" parameter of the wrapper
+            # function, this snippet preceded by code localizing the number of
+            # these parameters.
             f'{CODE_INIT_ARGS_LEN}{func_code}'
-            if is_params_positional else
-            # Else, this callable accepts *NO* positional parameters. In this
-            # case, this snippet as is.
+            if (
+                is_params_positional and
+                not data.is_func_wrapper_sig_mirrored
+            ) else
+            # Else, this snippet as is.
             func_code
         ),
         # This boolean.
@@ -999,7 +1130,8 @@ def _code_check_return(data: BeartypeData) -> Tuple[str, bool]:
     # If this return is unannotated, generate code calling this callable
     # unchecked and returning this value from this wrapper.
     if hint is _RETURN_HINT_EMPTY:
-        func_code = CODE_RETURN_UNCHECKED
+        func_code = CODE_RETURN_UNCHECKED.format(
+            func_call_args=data.func_wrapper_code_call_args)
     # Else, this return is annotated.
     else:
         # PEP-compliant type hint converted from this PEP-noncompliant type
@@ -1015,16 +1147,29 @@ def _code_check_return(data: BeartypeData) -> Tuple[str, bool]:
                 f'{label_callable_decorated_return(func)} type hint'),
         )
 
-        # If this hint is ignorable, generate code calling this callable
-        # unchecked and returning that return value from this wrapper.
-        if is_hint_ignorable(hint):
+        # Name of the local variable to which the type bound to the type
+        # variable annotating this return by each call is assigned if any *OR*
+        # "None" otherwise.
+        typevar_var_name = data.func_pith_name_to_typevar_var_name.get(
+            'return')
+
+        # If bounded and constrained type variables are to be type-checked,
+        # reduce all such type variables parametrizing this hint.
+        if data.conf.is_check_typevars:
+            hint = reduce_hint_pep484_typevars(hint)
+
+        # If this hint is ignorable *AND* this return binds *NO* type
+        # variable, generate code calling this callable unchecked and
+        # returning that return value from this wrapper.
+        if is_hint_ignorable(hint) and typevar_var_name is None:
             # print(f'Ignoring {data.func_name} return hint {repr(hint)}...')
-            func_code = CODE_RETURN_UNCHECKED
+            func_code = CODE_RETURN_UNCHECKED.format(
+                func_call_args=data.func_wrapper_code_call_args)
         # Else, this hint is unignorable.
         else:
             # Python code snippet type-checking this return against this hint.
             func_code, is_func_code_needs_random_int = pep_code_check_return(
-                data=data, hint=hint)
+                data=data, hint=hint, typevar_var_name=typevar_var_name)
 
     # Return all metadata required by higher-level callers, including...
     return (
@@ -1033,3 +1178,336 @@ def _code_check_return(data: BeartypeData) -> Tuple[str, bool]:
         # This boolean.
         is_func_code_needs_random_int,
     )
+
+# ....................{ CODERS ~ signature                }....................
+def _init_sig_mirrored(data: BeartypeData) -> None:
+    '''
+    Decide whether the signature of the wrapper function type-checking the
+    decorated callable mirrors the signature of that callable, setting the
+    :attr:`BeartypeData.is_func_wrapper_sig_mirrored` and
+    :attr:`BeartypeData.func_wrapper_code_call_args` instance variables of the
+    passed data object accordingly.
+
+    Mirroring wrapper functions accept each parameter passed by the caller as a
+    fast local of the same name and forward these parameters to the decorated
+    callable as is, avoiding the tuple and dictionary allocations implied by
+    repacking these parameters into the variadic ``*args`` and ``**kwargs``
+    parameters on each call. Wrapper functions fallback to such repacking only
+    if either:
+
+    * The signature of this callable is *not* that of the code object
+      underlying this callable (e.g., due to this callable wrapping another
+      callable via the :func:`functools.wraps` decorator), in which case
+      mirroring the former could reject calls accepted by the latter.
+    * The name of any parameter of this callable either shadows a builtin
+      referenced by type-checking code (e.g., ``type``) *or* is prefixed by
+      the reserved substring ``__bear``.
+
+    Mirroring wrapper functions default each optional parameter to the
+    private ``__beartypistry`` sentinel value and replace that value by the
+    *current* default value of that parameter on calls leaving that parameter
+    unpassed (see the :data:`CODE_CALL_ARG_DEFAULT` snippet), preserving
+    changes to the ``__defaults__`` and ``__kwdefaults__`` dunder attributes
+    of this callable made *after* decoration.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+
+    # Decorated callable.
+    func = data.func
+
+    # If the signature of this callable is *NOT* that of the code object
+    # underlying this callable, fallback to repacking.
+    if (
+        getattr(func, '__wrapped__', None) is not None or
+        getattr(func, '__signature__', None) is not None
+    ):
+        data.is_func_wrapper_sig_mirrored = False
+        data.func_wrapper_code_call_args = CODE_CALL_ARGS_VARIADIC
+        return
+    # Else, the signature of this callable is that of that code object.
+
+    # List of Python code snippets passing each parameter to this callable.
+    code_call_args = []
+
+    # Number of non-variadic positional parameters accepted by this callable.
+    params_positional_len = sum(
+        1
+        for param in data.func_sig.parameters.values()
+        if param.kind in _PARAM_KINDS_POSITIONAL
+    )
+
+    # 0-based index of the current non-variadic positional parameter.
+    param_positional_index = 0
+
+    # For each parameter accepted by this callable (in declaration order)...
+    for param in data.func_sig.parameters.values():
+        # Name and kind of this parameter.
+        param_name = param.name
+        param_kind = param.kind
+
+        # If this name is unmirrorable, fallback to repacking.
+        if (
+            param_name in _PARAM_NAMES_UNMIRRORABLE or
+            param_name.startswith('__bear')
+        ):
+            data.is_func_wrapper_sig_mirrored = False
+            data.func_wrapper_code_call_args = CODE_CALL_ARGS_VARIADIC
+            return
+        # Else, this name is mirrorable.
+
+        # If this parameter is variadic, append a snippet passing this
+        # parameter as declared and continue to the next parameter.
+        if param_kind is Parameter.VAR_POSITIONAL:
+            code_call_args.append(f'*{param_name}')
+            continue
+        elif param_kind is Parameter.VAR_KEYWORD:
+            code_call_args.append(f'**{param_name}')
+            continue
+        # Else, this parameter is non-variadic.
+
+        # Python code snippet passing this parameter to this callable,
+        # defaulting to this parameter as is.
+        code_call_arg = param_name
+
+        # If this parameter is optional, this parameter defaults to a
+        # sentinel value in the signature of the wrapper function. In this
+        # case, replace this sentinel value by the current default value of
+        # this parameter when unpassed.
+        if param.default is not _PARAM_DEFAULT_EMPTY:
+            code_call_arg = CODE_CALL_ARG_DEFAULT.format(
+                arg_name=param_name,
+                arg_default=(
+                    CODE_ARG_DEFAULT_KEYWORD.format(arg_name=param_name)
+                    if param_kind is Parameter.KEYWORD_ONLY else
+                    CODE_ARG_DEFAULT_POSITIONAL.format(
+                        arg_default_index=(
+                            param_positional_index - params_positional_len))
+                ),
+            )
+
+        # Append a snippet passing this parameter as declared.
+        if param_kind is Parameter.KEYWORD_ONLY:
+            code_call_args.append(f'{param_name}={code_call_arg}')
+        else:
+            code_call_args.append(code_call_arg)
+            param_positional_index += 1
+
+    # Mirror this signature.
+    data.is_func_wrapper_sig_mirrored = True
+    data.func_wrapper_code_call_args = ', '.join(code_call_args)
+
+
+def _init_typevar_bindings(data: BeartypeData) -> None:
+    '''
+    Decide which type variables are bound by each call to the wrapper
+    function type-checking the decorated callable, setting the
+    :attr:`BeartypeData.func_pith_name_to_typevar_var_name` instance variable
+    of the passed data object accordingly.
+
+    If the :attr:`beartype.BeartypeConf.is_check_typevar_bindings` option is
+    enabled, each type variable directly annotating two or more non-variadic
+    parameters or the return of this callable (e.g., ``T`` in
+    ``def muh_func(muh_arg: T, muh_kwarg: T) -> T``) is bound to the type of
+    the first such parameter passed to each call. That wrapper tracks each
+    such binding in a local variable rather than in any global state, reducing
+    the cost of type-checking each subsequent parameter or return annotated by
+    that type variable against that binding to a single :func:`type` identity
+    test. Type variables annotating only one parameter or return *or* only
+    parametrizing other hints (e.g., ``List[T]``) bind nothing.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+
+    # Dictionary mapping from the name of each parameter or return binding a
+    # type variable to the name of the local variable tracking that binding.
+    data.func_pith_name_to_typevar_var_name = {}
+
+    # If type variable bindings are *NOT* to be type-checked, silently reduce
+    # to a noop.
+    if not data.conf.is_check_typevar_bindings:
+        return
+    # Else, type variable bindings are to be type-checked.
+
+    # Dictionary mapping from each type variable directly annotating a
+    # non-variadic parameter or the return of this callable to the list of
+    # the names of all such parameters and return (in declaration order).
+    typevar_to_pith_names = {}
+
+    # For each parameter accepted by this callable...
+    for param in data.func_sig.parameters.values():
+        # If this parameter is non-variadic *AND* directly annotated by a type
+        # variable, record this parameter as annotated by that type variable.
+        if (
+            param.kind not in _PARAM_KINDS_VARIADIC and
+            isinstance(param.annotation, TypeVar)
+        ):
+            typevar_to_pith_names.setdefault(
+                param.annotation, []).append(param.name)
+
+    # If the return is directly annotated by a type variable, record the
+    # return as annotated by that type variable.
+    hint_return = data.func_sig.return_annotation
+    if isinstance(hint_return, TypeVar):
+        typevar_to_pith_names.setdefault(hint_return, []).append('return')
+
+    # For the 0-based index of each type variable and the names of all
+    # parameters and return annotated by that type variable...
+    for typevar_index, pith_names in enumerate(
+        typevar_to_pith_names.values()):
+        # If only one parameter or return is annotated by this type variable,
+        # this type variable constrains nothing across this call.
+        if len(pith_names) < 2:
+            continue
+        # Else, two or more parameters or return are annotated by this type
+        # variable.
+
+        # Name of the local variable tracking this binding.
+        typevar_var_name = (
+            f'{PEP484_CODE_TYPEVAR_BINDING_VAR_NAME_PREFIX}{typevar_index}')
+
+        # Map each such parameter and return to this name.
+        for pith_name in pith_names:
+            data.func_pith_name_to_typevar_var_name[pith_name] = (
+                typevar_var_name)
+
+
+def _code_sig_params(data: BeartypeData) -> Tuple[str, str]:
+    '''
+    2-tuple of Python code snippets declaring all public parameters of the
+    wrapper function type-checking the decorated callable, setting the
+    :attr:`BeartypeData.func_wrapper_defaults` and
+    :attr:`BeartypeData.func_wrapper_kwdefaults` instance variables of the
+    passed data object to the default values of these parameters.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    Tuple[str, str]
+        2-tuple ``(code_sig_params, code_sig_params_var_kw)``, where:
+
+        * ``code_sig_params`` is Python code declaring all public parameters
+          preceding the private keyword-only parameters of this wrapper
+          function, terminated by either a variadic positional parameter *or*
+          the ``*`` delimiter.
+        * ``code_sig_params_var_kw`` is Python code declaring the variadic
+          keyword parameter following these private parameters if any *or* the
+          empty string otherwise.
+
+    Each optional parameter of this wrapper function defaults to the
+    ``__beartypistry`` sentinel value, which the Python code passing these
+    parameters to the decorated callable replaces by the current default value
+    of that parameter (see the :func:`_init_sig_mirrored` function).
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+
+    # If this wrapper repacks all passed parameters, declare only the variadic
+    # "*args" and "**kwargs" parameters defaulting to nothing.
+    if not data.is_func_wrapper_sig_mirrored:
+        data.func_wrapper_defaults = ()
+        data.func_wrapper_kwdefaults = {}
+        return (
+            CODE_SIGNATURE_PARAMS_VARIADIC,
+            CODE_SIGNATURE_PARAMS_VARIADIC_KW,
+        )
+    # Else, this wrapper mirrors the signature of the decorated callable.
+
+    # List of Python code snippets declaring each public parameter.
+    code_params = []
+
+    # Python code snippet declaring the variadic keyword parameter if any.
+    code_params_var_kw = ''
+
+    # List of the default values of all optional positional parameters.
+    func_wrapper_defaults = []
+
+    # Dictionary mapping from the name to default value of all optional
+    # keyword-only parameters.
+    func_wrapper_kwdefaults = {}
+
+    # True only if the previously declared parameter was positional-only.
+    is_param_prev_positional_only = False
+
+    # True only if a parameter delimiting keyword-only parameters (i.e., either
+    # a variadic positional parameter *OR* the "*" delimiter) was declared.
+    is_params_kwonly_delimited = False
+
+    # For each parameter accepted by this callable (in declaration order)...
+    for param in data.func_sig.parameters.values():
+        # Name and kind of this parameter.
+        param_name = param.name
+        param_kind = param.kind
+
+        # If the previously declared parameter was the last positional-only
+        # parameter, delimit all positional-only parameters.
+        if (
+            is_param_prev_positional_only and
+            param_kind is not Parameter.POSITIONAL_ONLY
+        ):
+            code_params.append('/')
+        is_param_prev_positional_only = (
+            param_kind is Parameter.POSITIONAL_ONLY)
+
+        # If this parameter is variadic, declare this parameter as such.
+        if param_kind is Parameter.VAR_POSITIONAL:
+            code_params.append(f'*{param_name}')
+            is_params_kwonly_delimited = True
+            continue
+        elif param_kind is Parameter.VAR_KEYWORD:
+            code_params_var_kw = f'\n    **{param_name}'
+            continue
+        # Else, this parameter is non-variadic.
+        #
+        # If this parameter is the first keyword-only parameter *NOT* preceded
+        # by a variadic positional parameter, delimit these parameters.
+        elif (
+            param_kind is Parameter.KEYWORD_ONLY and
+            not is_params_kwonly_delimited
+        ):
+            code_params.append('*')
+            is_params_kwonly_delimited = True
+
+        # Declare this parameter.
+        code_params.append(param_name)
+
+        # If this parameter is mandatory, continue to the next parameter.
+        if param.default is _PARAM_DEFAULT_EMPTY:
+            continue
+        # Else, this parameter is optional. In this case, default this
+        # parameter to the sentinel value "__beartypistry", which the code
+        # passing this parameter to this callable replaces by the current
+        # default value of this parameter.
+        if param_kind is Parameter.KEYWORD_ONLY:
+            func_wrapper_kwdefaults[param_name] = bear_typistry
+        else:
+            func_wrapper_defaults.append(bear_typistry)
+
+    # If the last declared parameter was positional-only, delimit all
+    # positional-only parameters.
+    if is_param_prev_positional_only:
+        code_params.append('/')
+
+    # If keyword-only parameters have yet to be delimited, do so *BEFORE*
+    # declaring the private keyword-only parameters following these
+    # parameters.
+    if not is_params_kwonly_delimited:
+        code_params.append('*')
+
+    # Record all default values.
+    data.func_wrapper_defaults = tuple(func_wrapper_defaults)
+    data.func_wrapper_kwdefaults = func_wrapper_kwdefaults
+
+    # Return these snippets.
+    return f'{", ".join(code_params)},', code_params_var_kw
@@ -30,16 +30,120 @@ parameter whose default value is the beartypistry singleton implicitly passed
 to all wrapper functions generated by the :func:`beartype.beartype` decorator).
 '''
 
+
+ARG_NAME_CALL_COUNTER = '__beartype_call_counter'
+'''
+Name of the **private call counter parameter** (i.e., :mod:`beartype`-specific
+parameter whose default value is an :class:`itertools.count` iterator
+implicitly passed to wrapper functions generated by the
+:func:`beartype.beartype` decorator under configurations sampling every
+``N``-th call).
+'''
+
+
 # ....................{ CODE                              }....................
 CODE_SIGNATURE = f'''def {{func_wrapper_name}}(
-    *args,
-    {ARG_NAME_FUNC}={ARG_NAME_FUNC},
-    {ARG_NAME_TYPISTRY}={ARG_NAME_TYPISTRY},
-    **kwargs
+    {{func_wrapper_params}}
+    {ARG_NAME_FUNC},
+    {ARG_NAME_TYPISTRY},{{func_wrapper_args_private}}{{func_wrapper_params_var_kw}}
 ):'''
 '''
 PEP-agnostic code snippet declaring the signature of the wrapper function
 type-checking the decorated callable.
+
+This signature intentionally declares *no* default values. Instead, the
+:func:`beartype.beartype` decorator sets the ``__defaults__`` and
+``__kwdefaults__`` dunder attributes of each wrapper function *after* defining
+that function, passing all private parameters as keyword-only parameters
+defaulting to the objects those parameters alias.
+
+This signature is intentionally named ``{func_wrapper_name}`` after the
+decorated callable itself. Under Python < 3.10, the :class:`TypeError`
+exceptions raised by the active Python interpreter on failing to bind the
+arguments passed by callers to the parameters of mirroring wrapper functions
+embed the name of the code object of those functions rather than the name of
+those functions (e.g., ``"muh_func() got an unexpected keyword argument"``).
+'''
+
+
+CODE_SIGNATURE_ARG_CALL_COUNTER = f'''
+    {ARG_NAME_CALL_COUNTER},'''
+'''
+PEP-agnostic code snippet declaring the private call counter parameter in the
+signature of the wrapper function type-checking the decorated callable,
+formatted into the ``{func_wrapper_args_private}`` substring of the
+:data:`CODE_SIGNATURE` snippet under configurations sampling every ``N``-th
+call.
+'''
+
+
+CODE_SIGNATURE_PARAMS_VARIADIC = '*args,'
+'''
+PEP-agnostic code snippet declaring the variadic positional parameter in the
+signature of **repacking wrapper functions** (i.e., wrapper functions accepting
+all parameters passed by the caller as the variadic ``*args`` and ``**kwargs``
+parameters rather than mirroring the signature of the decorated callable),
+formatted into the ``{func_wrapper_params}`` substring of the
+:data:`CODE_SIGNATURE` snippet.
+'''
+
+
+CODE_SIGNATURE_PARAMS_VARIADIC_KW = '''
+    **kwargs'''
+'''
+PEP-agnostic code snippet declaring the variadic keyword parameter in the
+signature of repacking wrapper functions, formatted into the
+``{func_wrapper_params_var_kw}`` substring of the :data:`CODE_SIGNATURE`
+snippet.
+'''
+
+
+CODE_CALL_ARGS_VARIADIC = '*args, **kwargs'
+'''
+PEP-agnostic code snippet passing all parameters passed to repacking wrapper
+functions to the decorated callable, formatted into the ``{func_call_args}``
+substring of snippets calling that callable (e.g.,
+:data:`CODE_RETURN_UNCHECKED`).
+'''
+
+
+CODE_CALL_ARG_DEFAULT = f'''({{arg_name}} if {{arg_name}} is not {ARG_NAME_TYPISTRY} else {{arg_default}})'''
+'''
+PEP-agnostic code snippet passing an optional parameter (i.e., parameter with
+a default value) passed to mirroring wrapper functions to the decorated
+callable, replacing the ``__beartypistry`` sentinel value defaulting this
+parameter in the signature of those functions by the actual default value of
+this parameter when unpassed.
+
+The ``{arg_default}`` substring is either the
+:data:`CODE_ARG_DEFAULT_POSITIONAL` or :data:`CODE_ARG_DEFAULT_KEYWORD`
+snippet, dynamically retrieving that default value from the decorated
+callable on each such call. Since callers may freely rebind the
+``__defaults__`` and ``__kwdefaults__`` dunder attributes of that callable
+*after* decoration, this default value is intentionally *not* snapshotted at
+decoration time.
+'''
+
+
+CODE_ARG_DEFAULT_POSITIONAL = f'''{ARG_NAME_FUNC}.__defaults__[{{arg_default_index}}]'''
+'''
+PEP-agnostic code snippet retrieving the current default value of an optional
+positional parameter from the decorated callable, formatted into the
+``{arg_default}`` substring of the :data:`CODE_CALL_ARG_DEFAULT` snippet.
+
+The ``{arg_default_index}`` substring is the *negative* index of this
+parameter relative to the last positional parameter accepted by that callable
+(e.g., ``-1`` for the last such parameter). Since the ``__defaults__`` tuple
+always defaults the trailing positional parameters, this index remains valid
+even if that tuple is later rebound to a longer tuple.
+'''
+
+
+CODE_ARG_DEFAULT_KEYWORD = f'''{ARG_NAME_FUNC}.__kwdefaults__[{{arg_name!r}}]'''
+'''
+PEP-agnostic code snippet retrieving the current default value of an optional
+keyword-only parameter from the decorated callable, formatted into the
+``{arg_default}`` substring of the :data:`CODE_CALL_ARG_DEFAULT` snippet.
 '''
 
 # ....................{ CODE ~ var                        }....................
@@ -155,11 +259,53 @@ https://eli.thegreenplace.net/2018/slow-and-fast-methods-for-generating-random-i
     Authoritative article profiling various :mod:`random` callables.
 '''
 
+# ....................{ CODE ~ sample                     }....................
+CODE_SAMPLE_EVERY = f'''
+    # If this call is *NOT* the N-th call since the last type-checked call,
+    # call this function unchecked and return the value returned from this
+    # call. Since the call counter is a C-based iterator, this is both
+    # efficient and thread-safe.
+    if next({ARG_NAME_CALL_COUNTER}) % {{sample_every}}:
+        return {ARG_NAME_FUNC}({{func_call_args}})'''
+'''
+PEP-agnostic code snippet type-checking only every ``N``-th call to the
+decorated callable, calling that callable *without* type-checking on all other
+calls.
+
+The first call is always type-checked, as the :class:`itertools.count`
+iterator passed as the private call counter parameter starts at 0.
+'''
+
+
+CODE_SAMPLE_RATIO = f'''
+    # Generate and localize a sufficiently large pseudo-random integer for
+    # both sampling this call and subsequent indexation in type-checking
+    # randomly selected container items.
+    {VAR_NAME_RANDOM_INT} = __beartype_getrandbits(32)
+
+    # If this integer exceeds the sampling bound, call this function unchecked
+    # and return the value returned from this call.
+    if {VAR_NAME_RANDOM_INT} >= {{sample_ratio_bound}}:
+        return {ARG_NAME_FUNC}({{func_call_args}})'''
+'''
+PEP-agnostic code snippet type-checking only a pseudo-random fraction of calls
+to the decorated callable, calling that callable *without* type-checking on all
+other calls.
+
+This snippet reuses the pseudo-random integer otherwise generated by the
+:data:`CODE_INIT_RANDOM_INT` snippet and thus subsumes that snippet, avoiding
+an additional call to the :func:`random.getrandbits` function on type-checked
+calls. Although this integer is then guaranteed to be strictly less than the
+sampling bound on type-checked calls, that bound typically exceeds the lengths
+of real-world containers and thus reduces pseudo-random container indexation
+by only a negligible degree.
+'''
+
 # ....................{ CODE ~ return                     }....................
 CODE_RETURN_UNCHECKED = f'''
     # Call this function with all passed parameters and return the value
     # returned from this call.
-    return {ARG_NAME_FUNC}(*args, **kwargs)'''
+    return {ARG_NAME_FUNC}({{func_call_args}})'''
 '''
 PEP-agnostic code snippet calling the decorated callable *without*
 type-checking the value returned by that call (if any).
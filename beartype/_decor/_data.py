@@ -34,12 +34,14 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                           }....................
 import inspect
-from beartype.cave import CallableCodeObjectType
+from beartype._cave._cavefast import CallableCodeObjectType
 from beartype.roar import BeartypeDecorWrappeeException
+from beartype._decor.conf import BeartypeConf
 from beartype._util.func.utilfunccodeobj import get_func_codeobj
 from beartype._util.text.utiltextlabel import label_callable_decorated
 from collections.abc import Callable
 from inspect import Signature
+from keyword import iskeyword
 from typing import Optional
 
 # See the "beartype.cave" submodule for further commentary.
@@ -84,6 +86,9 @@ class BeartypeData(object):
 
     Attributes
     ----------
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching immutable object
+        configuring the type-checking code generated for this callable).
     func : Callable
         **Decorated callable** (i.e., callable currently being decorated by the
         :func:`beartype.beartype` decorator).
@@ -93,13 +98,45 @@ class BeartypeData(object):
     func_sig : inspect.Signature
         :class:`inspect.Signature` object describing this signature.
 
-    Attributes (String)
+    Attributes (Wrapper)
     ----------
+    func_pith_name_to_typevar_var_name : dict
+        Dictionary mapping from the name of each non-variadic parameter (or
+        ``"return"`` for the return) of the decorated callable directly
+        annotated by a **bindable type variable** (i.e.,
+        :class:`typing.TypeVar` instance directly annotating two or more such
+        parameters or the return) to the name of the local variable of the
+        wrapper function to which the type bound to that type variable by the
+        current call is assigned if the
+        :attr:`beartype.BeartypeConf.is_check_typevar_bindings` option is
+        enabled *or* the empty dictionary otherwise.
+    func_wrapper_code_call_args : str
+        Python code passing all parameters passed to the wrapper function to
+        the decorated callable (e.g., ``muh_arg, *args, muh_kwarg=muh_kwarg``).
+    func_wrapper_defaults : tuple
+        Tuple of the default values of all optional positional parameters
+        declared by the signature of the wrapper function (i.e., the
+        ``__beartypistry`` sentinel value for each such parameter), set as the
+        ``__defaults__`` dunder attribute of that function.
+    func_wrapper_kwdefaults : dict
+        Dictionary mapping from the name to default value of all optional
+        keyword-only parameters declared by the signature of the wrapper
+        function that are *not* private (e.g., ``__beartype_func``), merged
+        into the ``__kwdefaults__`` dunder attribute of that function.
     func_wrapper_name : str
         Machine-readable name of the wrapper function to be generated and
-        returned by this decorator. To efficiently (albeit imperfectly) avoid
-        clashes with existing attributes of the module defining that function,
-        this name is obfuscated while still preserving human-readability.
+        returned by this decorator. Since that function is declared in a
+        private scope rather than the module defining the decorated callable,
+        this name is that of that callable when that name is a valid Python
+        identifier, preserving that name in the :class:`TypeError` exceptions
+        raised by the active Python interpreter on failing to bind arguments
+        passed to that function under Python < 3.10.
+    is_func_wrapper_sig_mirrored : bool
+        ``True`` only if the signature of the wrapper function mirrors the
+        signature of the decorated callable, in which case that function
+        accesses each parameter as a fast local of the same name rather than
+        repacking all parameters into the variadic ``*args`` and ``**kwargs``
+        parameters.
 
     .. _PEP 563:
         https://www.python.org/dev/peps/pep-0563
@@ -111,10 +148,16 @@ class BeartypeData(object):
     # called @beartype decorations. Slotting has been shown to reduce read and
     # write costs by approximately ~10%, which is non-trivial.
     __slots__ = (
+        'conf',
         'func',
         'func_codeobj',
+        'func_pith_name_to_typevar_var_name',
         'func_sig',
+        'func_wrapper_code_call_args',
+        'func_wrapper_defaults',
+        'func_wrapper_kwdefaults',
         'func_wrapper_name',
+        'is_func_wrapper_sig_mirrored',
     )
 
     # Coerce instances of this class to be unhashable, preventing spurious
@@ -148,13 +191,19 @@ class BeartypeData(object):
         '''
 
         # Nullify all remaining instance variables.
+        self.conf: BeartypeConf = None  # type: ignore[assignment]
         self.func: Callable = None  # type: ignore[assignment]
         self.func_codeobj: CallableCodeObjectType = None  # type: ignore[assignment]
+        self.func_pith_name_to_typevar_var_name: dict = None  # type: ignore[assignment]
         self.func_sig: Signature = None  # type: ignore[assignment]
+        self.func_wrapper_code_call_args: str = None  # type: ignore[assignment]
+        self.func_wrapper_defaults: tuple = None  # type: ignore[assignment]
+        self.func_wrapper_kwdefaults: dict = None  # type: ignore[assignment]
         self.func_wrapper_name: str = None  # type: ignore[assignment]
+        self.is_func_wrapper_sig_mirrored = False
 
 
-    def reinit(self, func: Callable) -> None:
+    def reinit(self, func: Callable, conf: BeartypeConf) -> None:
         '''
         Reinitialize this metadata from the passed callable, typically after
         acquisition of a previously cached instance of this class from the
@@ -169,6 +218,8 @@ class BeartypeData(object):
         ----------
         func : Callable
             Callable currently being decorated by :func:`beartype.beartype`.
+        conf : BeartypeConf
+            Beartype configuration configuring this decoration.
 
         Raises
         ----------
@@ -185,24 +236,40 @@ class BeartypeData(object):
            https://www.python.org/dev/peps/pep-0563
         '''
         assert callable(func), f'{repr(func)} uncallable.'
+        assert isinstance(conf, BeartypeConf), (
+            f'{repr(conf)} not beartype configuration.')
 
         # Avoid circular import dependencies.
         from beartype._decor._pep563 import resolve_hints_postponed_if_needed
 
-        # Callable currently being decorated.
+        # Callable currently being decorated and configuration configuring
+        # this decoration.
         self.func = func
+        self.conf = conf
 
         # Code object underlying this callable if this callable is a
         # pure-Python function or method *OR* raise an exception otherwise.
         self.func_codeobj = get_func_codeobj(
             func=func, exception_cls=BeartypeDecorWrappeeException)
 
-        # Machine-readable name of the wrapper function to be generated.
-        self.func_wrapper_name = f'__beartyped_{func.__name__}'
+        # Machine-readable name of the wrapper function to be generated,
+        # defaulting to an obfuscated name if the name of this callable is
+        # *NOT* a valid Python identifier (e.g., due to reassignment).
+        func_name = func.__name__
+        self.func_wrapper_name = (
+            func_name
+            if func_name.isidentifier() and not iskeyword(func_name) else
+            '__beartyped_func'
+        )
 
         # Nullify all remaining attributes for safety *BEFORE* passing this
         # object to any functions (e.g., resolve_hints_postponed_if_needed()).
+        self.func_pith_name_to_typevar_var_name = None  # type: ignore[assignment]
         self.func_sig = None  # type: ignore[assignment]
+        self.func_wrapper_code_call_args = None  # type: ignore[assignment]
+        self.func_wrapper_defaults = None  # type: ignore[assignment]
+        self.func_wrapper_kwdefaults = None  # type: ignore[assignment]
+        self.is_func_wrapper_sig_mirrored = False
 
         # Resolve all postponed annotations if any on this callable *BEFORE*
         # parsing the actual annotations these postponed annotations refer to.
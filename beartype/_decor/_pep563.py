@@ -18,12 +18,9 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                           }....................
 import __future__
-from beartype.roar import (
-    BeartypeDecorHintPep563Exception,
-    BeartypeDecorHintPepException,
-)
+from beartype.roar import BeartypeDecorHintPep563Exception
+from beartype._decor._cache.cachepep563 import eval_hint_postponed
 from beartype._decor._data import BeartypeData
-from beartype._util.cache.pool.utilcachepoollistfixed import SIZE_BIG
 from beartype._util.py.utilpyversion import (
     IS_PYTHON_AT_LEAST_3_10,
     IS_PYTHON_AT_LEAST_3_7,
@@ -172,6 +169,7 @@ def _resolve_hints_postponed(data: BeartypeData) -> None:
     # Localize attributes of this metadata for negligible efficiency gains.
     func = data.func
     func_globals = func.__globals__  # type: ignore[attr-defined]
+    func_module_name = getattr(func, '__module__', None)
 
     # Dictionary mapping from parameter name to resolved annotation for each
     # annotated parameter and return value of this callable.
@@ -224,17 +222,15 @@ def _resolve_hints_postponed(data: BeartypeData) -> None:
         #    The value of localns cannot be reliably retrieved for functions
         #    because in all likelihood the stack frame at the time of the call no
         #    longer exists."
-
-            # If this string internally exceeds the child limit (i.e., maximum
-            # number of nested child type hints listed as subscripted arguments
-            # of the parent PEP-compliant type hint produced by evaluating this
-            # string) permitted by the @beartype decorator, raise an exception.
-            _die_if_hint_repr_exceeds_child_limit(
-                hint_repr=pith_hint, pith_label=pith_label)
+        #
+        # Since modules commonly annotate many callables by the same strings
+        # (e.g., "Optional[UserId]"), each such evaluation is memoized against
+        # the module declaring this callable rather than repeated here.
 
             # Attempt to resolve this postponed annotation to its referent.
             try:
-                func_hints[pith_name] = eval(pith_hint, func_globals)
+                func_hints[pith_name] = eval_hint_postponed(
+                    pith_hint, func_globals, func_module_name)
             # If this fails (as it commonly does), wrap the low-level (and
             # usually non-human-readable) exception raised by eval() with a
             # higher-level human-readable beartype-specific exception.
@@ -273,23 +269,6 @@ def _resolve_hints_postponed(data: BeartypeData) -> None:
         #
         # Because we should probably mention those complaints here.
         else:
-            # If the machine-readable representation of this annotation (which
-            # internally encapsulates the same structural metadata as the
-            # PEP 563-formatted postponed string representation of this
-            # annotation) internally exceeds the child limit as tested above,
-            # again raise an exception.
-            #
-            # Note that obtaining the machine-readable representation of this
-            # annotation incurs a minor performance penalty. However, since
-            # effectively *ALL* annotations will be PEP 563-formatted postponed
-            # strings once the next major Python version officially instates
-            # PEP 563 as a mandatory backward compatibility-breaking change,
-            # this penalty will effectively cease to existence for the
-            # overwhelming majority of real-world annotations. *shrug*
-            _die_if_hint_repr_exceeds_child_limit(
-                hint_repr=repr(pith_hint),
-                pith_label=pith_label)
-
             # Silently preserve this annotation as is.
             func_hints[pith_name] = pith_hint
 
@@ -304,89 +283,3 @@ def _resolve_hints_postponed(data: BeartypeData) -> None:
     # with useful real annotations; so, we do so.
     func.__annotations__ = func_hints
 
-
-# ....................{ PRIVATE ~ resolvers               }....................
-def _die_if_hint_repr_exceeds_child_limit(
-    hint_repr: str, pith_label: str) -> None:
-    '''
-    Raise an exception if the passed machine-readable representation of an
-    arbitrary annotation internally exceeds the **child limit** (i.e., maximum
-    number of nested child type hints listed as subscripted arguments of
-    PEP-compliant type hints) permitted by the :func:`beartype.beartype`
-    decorator.
-
-    The :mod:`beartype` decorator internally traverses over these nested child
-    types of the parent PEP-compliant type hint produced by evaluating this
-    string representation to its referent with a breadth-first search (BFS).
-    For efficiency, this search is iteratively implemented with a cached
-    **fixed list** (i.e.,
-    :class:`beartype._util.cache.pool.utilcachepoollistfixed.FixedList`
-    instance) rather than recursively implemented with traditional recursion.
-    Since the size of this list is sufficiently large to handle all uncommon
-    *and* uncommon edge cases, this list suffices for *all* PEP-compliant type
-    hints of real-world interest.
-
-    Nonetheless, safety demands that we guarantee this by explicitly raising an
-    exception when the internal structure of this string suggests that the
-    resulting PEP-compliant type hint will subsequently violate this limit.
-    This has the convenient side effect of optimizing that BFS, which may now
-    unconditionally insert child hints into arbitrary indices of that cached
-    fixed list without having to explicitly test whether each index exceeds the
-    fixed length of that list.
-
-    Caveats
-    ----------
-    **This function is currently irrelevant.** Why? Because all existing
-    implementations of the :mod:`typing` module are sufficiently
-    space-consumptive that they already implicitly prohibit deep nesting of
-    PEP-compliant type hints. See commentary in the
-    :mod:`beartype_test.a00_unit.data.data_pep563` submodule for appalling details.
-    Ergo, this validator could technically be disabled. Indeed, if this
-    validator actually incurred any measurable costs, it *would* be disabled.
-    Since it doesn't, this validator has preserved purely for forward
-    compatibility with some future revision of the :mod:`typing` module that
-    hopefully improves that module's horrid space consumption.
-
-    Parameters
-    ----------
-    hint_repr : str
-        Machine-readable representation of this annotation, typically but *not*
-        necessarily as a `PEP 563`_-formatted postponed string.
-    pith_label : str
-        Human-readable label describing the callable parameter or return value
-        annotated by this string.
-
-    Raises
-    ----------
-    BeartypeDecorHintPepException
-        If this representation internally exceeds this limit.
-
-    .. _PEP 563:
-       https://www.python.org/dev/peps/pep-0563
-    '''
-    assert isinstance(hint_repr, str), f'{repr(hint_repr)} not string.'
-
-    # Total number of hints transitively encapsulated in this hint (i.e., the
-    # total number of all child hints of this hint as well as this hint
-    # itself), defined as the summation of...
-    hints_num = (
-        # Number of parent PEP-compliant type hints nested in this hint,
-        # including this hint itself *AND*...
-        hint_repr.count('[') +
-        # Number of child type hints (both PEP-compliant type hints and
-        # non-"typing" types) nested in this hint, excluding the last child
-        # hint subscripting each parent PEP-compliant type hint *AND*...
-        hint_repr.count(',') +
-        # Number of last child hints subscripting all parent PEP-compliant type
-        # hints.
-        hint_repr.count(']')
-    )
-
-    # If this number exceeds the fixed length of the cached fixed list with
-    # which the @beartype decorator traverses this hint, raise an exception.
-    if hints_num >= SIZE_BIG:
-        raise BeartypeDecorHintPepException(
-            f'{pith_label} hint representation "{hint_repr}" '
-            f'contains {hints_num} subscripted arguments '
-            f'exceeding maximum limit {SIZE_BIG-1}.'
-        )
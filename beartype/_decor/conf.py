@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype decorator configuration.**
+
+This private submodule defines the :class:`BeartypeConf` class configuring the
+type-checking code dynamically generated by the :func:`beartype.beartype`
+decorator. The :mod:`beartype.__init__` submodule then imports this class for
+importation as the public :class:`beartype.BeartypeConf` class by downstream
+callers.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype.roar import BeartypeConfException
+from threading import Lock
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CLASSES                           }....................
+class BeartypeConf(object):
+    '''
+    **Beartype configuration** (i.e., self-caching immutable object
+    encapsulating *all* flags, options, settings, and other metadata
+    configuring the type-checking code dynamically generated by the
+    :func:`beartype.beartype` decorator for the callables it decorates).
+
+    Configurations are passed to that decorator as the optional keyword-only
+    ``conf`` parameter: e.g.,
+
+        >>> from beartype import BeartypeConf, beartype
+        >>> @beartype(conf=BeartypeConf(sample_every=16))
+        ... def hot_func(muh_int: int) -> int: return muh_int
+
+    Design
+    ----------
+    This class is **self-caching.** Instantiating this class multiple times
+    with the same parameters returns the same instance, guaranteeing that
+    configurations are safely hashable by identity and thus efficiently
+    passable as parameters to memoized callables (e.g.,
+    :func:`beartype._decor._code._pep._pephint.pep_code_check_hint`).
+
+    This class is **immutable.** All attributes are exposed as read-only
+    properties, as mutating a configuration previously passed to a memoized
+    callable would silently desynchronize the cached return values of that
+    callable from that configuration.
+
+    Attributes (Private)
+    ----------
+    _is_check_fields : bool
+        **Record field checking flag.** See the :attr:`is_check_fields`
+        property.
+    _is_check_kwargs_all : bool
+        **Variadic keyword checking flag.** See the
+        :attr:`is_check_kwargs_all` property.
+    _is_check_typevars : bool
+        **Type variable checking flag.** See the :attr:`is_check_typevars`
+        property.
+    _is_check_typevar_bindings : bool
+        **Type variable binding checking flag.** See the
+        :attr:`is_check_typevar_bindings` property.
+    _is_lazy : bool
+        **Lazy decoration flag.** See the :attr:`is_lazy` property.
+    _is_proxy_iterators : bool
+        **Iterator proxying flag.** See the :attr:`is_proxy_iterators`
+        property.
+    _sample_every : int
+        **Sampling interval.** See the :attr:`sample_every` property.
+    _sample_ratio : float
+        **Sampling ratio.** See the :attr:`sample_ratio` property.
+    _sample_ratio_bound : int
+        **Sampling bound** (i.e., exclusive upper bound of the unsigned 32-bit
+        pseudo-random integers type-checking the current call when randomly
+        sampling calls), precomputed from the :attr:`sample_ratio` property.
+    '''
+
+    # ..................{ CLASS VARIABLES                   }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables.
+    __slots__ = (
+        '_is_check_fields',
+        '_is_check_kwargs_all',
+        '_is_check_typevars',
+        '_is_check_typevar_bindings',
+        '_is_lazy',
+        '_is_proxy_iterators',
+        '_sample_every',
+        '_sample_ratio',
+        '_sample_ratio_bound',
+    )
+
+    # ..................{ INSTANTIATORS                     }..................
+    def __new__(
+        cls,
+        *,
+        sample_every: int = 1,
+        sample_ratio: float = 1.0,
+        is_check_kwargs_all: bool = False,
+        is_check_fields: bool = False,
+        is_proxy_iterators: bool = False,
+        is_check_typevars: bool = False,
+        is_check_typevar_bindings: bool = False,
+        is_lazy: bool = False,
+    ) -> 'BeartypeConf':
+        '''
+        Instantiate this configuration if needed (i.e., if *no* prior
+        configuration with these same parameters was previously instantiated)
+        *or* reuse that previously instantiated configuration otherwise.
+
+        Parameters
+        ----------
+        sample_every : int
+            **Sampling interval** (i.e., positive integer ``N`` such that
+            wrappers generated under this configuration type-check only every
+            ``N``-th call, calling the decorated callable *without*
+            type-checking on all other calls). Defaults to 1, type-checking
+            every call.
+        sample_ratio : float
+            **Sampling ratio** (i.e., floating-point number in the
+            left-exclusive range ``(0.0, 1.0]`` such that wrappers generated
+            under this configuration type-check only a pseudo-random fraction
+            of calls approximating this ratio, calling the decorated callable
+            *without* type-checking on all other calls). Defaults to 1.0,
+            type-checking every call.
+        is_check_kwargs_all : bool
+            ``True`` only if wrappers generated under this configuration
+            type-check *all* variadic keyword parameters (e.g., ``**kwargs:
+            int``) passed to each call in linear time. Defaults to ``False``,
+            in which case these wrappers type-check only the first such
+            parameter in constant time, consistent with the constant-time
+            random sampling of items of type-checked containers.
+        is_check_fields : bool
+            ``True`` only if wrappers generated under this configuration
+            type-check *all* annotated fields of **records** (i.e., instances
+            of :class:`typing.NamedTuple` subclasses and of classes decorated
+            by the :func:`dataclasses.dataclass` decorator) annotated as such.
+            Defaults to ``False``, in which case these wrappers only
+            type-check records to be instances of their classes.
+        is_proxy_iterators : bool
+            ``True`` only if wrappers generated under this configuration
+            replace each passed parameter and returned value annotated by an
+            **iterator hint** (i.e., subscription of either
+            :class:`typing.Iterator`, :class:`typing.Iterable`, or
+            :class:`typing.Generator` *or* the :mod:`collections.abc`
+            equivalents of those hints) by a proxy type-checking each item
+            yielded by that iterator as that item is consumed. Defaults to
+            ``False``, in which case these wrappers only type-check these
+            objects to be iterators, as type-checking their items would
+            otherwise exhaust one-shot iterators. Note that:
+
+            * Since proxies are *not* the objects they proxy, callers
+              enabling this option should avoid testing the identities or
+              exact types of these objects.
+            * Iterables that are *not* iterators (e.g., lists annotated as
+              ``Iterable[int]``) are reiterable and thus passed as is. Items
+              of sequences are type-checked by pseudo-randomly sampling one
+              item per call (e.g., ``[['a']]`` violates
+              ``Iterable[List[int]]``). Items of all other reiterable
+              containers (e.g., sets, dictionaries) are *not* type-checked.
+            * Parameters are proxied only by wrappers mirroring the signature
+              of the decorated callable; parameters passed to wrappers
+              repacking all parameters into ``*args`` and ``**kwargs`` are
+              passed as is.
+        is_check_typevars : bool
+            ``True`` only if wrappers generated under this configuration
+            type-check objects annotated by bounded or constrained **type
+            variables** (i.e., :class:`typing.TypeVar` instances) against the
+            bounds or constraints of these variables (e.g., ``int`` for
+            ``TypeVar('T', bound=int)``), including type variables nested in
+            other type hints (e.g., ``List[T]``). Defaults to ``False``, in
+            which case these wrappers ignore all type variables.
+        is_check_typevar_bindings : bool
+            ``True`` only if wrappers generated under this configuration
+            additionally require all parameters and the return annotated by
+            the same type variable in the same call to be of the same exact
+            type (e.g., rejecting ``f(1, 'a')`` for ``def f(a: T, b: T)``).
+            Each such variable is bound to the type of the first such object
+            passed to each call, tracked in a local variable of the wrapper
+            and thus costing only one type comparison per object. Only
+            parameters and returns annotated directly by type variables are
+            bound; type variables nested in other type hints are *not*.
+            Defaults to ``False``. Requires ``is_check_typevars`` to be
+            ``True``.
+        is_lazy : bool
+            ``True`` only if the :func:`beartype.beartype` decorator decorates
+            callables under this configuration lazily (i.e., by returning a
+            lightweight trampoline deferring all decoration work to the first
+            call of that trampoline). On that call, that trampoline resolves
+            the annotations of the decorated callable, generates its wrapper,
+            and rebinds the attribute of the module or class declaring that
+            callable to that wrapper if that attribute is that trampoline.
+            Defaults to ``False``, in which case that decorator decorates
+            callables eagerly. Note that:
+
+            * Decorating callables that are never called is then effectively
+              free, reducing the startup time of applications decorating many
+              such callables.
+            * `PEP 563`_-postponed annotations may then refer to classes
+              declared *after* the decorated callable in the same module.
+            * Exceptions otherwise raised at decoration time (e.g., due to
+              unsupported type hints) are then raised on the first call to
+              that trampoline instead.
+            * References to that trampoline obtained *before* that call (e.g.,
+              aliases, callbacks) remain valid, at the negligible cost of one
+              additional call per call.
+
+        Returns
+        ----------
+        BeartypeConf
+            Configuration with these parameters.
+
+        Raises
+        ----------
+        BeartypeConfException
+            If either:
+
+            * ``sample_every`` is *not* a positive integer.
+            * ``sample_ratio`` is *not* a number in the range ``(0.0, 1.0]``.
+            * Both ``sample_every`` and ``sample_ratio`` are non-default, as
+              these sampling strategies are mutually exclusive.
+            * ``is_check_kwargs_all`` is *not* a boolean.
+            * ``is_check_fields`` is *not* a boolean.
+            * ``is_proxy_iterators`` is *not* a boolean.
+            * ``is_check_typevars`` is *not* a boolean.
+            * ``is_check_typevar_bindings`` is *not* a boolean.
+            * ``is_check_typevar_bindings`` is ``True`` but
+              ``is_check_typevars`` is ``False``.
+            * ``is_lazy`` is *not* a boolean.
+
+        .. _PEP 563:
+           https://www.python.org/dev/peps/pep-0563
+        '''
+
+        # Validate all passed parameters *BEFORE* looking up these parameters
+        # in the cache below, as invalid parameters may compare equal to valid
+        # parameters (e.g., "True == 1").
+        #
+        # If this interval is *NOT* a positive integer, raise an exception.
+        if not (
+            isinstance(sample_every, int) and
+            not isinstance(sample_every, bool) and
+            sample_every >= 1
+        ):
+            raise BeartypeConfException(
+                f'Sampling interval {repr(sample_every)} '
+                f'not positive integer.'
+            )
+        # Else if this ratio is *NOT* a number in the range (0.0, 1.0], raise
+        # an exception.
+        elif not (
+            isinstance(sample_ratio, (int, float)) and
+            not isinstance(sample_ratio, bool) and
+            0.0 < sample_ratio <= 1.0
+        ):
+            raise BeartypeConfException(
+                f'Sampling ratio {repr(sample_ratio)} '
+                f'not number in range (0.0, 1.0].'
+            )
+        # Else if both sampling strategies are enabled, raise an exception.
+        elif sample_every != 1 and sample_ratio != 1.0:
+            raise BeartypeConfException(
+                f'Sampling interval {repr(sample_every)} and '
+                f'sampling ratio {repr(sample_ratio)} mutually exclusive.'
+            )
+        # Else if this flag is *NOT* a boolean, raise an exception.
+        elif not isinstance(is_check_kwargs_all, bool):
+            raise BeartypeConfException(
+                f'Variadic keyword checking flag '
+                f'{repr(is_check_kwargs_all)} not boolean.'
+            )
+        # Else if this flag is *NOT* a boolean, raise an exception.
+        elif not isinstance(is_check_fields, bool):
+            raise BeartypeConfException(
+                f'Record field checking flag '
+                f'{repr(is_check_fields)} not boolean.'
+            )
+        # Else if this flag is *NOT* a boolean, raise an exception.
+        elif not isinstance(is_proxy_iterators, bool):
+            raise BeartypeConfException(
+                f'Iterator proxying flag '
+                f'{repr(is_proxy_iterators)} not boolean.'
+            )
+        # Else if this flag is *NOT* a boolean, raise an exception.
+        elif not isinstance(is_check_typevars, bool):
+            raise BeartypeConfException(
+                f'Type variable checking flag '
+                f'{repr(is_check_typevars)} not boolean.'
+            )
+        # Else if this flag is *NOT* a boolean, raise an exception.
+        elif not isinstance(is_check_typevar_bindings, bool):
+            raise BeartypeConfException(
+                f'Type variable binding checking flag '
+                f'{repr(is_check_typevar_bindings)} not boolean.'
+            )
+        # Else if type variable bindings are to be checked *WITHOUT* checking
+        # type variables, raise an exception.
+        elif is_check_typevar_bindings and not is_check_typevars:
+            raise BeartypeConfException(
+                'Type variable binding checking flag enabled but '
+                'type variable checking flag disabled.'
+            )
+        # Else if this flag is *NOT* a boolean, raise an exception.
+        elif not isinstance(is_lazy, bool):
+            raise BeartypeConfException(
+                f'Lazy decoration flag {repr(is_lazy)} not boolean.')
+        # Else, all passed parameters are valid.
+
+        # Tuple of all passed parameters, uniquely identifying this
+        # configuration.
+        conf_params = (
+            sample_every,
+            sample_ratio,
+            is_check_kwargs_all,
+            is_check_fields,
+            is_proxy_iterators,
+            is_check_typevars,
+            is_check_typevar_bindings,
+            is_lazy,
+        )
+
+        # Configuration previously instantiated with these parameters if any
+        # *OR* "None" otherwise.
+        conf = _CONF_PARAMS_TO_CONF.get(conf_params)
+
+        # If this configuration was previously instantiated, reuse that.
+        if conf is not None:
+            return conf
+        # Else, this configuration has yet to be instantiated.
+
+        # Instantiate and initialize this configuration.
+        conf = super().__new__(cls)
+        conf._sample_every = sample_every
+        conf._sample_ratio = float(sample_ratio)
+        conf._sample_ratio_bound = int(sample_ratio * _RANDOM_INT_BOUND)
+        conf._is_check_kwargs_all = is_check_kwargs_all
+        conf._is_check_fields = is_check_fields
+        conf._is_proxy_iterators = is_proxy_iterators
+        conf._is_check_typevars = is_check_typevars
+        conf._is_check_typevar_bindings = is_check_typevar_bindings
+        conf._is_lazy = is_lazy
+
+        # Cache this configuration in a thread-safe manner, deferring to any
+        # configuration with these same parameters concurrently cached by
+        # another thread.
+        with _CONF_PARAMS_TO_CONF_LOCK:
+            return _CONF_PARAMS_TO_CONF.setdefault(conf_params, conf)
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def sample_every(self) -> int:
+        '''
+        **Sampling interval** (i.e., positive integer ``N`` such that wrappers
+        generated under this configuration type-check only every ``N``-th
+        call).
+        '''
+
+        return self._sample_every
+
+
+    @property
+    def sample_ratio(self) -> float:
+        '''
+        **Sampling ratio** (i.e., approximate fraction of calls type-checked by
+        wrappers generated under this configuration).
+        '''
+
+        return self._sample_ratio
+
+
+    @property
+    def sample_ratio_bound(self) -> int:
+        '''
+        **Sampling bound** (i.e., exclusive upper bound of the unsigned 32-bit
+        pseudo-random integers type-checking the current call when randomly
+        sampling calls).
+        '''
+
+        return self._sample_ratio_bound
+
+
+    @property
+    def is_check_kwargs_all(self) -> bool:
+        '''
+        ``True`` only if wrappers generated under this configuration
+        type-check *all* variadic keyword parameters passed to each call in
+        linear time rather than only the first such parameter in constant time.
+        '''
+
+        return self._is_check_kwargs_all
+
+
+    @property
+    def is_check_fields(self) -> bool:
+        '''
+        ``True`` only if wrappers generated under this configuration
+        type-check *all* annotated fields of records (i.e., instances of
+        :class:`typing.NamedTuple` subclasses and dataclasses) rather than only
+        the types of these records.
+        '''
+
+        return self._is_check_fields
+
+
+    @property
+    def is_proxy_iterators(self) -> bool:
+        '''
+        ``True`` only if wrappers generated under this configuration proxy
+        iterators annotated by iterator hints (e.g., ``Iterator[int]``),
+        lazily type-checking each item of these iterators as that item is
+        consumed rather than only the types of these iterators.
+        '''
+
+        return self._is_proxy_iterators
+
+
+    @property
+    def is_check_typevars(self) -> bool:
+        '''
+        ``True`` only if wrappers generated under this configuration
+        type-check objects annotated by bounded or constrained type variables
+        against the bounds or constraints of these variables rather than
+        ignoring these variables.
+        '''
+
+        return self._is_check_typevars
+
+
+    @property
+    def is_check_typevar_bindings(self) -> bool:
+        '''
+        ``True`` only if wrappers generated under this configuration require
+        all parameters and the return annotated by the same type variable in
+        the same call to be of the same exact type.
+        '''
+
+        return self._is_check_typevar_bindings
+
+
+    @property
+    def is_lazy(self) -> bool:
+        '''
+        ``True`` only if the :func:`beartype.beartype` decorator decorates
+        callables under this configuration lazily on their first call rather
+        than eagerly at decoration time.
+        '''
+
+        return self._is_lazy
+
+
+    @property
+    def is_sampled(self) -> bool:
+        '''
+        ``True`` only if wrappers generated under this configuration
+        type-check only a subset of all calls.
+        '''
+
+        return self._sample_every != 1 or self._sample_ratio != 1.0
+
+    # ..................{ DUNDERS                           }..................
+    def __repr__(self) -> str:
+        '''
+        Machine-readable representation of this configuration.
+        '''
+
+        return (
+            f'BeartypeConf('
+            f'sample_every={repr(self._sample_every)}, '
+            f'sample_ratio={repr(self._sample_ratio)}, '
+            f'is_check_kwargs_all={repr(self._is_check_kwargs_all)}, '
+            f'is_check_fields={repr(self._is_check_fields)}, '
+            f'is_proxy_iterators={repr(self._is_proxy_iterators)}, '
+            f'is_check_typevars={repr(self._is_check_typevars)}, '
+            f'is_check_typevar_bindings='
+            f'{repr(self._is_check_typevar_bindings)}, '
+            f'is_lazy={repr(self._is_lazy)})'
+        )
+
+# ....................{ PRIVATE ~ globals                 }....................
+_CONF_PARAMS_TO_CONF = {}
+'''
+Non-thread-safe dictionary mapping from the tuple of all parameters passed to
+the :meth:`BeartypeConf.__new__` method to the configuration previously
+instantiated with those parameters.
+'''
+
+
+_CONF_PARAMS_TO_CONF_LOCK = Lock()
+'''
+Non-reentrant thread lock serializing writes to the
+:data:`_CONF_PARAMS_TO_CONF` dictionary.
+'''
+
+
+_RANDOM_INT_BOUND = 1 << 32
+'''
+Exclusive upper bound of the unsigned 32-bit pseudo-random integers generated
+by the ``CODE_INIT_RANDOM_INT`` code snippet.
+'''
+
+# ....................{ GLOBALS                           }....................
+BEARTYPE_CONF_DEFAULT = BeartypeConf()
+'''
+**Default beartype configuration** (i.e., configuration type-checking every
+call, applied to all callables decorated by the :func:`beartype.beartype`
+decorator *not* explicitly passed a ``conf`` parameter).
+'''
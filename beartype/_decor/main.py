@@ -223,33 +223,44 @@ This private submodule is *not* intended for importation by downstream callers.
 #perspective, which means we should make this happen.
 
 # ....................{ IMPORTS                           }....................
-import functools, random
+import builtins, functools, random
 from beartype.roar import (
+    BeartypeConfException,
     BeartypeDecorWrappeeException,
     BeartypeDecorWrapperException,
 )
 from beartype._decor._code.codemain import generate_code
 from beartype._decor._code.codesnip import (
-    ARG_NAME_FUNC, ARG_NAME_TYPISTRY)
+    ARG_NAME_CALL_COUNTER, ARG_NAME_FUNC, ARG_NAME_TYPISTRY)
+from beartype._decor._code._pep._pepsnip import (
+    PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC_TYPES_NAME_PREFIX)
 from beartype._decor._data import BeartypeData
+from beartype._decor._cache.cacheglobal import wrapper_globals
 from beartype._decor._cache.cachetype import bear_typistry
+from beartype._decor.conf import BEARTYPE_CONF_DEFAULT, BeartypeConf
+from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.cache.pool.utilcachepoolobjecttyped import (
     acquire_object_typed, release_object_typed)
+from beartype._util.cls.utilclsabc import TYPE_ABC_TO_TYPES_CONCRETE
 from beartype._decor._code._pep._error.peperror import (
-    raise_pep_call_exception)
+    raise_pep_call_exception,
+    raise_pep_call_typevar_exception,
+)
+from beartype._util.py.utilpyinterpreter import is_python_gil_enabled
+from beartype._util.text.utiltextlabel import label_callable_decorated
 from beartype._util.text.utiltextmunge import number_lines
-from typing import Callable, TYPE_CHECKING
+from itertools import count, repeat
+from os import cpu_count
+from sys import modules as sys_modules
+from types import CodeType, FunctionType
+from typing import Callable, Iterable, List, Optional, Tuple, TYPE_CHECKING
 # from beartype._util.utilobject import get_object_name
-# from types import FunctionType
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
 # ....................{ CONSTANTS                         }....................
-_GLOBAL_ATTRS = {
-    '__beartype_getrandbits': random.getrandbits,
-    '__beartype_raise_pep_call_exception': raise_pep_call_exception,
-}
+_GLOBAL_ATTRS = wrapper_globals
 '''
 Dictionary mapping from the name to value of all attributes internally
 accessed as globals (rather than as locals externally passed as private default
@@ -262,6 +273,15 @@ constants declared by one or more snippet submodules (e.g.,
 arbitrary caller-defined parameters, these names *must* be aliased under
 alternate names prefixed by ``__beartype_``.
 
+This dictionary is the
+:data:`beartype._decor._cache.cacheglobal.wrapper_globals` singleton,
+initialized below with all attributes accessed by wrapper functions
+type-checking commonplace hints. Submodules caching attributes accessed only by
+wrapper functions type-checking comparatively uncommon hints (e.g., typed
+dictionaries, beartype validators) instead register those attributes with this
+dictionary on their first importation by the code generator, preserving the
+importation time of the :mod:`beartype` package.
+
 Caveats
 ----------
 **Attributes frequently accessed in the body of these functions should instead
@@ -270,8 +290,36 @@ includes the frequently accessed ``__beartypistry`` local, which is thus passed
 as a private default parameter to the signatures of these functions.
 '''
 
+# Register all attributes accessed by wrapper functions type-checking
+# commonplace hints.
+_GLOBAL_ATTRS.update({
+    # Builtins accessible to these functions. Although the exec() builtin
+    # implicitly adds this key to this dictionary on first execution, the
+    # "types.FunctionType" class under Python < 3.10 does *NOT*. Functions
+    # directly instantiated from code objects by the _compile_wrapper_codes()
+    # function before any such execution would otherwise access *NO* builtins.
+    '__builtins__': builtins,
+    '__beartype_getrandbits': random.getrandbits,
+    '__beartype_raise_pep_call_exception': raise_pep_call_exception,
+    '__beartype_raise_pep_call_typevar_exception': (
+        raise_pep_call_typevar_exception),
+    '__beartype_type': type,
+
+    # Frozen sets of all common concrete types subclassing each standard ABC,
+    # referenced by code type-checking piths against these ABCs.
+    **{
+        f'{PEP_CODE_CHECK_HINT_NONPEP_TYPE_ABC_TYPES_NAME_PREFIX}'
+        f'{type_abc.__name__}': types_concrete
+        for type_abc, types_concrete in TYPE_ABC_TO_TYPES_CONCRETE.items()
+    },
+})
+
 # ....................{ DECORATORS                        }....................
-def beartype(func: Callable) -> Callable:
+def beartype(
+    func: Optional[Callable] = None,
+    *,
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+) -> Callable:
     '''
     Decorate the passed **pure-Python callable** (e.g., function or method
     declared in Python rather than C) to validate both all annotated parameters
@@ -295,16 +343,33 @@ def beartype(func: Callable) -> Callable:
     func : Callable
         **Non-class callable** (i.e., callable object that is *not* a class) to
         be decorated by a dynamically generated new callable wrapping this
-        original callable with pure-Python type-checking.
+        original callable with pure-Python type-checking. Defaults to ``None``,
+        in which case this decorator instead returns a new decorator
+        configured by the passed configuration: e.g.,
+
+            >>> from beartype import BeartypeConf, beartype
+            >>> @beartype(conf=BeartypeConf(sample_every=8))
+            ... def sometimes_checked(muh_int: int) -> int: return muh_int
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching immutable object
+        configuring the type-checking code generated by this decorator).
+        Defaults to the default configuration type-checking every call.
 
     Returns
     ----------
     Callable
-        Dynamically generated new callable wrapping this original callable with
-        pure-Python type-checking.
+        Either:
+
+        * If passed a callable, a dynamically generated new callable wrapping
+          this original callable with pure-Python type-checking. If the
+          :attr:`BeartypeConf.is_lazy` option is enabled, this callable is
+          instead a trampoline generating that wrapper on its first call.
+        * Else, a new decorator configured by the passed configuration.
 
     Raises
     ----------
+    BeartypeConfException
+        If ``conf`` is *not* a beartype configuration.
     BeartypeDecorHintException
         If any annotation on this callable is neither:
 
@@ -342,6 +407,257 @@ def beartype(func: Callable) -> Callable:
        https://www.python.org/dev/peps/pep-0563
     '''
 
+    # If this configuration is *NOT* a configuration, raise an exception.
+    if not isinstance(conf, BeartypeConf):
+        raise BeartypeConfException(
+            f'{repr(conf)} not beartype configuration.')
+    # Else, this configuration is a configuration.
+    #
+    # If *NO* callable was passed, this decorator was called with only a
+    # configuration (e.g., "@beartype(conf=BeartypeConf(...))"). In this case,
+    # return a new decorator configured by this configuration.
+    elif func is None:
+        return _get_beartype_conf_decorator(conf)
+    # Else, a callable was passed.
+    #
+    # If this configuration defers decoration to the first call of this
+    # callable, return a trampoline doing so.
+    elif conf.is_lazy:
+        return _make_lazy_wrapper(func, conf)
+    # Else, this configuration decorates this callable eagerly.
+
+    # Return a wrapper type-checking this callable.
+    return _make_wrapper(func, conf)
+
+
+def beartype_all(
+    funcs: Iterable[Callable],
+    *,
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+    workers: Optional[int] = None,
+) -> List[Callable]:
+    '''
+    Decorate all passed **pure-Python callables** by the :func:`beartype`
+    decorator in bulk, returning a list of the resulting wrappers in the same
+    order as these callables.
+
+    This function is semantically equivalent to but typically faster than
+    ``[beartype(func, conf=conf) for func in funcs]`` when decorating many
+    callables at once (e.g., thousands of callables at application startup).
+    Specifically, this function:
+
+    #. Generates the code implementing all wrappers across a thread pool of
+       the passed number of workers. Under free-threaded CPython builds, this
+       generation runs in parallel.
+    #. Compiles that code in bulk, either:
+
+       * If the active Python interpreter is guarded by a Global Interpreter
+         Lock (GIL), with a single call to the :func:`compile` builtin.
+       * Else, with one call to that builtin per worker in parallel.
+
+    #. Attaches each resulting wrapper to its callable in the caller's order.
+
+    Parameters
+    ----------
+    funcs : Iterable[Callable]
+        Iterable of all callables to be decorated.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching immutable object
+        configuring the type-checking code generated by this function).
+        Defaults to the default configuration type-checking every call.
+    workers : Optional[int]
+        Maximum number of threads with which to decorate these callables.
+        Defaults to ``None``, in which case ``min(32, os.cpu_count() + 4)``
+        threads are used (i.e., the default number of threads selected by the
+        :class:`concurrent.futures.ThreadPoolExecutor` class).
+
+    Returns
+    ----------
+    List[Callable]
+        List such that each item is the result of decorating the callable at
+        the same 0-based index of the passed iterable by the :func:`beartype`
+        decorator (i.e., either a wrapper type-checking that callable *or*
+        that callable as is if that callable requires *no* type-checking).
+
+    Raises
+    ----------
+    BeartypeConfException
+        If either:
+
+        * ``conf`` is *not* a beartype configuration.
+        * ``workers`` is neither ``None`` *nor* a positive integer.
+    BeartypeDecorWrapperException
+        If the code generated for any wrapper fails to compile.
+
+    See the :func:`beartype` decorator for all other exceptions raised by this
+    function, which raises the exception raised by decorating the first such
+    callable in the passed order that fails to be decorated.
+    '''
+
+    # If this configuration is *NOT* a configuration, raise an exception.
+    if not isinstance(conf, BeartypeConf):
+        raise BeartypeConfException(
+            f'{repr(conf)} not beartype configuration.')
+    # Else if this number of workers is neither "None" nor a positive integer,
+    # raise an exception.
+    elif workers is not None and not (
+        isinstance(workers, int) and
+        not isinstance(workers, bool) and
+        workers >= 1
+    ):
+        raise BeartypeConfException(
+            f'Worker count {repr(workers)} not positive integer.')
+    # Else, all passed parameters are valid.
+    #
+    # If this configuration defers decoration to the first call of each
+    # callable, return a trampoline doing so for each callable. Since creating
+    # these trampolines is trivial, doing so in a thread pool is pointless.
+    elif conf.is_lazy:
+        return [_make_lazy_wrapper(func, conf) for func in funcs]
+    # Else, this configuration decorates these callables eagerly.
+
+    # Defer heavyweight imports, avoiding increasing the import time of the
+    # "beartype" package for callers never calling this function.
+    from concurrent.futures import ThreadPoolExecutor
+
+    # If the caller passed *NO* number of workers, default to the number of
+    # workers selected by the "ThreadPoolExecutor" class under Python 3.8.
+    if workers is None:
+        workers = min(32, (cpu_count() or 1) + 4)
+
+    # Tuple of all callables to be decorated, preserving the caller's order.
+    funcs = tuple(funcs)
+
+    # List of all callables and wrappers to be returned, initialized to these
+    # callables and subsequently replaced by these wrappers.
+    funcs_decorated: List[Callable] = list(funcs)
+
+    # If *NO* callables were passed, silently reduce to a noop.
+    if not funcs:
+        return funcs_decorated
+    # Else, one or more callables were passed.
+
+    # In a thread pool of this number of workers...
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # List of the code generated for each callable if that callable
+        # requires type-checking *OR* "None" otherwise, generated in parallel.
+        wrapper_codes = list(executor.map(
+            _generate_wrapper_code, funcs, repeat(conf)))
+
+        # List of the 0-based indices of all callables requiring wrappers.
+        funcs_index = [
+            func_index
+            for func_index, wrapper_code in enumerate(wrapper_codes)
+            if wrapper_code is not None
+        ]
+
+        # If this interpreter is guarded by a GIL, compile the code for all
+        # wrappers in this thread with a single call to compile(), as
+        # parallelizing that call would only induce contention.
+        if is_python_gil_enabled():
+            funcs_wrapper = _compile_wrapper_codes(
+                funcs, wrapper_codes, funcs_index)
+        # Else, this interpreter is free-threaded. In this case, partition
+        # these indices into one chunk per worker and compile the code for all
+        # wrappers of each chunk in parallel.
+        else:
+            # List of these chunks, striding these indices across chunks to
+            # balance the total length of code compiled by each worker.
+            funcs_index_chunks = [
+                funcs_index[chunk_index::workers]
+                for chunk_index in range(workers)
+            ]
+
+            # Compile the code for all wrappers of each chunk in parallel.
+            funcs_wrapper_chunks = executor.map(
+                _compile_wrapper_codes,
+                repeat(funcs),
+                repeat(wrapper_codes),
+                funcs_index_chunks,
+            )
+
+            # Flatten these chunks of indices and wrappers in the same order.
+            funcs_index = [
+                func_index
+                for funcs_index_chunk in funcs_index_chunks
+                for func_index in funcs_index_chunk
+            ]
+            funcs_wrapper = [
+                func_wrapper
+                for funcs_wrapper_chunk in funcs_wrapper_chunks
+                for func_wrapper in funcs_wrapper_chunk
+            ]
+
+    # For the 0-based index of each callable requiring a wrapper and that
+    # wrapper, attach that wrapper to that callable in the caller's order.
+    for func_index, func_wrapper in zip(funcs_index, funcs_wrapper):
+        funcs_decorated[func_index] = _attach_wrapper(
+            func=funcs[func_index], func_wrapper=func_wrapper)
+
+    # Return these callables and wrappers.
+    return funcs_decorated
+
+# ....................{ CLEARERS                          }....................
+def clear_protocol_types() -> None:
+    '''
+    Clear the **protocol conformance cache** (i.e., weak sets of the types of
+    all objects previously found to satisfy `PEP 544`_-compliant
+    runtime-checkable protocols), forcing wrapper functions generated by the
+    :func:`beartype` decorator to reinspect the types of *all* objects
+    subsequently type-checked against these protocols.
+
+    These wrappers type-check each object against each such protocol by
+    inspecting the members of the type of that object only on the first call
+    passed an object of that type, caching that type on success. Since this
+    cache is *not* invalidated on class mutation, callers monkey-patching a
+    type previously found to satisfy a protocol to no longer do so (e.g., by
+    deleting a method required by that protocol) should call this function
+    after doing so.
+
+    .. _PEP 544:
+       https://www.python.org/dev/peps/pep-0544
+    '''
+
+    # Protocol conformance cache submodule if previously imported *OR* "None"
+    # otherwise. Since the code generator only imports this submodule on
+    # first generating code type-checking a cacheable protocol, this cache is
+    # necessarily empty if this submodule has yet to be imported. In this
+    # case, silently reduce to a noop rather than needlessly importing it.
+    cacheprotocol = sys_modules.get('beartype._decor._cache.cacheprotocol')
+
+    # If this submodule was previously imported, clear this cache.
+    if cacheprotocol is not None:
+        cacheprotocol.clear_protocol_types()
+
+# ....................{ PRIVATE ~ testers                 }....................
+def _is_wrapper_needed(func: Callable) -> bool:
+    '''
+    ``True`` only if the passed callable is *not* trivially exempt from
+    type-checking and thus requires the :func:`beartype` decorator to generate
+    a wrapper type-checking this callable.
+
+    Note that callables for which this tester returns ``True`` may still
+    require *no* type-checking (e.g., due to being annotated only by
+    ignorable type hints), as detecting that requires generating code.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this callable is annotated, *not* decorated by the
+        :func:`typing.no_type_check` decorator, *and* *not* already a
+        :mod:`beartype`-specific wrapper.
+
+    Raises
+    ----------
+    BeartypeDecorWrappeeException
+        If this callable is either uncallable *or* a class.
+    '''
+
     # Validate the type of the decorated object *BEFORE* performing any work
     # assuming this object to define attributes (e.g., "func.__name__").
     #
@@ -354,10 +670,10 @@ def beartype(func: Callable) -> Callable:
             f'{repr(func)} unsupported, '
             f'as classes currently unsupported by @beartype.'
         )
-    # Else, this object is a non-class callable. Let's do this, folks.
+    # Else, this object is a non-class callable.
 
-    # If either...
-    if (
+    # Return true only if *NONE* of the following apply:
+    return not (
         # This callable is unannotated *OR*...
         not func.__annotations__ or
         # This callable is decorated by the @typing.no_type_check decorator
@@ -366,10 +682,59 @@ def beartype(func: Callable) -> Callable:
         # This callable is a @beartype-specific wrapper previously generated by
         # this decorator...
         hasattr(func, '__beartype_wrapper')
-    ):
-        # Efficiently reduce to a noop (i.e., the identity decorator) by
-        # returning this callable as is.
-        return func
+    )
+
+# ....................{ PRIVATE ~ generators              }....................
+def _generate_wrapper_code(
+    func: Callable,
+    conf: BeartypeConf,
+) -> Optional[Tuple[str, str, tuple, dict]]:
+    '''
+    Generate the raw string of Python statements implementing the wrapper
+    type-checking the passed callable under the passed configuration if this
+    callable requires type-checking *or* ``None`` otherwise.
+
+    This generator performs *all* pure-Python work required to decorate this
+    callable *except* compiling this string into a wrapper function, enabling
+    the :func:`beartype_all` function to generate code for multiple callables
+    in parallel and then compile that code in bulk.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated.
+    conf : BeartypeConf
+        Beartype configuration configuring this decoration.
+
+    Returns
+    ----------
+    Optional[Tuple[str, str, tuple, dict]]
+        Either:
+
+        * If this callable requires *no* type-checking (e.g., due to being
+          unannotated), ``None``.
+        * Else, a 4-tuple ``(func_code, func_wrapper_name,
+          func_wrapper_defaults, local_attrs)``, where:
+
+          * ``func_code`` is the raw string of Python statements declaring
+            this wrapper.
+          * ``func_wrapper_name`` is the name of this wrapper.
+          * ``func_wrapper_defaults`` is the tuple of the default values of
+            all optional positional parameters of this wrapper.
+          * ``local_attrs`` is the dictionary mapping from the names to values
+            of all attributes local to this wrapper, passed as the default
+            values of the keyword-only parameters of this wrapper.
+
+    Raises
+    ----------
+    See the :func:`beartype` decorator for further details.
+    '''
+
+    # If this callable trivially requires *NO* type-checking, efficiently
+    # reduce to a noop by returning "None".
+    if not _is_wrapper_needed(func):
+        return None
+    # Else, this callable is a non-class callable. Let's do this, folks.
 
     #FIXME: Optimize by caching and reusing previously cached "BeartypeData"
     #instances across @beartype decorations. To do so:
@@ -388,35 +753,269 @@ def beartype(func: Callable) -> Callable:
 
     # Previously cached callable metadata reinitialized from this callable.
     func_data = acquire_object_typed(BeartypeData)
-    func_data.reinit(func)
+    func_data.reinit(func, conf)
 
     # Generate the raw string of Python statements implementing this wrapper.
     func_code, is_func_code_noop = generate_code(func_data)
 
     # If this wrapper proxies this callable *WITHOUT* type-checking,
-    # efficiently reduce to a noop (i.e., the identity decorator) by returning
-    # this callable as is.
+    # efficiently reduce to a noop (i.e., the identity decorator) by releasing
+    # this callable metadata back to its object pool and returning "None".
     if is_func_code_noop:
-        return func
+        release_object_typed(func_data)
+        return None
 
-    # Dictionary mapping from local attribute names to values passed to the
-    # module-scoped outermost definition (but *NOT* the actual body) of this
-    # wrapper. Note that:
+    # Dictionary mapping from local attribute names to values passed to this
+    # wrapper as the default values of its keyword-only parameters. Note that:
     #
     # * For efficiency, only attributes specific to the body of this wrapper
     #   are copied from the current namespace. Attributes generically
     #   applicable to the body of all wrappers are instead implicitly imported
     #   from this submodule by passing "_GLOBAL_ATTRS" below.
-    # * For each attribute specified here, one new keyword parameter of the
-    #   form "{local_attr_key_name}={local_attr_key_name}" *MUST* be added to
-    #   the signature for this wrapper defined by the "CODE_SIGNATURE" string.
+    # * For each attribute specified here, one new keyword-only parameter of
+    #   the same name *MUST* be added to the signature for this wrapper
+    #   defined by the "CODE_SIGNATURE" string.
     #
-    # For the above reasons, the *ONLY* attribute that should be passed is the
-    # wrapper-specific "__beartype_func" attribute.
+    # For the above reasons, the *ONLY* attributes that should be passed are
+    # wrapper-specific attributes (e.g., "__beartype_func") *AND* the default
+    # values of keyword-only parameters of this callable mirrored by the
+    # signature of this wrapper.
     local_attrs = {
         ARG_NAME_FUNC: func,
         ARG_NAME_TYPISTRY: bear_typistry,
     }
+    local_attrs.update(func_data.func_wrapper_kwdefaults)
+
+    # If this wrapper type-checks only every N-th call, pass this wrapper a new
+    # call counter specific to this wrapper.
+    if conf.sample_every != 1:
+        local_attrs[ARG_NAME_CALL_COUNTER] = count()
+
+    # Machine-readable name of this wrapper and tuple of the default values
+    # of all optional positional parameters of this wrapper.
+    func_wrapper_name = func_data.func_wrapper_name
+    func_wrapper_defaults = func_data.func_wrapper_defaults
+
+    # Release this callable metadata back to its object pool.
+    release_object_typed(func_data)
+
+    # Return this code and associated metadata.
+    return (func_code, func_wrapper_name, func_wrapper_defaults, local_attrs)
+
+# ....................{ PRIVATE ~ makers                  }....................
+def _make_wrapper(func: Callable, conf: BeartypeConf) -> Callable:
+    '''
+    Wrapper type-checking the passed callable under the passed configuration
+    if this callable requires type-checking *or* this callable as is
+    otherwise, eagerly performing all work required to decorate this callable.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated.
+    conf : BeartypeConf
+        Beartype configuration configuring this decoration.
+
+    Returns
+    ----------
+    Callable
+        Either this wrapper *or* this callable as is.
+
+    Raises
+    ----------
+    See the :func:`beartype` decorator for further details.
+    '''
+
+    # Wrapper code generated for this callable if this callable requires
+    # type-checking *OR* "None" otherwise.
+    wrapper_code = _generate_wrapper_code(func, conf)
+
+    # If this callable requires *NO* type-checking, efficiently reduce to a
+    # noop (i.e., the identity decorator) by returning this callable as is.
+    if wrapper_code is None:
+        return func
+    # Else, this callable requires type-checking.
+
+    # Define, decorate, and return a wrapper type-checking this callable.
+    return _attach_wrapper(func=func, func_wrapper=_exec_wrapper_code(
+        func, *wrapper_code))
+
+
+def _make_lazy_wrapper(func: Callable, conf: BeartypeConf) -> Callable:
+    '''
+    **Trampoline** (i.e., lightweight wrapper deferring all work required to
+    decorate the passed callable to its first call) of the passed callable
+    under the passed configuration if this callable is *not* trivially exempt
+    from type-checking *or* this callable as is otherwise.
+
+    On its first call, this trampoline (in order):
+
+    #. Generates the wrapper type-checking this callable via the
+       :func:`_make_wrapper` function, resolving all `PEP 563`_-postponed
+       annotations on this callable against the *current* global scope of its
+       module and thus permitting those annotations to refer to classes
+       declared after this callable.
+    #. Rebinds the attribute of the module or class declaring this callable
+       to this wrapper if that attribute is still this trampoline, reducing
+       all subsequent calls accessing this callable by that attribute to
+       direct calls of this wrapper.
+    #. Calls this wrapper.
+
+    All subsequent calls to this trampoline (e.g., via references obtained
+    before its first call) directly call this wrapper. Since the code objects
+    of wrappers assume globals differing from those of this trampoline,
+    rebinding the ``__code__`` attribute of this trampoline is infeasible.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated.
+    conf : BeartypeConf
+        Beartype configuration configuring this decoration.
+
+    Returns
+    ----------
+    Callable
+        Either this trampoline *or* this callable as is.
+
+    Raises
+    ----------
+    BeartypeDecorWrappeeException
+        If this callable is either uncallable *or* a class.
+
+    See the :func:`beartype` decorator for all other exceptions, raised by
+    the first call to this trampoline rather than by this function.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # If this callable trivially requires *NO* type-checking, efficiently
+    # reduce to a noop by returning this callable as is.
+    if not _is_wrapper_needed(func):
+        return func
+    # Else, this callable requires a wrapper.
+
+    # Wrapper type-checking this callable if this trampoline has been called
+    # at least once *OR* "None" otherwise.
+    func_wrapper = None
+
+    # Define this trampoline.
+    def func_lazy(*args, **kwargs):
+        nonlocal func_wrapper
+
+        # If this is the first call to this trampoline, generate this wrapper.
+        #
+        # Note that this is technically non-thread-safe, as multiple threads
+        # could concurrently generate multiple wrappers for this callable.
+        # Since each such wrapper is functionally equivalent, this race is
+        # harmless and thus permitted for efficiency.
+        if func_wrapper is None:
+            func_wrapper = _make_wrapper(func, conf)
+
+            # Synchronize the annotations of this trampoline with those of
+            # this callable, which generating this wrapper may have resolved.
+            func_lazy.__annotations__ = func.__annotations__
+
+            # Rebind the attribute declaring this callable to this wrapper.
+            _rebind_lazy_wrapper(func, func_lazy, func_wrapper)
+
+        # Call this wrapper.
+        return func_wrapper(*args, **kwargs)
+
+    # Decorate and return this trampoline.
+    return _attach_wrapper(func=func, func_wrapper=func_lazy)
+
+
+def _rebind_lazy_wrapper(
+    func: Callable, func_lazy: Callable, func_wrapper: Callable) -> None:
+    '''
+    Rebind the attribute of the module or class declaring the passed callable
+    to the passed wrapper if that attribute is the passed trampoline
+    previously created by the :func:`_make_lazy_wrapper` function for this
+    callable *or* silently reduce to a noop otherwise.
+
+    The declarer of this callable is found by resolving the fully-qualified
+    name of this callable against the module declaring this callable. This
+    function thus reduces to a noop for callables declared in local scopes
+    (e.g., closures), aliased under other names, *or* wrapped by other
+    decorators (e.g., :func:`staticmethod`), whose declarers are either
+    inaccessible *or* bind objects other than this trampoline.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable being decorated.
+    func_lazy : Callable
+        Trampoline previously created for this callable.
+    func_wrapper : Callable
+        Wrapper type-checking this callable.
+    '''
+
+    # Module declaring this callable if any *OR* "None" otherwise.
+    func_declarer = sys_modules.get(getattr(func, '__module__', None))  # type: ignore[arg-type]
+
+    # List of the unqualified names of all classes (if any) declaring this
+    # callable and the unqualified name of this callable.
+    func_names = getattr(func, '__qualname__', '').split('.')
+
+    # For the unqualified name of each class declaring this callable, resolve
+    # that class against its declarer.
+    for func_declarer_name in func_names[:-1]:
+        func_declarer = getattr(func_declarer, '__dict__', {}).get(
+            func_declarer_name)
+
+    # Dictionary of the attributes of the declarer of this callable if any
+    # *OR* the empty dictionary otherwise.
+    func_declarer_dict = getattr(func_declarer, '__dict__', {})
+
+    # If the attribute declaring this callable is this trampoline, rebind
+    # that attribute to this wrapper.
+    #
+    # Note that this attribute is tested in the dictionary of this declarer
+    # rather than accessed via getattr(), which would transparently unwrap
+    # descriptors (e.g., "staticmethod" objects) that must be preserved.
+    if func_declarer_dict.get(func_names[-1]) is func_lazy:
+        setattr(func_declarer, func_names[-1], func_wrapper)
+
+
+def _exec_wrapper_code(
+    func: Callable,
+    func_code: str,
+    func_wrapper_name: str,
+    func_wrapper_defaults: tuple,
+    local_attrs: dict,
+) -> Callable:
+    '''
+    Wrapper type-checking the passed callable, defined by dynamically executing
+    the passed raw string of Python statements previously generated by the
+    :func:`_generate_wrapper_code` function for this callable.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated.
+    func_code : str
+        Raw string of Python statements declaring this wrapper.
+    func_wrapper_name : str
+        Name of this wrapper.
+    func_wrapper_defaults : tuple
+        Tuple of the default values of all optional positional parameters of
+        this wrapper.
+    local_attrs : dict
+        Dictionary mapping from the names to default values of all
+        keyword-only parameters of this wrapper.
+
+    Returns
+    ----------
+    Callable
+        This wrapper.
+
+    Raises
+    ----------
+    BeartypeDecorWrapperException
+        If this string fails to declare this wrapper.
+    '''
 
     #FIXME: Uncomment after uncommenting the corresponding logic below.
     # Fully-qualified name of this undecorated callable to be decorated.
@@ -489,6 +1088,9 @@ def beartype(func: Callable) -> Callable:
     #Indeed, see the _make() function of the "makefun.main" submodule:
     #    https://github.com/smarie/python-makefun/blob/master/makefun/main.py
 
+    # Dictionary to which the exec() builtin locally defines this wrapper.
+    func_locals: dict = {}
+
     # Attempt to define this wrapper as a closure of this decorator. For
     # obscure and presumably uninteresting reasons, Python fails to locally
     # declare this closure when the locals() dictionary is passed; to capture
@@ -510,7 +1112,7 @@ def beartype(func: Callable) -> Callable:
     try:
         # print('\n@beartyped {} wrapper:\n\n{}\n'.format(func_data.func_name, func_code))
         # print('\n@beartyped {} wrapper:\n\n{}\n'.format(func_data.func_name, number_lines(func_code)))
-        exec(func_code, _GLOBAL_ATTRS, local_attrs)
+        exec(func_code, _GLOBAL_ATTRS, func_locals)
 
         #FIXME: See above.
         #FIXME: Should "exec" be "single" instead? Does it matter? Is there any
@@ -534,7 +1136,8 @@ def beartype(func: Callable) -> Callable:
     #     SyntaxError: invalid syntax
     except Exception as exception:
         raise BeartypeDecorWrapperException(
-            f'@beartyped {func_data.func_name} wrapper unparseable:\n\n'
+            f'@beartyped {label_callable_decorated(func)} wrapper '
+            f'unparseable:\n\n'
             f'{number_lines(func_code)}'
         ) from exception
 
@@ -544,7 +1147,147 @@ def beartype(func: Callable) -> Callable:
     # dictionary is guaranteed to contain a key with this wrapper's name whose
     # value is this wrapper. Ergo, no additional validation of the existence of
     # this key or type of this wrapper is needed.
-    func_wrapper: Callable = local_attrs[func_data.func_wrapper_name]  # type: ignore[assignment]
+    func_wrapper = func_locals[func_wrapper_name]
+
+    # Default the parameters of this wrapper. Since the "CODE_SIGNATURE"
+    # snippet declares *NO* default values, these values are explicitly set
+    # rather than implicitly evaluated.
+    func_wrapper.__defaults__ = func_wrapper_defaults
+    func_wrapper.__kwdefaults__ = local_attrs
+
+    # Return this wrapper.
+    return func_wrapper  # type: ignore[no-any-return]
+
+
+def _compile_wrapper_codes(
+    funcs: Tuple[Callable, ...],
+    wrapper_codes: List[Optional[Tuple[str, str, tuple, dict]]],
+    funcs_index: List[int],
+) -> List[Callable]:
+    '''
+    List of the wrappers type-checking the callables with the passed 0-based
+    indices of the passed tuple of callables, defined by compiling the code
+    previously generated by the :func:`_generate_wrapper_code` function for
+    these callables with a single call to the :func:`compile` builtin.
+
+    Specifically, this function concatenates the code declaring all of these
+    wrappers into a single module, compiles that module, and defines each of
+    these wrappers from the code object of that wrapper embedded in that
+    module. As with the :func:`_exec_wrapper_code` function, the default
+    values of the parameters of these wrappers are explicitly set rather than
+    implicitly evaluated.
+
+    Parameters
+    ----------
+    funcs : Tuple[Callable, ...]
+        Tuple of all callables being decorated.
+    wrapper_codes : List[Optional[Tuple[str, str, tuple, dict]]]
+        List such that each item is the code generated by the
+        :func:`_generate_wrapper_code` function for the callable at the same
+        0-based index of ``funcs``.
+    funcs_index : List[int]
+        List of the 0-based indices of all callables to be compiled, each of
+        which *must* require type-checking.
+
+    Returns
+    ----------
+    List[Callable]
+        List such that each item is the wrapper type-checking the callable at
+        the index at the same 0-based index of ``funcs_index``.
+
+    Raises
+    ----------
+    BeartypeDecorWrapperException
+        If the code declaring any of these wrappers fails to compile.
+    '''
+
+    # If *NO* callables are to be compiled, silently reduce to a noop.
+    if not funcs_index:
+        return []
+    # Else, one or more callables are to be compiled.
+
+    # Attempt to compile the code declaring all of these wrappers as a module.
+    try:
+        module_codeobj = compile(
+            '\n'.join(
+                wrapper_codes[func_index][0]  # type: ignore[index]
+                for func_index in funcs_index
+            ),
+            '<string>',
+            'exec',
+        )
+    # If doing so fails for any reason, defer to the slower approach of
+    # separately defining each wrapper, which raises a human-readable exception
+    # describing the first such wrapper failing to compile.
+    except Exception:
+        module_codeobj = None
+
+    # List of the code objects of these wrappers in declaration order if this
+    # module was compiled *OR* the empty list otherwise.
+    #
+    # Note that the constants of a module are uniquified in order of first
+    # appearance. Since no two code objects declared at different lines of the
+    # same module compare equal, this list is guaranteed to contain exactly
+    # one code object for each wrapper in declaration order.
+    wrapper_codeobjs = [] if module_codeobj is None else [
+        wrapper_codeobj
+        for wrapper_codeobj in module_codeobj.co_consts
+        if isinstance(wrapper_codeobj, CodeType)
+    ]
+
+    # If this module failed to declare exactly one code object per wrapper,
+    # separately define each wrapper by executing the code declaring that
+    # wrapper.
+    if len(wrapper_codeobjs) != len(funcs_index):
+        return [
+            _exec_wrapper_code(
+                funcs[func_index], *wrapper_codes[func_index])  # type: ignore[misc]
+            for func_index in funcs_index
+        ]
+    # Else, this module declared exactly one code object per wrapper.
+
+    # List of these wrappers to be returned.
+    funcs_wrapper = []
+
+    # For the 0-based index of each callable and the code object of its
+    # wrapper, define this wrapper from this code object.
+    for func_index, wrapper_codeobj in zip(funcs_index, wrapper_codeobjs):
+        # Default values of the positional and keyword-only parameters of
+        # this wrapper.
+        _, _, func_wrapper_defaults, local_attrs = wrapper_codes[func_index]  # type: ignore[misc]
+
+        # Define this wrapper with the same globals as those passed by the
+        # _exec_wrapper_code() function to the exec() builtin.
+        func_wrapper = FunctionType(wrapper_codeobj, _GLOBAL_ATTRS)
+
+        # Default the parameters of this wrapper, as the _exec_wrapper_code()
+        # function does.
+        func_wrapper.__defaults__ = func_wrapper_defaults
+        func_wrapper.__kwdefaults__ = local_attrs
+
+        # Append this wrapper.
+        funcs_wrapper.append(func_wrapper)
+
+    # Return these wrappers.
+    return funcs_wrapper
+
+def _attach_wrapper(func: Callable, func_wrapper: Callable) -> Callable:
+    '''
+    Decorate the passed wrapper as a :mod:`beartype`-specific wrapper of the
+    passed callable and return this wrapper.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated.
+    func_wrapper : Callable
+        Wrapper type-checking this callable.
+
+    Returns
+    ----------
+    Callable
+        This wrapper.
+    '''
 
     # Declare this wrapper to be generated by @beartype, which tests for the
     # existence of this attribute above to avoid re-decorating callables
@@ -559,12 +1302,38 @@ def beartype(func: Callable) -> Callable:
     # * "__module__", the fully-qualified name of this function's module.
     functools.update_wrapper(wrapper=func_wrapper, wrapped=func)
 
-    # Release this callable metadata back to its object pool.
-    release_object_typed(func_data)
-
     # Return this wrapper.
     return func_wrapper
 
+# ....................{ PRIVATE ~ getters                 }....................
+@callable_cached
+def _get_beartype_conf_decorator(conf: BeartypeConf) -> Callable:
+    '''
+    Decorator decorating callables by the :func:`beartype` decorator under the
+    passed configuration.
+
+    This getter is memoized for efficiency. Since configurations are
+    self-caching, this getter returns the same decorator for all calls to the
+    :func:`beartype` decorator passed the same configuration but *no* callable.
+
+    Parameters
+    ----------
+    conf : BeartypeConf
+        Beartype configuration configuring the decorator to be returned.
+
+    Returns
+    ----------
+    Callable
+        Decorator decorating callables under this configuration.
+    '''
+
+    # Define a decorator closing over this configuration.
+    def beartype_conf(func: Callable) -> Callable:
+        return beartype(func, conf=conf)
+
+    # Return this decorator.
+    return beartype_conf
+
 # ....................{ OPTIMIZATION                      }....................
 # If the active Python interpreter is either...
 if (
@@ -590,7 +1359,11 @@ if (
 #         return
 #
 # Tragically, Python fails to support module-scoped "return" statements. *sigh*
-    def beartype(func: Callable) -> Callable:
+    def beartype(  # type: ignore[misc]
+        func: Optional[Callable] = None,
+        *,
+        conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+    ) -> Callable:
         '''
         Identity decorator.
 
@@ -599,4 +1372,26 @@ if (
         interpreter at execution time).
         '''
 
+        # If *NO* callable was passed, this decorator was called with only a
+        # configuration. In this case, return this identity decorator itself.
+        if func is None:
+            return beartype
+
         return func
+
+
+    def beartype_all(  # type: ignore[misc]
+        funcs: Iterable[Callable],
+        *,
+        conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+        workers: Optional[int] = None,
+    ) -> List[Callable]:
+        '''
+        Identity bulk decorator.
+
+        This function currently reduces to returning a list of the passed
+        callables as is, as the active Python interpreter is optimized (e.g.,
+        option ``-O`` was passed to this interpreter at execution time).
+        '''
+
+        return list(funcs)
@@ -4,18 +4,18 @@
 # See "LICENSE" for further details.
 
 '''
-**Beartype key pool type** (i.e., object caching class implemented as a
-dictionary of lists of arbitrary objects to be cached, where objects cached to
-the same list are typically of the same type).
+**Beartype key pool types** (i.e., object caching classes implemented as
+dictionaries of lists of arbitrary objects to be cached, where objects cached
+to the same list are typically of the same type).
 
 This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                           }....................
 from beartype.roar import _BeartypeUtilCachedKeyPoolException
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Hashable
-from threading import Lock
+from threading import Lock, local
 from typing import Any, Dict, Union
 
 # ....................{ CLASSES                           }....................
@@ -234,3 +234,245 @@ class KeyPool(object):
 
             # Append this item to the pool associated with this key.
             self._key_to_pool[key].append(item)
+
+
+class ThreadLocalKeyPool(object):
+    '''
+    Thread-safe **thread-local key pool** (i.e., object cache implemented as a
+    thread-local dictionary of lists of arbitrary objects to be cached backed
+    by a lock-free shared dictionary of deques of the same, where objects
+    cached to the same list or deque are typically of the same type).
+
+    This class is a drop-in replacement for the :class:`KeyPool` class. Unlike
+    that class, this class acquires *no* locks. Instead, each thread acquires
+    and releases objects from and to its own **free lists** (i.e., lists of
+    released objects private to that thread), falling back to a **shared
+    pool** (i.e., deques of released objects shared between all threads) only
+    when those free lists are either empty on acquisition *or* full on
+    release. Since:
+
+    * Free lists are only ever accessed by their owning threads, free lists
+      require *no* synchronization.
+    * The :meth:`collections.deque.append` and :meth:`collections.deque.pop`
+      methods are atomic, the shared pool requires *no* synchronization.
+    * The :meth:`dict.setdefault` method is atomic, concurrently creating the
+      same deque of the shared pool from multiple threads safely yields the
+      same deque to all such threads.
+
+    Threads acquiring objects (e.g., by concurrently decorating callables with
+    the :func:`beartype.beartype` decorator) thus never contend with one
+    another, regardless of whether the active Python interpreter is guarded by
+    a Global Interpreter Lock (GIL) or not (e.g., free-threaded CPython).
+
+    Attributes
+    ----------
+    _key_to_pool_shared : dict
+        Dictionary mapping from an **arbitrary key** (i.e., hashable object) to
+        corresponding **shared pool** (i.e., deque of zero or more released
+        objects cached under that key and acquirable by any thread).
+    _pool_item_id_to_is_acquired : dict
+        Dictionary mapping from the unique object identifier of a **pool item**
+        (i.e., arbitrary object cached by this pool) to a boolean that is
+        either ``True`` if that item is currently acquired *or* ``False``
+        otherwise. See the :attr:`KeyPool._pool_item_id_to_is_acquired`
+        attribute for further details.
+    _pool_item_maker : Callable
+        Caller-defined factory callable internally called by the
+        :meth:`acquire` method on attempting to acquire a non-existent object
+        from both an empty free list *and* an empty shared pool. See
+        :meth:`KeyPool.__init__` for further details.
+    _thread_local : local
+        **Thread-local storage** whose ``key_to_pool`` attribute (if defined)
+        is a dictionary mapping from an arbitrary key to corresponding **free
+        list** (i.e., list of zero or more released objects cached under that
+        key and only acquirable by the current thread).
+    '''
+
+    # ..................{ CLASS VARIABLES                   }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently called
+    # @beartype decorations.
+    __slots__ = (
+        '_key_to_pool_shared',
+        '_pool_item_id_to_is_acquired',
+        '_pool_item_maker',
+        '_thread_local',
+    )
+
+    # ..................{ INITIALIZER                       }..................
+    def __init__(
+        self,
+        item_maker: Union[type, Callable],
+    ) -> None:
+        '''
+        Initialize this thread-local key pool with the passed factory callable.
+
+        Parameters
+        ----------
+        item_maker : Union[type, Callable[[Hashable,], Any]]
+            Caller-defined factory callable. See :meth:`KeyPool.__init__` for
+            further details.
+        '''
+        assert callable(item_maker), f'{repr(item_maker)} not callable.'
+
+        # Classify these parameters as instance variables.
+        self._pool_item_maker = item_maker
+
+        # Initialize all remaining instance variables.
+        self._key_to_pool_shared: Dict[Hashable, deque] = {}
+        self._pool_item_id_to_is_acquired: Dict[int, bool] = {}
+        self._thread_local = local()
+
+    # ..................{ PRIVATE ~ getters                 }..................
+    def _get_key_to_pool_local(self) -> Dict[Hashable, list]:
+        '''
+        Dictionary mapping from each arbitrary key to the corresponding free
+        list of the current thread, created on the first call to this method
+        from the current thread.
+        '''
+
+        # Attempt to return this thread's dictionary.
+        try:
+            return self._thread_local.key_to_pool
+        # If this is the first call to this method from this thread, create
+        # and return this thread's dictionary.
+        except AttributeError:
+            key_to_pool_local = self._thread_local.key_to_pool = {}
+            return key_to_pool_local
+
+    # ..................{ METHODS                           }..................
+    def acquire(self, key: Hashable = None) -> object:
+        '''
+        Acquire an arbitrary object associated with the passed **arbitrary
+        key** (i.e., hashable object).
+
+        Specifically, this method (in order):
+
+        #. If the free list of the current thread associated with this key is
+           non-empty, pops and returns the last item of that list.
+        #. Else if the shared pool associated with this key is non-empty, pops
+           and returns the last item of that pool.
+        #. Else, creates and returns a new object by calling the user-defined
+           :meth:`_pool_item_maker` factory callable.
+
+        Parameters
+        ----------
+        key : Optional[HashableType]
+            Hashable object associated with the pool item to be acquired.
+            Defaults to ``None``.
+
+        Returns
+        ----------
+        object
+            Pool item associated with this hashable object.
+
+        Raises
+        ----------
+        TypeError
+            If this key is unhashable and thus *not* a key.
+        '''
+
+        # Free list of the current thread associated with this key if any *OR*
+        # "None" otherwise.
+        #
+        # Note that this statement implicitly raises a "TypeError" exception
+        # if this key is unhashable.
+        pool_local = self._get_key_to_pool_local().get(key)
+
+        # If this free list is non-empty, pop this item from this list.
+        if pool_local:
+            pool_item = pool_local.pop()
+        # Else, this free list is empty.
+        else:
+            # Shared pool associated with this key if any *OR* "None".
+            pool_shared = self._key_to_pool_shared.get(key)
+
+            # Attempt to pop this item from this shared pool. Since another
+            # thread may concurrently empty this pool, this pool is popped
+            # rather than tested for emptiness and then popped.
+            try:
+                pool_item = pool_shared.pop()  # type: ignore[union-attr]
+            # If this shared pool is either undefined or empty, create a new
+            # item associated with this key.
+            except (AttributeError, IndexError):
+                pool_item = self._pool_item_maker(key)
+
+        # Record this item to have now been acquired.
+        self._pool_item_id_to_is_acquired[id(pool_item)] = True
+
+        # Return this item.
+        return pool_item
+
+
+    def release(self, item: object, key: Hashable = None) -> None:
+        '''
+        Release the passed object acquired by a prior call to the
+        :meth:`acquire` method passed the same passed **arbitrary key** (i.e.,
+        hashable object) from any thread.
+
+        Specifically, this method appends this object to the free list of the
+        current thread associated with this key if that list is *not* full
+        (i.e., contains less than :data:`THREAD_LOCAL_POOL_LEN_MAX` items)
+        *or* to the shared pool associated with this key otherwise.
+
+        Parameters
+        ----------
+        item : object
+            Arbitrary object previously associated with this key.
+        key : Optional[HashableType]
+            Hashable object previously associated with this pool item. Defaults
+            to ``None``.
+
+        Raises
+        ----------
+        TypeError
+            If this key is unhashable (i.e. *not* a key).
+        _BeartypeUtilCachedKeyPoolException
+            If this pool item was *not* acquired (i.e., returned by a prior
+            call to the :meth:`acquire` method) and thus ineligible for
+            release.
+        '''
+
+        # Integer uniquely identifying this previously acquired pool item.
+        item_id = id(item)
+
+        # If this item was *NOT* previously acquired, raise an exception.
+        if not self._pool_item_id_to_is_acquired.get(item_id, False):
+            raise _BeartypeUtilCachedKeyPoolException(
+                f'Key pool unacquired item {repr(item)} not releasable.')
+
+        # Record this item to have now been released.
+        self._pool_item_id_to_is_acquired[item_id] = False
+
+        # Dictionary mapping from each key to each free list of this thread.
+        key_to_pool_local = self._get_key_to_pool_local()
+
+        # Free list of the current thread associated with this key if any *OR*
+        # "None" otherwise.
+        pool_local = key_to_pool_local.get(key)
+
+        # If this free list is undefined, define this list as a new list
+        # containing only this item.
+        if pool_local is None:
+            key_to_pool_local[key] = [item]
+        # Else if this free list is *NOT* full, append this item to this list.
+        elif len(pool_local) < THREAD_LOCAL_POOL_LEN_MAX:
+            pool_local.append(item)
+        # Else, this free list is full. In this case, append this item to the
+        # shared pool associated with this key, atomically creating this pool
+        # if needed.
+        else:
+            self._key_to_pool_shared.setdefault(key, deque()).append(item)
+
+# ....................{ CONSTANTS                         }....................
+THREAD_LOCAL_POOL_LEN_MAX = 16
+'''
+Maximum number of released objects cached under the same key by each free list
+of each thread of each :class:`ThreadLocalKeyPool` instance, beyond which
+released objects are cached in the shared pool of that instance instead.
+
+This maximum bounds the number of objects stranded in the free lists of
+threads that release more objects than they subsequently acquire (e.g., worker
+threads releasing objects acquired by other threads), which would otherwise be
+unavailable to other threads.
+'''
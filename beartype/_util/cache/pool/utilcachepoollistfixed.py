@@ -19,7 +19,7 @@ This private submodule is *not* intended for importation by downstream callers.
 #    https://stackoverflow.com/questions/51558015/implementing-efficient-fixed-size-fifo-in-python
 
 # ....................{ IMPORTS                           }....................
-from beartype._util.cache.pool.utilcachepool import KeyPool
+from beartype._util.cache.pool.utilcachepool import ThreadLocalKeyPool
 from beartype._util.text.utiltextrepr import get_object_representation
 from beartype.roar import _BeartypeUtilCachedFixedListException
 from collections.abc import Iterable, Sized
@@ -264,10 +264,11 @@ class FixedList(list):
         return f'Fixed list {get_object_representation(self)}'
 
 # ....................{ SINGLETONS ~ private              }....................
-_fixed_list_pool = KeyPool(item_maker=FixedList)
+_fixed_list_pool = ThreadLocalKeyPool(item_maker=FixedList)
 '''
-Thread-safe **fixed list pool** (i.e., :class:`KeyPool` singleton caching
-previously instantiated :class:`FixedList` instances of various lengths).
+Thread-safe **fixed list pool** (i.e., :class:`ThreadLocalKeyPool` singleton
+caching previously instantiated :class:`FixedList` instances of various
+lengths).
 
 Caveats
 ----------
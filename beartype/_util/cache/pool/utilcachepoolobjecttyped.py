@@ -30,7 +30,7 @@ example:
 '''
 
 # ....................{ IMPORTS                           }....................
-from beartype._util.cache.pool.utilcachepool import KeyPool
+from beartype._util.cache.pool.utilcachepool import ThreadLocalKeyPool
 from beartype.roar import _BeartypeUtilCachedObjectTypedException
 from typing import Any
 
@@ -38,10 +38,11 @@ from typing import Any
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
 # ....................{ SINGLETONS ~ private              }....................
-_object_typed_pool = KeyPool(item_maker=lambda cls: cls())
+_object_typed_pool = ThreadLocalKeyPool(item_maker=lambda cls: cls())
 '''
-Thread-safe **typed object pool** (i.e., :class:`KeyPool` singleton caching
-previously instantiated objects of the same types under those types).
+Thread-safe **typed object pool** (i.e., :class:`ThreadLocalKeyPool`
+singleton caching previously instantiated objects of the same types under those
+types).
 
 Caveats
 ----------
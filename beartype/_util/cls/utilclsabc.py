@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Package-wide **abstract base class (ABC) globals** (i.e., constant global
+variables concerning the standard ABCs declared by the :mod:`collections.abc`
+module and the concrete standard types registered with those ABCs).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+import collections.abc
+from collections import (
+    ChainMap,
+    Counter,
+    OrderedDict,
+    defaultdict,
+    deque,
+)
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ PRIVATE ~ constants               }....................
+_TYPES_CONCRETE = (
+    # Builtin scalar types registered with one or more ABCs (e.g., "int" with
+    # "collections.abc.Hashable").
+    bool,
+    complex,
+    float,
+    int,
+    type(None),
+
+    # Builtin container types.
+    bytearray,
+    bytes,
+    dict,
+    frozenset,
+    list,
+    memoryview,
+    range,
+    set,
+    str,
+    tuple,
+
+    # Builtin dictionary view types.
+    type({}.items()),
+    type({}.keys()),
+    type({}.values()),
+
+    # Builtin iterator types, commonly passed where iterables are expected.
+    type(iter(())),
+    type(iter([])),
+    type(iter('')),
+    type(iter({})),
+    type(iter(range(0))),
+
+    # Standard container types declared by the "collections" module.
+    ChainMap,
+    Counter,
+    OrderedDict,
+    defaultdict,
+    deque,
+)
+'''
+Tuple of all **common concrete standard types** (i.e., builtin types and types
+declared by the :mod:`collections` module frequently passed to callables
+annotated by standard ABCs).
+'''
+
+# ....................{ MAPPINGS                          }....................
+TYPE_ABC_TO_TYPES_CONCRETE = {}
+'''
+Dictionary mapping from each public standard ABC declared by the
+:mod:`collections.abc` module to the frozen set of all common concrete standard
+types that are subclasses of that ABC (e.g., from
+:class:`collections.abc.Sequence` to ``frozenset({list, tuple, str, ...})``).
+
+This dictionary excludes ABCs to which *no* such types are subclasses.
+
+Design
+----------
+This dictionary enables code generated by the :func:`beartype.beartype`
+decorator to test whether an object is an instance of a standard ABC by
+first testing whether the type of that object is one of these concrete types
+*before* deferring to the :func:`isinstance` builtin. Unlike the former,
+the latter calls the :meth:`abc.ABCMeta.__instancecheck__` dunder method
+and is thus several times slower than a constant-time set membership test.
+
+This dictionary is safely computable once at importation time, as ABC
+registration is append-only. Once a type has been registered with an ABC,
+that type cannot be subsequently unregistered from that ABC. Ergo, if a type
+is a subclass of an ABC at importation time, that type remains a subclass of
+that ABC for the lifetime of the active Python interpreter.
+'''
+
+
+# For the unqualified name of each public attribute of the standard
+# "collections.abc" module...
+for _type_abc_name in collections.abc.__all__:
+    # This attribute if directly defined by that module *OR* "None" otherwise
+    # (e.g., if this attribute is a deprecated ABC only dynamically defined by
+    # a module-scoped __getattr__() dunder function emitting a warning).
+    _type_abc = vars(collections.abc).get(_type_abc_name)
+
+    # If this attribute is *NOT* a class, silently skip to the next.
+    if not isinstance(_type_abc, type):
+        continue
+
+    # Frozen set of all concrete types that are subclasses of this ABC.
+    _types_concrete = frozenset(
+        type_concrete
+        for type_concrete in _TYPES_CONCRETE
+        if issubclass(type_concrete, _type_abc)
+    )
+
+    # If one or more concrete types are subclasses of this ABC, map this ABC
+    # to this set.
+    if _types_concrete:
+        TYPE_ABC_TO_TYPES_CONCRETE[_type_abc] = _types_concrete
+
+# Delete all temporary variables declared above to avoid polluting this
+# submodule's namespace.
+del _type_abc, _type_abc_name, _types_concrete
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Package-wide **record class utilities** (i.e., callables introspecting
+**records,** classes whose instances declare a fixed set of annotated fields,
+including both :class:`typing.NamedTuple` subclasses and classes decorated by
+the :func:`dataclasses.dataclass` decorator).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from typing import Tuple, get_type_hints
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ TESTERS                           }....................
+def is_type_record(cls: type) -> bool:
+    '''
+    ``True`` only if the passed class is a **record** (i.e., either a
+    :class:`typing.NamedTuple` subclass *or* a class decorated by the
+    :func:`dataclasses.dataclass` decorator).
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    cls : type
+        Class to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this class is a record.
+    '''
+    assert isinstance(cls, type), f'{repr(cls)} not class.'
+
+    # Return true only if this class is either...
+    return (
+        # A dataclass *OR*...
+        hasattr(cls, '__dataclass_fields__') or
+        # A "typing.NamedTuple" subclass. Since "typing.NamedTuple" is merely a
+        # factory function under Python < 3.9 rather than an actual class, this
+        # test duck-types the attributes of tuple subclasses created by that
+        # factory. Note that tuple subclasses created by the untyped
+        # "collections.namedtuple" factory declare no "__annotations__" and
+        # are thus intentionally *NOT* considered to be records.
+        (
+            issubclass(cls, tuple) and
+            hasattr(cls, '_fields') and
+            hasattr(cls, '__annotations__')
+        )
+    )
+
+# ....................{ GETTERS                           }....................
+def get_type_record_field_hints(cls: type) -> Tuple[Tuple[str, object], ...]:
+    '''
+    Tuple of 2-tuples ``(field_name, field_hint)`` describing each annotated
+    field of the passed record in declaration order, where:
+
+    * ``field_name`` is the name of this field.
+    * ``field_hint`` is the type hint annotating this field, resolved from a
+      postponed string hint into the object this hint refers to where feasible.
+
+    Parameters
+    ----------
+    cls : type
+        Record to be inspected, assumed to satisfy the :func:`is_type_record`
+        tester.
+
+    Returns
+    ----------
+    Tuple[Tuple[str, object], ...]
+        Tuple of all annotated fields of this record.
+    '''
+    assert isinstance(cls, type), f'{repr(cls)} not class.'
+
+    # Dictionary mapping from the name to hint of each field of this record,
+    # resolving postponed hints if feasible. Since resolving these hints
+    # requires evaluating arbitrary expressions (e.g., forward references to
+    # classes that have yet to be defined), silently fallback to the
+    # unresolved hints on failure.
+    try:
+        field_name_to_hint = get_type_hints(cls)
+    except Exception:
+        field_name_to_hint = getattr(cls, '__annotations__', {})
+
+    # Tuple of the names of all fields of this record.
+    field_names: Tuple[str, ...] = None  # type: ignore[assignment]
+
+    # If this record is a dataclass, defer to the standard API introspecting
+    # dataclass fields, which excludes pseudo-fields annotated by either the
+    # "typing.ClassVar" or "dataclasses.InitVar" type hints.
+    if hasattr(cls, '__dataclass_fields__'):
+        # Avoid importing this module unless required.
+        from dataclasses import fields
+        field_names = tuple(field.name for field in fields(cls))
+    # Else, this record is a "typing.NamedTuple" subclass.
+    else:
+        field_names = cls._fields  # type: ignore[attr-defined]
+
+    # Return a tuple of the names and hints of all annotated fields.
+    return tuple(
+        (field_name, field_name_to_hint[field_name])
+        for field_name in field_names
+        if field_name in field_name_to_hint
+    )
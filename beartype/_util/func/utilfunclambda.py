@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype lambda function utilities.**
+
+This private submodule implements utility functions dynamically introspecting
+the source code of **lambda functions** (i.e., pure-Python functions declared
+by ``lambda`` expressions), enabling callers to inline the bodies of these
+functions into dynamically generated code.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+import ast, builtins
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.func.utilfunccodeobj import get_func_codeobj_or_none
+from collections.abc import Callable
+from inspect import getsource
+from types import FunctionType
+from typing import Optional
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ PRIVATE ~ constants               }....................
+_LAMBDA_NAME = (lambda: None).__name__
+'''
+Name of all lambda functions (i.e., ``"<lambda>"``).
+'''
+
+
+_LAMBDA_SOURCE_END_CHARS = frozenset(',)]}\n')
+'''
+Frozen set of all characters possibly terminating the source code of a lambda
+expression embedded in a larger line of source code.
+'''
+
+
+_AST_NODE_TYPES_SCOPED = tuple(
+    getattr(ast, ast_node_type_name)
+    for ast_node_type_name in (
+        'Lambda',
+        'ListComp',
+        'SetComp',
+        'DictComp',
+        'GeneratorExp',
+        'NamedExpr',
+        'Await',
+        'Yield',
+        'YieldFrom',
+    )
+    if hasattr(ast, ast_node_type_name)
+)
+'''
+Tuple of all types of abstract syntax tree (AST) nodes either introducing a new
+scope *or* binding a new name, whose presence in the body of a lambda function
+prohibits that body from being safely inlined into another scope.
+'''
+
+# ....................{ TESTERS                           }....................
+def is_func_lambda(func: object) -> bool:
+    '''
+    ``True`` only if the passed object is a **lambda function** (i.e.,
+    pure-Python function declared by a ``lambda`` expression).
+
+    Parameters
+    ----------
+    func : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object is a lambda function.
+    '''
+
+    # Return true only if this object is a pure-Python function named
+    # "<lambda>".
+    return isinstance(func, FunctionType) and func.__name__ == _LAMBDA_NAME
+
+# ....................{ GETTERS                           }....................
+@callable_cached
+def get_func_lambda_node_or_none(func: Callable) -> 'Optional[ast.Lambda]':
+    '''
+    **Abstract syntax tree (AST) node** (i.e., :class:`ast.Lambda` instance)
+    declaring the passed lambda function if the source code declaring this
+    lambda function is both accessible *and* unambiguous *or* ``None``
+    otherwise.
+
+    This getter parses the lines of source code declaring this lambda function
+    for ``lambda`` expressions whose compiled bytecode is identical to that of
+    this function, returning ``None`` if either:
+
+    * This source code is inaccessible (e.g., due to this function having been
+      declared interactively or by the :func:`exec` builtin).
+    * This source code declares *no* such expression.
+    * This source code declares two or more such expressions that differ.
+
+    This getter is memoized for efficiency, as parsing source code is
+    considerably slower than most introspection. Callers should *not* modify
+    the returned node in-place.
+
+    Parameters
+    ----------
+    func : Callable
+        Lambda function to be inspected.
+
+    Returns
+    ----------
+    Optional[ast.Lambda]
+        Either:
+
+        * If the source code declaring this function is accessible and
+          unambiguous, the AST node declaring this function.
+        * Else, ``None``.
+    '''
+
+    # Code object underlying this function if any *OR* "None" otherwise.
+    func_codeobj = get_func_codeobj_or_none(func)
+
+    # If this function is *NOT* a pure-Python lambda function, return "None".
+    if func_codeobj is None or not is_func_lambda(func):
+        return None
+    # Else, this function is a pure-Python lambda function.
+
+    # Attempt to retrieve the lines of source code declaring this function.
+    try:
+        func_source = getsource(func)
+    # If these lines are inaccessible, return "None".
+    except (OSError, TypeError):
+        return None
+
+    # AST node declaring this function if found *OR* "None" otherwise.
+    func_node = None
+
+    # 0-based index of the first character of the next "lambda" expression
+    # embedded in these lines if any *OR* -1 otherwise.
+    lambda_start = func_source.find('lambda')
+
+    # While these lines embed one or more unvisited "lambda" substrings...
+    while lambda_start != -1:
+        # Parse the shortest substring of these lines starting at this
+        # substring that is a syntactically valid lambda expression.
+        lambda_node = _get_lambda_node_or_none(func_source, lambda_start)
+
+        # If this substring is a lambda expression compiling to the same
+        # bytecode as this function...
+        if lambda_node is not None and _is_lambda_node_func(
+            lambda_node, func_codeobj):
+            # If a prior lambda expression also compiled to the same bytecode
+            # but differs from this expression, this source code is ambiguous.
+            # In this case, return "None".
+            if func_node is not None and (
+                ast.dump(func_node) != ast.dump(lambda_node)):
+                return None
+            # Else, this is the first such expression.
+
+            func_node = lambda_node
+
+        # Find the next "lambda" substring embedded in these lines.
+        lambda_start = func_source.find('lambda', lambda_start + 1)
+
+    # Return this AST node if found *OR* "None" otherwise.
+    return func_node
+
+
+def get_func_lambda_source_or_none(func: Callable) -> Optional[str]:
+    '''
+    Source code declaring the passed lambda function if accessible and
+    unambiguous *or* ``None`` otherwise.
+
+    Parameters
+    ----------
+    func : Callable
+        Lambda function to be inspected.
+
+    Returns
+    ----------
+    Optional[str]
+        Either:
+
+        * If the source code declaring this function is accessible and
+          unambiguous *and* the active Python interpreter is able to unparse
+          AST nodes back into source code (i.e., targets Python >= 3.9), that
+          code.
+        * Else, ``None``.
+    '''
+
+    # AST node declaring this function if accessible *OR* "None" otherwise.
+    func_node = get_func_lambda_node_or_none(func)
+
+    # Return either this node unparsed back into source code if possible *OR*
+    # "None" otherwise.
+    return (
+        ast.unparse(func_node)
+        if func_node is not None and hasattr(ast, 'unparse') else
+        None
+    )
+
+
+def get_func_lambda_expr_or_none(
+    func: Callable, arg_name: str, builtins_name: str) -> Optional[str]:
+    '''
+    Python expression semantically equivalent to the body of the passed lambda
+    function when inlined into another scope if that body is safely inlinable
+    *or* ``None`` otherwise.
+
+    The body of a lambda function is safely inlinable only if:
+
+    * That function accepts exactly one mandatory positional parameter.
+    * That body references no names other than that parameter and builtins
+      *not* shadowed by the global scope declaring that function (e.g.,
+      ``lambda text: len(text) > 0`` but *not* ``lambda text: text in WORDS``).
+    * That body neither introduces a new scope nor binds a new name (e.g., by
+      nested lambda functions, comprehensions, or assignment expressions).
+
+    Parameters
+    ----------
+    func : Callable
+        Lambda function to be inspected.
+    arg_name : str
+        Python expression to replace each reference to the parameter accepted
+        by this function with in the returned expression.
+    builtins_name : str
+        Name of the variable referring to the :mod:`builtins` module in the
+        scope this expression is inlined into. To avoid shadowing by local
+        variables of that scope, each reference to a builtin in this expression
+        is replaced by an attribute access of this variable.
+
+    Returns
+    ----------
+    Optional[str]
+        Either:
+
+        * If the body of this function is safely inlinable, this expression.
+        * Else, ``None``.
+    '''
+    assert isinstance(arg_name, str), f'{repr(arg_name)} not string.'
+    assert isinstance(builtins_name, str), f'{repr(builtins_name)} not string.'
+
+    # AST node declaring this function if accessible *OR* "None" otherwise.
+    func_node = get_func_lambda_node_or_none(func)
+
+    # If either this node is inaccessible *OR* the active Python interpreter
+    # is unable to unparse AST nodes back into source code (i.e., targets
+    # Python < 3.9), return "None".
+    if func_node is None or not hasattr(ast, 'unparse'):
+        return None
+    # Else, this node is accessible and unparsable.
+
+    # Arguments accepted by this function.
+    func_args = func_node.args
+
+    # If this function accepts anything other than exactly one mandatory
+    # positional parameter, return "None".
+    if (
+        len(func_args.args) != 1 or
+        func_args.posonlyargs or
+        func_args.kwonlyargs or
+        func_args.vararg or
+        func_args.kwarg or
+        func_args.defaults
+    ):
+        return None
+    # Else, this function accepts exactly one mandatory positional parameter.
+
+    # Name of this parameter.
+    func_arg_name = func_args.args[0].arg
+
+    # AST node declaring the body of this function, copied by reparsing to
+    # avoid modifying the original node in-place below.
+    func_body_node = ast.parse(ast.unparse(func_node.body), mode='eval')
+
+    # If any AST node transitively visitable from this body either introduces
+    # a new scope *OR* binds a new name, return "None".
+    if any(
+        isinstance(node, _AST_NODE_TYPES_SCOPED)
+        for node in ast.walk(func_body_node)
+    ):
+        return None
+    # Else, this body neither introduces a new scope *NOR* binds a new name.
+
+    # Rename all names in this body as documented above.
+    func_body_renamer = _LambdaBodyRenamer(
+        func=func,
+        func_arg_name=func_args.args[0].arg,
+        arg_name=arg_name,
+        builtins_name=builtins_name,
+    )
+    func_body_node = func_body_renamer.visit(func_body_node)
+
+    # If this body references one or more global or closure variables, return
+    # "None".
+    if func_body_renamer.is_uninlinable:
+        return None
+    # Else, this body references *ONLY* this parameter and builtins.
+
+    # Return this body unparsed back into source code, parenthesized to
+    # preserve operator precedence when inlined into a larger expression.
+    return f'({ast.unparse(func_body_node)})'
+
+# ....................{ PRIVATE ~ classes                 }....................
+class _LambdaBodyRenamer(ast.NodeTransformer):
+    '''
+    **Lambda body renamer** (i.e., AST transformer renaming all references to
+    the parameter accepted by a lambda function and to builtins in the body of
+    that function, enabling that body to be inlined into another scope).
+
+    Attributes
+    ----------
+    is_uninlinable : bool
+        ``True`` only if this body references one or more names that are
+        neither this parameter nor unshadowed builtins (e.g., global or closure
+        variables) and is thus *not* safely inlinable.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(
+        self,
+        func: Callable,
+        func_arg_name: str,
+        arg_name: str,
+        builtins_name: str,
+    ) -> None:
+        '''
+        Initialize this renamer.
+
+        Parameters
+        ----------
+        func : Callable
+            Lambda function whose body is to be renamed.
+        func_arg_name : str
+            Name of the parameter accepted by this function.
+        arg_name : str
+            Python expression to replace each reference to this parameter with.
+        builtins_name : str
+            Name of the variable referring to the :mod:`builtins` module.
+        '''
+
+        self._func_globals = func.__globals__  # type: ignore[attr-defined]
+        self._func_arg_name = func_arg_name
+        self._arg_name = arg_name
+        self._builtins_name = builtins_name
+        self.is_uninlinable = False
+
+    # ..................{ VISITORS                          }..................
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+
+        # If this name is this parameter, replace this name accordingly.
+        if node.id == self._func_arg_name:
+            return ast.copy_location(
+                ast.Name(id=self._arg_name, ctx=node.ctx), node)
+        # Else if this name is a builtin *NOT* shadowed by the global scope
+        # declaring this function, access this builtin as an attribute of the
+        # "builtins" module.
+        elif hasattr(builtins, node.id) and node.id not in self._func_globals:
+            return ast.copy_location(ast.Attribute(
+                value=ast.Name(id=self._builtins_name, ctx=ast.Load()),
+                attr=node.id,
+                ctx=node.ctx,
+            ), node)
+
+        # Else, this name is either a global or closure variable.
+        self.is_uninlinable = True
+        return node
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_lambda_node_or_none(
+    source: str, lambda_start: int) -> 'Optional[ast.Lambda]':
+    '''
+    AST node declaring the shortest syntactically valid ``lambda`` expression
+    embedded in the passed source code starting at the passed index if any
+    *or* ``None`` otherwise.
+
+    Parameters
+    ----------
+    source : str
+        Source code to be parsed.
+    lambda_start : int
+        0-based index of the first character of this expression in this code.
+
+    Returns
+    ----------
+    Optional[ast.Lambda]
+        Either:
+
+        * If this code embeds such an expression, the AST node declaring it.
+        * Else, ``None``.
+    '''
+
+    # For each 0-based index of a character possibly terminating this
+    # expression...
+    for lambda_end in range(lambda_start + 1, len(source) + 1):
+        if (
+            lambda_end != len(source) and
+            source[lambda_end] not in _LAMBDA_SOURCE_END_CHARS
+        ):
+            continue
+
+        # Attempt to parse this substring as a lambda expression.
+        try:
+            lambda_node = ast.parse(
+                source[lambda_start:lambda_end].replace('\n', ' '),
+                mode='eval',
+            ).body
+        # If this substring is syntactically invalid, continue to the next.
+        except SyntaxError:
+            continue
+
+        # Return this node if this substring is a lambda expression *OR*
+        # "None" otherwise (e.g., "lambda" embedded in a string literal).
+        return lambda_node if isinstance(lambda_node, ast.Lambda) else None
+
+    # Else, this code embeds *NO* such expression. Return "None".
+    return None
+
+# ....................{ PRIVATE ~ testers                 }....................
+def _is_lambda_node_func(lambda_node: 'ast.Lambda', func_codeobj) -> bool:
+    '''
+    ``True`` only if the passed AST node declaring a ``lambda`` expression
+    compiles to the same bytecode as the passed code object underlying a
+    lambda function.
+
+    Parameters
+    ----------
+    lambda_node : ast.Lambda
+        AST node to be compiled.
+    func_codeobj : CodeType
+        Code object to be compared against.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this node compiles to this code object.
+    '''
+
+    # Code object underlying the module-scoped expression compiled from this
+    # node, whose constants embed the code object compiled from this lambda.
+    module_codeobj = compile(
+        ast.Expression(body=lambda_node), '<lambda>', 'eval')
+
+    # Return true only if that lambda's code object matches this code object.
+    return any(
+        getattr(const, 'co_code', None) == func_codeobj.co_code and
+        const.co_names == func_codeobj.co_names and
+        const.co_varnames == func_codeobj.co_varnames and
+        const.co_consts == func_codeobj.co_consts
+        for const in module_codeobj.co_consts
+    )
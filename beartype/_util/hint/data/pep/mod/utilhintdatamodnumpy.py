@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :mod:`numpy` **type hint data.**
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._util.utilobject import Iota
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ SIGNS                             }....................
+HINT_NUMPY_SIGN_NDARRAY = Iota()
+'''
+:mod:`numpy`-specific **array sign** (i.e., arbitrary object uniquely
+identifying all subscriptions of the :class:`numpy.ndarray` type, including
+both ``numpy.ndarray[...]`` and ``numpy.typing.NDArray[...]`` type hints).
+
+Since the :mod:`numpy` package is an optional third-party dependency that
+is *not* safely importable at :mod:`beartype` importation time, this sign is
+intentionally a beartype-specific sentinel rather than a :mod:`numpy` object.
+'''
+
+# ....................{ SETS ~ sign : supported           }....................
+HINT_NUMPY_SIGNS_SUPPORTED_DEEP = frozenset((HINT_NUMPY_SIGN_NDARRAY,))
+'''
+Frozen set of all :mod:`numpy`-specific **deeply supported signs** (i.e.,
+arbitrary objects uniquely identifying :mod:`numpy`-specific type hints for
+which the :func:`beartype.beartype` decorator generates deep type-checking
+code).
+'''
@@ -14,7 +14,7 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                           }....................
 import typing
-from beartype.cave import NoneType
+from beartype._cave._cavefast import NoneType
 from beartype._util.py.utilpyversion import (
     IS_PYTHON_3_6,
     IS_PYTHON_AT_LEAST_3_7,
@@ -173,6 +173,35 @@ ignored by the :func:`beartype.beartype` decorator).
 '''
 
 # ....................{ SETS ~ sign : category            }....................
+HINT_PEP484_SIGNS_ITERATOR = frozenset((
+    Generator,
+    Iterable,
+    Iterator,
+))
+'''
+Frozen set of all `PEP 484`_-compliant **iterator signs** (i.e., arbitrary
+objects uniquely identifying `PEP 484`_-compliant type hints whose first
+subscripted type hint argument constrains *all* items yielded by compliant
+iterables, which are only lazily type-checkable as these items are consumed).
+
+.. _PEP 484:
+    https://www.python.org/dev/peps/pep-0484
+'''
+
+
+HINT_PEP484_SIGNS_SEQUENCE_ENDS = frozenset((Deque,))
+'''
+Frozen set of all `PEP 484`_-compliant **end-indexable sequence signs** (i.e.,
+arbitrary objects uniquely identifying `PEP 484`_-compliant type hints
+accepting exactly one subscripted type hint argument constraining *all* items
+of compliant sequences, which guarantee ``O(1)`` indexation of only their
+first and last items).
+
+.. _PEP 484:
+    https://www.python.org/dev/peps/pep-0484
+'''
+
+
 HINT_PEP484_SIGNS_SEQUENCE_STANDARD = frozenset((
     List,
     MutableSequence,
@@ -248,6 +277,7 @@ hints *not* originating from a non-:mod:`typing` origin type for which the
 
 
 HINT_PEP484_SIGNS_SUPPORTED_DEEP = frozenset((
+    Deque,
     Generic,
     List,
     MutableSequence,
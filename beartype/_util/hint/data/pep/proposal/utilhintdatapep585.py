@@ -57,6 +57,31 @@ type hints).
 '''
 
 # ....................{ SETS ~ sign : category            }....................
+HINT_PEP585_SIGNS_ITERATOR: FrozenSet[Any] = frozenset()
+'''
+Frozen set of all `PEP 585`_-compliant **iterator signs** (i.e., arbitrary
+objects uniquely identifying `PEP 585`_-compliant type hints whose first
+subscripted type hint argument constrains *all* items yielded by compliant
+iterables, which are only lazily type-checkable as these items are consumed).
+
+.. _PEP 585:
+    https://www.python.org/dev/peps/pep-0585
+'''
+
+
+HINT_PEP585_SIGNS_SEQUENCE_ENDS: FrozenSet[Any] = frozenset()
+'''
+Frozen set of all `PEP 585`_-compliant **end-indexable sequence signs** (i.e.,
+arbitrary objects uniquely identifying `PEP 585`_-compliant type hints
+accepting exactly one subscripted type hint argument constraining *all* items
+of compliant sequences, which guarantee ``O(1)`` indexation of only their
+first and last items).
+
+.. _PEP 585:
+    https://www.python.org/dev/peps/pep-0585
+'''
+
+
 HINT_PEP585_SIGNS_SEQUENCE_STANDARD: FrozenSet[Any] = frozenset()
 '''
 Frozen set of all `PEP 585`_-compliant **standard sequence signs** (i.e.,
@@ -141,6 +166,8 @@ def _init() -> None:
     # ..................{ GLOBALS                           }..................
     # Submodule globals to be redefined below.
     global \
+        HINT_PEP585_SIGNS_ITERATOR, \
+        HINT_PEP585_SIGNS_SEQUENCE_ENDS, \
         HINT_PEP585_SIGNS_SEQUENCE_STANDARD, \
         HINT_PEP585_SIGNS_SUPPORTED_DEEP, \
         HINT_PEP585_SIGNS_TUPLE, \
@@ -148,6 +175,7 @@ def _init() -> None:
 
     # ..................{ SETS ~ sign                       }..................
     HINT_PEP585_SIGNS_SUPPORTED_DEEP = frozenset((
+        deque,
         list,
         tuple,
         ByteString,
@@ -196,6 +224,12 @@ def _init() -> None:
     ))
 
     # ..................{ SETS ~ sign : category            }..................
+    HINT_PEP585_SIGNS_ITERATOR = frozenset((
+        Generator,
+        Iterable,
+        Iterator,
+    ))
+    HINT_PEP585_SIGNS_SEQUENCE_ENDS = frozenset((deque,))
     HINT_PEP585_SIGNS_SEQUENCE_STANDARD = frozenset((
         list,
         ByteString,
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype `PEP 589`_**-compliant type hint data.**
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 589:
+    https://www.python.org/dev/peps/pep-0589
+'''
+
+# ....................{ IMPORTS                           }....................
+import typing
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ SIGNS                             }....................
+HINT_PEP589_SIGN_TYPEDDICT = (
+    typing.TypedDict  # type: ignore[attr-defined]
+    if IS_PYTHON_AT_LEAST_3_8 else
+    None
+)
+'''
+`PEP 589`_-compliant **typed dictionary sign** (i.e., arbitrary object uniquely
+identifying all :class:`typing.TypedDict` subclasses) if the active Python
+interpreter targets at least Python >= 3.8 and thus supports `PEP 589`_ *or*
+``None`` otherwise.
+
+.. _PEP 589:
+    https://www.python.org/dev/peps/pep-0589
+'''
+
+# ....................{ SETS ~ sign : supported           }....................
+HINT_PEP589_SIGNS_SUPPORTED_DEEP = frozenset(
+    (HINT_PEP589_SIGN_TYPEDDICT,)
+    if IS_PYTHON_AT_LEAST_3_8 else
+    ()
+)
+'''
+Frozen set of all `PEP 589`_-compliant **deeply supported signs** (i.e.,
+arbitrary objects uniquely identifying `PEP 589`_-compliant type hints for
+which the :func:`beartype.beartype` decorator generates deep type-checking
+code).
+
+.. _PEP 589:
+    https://www.python.org/dev/peps/pep-0589
+'''
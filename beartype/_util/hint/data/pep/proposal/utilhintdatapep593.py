@@ -19,9 +19,25 @@ from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
+# ....................{ SIGNS                             }....................
+HINT_PEP593_SIGN_ANNOTATED = (
+    typing.Annotated  # type: ignore[attr-defined]
+    if IS_PYTHON_AT_LEAST_3_9 else
+    None
+)
+'''
+`PEP 593`_-compliant **type metahint sign** (i.e., arbitrary object uniquely
+identifying all subscriptions of the :attr:`typing.Annotated` singleton) if
+the active Python interpreter targets at least Python >= 3.9 and thus supports
+`PEP 593`_ *or* ``None`` otherwise.
+
+.. _PEP 593:
+    https://www.python.org/dev/peps/pep-0593
+'''
+
 # ....................{ SETS ~ sign : supported           }....................
 HINT_PEP593_SIGNS_SUPPORTED_DEEP = frozenset(
-    (typing.Annotated,)  # type: ignore[attr-defined]
+    (HINT_PEP593_SIGN_ANNOTATED,)
     if IS_PYTHON_AT_LEAST_3_9 else
     ()
 )
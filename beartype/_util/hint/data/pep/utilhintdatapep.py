@@ -27,6 +27,8 @@ This private submodule is *not* intended for importation by downstream callers.
 from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_SIGNS_DEPRECATED,
     HINT_PEP484_SIGNS_IGNORABLE,
+    HINT_PEP484_SIGNS_ITERATOR,
+    HINT_PEP484_SIGNS_SEQUENCE_ENDS,
     HINT_PEP484_SIGNS_SEQUENCE_STANDARD,
     HINT_PEP484_SIGNS_SUPPORTED_DEEP,
     HINT_PEP484_SIGNS_SUPPORTED_SHALLOW,
@@ -39,14 +41,22 @@ from beartype._util.hint.data.pep.proposal.utilhintdatapep544 import (
     HINT_PEP544_SIGNS_SUPPORTED_DEEP,
 )
 from beartype._util.hint.data.pep.proposal.utilhintdatapep585 import (
+    HINT_PEP585_SIGNS_ITERATOR,
+    HINT_PEP585_SIGNS_SEQUENCE_ENDS,
     HINT_PEP585_SIGNS_SEQUENCE_STANDARD,
     HINT_PEP585_SIGNS_SUPPORTED_DEEP,
     HINT_PEP585_SIGNS_TUPLE,
     HINT_PEP585_SIGNS_TYPE,
 )
+from beartype._util.hint.data.pep.proposal.utilhintdatapep589 import (
+    HINT_PEP589_SIGNS_SUPPORTED_DEEP,
+)
 from beartype._util.hint.data.pep.proposal.utilhintdatapep593 import (
     HINT_PEP593_SIGNS_SUPPORTED_DEEP,
 )
+from beartype._util.hint.data.pep.mod.utilhintdatamodnumpy import (
+    HINT_NUMPY_SIGNS_SUPPORTED_DEEP,
+)
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -78,6 +88,44 @@ See Also
 '''
 
 # ....................{ SETS ~ category                   }....................
+HINT_PEP_SIGNS_ITERATOR = (
+    HINT_PEP484_SIGNS_ITERATOR |
+    HINT_PEP585_SIGNS_ITERATOR
+)
+'''
+Frozen set of all **iterator signs** (i.e., arbitrary objects uniquely
+identifying PEP-compliant type hints whose first subscripted type hint argument
+constrains *all* items yielded by compliant iterables).
+
+Since iterating an iterable to type-check its items would exhaust one-shot
+iterables (e.g., generators), these items are only type-checkable by proxying
+these iterables under the :attr:`beartype.BeartypeConf.is_proxy_iterators`
+option.
+'''
+
+
+HINT_PEP_SIGNS_SEQUENCE_ENDS = (
+    HINT_PEP484_SIGNS_SEQUENCE_ENDS |
+    HINT_PEP585_SIGNS_SEQUENCE_ENDS
+)
+'''
+Frozen set of all **end-indexable sequence signs** (i.e., arbitrary objects
+uniquely identifying PEP-compliant type hints accepting exactly one subscripted
+type hint argument constraining *all* items of compliant sequences, which
+guarantee ``O(1)`` indexation of only their first and last items).
+
+This set includes the :attr:`typing.Deque` sign, whose compliant objects
+(i.e., :class:`collections.deque` instances) only `guarantee O(n) indexation
+across all sequence items <collections.deque_>`__. Since these objects *do*
+guarantee ``O(1)`` indexation of their first and last items, the
+:func:`beartype.beartype` decorator deeply type-checks these items instead of
+a pseudo-randomly indexed item.
+
+.. _collections.deque:
+   https://docs.python.org/3/library/collections.html#collections.deque
+'''
+
+
 HINT_PEP_SIGNS_SEQUENCE_STANDARD = (
     HINT_PEP484_SIGNS_SEQUENCE_STANDARD |
     HINT_PEP585_SIGNS_SEQUENCE_STANDARD
@@ -106,6 +154,8 @@ This set intentionally excludes the:
      Indexed access is ``O(1)`` at both ends but slows to ``O(n)`` in the
      middle. For fast random access, use lists instead.
 
+  See the :data:`HINT_PEP_SIGNS_SEQUENCE_ENDS` set instead.
+
 * :attr:`typing.NamedTuple` sign, which embeds a variadic number of
   PEP-compliant field type hints and thus requires special-cased handling.
 * :attr:`typing.Text` sign, which accepts *no* subscripted arguments.
@@ -145,7 +195,9 @@ HINT_PEP_SIGNS_SUPPORTED_DEEP = (
     HINT_PEP484_SIGNS_SUPPORTED_DEEP |
     HINT_PEP544_SIGNS_SUPPORTED_DEEP |
     HINT_PEP585_SIGNS_SUPPORTED_DEEP |
-    HINT_PEP593_SIGNS_SUPPORTED_DEEP
+    HINT_PEP589_SIGNS_SUPPORTED_DEEP |
+    HINT_PEP593_SIGNS_SUPPORTED_DEEP |
+    HINT_NUMPY_SIGNS_SUPPORTED_DEEP
 )
 '''
 Frozen set of all **deeply supported signs** (i.e., arbitrary objects uniquely
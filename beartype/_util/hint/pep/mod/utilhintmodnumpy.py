@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :mod:`numpy` **type hint utilities.**
+
+This private submodule is *not* intended for importation by downstream callers.
+
+Caveats
+----------
+**This submodule never imports the optional third-party** :mod:`numpy`
+**package.** Since any type hint subscripting the :class:`numpy.ndarray` type
+implies the caller to have already imported that package, this submodule
+instead inspects the :data:`sys.modules` dictionary for that package. Doing so
+avoids the non-negligible cost of importing :mod:`numpy` when unused.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._util.utilobject import SENTINEL
+from sys import modules as sys_modules
+from typing import Optional
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ TESTERS                           }....................
+def is_hint_numpy_ndarray(hint: object) -> bool:
+    '''
+    ``True`` only if the passed object is a :mod:`numpy`-specific **array type
+    hint** (i.e., subscription of the :class:`numpy.ndarray` type, including
+    ``numpy.typing.NDArray[...]`` type hints).
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object is a :mod:`numpy` array type hint.
+    '''
+
+    # "numpy" package if already imported *OR* "None" otherwise.
+    numpy = sys_modules.get('numpy')
+
+    # Return true only if...
+    return (
+        # The "numpy" package has already been imported *AND*...
+        numpy is not None and
+        # This hint originates from the "numpy.ndarray" type. Since this
+        # package may still be in the midst of being imported, this type is
+        # *NOT* guaranteed to exist yet.
+        getattr(hint, '__origin__', None) is getattr(
+            numpy, 'ndarray', SENTINEL)
+    )
+
+# ....................{ GETTERS                           }....................
+def get_hint_numpy_ndarray_dtype_type_or_none(hint: object) -> Optional[type]:
+    '''
+    **Scalar type** (i.e., subclass of the :class:`numpy.generic` superclass)
+    of all items of all arrays satisfying the passed :mod:`numpy`-specific
+    array type hint if this hint constrains the dtype of these arrays *or*
+    ``None`` otherwise (e.g., if this hint is ``numpy.typing.NDArray`` or
+    ``numpy.ndarray[typing.Any, typing.Any]``).
+
+    Parameters
+    ----------
+    hint : object
+        :mod:`numpy` array type hint to be inspected.
+
+    Returns
+    ----------
+    Optional[type]
+        Either:
+
+        * If this hint is subscripted by a dtype hint subscripted by a proper
+          subclass of the :class:`numpy.generic` superclass (e.g.,
+          ``numpy.float64`` for the hint ``numpy.typing.NDArray[np.float64]``),
+          that subclass.
+        * Else, ``None``.
+    '''
+    assert is_hint_numpy_ndarray(hint), f'{repr(hint)} not NumPy array hint.'
+
+    # "numpy" package, guaranteed to have been imported by the above check.
+    numpy = sys_modules['numpy']
+
+    # Tuple of all arguments subscripting this hint.
+    hint_args = getattr(hint, '__args__', ())
+
+    # If this hint is *NOT* subscripted by both a shape and dtype hint, this
+    # hint constrains *NO* dtype. In this case, return "None".
+    if len(hint_args) != 2:
+        return None
+    # Else, this hint is subscripted by both a shape and dtype hint.
+
+    # Dtype hint subscripting this hint (e.g., "numpy.dtype[numpy.float64]").
+    hint_dtype = hint_args[1]
+
+    # If this dtype hint is *NOT* a subscription of the "numpy.dtype" type
+    # by exactly one argument, this hint constrains *NO* dtype.
+    if getattr(hint_dtype, '__origin__', None) is not numpy.dtype:
+        return None
+    hint_dtype_args = getattr(hint_dtype, '__args__', ())
+    if len(hint_dtype_args) != 1:
+        return None
+    # Else, this dtype hint is subscripted by exactly one argument.
+
+    # Scalar type subscripting this dtype hint.
+    hint_dtype_type = hint_dtype_args[0]
+
+    # Return this scalar type if this type is a proper subclass of the root
+    # "numpy.generic" superclass *OR* "None" otherwise (e.g., if this dtype
+    # hint is subscripted by either "typing.Any" or a type variable, as is
+    # the unsubscripted "numpy.typing.NDArray" alias).
+    return (
+        hint_dtype_type
+        if (
+            isinstance(hint_dtype_type, type) and
+            issubclass(hint_dtype_type, numpy.generic) and
+            hint_dtype_type is not numpy.generic
+        ) else
+        None
+    )
+
+
+def get_hint_numpy_ndarray_ndim_or_none(hint: object) -> Optional[int]:
+    '''
+    **Dimensionality** (i.e., number of dimensions) of all arrays satisfying
+    the passed :mod:`numpy`-specific array type hint if this hint constrains
+    the shape of these arrays to a fixed-length tuple *or* ``None`` otherwise
+    (e.g., if this hint is ``numpy.typing.NDArray[numpy.float64]``, whose shape
+    hint is the variadic ``tuple[typing.Any, ...]``).
+
+    Parameters
+    ----------
+    hint : object
+        :mod:`numpy` array type hint to be inspected.
+
+    Returns
+    ----------
+    Optional[int]
+        Either:
+
+        * If this hint is subscripted by a fixed-length tuple shape hint (e.g.,
+          ``tuple[int, int]`` for the hint
+          ``numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float64]]``),
+          the length of that tuple.
+        * Else, ``None``.
+    '''
+    assert is_hint_numpy_ndarray(hint), f'{repr(hint)} not NumPy array hint.'
+
+    # Tuple of all arguments subscripting this hint.
+    hint_args = getattr(hint, '__args__', ())
+
+    # If this hint is *NOT* subscripted by both a shape and dtype hint, this
+    # hint constrains *NO* shape. In this case, return "None".
+    if len(hint_args) != 2:
+        return None
+    # Else, this hint is subscripted by both a shape and dtype hint.
+
+    # Shape hint subscripting this hint (e.g., "tuple[int, int]").
+    hint_shape = hint_args[0]
+
+    # If this shape hint is *NOT* a tuple hint, this hint constrains *NO*
+    # shape. In this case, return "None".
+    if getattr(hint_shape, '__origin__', None) is not tuple:
+        return None
+    # Else, this shape hint is a tuple hint.
+
+    # Tuple of all arguments subscripting this shape hint.
+    hint_shape_args = getattr(hint_shape, '__args__', ())
+
+    # If this shape hint is the empty tuple hint (e.g., "tuple[()]"), this
+    # hint constrains these arrays to be zero-dimensional. Note that Python <
+    # 3.11 represents this hint as subscripted by the empty tuple, while
+    # Python >= 3.11 represents this hint as subscripted by nothing.
+    if not hint_shape_args or hint_shape_args == ((),):
+        return 0
+    # Else, this shape hint is a non-empty tuple hint.
+    #
+    # If this shape hint is variadic (e.g., "tuple[int, ...]"), this hint
+    # constrains *NO* dimensionality. In this case, return "None".
+    elif hint_shape_args[-1] is Ellipsis:
+        return None
+    # Else, this shape hint is a fixed-length tuple hint.
+
+    # Return the length of this tuple.
+    return len(hint_shape_args)
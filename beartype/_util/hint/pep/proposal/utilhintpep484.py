@@ -13,7 +13,7 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                           }....................
-from beartype.cave import FunctionType
+from beartype._cave._cavefast import FunctionType
 from beartype.roar import (
     BeartypeDecorHintForwardRefException,
     BeartypeDecorHintPep484Exception,
@@ -23,9 +23,12 @@ from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_BASE_FORWARDREF,
     HINT_PEP484_SIGNS_UNION,
 )
-from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_7
+from beartype._util.py.utilpyversion import (
+    IS_PYTHON_AT_LEAST_3_7,
+    IS_PYTHON_AT_LEAST_3_10,
+)
 from beartype._util.utilobject import is_object_subclass
-from typing import Any, Generic, NewType, Optional
+from typing import Any, Generic, NewType, Optional, TypeVar, Union
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -397,6 +400,14 @@ def is_hint_pep484_newtype(hint: object) -> bool:
        https://www.python.org/dev/peps/pep-0484
     '''
 
+    # If the active Python interpreter targets Python >= 3.10, the
+    # typing.NewType() closure factory function is instead a class whose
+    # instances are new types. In this case, return true only if this hint is
+    # an instance of that class.
+    if IS_PYTHON_AT_LEAST_3_10:
+        return isinstance(hint, NewType)  # type: ignore[arg-type]
+    # Else, the active Python interpreter targets Python < 3.10.
+
     # Return true only if...
     return (
         # This hint is a pure-Python function *AND*...
@@ -489,15 +500,20 @@ def get_hint_pep484_forwardref_class_basename(hint: Any) -> str:
     return hint.__forward_arg__
 
 # ....................{ GETTERS ~ newtype                 }....................
+@callable_cached
 def get_hint_pep484_newtype_class(hint: Any) -> type:
     '''
     User-defined class aliased by the passed `PEP 484`_-compliant **new type**
     (i.e., closure created and returned by the :func:`typing.NewType` closure
-    factory function).
+    factory function), transitively resolving **new type chains** (i.e., new
+    types aliasing other new types) to the class ultimately aliased by the
+    last new type in that chain.
 
-    This getter is intentionally *not* memoized (e.g., by the
-    :func:`callable_cached` decorator), as the implementation trivially reduces
-    to an efficient one-liner.
+    This getter is memoized for efficiency. Since new types are commonly
+    aliased by other new types (e.g., ``AdminId = NewType('AdminId',
+    UserId)``) and repeatedly subscript container hints (e.g.,
+    ``Dict[UserId, List[OrderId]]``), memoization reduces each resolution of
+    the same chain after the first to a dictionary lookup.
 
     Parameters
     ----------
@@ -507,7 +523,8 @@ def get_hint_pep484_newtype_class(hint: Any) -> type:
     Returns
     ----------
     type
-        User-defined class aliased by this `PEP 484`_-compliant new type.
+        User-defined class aliased by this `PEP 484`_-compliant new type *or*
+        by the last new type in the chain of new types this new type aliases.
 
     Raises
     ----------
@@ -530,11 +547,143 @@ def get_hint_pep484_newtype_class(hint: Any) -> type:
             f'PEP-compliant type hint {repr(hint)} not "typing.NewType".')
     # Else, this object is a PEP 484-compliant new type hint.
 
-    # Return the unqualified classname referred to by this reference. Note
-    # that this requires violating privacy encapsulation by accessing a dunder
-    # instance variable unique to closures created by the typing.NewType()
-    # closure factory function.
-    return hint.__supertype__
+    # While this hint is a new type, reduce this hint to the class (or new
+    # type) aliased by this new type. Note that this requires violating
+    # privacy encapsulation by accessing a dunder instance variable unique to
+    # closures created by the typing.NewType() closure factory function.
+    while True:
+        hint = hint.__supertype__
+
+        # If this supertype is *NOT* itself a new type, return this supertype.
+        if not is_hint_pep484_newtype(hint):
+            return hint
+        # Else, this supertype is itself a new type. Resolve this new type.
+
+# ....................{ GETTERS ~ typevar                 }....................
+def get_hint_pep484_typevar_bound_or_none(hint: TypeVar) -> object:
+    '''
+    Type hint constraining the passed `PEP 484`_-compliant **type variable**
+    (i.e., :class:`typing.TypeVar` instance) if this variable is either bounded
+    or constrained *or* ``None`` otherwise (i.e., if this variable is
+    unconstrained).
+
+    This getter is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    hint : TypeVar
+        Type variable to be inspected.
+
+    Returns
+    ----------
+    object
+        Either:
+
+        * If this variable is bounded (e.g., ``TypeVar('T', bound=int)``), the
+          upper bound of this variable (e.g., ``int``).
+        * If this variable is constrained (e.g., ``TypeVar('T', int, str)``),
+          the union of these constraints (e.g., ``Union[int, str]``).
+        * Else, ``None``.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+    assert isinstance(hint, TypeVar), f'{repr(hint)} not type variable.'
+
+    # If this variable is constrained, return the union of these constraints.
+    # Note that PEP 484 prohibits type variables from being both bounded and
+    # constrained.
+    if hint.__constraints__:
+        return Union.__getitem__(hint.__constraints__)
+    # Else, this variable is unconstrained.
+
+    # Return the upper bound of this variable if any *OR* "None" otherwise.
+    return hint.__bound__
+
+
+@callable_cached
+def reduce_hint_pep484_typevars(hint: object) -> object:
+    '''
+    Reduce the passed type hint to the equivalent type hint replacing *all*
+    bounded or constrained `PEP 484`_-compliant **type variables** (i.e.,
+    :class:`typing.TypeVar` instances) parametrizing this hint by the type
+    hints constraining these variables, enabling these variables to be
+    type-checked rather than ignored.
+
+    Unconstrained type variables are preserved as is and thus remain
+    ignorable (e.g., ``List[T]`` reduces to ``List[T]`` for the unconstrained
+    type variable ``T = TypeVar('T')``).
+
+    This reducer is memoized for efficiency.
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be reduced.
+
+    Returns
+    ----------
+    object
+        Either:
+
+        * If this hint is itself a bounded or constrained type variable, the
+          type hint constraining this variable (e.g., ``int`` for
+          ``TypeVar('T', bound=int)``).
+        * If this hint is parametrized by one or more bounded or constrained
+          type variables, this hint subscripted by the type hints constraining
+          these variables (e.g., ``List[int]`` for
+          ``List[TypeVar('T', bound=int)]``).
+        * Else, this hint as is.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # If this hint is itself a type variable, return the type hint
+    # constraining this variable if any *OR* this variable as is otherwise.
+    if isinstance(hint, TypeVar):
+        hint_bound = get_hint_pep484_typevar_bound_or_none(hint)
+        return hint if hint_bound is None else hint_bound
+    # Else, this hint is *NOT* a type variable.
+
+    # Tuple of all type variables parametrizing this hint if any *OR* the
+    # empty tuple otherwise.
+    hint_typevars = getattr(hint, '__parameters__', None)
+
+    # If this hint is parametrized by *NO* type variables, return this hint.
+    if not (isinstance(hint_typevars, tuple) and hint_typevars):
+        return hint
+    # Else, this hint is parametrized by one or more type variables.
+
+    # Tuple of the type hints constraining these variables, preserving each
+    # unconstrained variable as is.
+    hint_typevars_bound = tuple(
+        hint_typevar
+        if (
+            not isinstance(hint_typevar, TypeVar) or
+            get_hint_pep484_typevar_bound_or_none(hint_typevar) is None
+        ) else
+        get_hint_pep484_typevar_bound_or_none(hint_typevar)
+        for hint_typevar in hint_typevars
+    )
+
+    # If all of these variables are unconstrained, return this hint.
+    if hint_typevars_bound == hint_typevars:
+        return hint
+    # Else, one or more of these variables are constrained.
+
+    # Attempt to return this hint subscripted by these type hints, replacing
+    # each such variable throughout this hint by the type hint constraining
+    # that variable.
+    try:
+        return hint[hint_typevars_bound]  # type: ignore[index]
+    # If this hint rejects this subscription (e.g., due to being a
+    # user-defined generic overriding the __class_getitem__() dunder method),
+    # silently preserve this hint and thus these variables as is.
+    except TypeError:
+        return hint
 
 # ....................{ GETTERS ~ generic                 }....................
 @callable_cached
@@ -29,7 +29,10 @@ __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 # supports PEP 544, define these functions appropriately.
 if IS_PYTHON_AT_LEAST_3_8:
     # Defer version-dependent imports.
-    from typing import Protocol
+    from typing import (  # type: ignore[attr-defined]
+        Protocol,
+        _get_protocol_attrs,
+    )
 
     def is_hint_pep544_ignorable_or_none(
         hint: object, hint_sign: object) -> Optional[bool]:
@@ -79,6 +82,29 @@ if IS_PYTHON_AT_LEAST_3_8:
         )
 
 
+    def is_hint_pep544_protocol_cacheable(hint: object) -> bool:
+
+        # If this hint is either *NOT* a protocol, a concrete subclass of a
+        # protocol, *OR* a protocol *NOT* decorated by the
+        # @typing.runtime_checkable decorator, return false.
+        if not (
+            is_hint_pep544_protocol(hint) and
+            getattr(hint, '_is_protocol', False) and
+            getattr(hint, '_is_runtime_protocol', False)
+        ):
+            return False
+        # Else, this hint is a runtime-checkable protocol.
+
+        # Return true only if *ALL* members declared by this protocol are
+        # callable. Protocols declaring one or more data members (e.g.,
+        # variables, properties) are satisfied by objects whose instance
+        # variables happen to define these members and thus depend on the
+        # objects rather than the types of those objects.
+        return all(
+            callable(getattr(hint, hint_attr_name, None))
+            for hint_attr_name in _get_protocol_attrs(hint)
+        )
+
 # Else, the active Python interpreter targets at most Python < 3.8 and thus
 # fails to support PEP 544. In this case, fallback to declaring this function
 # to unconditionally return False.
@@ -95,6 +121,10 @@ else:
     def is_hint_pep544_protocol(hint: object) -> bool:
         return False
 
+
+    def is_hint_pep544_protocol_cacheable(hint: object) -> bool:
+        return False
+
 # ....................{ TESTERS ~ doc                     }....................
 is_hint_pep544_ignorable_or_none.__doc__ = '''
     ``True`` only if the passed object is a `PEP 544`_-compliant **ignorable
@@ -207,6 +237,41 @@ is_hint_pep544_protocol.__doc__ = '''
        https://www.python.org/dev/peps/pep-0544
     '''
 
+
+is_hint_pep544_protocol_cacheable.__doc__ = '''
+    ``True`` only if the passed object is a `PEP 544`_-compliant **cacheable
+    protocol** (i.e., subclass of the :class:`typing.Protocol` superclass
+    directly subclassing that superclass, decorated by the
+    :func:`typing.runtime_checkable` decorator, and declaring *only* callable
+    members).
+
+    Whether an object satisfies a cacheable protocol depends *only* on the type
+    of that object rather than that object itself, enabling callers to cache
+    the types of objects satisfying that protocol. Conversely, whether an
+    object satisfies a protocol declaring one or more data members depends on
+    the instance variables of that object and is thus uncacheable.
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as this tester is only called by the
+    memoized
+    :func:`beartype._decor._cache.cacheprotocol.register_protocol_types`
+    registrar.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object is a `PEP 544`_-compliant cacheable
+        protocol.
+
+    .. _PEP 544:
+       https://www.python.org/dev/peps/pep-0544
+    '''
+
 # ....................{ GETTTERS                          }....................
 def get_hint_pep544_io_protocol_from_generic(hint: type) -> type:
     '''
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** `PEP 589`_**-compliant type hint utilities.**
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 589:
+    https://www.python.org/dev/peps/pep-0589
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
+from typing import FrozenSet, Tuple, get_type_hints
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ TESTERS                           }....................
+# If the active Python interpreter targets at least Python >= 3.8 and thus
+# supports PEP 589, define these functions appropriately.
+if IS_PYTHON_AT_LEAST_3_8:
+    def is_hint_pep589(hint: object) -> bool:
+
+        # Return true only if this hint is a dictionary subclass declaring the
+        # dunder attributes declared by all "typing.TypedDict" subclasses.
+        #
+        # Note that "typing.TypedDict" is merely a factory function rather
+        # than an actual class and that the "typing._TypedDictMeta" metaclass
+        # of "typing.TypedDict" subclasses is private and thus fragile. Since
+        # "typing.TypedDict" subclasses are otherwise indistinguishable from
+        # standard dictionary subclasses, this test duck-types the attributes
+        # specific to the former. Happily, this also matches "TypedDict"
+        # subclasses declared by the third-party "typing_extensions" package.
+        return (
+            isinstance(hint, type) and
+            issubclass(hint, dict) and
+            hasattr(hint, '__total__') and
+            hasattr(hint, '__annotations__')
+        )
+# Else, the active Python interpreter targets at most Python < 3.8 and thus
+# fails to support PEP 589. In this case, fallback to defining this function
+# to unconditionally return False.
+else:
+    def is_hint_pep589(hint: object) -> bool:
+        return False
+
+# ....................{ TESTERS ~ doc                     }....................
+# Docstring for these functions regardless of the implementation details above.
+is_hint_pep589.__doc__ = '''
+    ``True`` only if the passed object is a `PEP 589`_-compliant **typed
+    dictionary** (i.e., subclass of the :class:`typing.TypedDict` superclass).
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object is a `PEP 589`_-compliant typed
+        dictionary.
+
+    .. _PEP 589:
+       https://www.python.org/dev/peps/pep-0589
+    '''
+
+# ....................{ GETTERS                           }....................
+def get_hint_pep589_keys_required(hint: type) -> FrozenSet[str]:
+    '''
+    Frozen set of the names of all **required keys** (i.e., keys that *must*
+    be present in every dictionary satisfying this hint) of the passed `PEP
+    589`_-compliant typed dictionary.
+
+    This getter is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner under Python >= 3.9.
+
+    Parameters
+    ----------
+    hint : type
+        Typed dictionary to be inspected, assumed to satisfy the
+        :func:`is_hint_pep589` tester.
+
+    Returns
+    ----------
+    FrozenSet[str]
+        Frozen set of the names of all required keys of this typed dictionary.
+
+    .. _PEP 589:
+       https://www.python.org/dev/peps/pep-0589
+    '''
+    assert is_hint_pep589(hint), f'{repr(hint)} not typed dictionary.'
+
+    # Return either...
+    return (
+        # If this typed dictionary declares the set of all required keys
+        # (as under Python >= 3.9), that set.
+        hint.__required_keys__  # type: ignore[attr-defined]
+        if hasattr(hint, '__required_keys__') else
+        # Else, this typed dictionary only declares whether *ALL* keys are
+        # required (as under Python 3.8). In this case, either the set of all
+        # annotated keys if all keys are required *OR* the empty set.
+        frozenset(hint.__annotations__)
+        if hint.__total__ else  # type: ignore[attr-defined]
+        frozenset()
+    )
+
+
+@callable_cached
+def get_hint_pep589_key_hints(hint: type) -> Tuple[Tuple[str, object], ...]:
+    '''
+    Tuple of 2-tuples ``(key_name, key_hint)`` describing each **unignorable
+    key** (i.e., key annotated by a type hint that is *not* ignorable) of the
+    passed `PEP 589`_-compliant typed dictionary in declaration order, where:
+
+    * ``key_name`` is the name of this key.
+    * ``key_hint`` is the type hint annotating the value of this key, resolved
+      from a postponed string hint into the object this hint refers to where
+      feasible.
+
+    This getter is memoized for efficiency. Since both the code type-checking
+    dictionaries against this typed dictionary *and* the code describing
+    failures of those dictionaries to do so index into this tuple by the same
+    pseudo-random integer, memoization also guarantees these callers to
+    visit the same keys in the same order.
+
+    Parameters
+    ----------
+    hint : type
+        Typed dictionary to be inspected, assumed to satisfy the
+        :func:`is_hint_pep589` tester.
+
+    Returns
+    ----------
+    Tuple[Tuple[str, object], ...]
+        Tuple of all unignorable keys of this typed dictionary.
+
+    .. _PEP 589:
+       https://www.python.org/dev/peps/pep-0589
+    '''
+    assert is_hint_pep589(hint), f'{repr(hint)} not typed dictionary.'
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.utilhinttest import is_hint_ignorable
+
+    # Dictionary mapping from the name to hint of each key of this typed
+    # dictionary, resolving postponed hints if feasible. Since resolving these
+    # hints requires evaluating arbitrary expressions (e.g., forward references
+    # to classes that have yet to be defined), silently fallback to the
+    # unresolved hints on failure.
+    try:
+        key_name_to_hint = get_type_hints(hint)
+    except Exception:
+        key_name_to_hint = hint.__annotations__
+
+    # Return a tuple of the names and hints of all unignorable keys.
+    return tuple(
+        (key_name, key_hint)
+        for key_name, key_hint in key_name_to_hint.items()
+        if not is_hint_ignorable(key_hint)
+    )
@@ -15,7 +15,7 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                           }....................
 from beartype.roar import BeartypeDecorHintPepException
 from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -43,6 +43,25 @@ if IS_PYTHON_AT_LEAST_3_9:
         return repr(hint).startswith('typing.Annotated[')
 
 
+    def is_hint_pep593_beartype(hint: object) -> bool:
+
+        # If this hint is *NOT* a PEP 593-compliant type metahint, return false.
+        if not is_hint_pep593(hint):
+            return False
+        # Else, this hint is a PEP 593-compliant type metahint.
+
+        # Defer heavyweight imports, avoiding increasing the import time of the
+        # "beartype" package for callers never annotating type hints.
+        from beartype.vale._valeis import _SubscriptedIs
+
+        # Return true only if this metahint is subscripted by one or more
+        # beartype validators.
+        return any(
+            isinstance(hint_metadatum, _SubscriptedIs)
+            for hint_metadatum in hint.__metadata__  # type: ignore[attr-defined]
+        )
+
+
     def is_hint_pep593_ignorable_or_none(
         hint: object, hint_sign: object) -> Optional[bool]:
 
@@ -54,8 +73,13 @@ if IS_PYTHON_AT_LEAST_3_9:
         return (
             # If this hint is annotated, true only if the PEP-compliant child
             # type hint annotated by this hint hint is ignorable (e.g., the
-            # "Any" in "Annotated[Any, 50, False]").
-            is_hint_ignorable(get_hint_pep593_hint(hint))
+            # "Any" in "Annotated[Any, 50, False]") *AND* this hint is
+            # subscripted by *NO* beartype validators, which constrain even
+            # ignorable child type hints (e.g., "Annotated[Any, Is[bool]]").
+            (
+                is_hint_ignorable(get_hint_pep593_hint(hint)) and
+                not is_hint_pep593_beartype(hint)
+            )
             if hint_sign is Annotated else
             # Else, "None".
             None
@@ -68,6 +92,10 @@ else:
         return False
 
 
+    def is_hint_pep593_beartype(hint: object) -> bool:
+        return False
+
+
     def is_hint_pep593_ignorable_or_none(
         hint: object, hint_sign: object) -> Optional[bool]:
         return None
@@ -98,6 +126,32 @@ is_hint_pep593.__doc__ = '''
     '''
 
 
+is_hint_pep593_beartype.__doc__ = '''
+    ``True`` only if the passed object is a `PEP 593`_-compliant **beartype
+    type metahint** (i.e., subscription of the :attr:`typing.Annotated`
+    singleton by one or more beartype validators (e.g.,
+    ``beartype.vale.Is[...]``) in addition to arbitrary other metadata).
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object is a `PEP 593`_-compliant beartype type
+        metahint.
+
+    .. _PEP 593:
+       https://www.python.org/dev/peps/pep-0593
+    '''
+
+
 is_hint_pep593_ignorable_or_none.__doc__ = '''
     ``True`` only if the passed object is a `PEP 593`_-compliant **ignorable
     type hint,** ``False`` only if this object is a `PEP 593`_-compliant
@@ -106,7 +160,8 @@ is_hint_pep593_ignorable_or_none.__doc__ = '''
 
     Specifically, this tester function returns ``True`` only if this object is
     the :data:`Annotated` singleton whose first subscripted argument is an
-    ignorable type hints (e.g., ``typing.Annotated[typing.Any, bool]``).
+    ignorable type hints (e.g., ``typing.Annotated[typing.Any, bool]``) *and*
+    whose remaining subscripted arguments are *not* beartype validators.
 
     This tester is intentionally *not* memoized (e.g., by the
     :func:`callable_cached` decorator), as this tester is only safely callable
@@ -136,7 +191,7 @@ is_hint_pep593_ignorable_or_none.__doc__ = '''
        https://www.python.org/dev/peps/pep-0593
     '''
 
-# ....................{ GETTERS ~ newtype                 }....................
+# ....................{ GETTERS                           }....................
 def get_hint_pep593_hint(hint: Any) -> object:
     '''
     PEP-compliant type hint annotated by the passed `PEP 593`_-compliant **type
@@ -194,3 +249,53 @@ def get_hint_pep593_hint(hint: Any) -> object:
     # commonly used to store the origin type of type hints originating from a
     # standard class rather than in a metahint-specific dunder attribute.
     return hint.__origin__
+
+
+def get_hint_pep593_metadata_validators(
+    hint: Any) -> Tuple['beartype.vale._valeis._SubscriptedIs', ...]:
+    '''
+    Tuple of all **beartype validators** (e.g., ``beartype.vale.Is[...]``)
+    subscripting the passed `PEP 593`_-compliant **type metahint** (i.e.,
+    subscription of the :attr:`typing.Annotated` singleton), silently ignoring
+    all other metadata subscripting this metahint.
+
+    This getter is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    Tuple[_SubscriptedIs, ...]
+        Tuple of all beartype validators subscripting this metahint in the
+        same order as these validators subscript this metahint.
+
+    Raises
+    ----------
+    BeartypeDecorHintPepException
+        If this object is *not* a `PEP 593`_-compliant type metahint.
+
+    .. _PEP 593:
+       https://www.python.org/dev/peps/pep-0593
+    '''
+
+    # If this object is *NOT* a PEP 593-compliant type metahint, raise an
+    # exception.
+    if not is_hint_pep593(hint):
+        raise BeartypeDecorHintPepException(
+            f'PEP-compliant type hint {repr(hint)} not "typing.Annotated".')
+    # Else, this object is a PEP 593-compliant type metahint.
+
+    # Defer heavyweight imports. See is_hint_pep593_beartype().
+    from beartype.vale._valeis import _SubscriptedIs
+
+    # Return all beartype validators subscripting this metahint.
+    return tuple(
+        hint_metadatum
+        for hint_metadatum in hint.__metadata__
+        if isinstance(hint_metadatum, _SubscriptedIs)
+    )
@@ -12,13 +12,14 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                           }....................
 import typing
-from beartype.cave import NoneType
+from beartype._cave._cavefast import NoneType
 from beartype.roar import (
     BeartypeDecorHintPepException,
     BeartypeDecorHintPepSignException,
 )
 from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_SEQUENCE_STANDARD,
     HINT_PEP_SIGNS_TYPE,
     HINT_PEP_SIGNS_TYPE_ORIGIN_STDLIB,
 )
@@ -30,16 +31,23 @@ from beartype._util.py.utilpyversion import (
     IS_PYTHON_AT_LEAST_3_9,
 )
 from beartype._util.hint.pep.proposal.utilhintpep484 import (
+    get_hint_pep484_generic_base_erased_from_unerased,
     get_hint_pep484_generic_bases_unerased,
     is_hint_pep484_newtype,
 )
+from beartype._util.hint.data.pep.proposal.utilhintdatapep589 import (
+    HINT_PEP589_SIGN_TYPEDDICT)
+from beartype._util.hint.pep.proposal.utilhintpep589 import is_hint_pep589
+from beartype._util.hint.data.pep.mod.utilhintdatamodnumpy import (
+    HINT_NUMPY_SIGN_NDARRAY)
+from beartype._util.hint.pep.mod.utilhintmodnumpy import is_hint_numpy_ndarray
 from beartype._util.hint.pep.proposal.utilhintpep585 import (
     get_hint_pep585_generic_bases_unerased,
     get_hint_pep585_generic_typevars,
     is_hint_pep585_builtin,
     is_hint_pep585_generic,
 )
-from typing import Any, Generic, NewType, Optional, Tuple, TypeVar
+from typing import Any, Generic, NewType, Optional, Tuple, TypeVar, Union
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -67,6 +75,79 @@ contains a key-value pair mapping from the non-existing :mod:`typing` attribute
 ``ContextManager``.
 '''
 
+
+_HINT_PEP_ORIGIN_TO_SIGN = {}
+'''
+Dictionary mapping from the **origin** (i.e., value of the ``__origin__``
+dunder attribute) of each PEP 484-compliant type hint defined by the
+:mod:`typing` module to the sign uniquely identifying that hint.
+
+This dictionary maps:
+
+* Each origin type of each unsubscripted :mod:`typing` attribute originating
+  from such a type to that attribute (e.g., from :class:`list` to
+  :attr:`typing.List`, from :class:`contextlib.AbstractContextManager` to
+  :attr:`typing.ContextManager`).
+* Each **special form** (i.e., unsubscripted :mod:`typing` attribute that is
+  its own origin when subscripted) to itself (e.g., from
+  :attr:`typing.Literal` to :attr:`typing.Literal`).
+
+This dictionary enables the :func:`get_hint_pep_sign` getter to resolve the
+signs of most PEP 484-compliant type hints with a single lookup rather than
+parsing the machine-readable representations of these hints, which is
+considerably more expensive for large nested hints. Since the origins of hints
+under Python 3.6 are themselves :mod:`typing` attributes rather than origin
+types, this dictionary is effectively unused under Python 3.6.
+'''
+
+
+# For the unqualified name of each public attribute of the "typing" module...
+for _sign_name in typing.__all__:
+    # This attribute if any *OR* "None" otherwise.
+    _sign = getattr(typing, _sign_name, None)
+
+    # Origin type of this attribute if any *OR* "None" otherwise.
+    _sign_origin = getattr(_sign, '__origin__', None)
+
+    # If this attribute originates from an origin type, map that type to this
+    # attribute.
+    if isinstance(_sign_origin, type):
+        _HINT_PEP_ORIGIN_TO_SIGN[_sign_origin] = _sign
+    # Else if this attribute is a special form, map this form to itself.
+    elif isinstance(_sign, type(Union)):
+        _HINT_PEP_ORIGIN_TO_SIGN[_sign] = _sign
+
+# Delete all temporary variables declared above to avoid polluting this
+# submodule's namespace.
+del _sign, _sign_name, _sign_origin
+
+
+_HINT_PEP_TYPE_TO_SIGN = {}
+'''
+Dictionary mapping from the type of each PEP-compliant type hint whose origin
+does *not* uniquely identify that hint to the sign uniquely identifying that
+hint.
+
+This dictionary is principally useful for `PEP 593`_-compliant type metahints,
+whose origins are the arbitrary type hints annotated by these metahints
+(e.g., :class:`list` for ``typing.Annotated[list, 'muh']``) and thus
+indistinguishable from the origins of other hints by the
+:data:`_HINT_PEP_ORIGIN_TO_SIGN` dictionary.
+
+.. _PEP 593:
+   https://www.python.org/dev/peps/pep-0593
+'''
+
+
+# If the active Python interpreter targets at least Python >= 3.9 and thus
+# supports PEP 593, map the type of all PEP 593-compliant type metahints to
+# the "typing.Annotated" attribute.
+if IS_PYTHON_AT_LEAST_3_9:
+    # Defer version-dependent imports.
+    from typing import Annotated  # type: ignore[attr-defined]
+
+    _HINT_PEP_TYPE_TO_SIGN[type(Annotated[int, 0])] = Annotated
+
 # ....................{ GETTERS ~ args                    }....................
 # If the active Python interpreter targets at least Python >= 3.7, implement
 # this function to access the standard "__args__" dunder instance variable.
@@ -310,6 +391,9 @@ def get_hint_pep_sign(hint: Any) -> object:
       (ABC) declared by the :mod:`collections.abc` submodule like
       :class:`collections.abc.Iterable` or :class:`collections.abc.Sequence`),
       :class:`beartype.cave.HintGenericSubscriptedType`.
+    * If this hint is a `PEP 589`_-compliant **typed dictionary** (i.e.,
+      subclass of the :class:`typing.TypedDict` superclass),
+      :class:`typing.TypedDict`.
     * If this hint is a **generic** (i.e., subclasses of the
       :class:`typing.Generic` abstract base class (ABC)),
       :class:`typing.Generic`. Note this includes `PEP 544`-compliant
@@ -386,6 +470,8 @@ def get_hint_pep_sign(hint: Any) -> object:
        https://www.python.org/dev/peps/pep-0484
     .. _PEP 585:
        https://www.python.org/dev/peps/pep-0585
+    .. _PEP 589:
+       https://www.python.org/dev/peps/pep-0589
     '''
 
     # Avoid circular import dependencies.
@@ -414,6 +500,14 @@ def get_hint_pep_sign(hint: Any) -> object:
         return NoneType
     # Else, this hint is *NOT* the PEP 484-compliant "None" singleton.
     #
+    # If this hint is a PEP 589-compliant typed dictionary, return the sign
+    # uniquely identifying these dictionaries. Since typed dictionaries are
+    # classes that may also subclass "typing.Generic", this test is
+    # intentionally performed *BEFORE* testing for both generics and classes.
+    elif is_hint_pep589(hint):
+        return HINT_PEP589_SIGN_TYPEDDICT
+    # Else, this hint is *NOT* a typed dictionary.
+    #
     # If this hint is a PEP-compliant generic (i.e., class
     # superficially subclassing at least one non-class PEP-compliant object),
     # return the "typing.Generic" abstract base class (ABC) generically -- get
@@ -444,6 +538,15 @@ def get_hint_pep_sign(hint: Any) -> object:
         return Generic
     # Else, this hint is *NOT* a generic.
     #
+    # If this hint is a NumPy array type hint (e.g.,
+    # "numpy.typing.NDArray[numpy.float64]"), return the sign uniquely
+    # identifying these hints. Since these hints are PEP 585-compliant type
+    # hints originating from the "numpy.ndarray" type, this test is
+    # intentionally performed *BEFORE* testing for PEP 585-compliant hints.
+    elif is_hint_numpy_ndarray(hint):
+        return HINT_NUMPY_SIGN_NDARRAY
+    # Else, this hint is *NOT* a NumPy array type hint.
+    #
     # If this hint is a PEP 585-compliant type hint, return the origin type
     # originating this hint (e.g., "list" for "list[str]").
     #
@@ -542,8 +645,48 @@ def get_hint_pep_sign(hint: Any) -> object:
     # Gods... this is horrible. Thanks for nuthin', Python 3.6.
     elif IS_PYTHON_3_6 and isinstance(hint, typing._TypeAlias):  # type: ignore[attr-defined]
         return getattr(typing, hint.name)
-    # Else, this hint *MUST* be a standard PEP 484-compliant type hint defined
-    # by the "typing" module.
+    # Else, this hint is *NOT* a Python 3.6-specific type alias.
+
+    # Sign uniquely identifying the type of this hint if any *OR* "None".
+    sign = _HINT_PEP_TYPE_TO_SIGN.get(type(hint))
+
+    # If this type uniquely identifies this hint, return this sign.
+    if sign is not None:
+        return sign
+    # Else, this type does *NOT* uniquely identify this hint.
+
+    # Sign uniquely identifying the origin of this hint if any *OR* "None".
+    #
+    # Note that this is the common case for PEP 484-compliant type hints and
+    # thus tested *BEFORE* falling back to inspecting the representation of
+    # this hint below.
+    sign = _HINT_PEP_ORIGIN_TO_SIGN.get(getattr(hint, '__origin__', None))
+
+    # If this origin uniquely identifies this hint...
+    if sign is not None:
+        # If this hint is a union under Python >= 3.9 subscripted by exactly
+        # two child hints one of which is "NoneType", this hint is
+        # representable as an optional hint (e.g., "Optional[int]" rather
+        # than "Union[int, None]"). In this case, return the "typing.Optional"
+        # attribute for consistency with the representation of this hint.
+        #
+        # Under Python < 3.9, the "typing" module instead always represents
+        # these hints as unions (e.g., "Union[int, NoneType]").
+        if (
+            sign is Union and
+            IS_PYTHON_AT_LEAST_3_9 and
+            len(hint.__args__) == 2 and
+            NoneType in hint.__args__
+        ):
+            return Optional
+
+        # Else, return this sign.
+        return sign
+    # Else, this origin does *NOT* uniquely identify this hint. In this case,
+    # this hint *MUST* be a standard PEP 484-compliant type hint defined by the
+    # "typing" module whose origin is unrecognized (e.g., due to the
+    # idiosyncratic "typing" implementation under Python 3.6). In this cold
+    # fallback...
 
     # Machine-readable string representation of this hint also serving as the
     # fully-qualified name of the public "typing" attribute uniquely associated
@@ -973,6 +1116,170 @@ def get_hint_pep_generic_bases_unerased(hint: object) -> Tuple[object, ...]:
     # Return this tuple of these pseudo-superclasses.
     return hint_pep_generic_bases_unerased
 
+
+@callable_cached
+def get_hint_pep_generic_bases_checkable(hint: object) -> Tuple[object, ...]:
+    '''
+    Tuple of all **checkable pseudo-superclasses** (i.e., unignorable
+    unerased pseudo-superclasses that are *not* actual classes) of the passed
+    PEP-compliant **generic** (i.e., class superficially subclassing at least
+    one non-class PEP-compliant object), against which all objects satisfying
+    this generic are to be deeply type-checked.
+
+    This getter is memoized for efficiency. Since the same generics are
+    commonly visited repeatedly while generating code type-checking different
+    callables, memoization reduces each subsequent call passed the same
+    generic to a dictionary lookup.
+
+    Specifically, this getter:
+
+    * Ignores all pseudo-superclasses that are actual classes. Objects
+      satisfying this generic are necessarily instances of this generic and
+      thus of these superclasses as well.
+    * If this generic is **subscripted** (i.e., indexed by one or more child
+      hints), propagates these child hints to each pseudo-superclass
+      parametrized by the type variables parametrizing this generic (e.g.,
+      from ``MuhList[int]`` to the ``typing.List[T]`` pseudo-superclass of
+      ``class MuhList(typing.List[T])``, producing ``typing.List[int]``).
+    * Reduces each pseudo-superclass that is neither a PEP 585-compliant
+      pseudo-superclass, a :mod:`typing` pseudo-superclass, *nor* itself a
+      generic to the erased superclass originating that pseudo-superclass.
+    * Ignores all pseudo-superclasses that are ignorable after the above
+      reductions (e.g., ``typing.Generic[T]``, ``typing.List[T]`` for
+      unsubscripted generics).
+
+    Parameters
+    ----------
+    hint : object
+        Generic to be inspected, either subscripted or unsubscripted.
+
+    Returns
+    ----------
+    Tuple[object, ...]
+        Tuple of the zero or more checkable pseudo-superclasses of this
+        generic.
+
+    Raises
+    ----------
+    BeartypeDecorHintPepException
+        If this hint is *not* a PEP-compliant generic.
+
+    Examples
+    ----------
+        >>> import typing
+        >>> from beartype._util.hint.pep.utilhintpepget import (
+        ...     get_hint_pep_generic_bases_checkable)
+        >>> T = typing.TypeVar('T')
+        >>> class MuhList(typing.List[T]): pass
+        >>> get_hint_pep_generic_bases_checkable(MuhList)
+        ()
+        >>> get_hint_pep_generic_bases_checkable(MuhList[int])
+        (typing.List[int],)
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.pep.utilhintpeptest import (
+        is_hint_pep,
+        is_hint_pep_generic,
+        is_hint_pep_typing,
+    )
+    from beartype._util.hint.utilhinttest import is_hint_ignorable
+
+    # Unsubscripted generic underlying this possibly subscripted generic.
+    hint_type = get_hint_pep_generic_type_or_none(hint)
+
+    # Dictionary mapping from each type variable parametrizing this generic to
+    # the child hint subscripting this generic in the same position if this
+    # generic is subscripted *OR* the empty dictionary otherwise.
+    typevar_to_hint = {}
+
+    # If this generic is subscripted by as many child hints as this generic is
+    # parametrized by type variables, map these variables to these hints.
+    if hint is not hint_type:
+        # Tuple of all type variables parametrizing this generic. Since PEP
+        # 585-compliant generics declare *NO* "__parameters__" dunder
+        # attribute, these variables are collected from their bases instead.
+        hint_typevars = (
+            get_hint_pep585_generic_typevars(hint_type)
+            if is_hint_pep585_generic(hint_type) else
+            getattr(hint_type, '__parameters__', ())
+        )
+        hint_args = getattr(hint, '__args__', ())
+        if len(hint_typevars) == len(hint_args):
+            typevar_to_hint = dict(zip(hint_typevars, hint_args))
+
+    # List of all checkable pseudo-superclasses of this generic.
+    hint_bases_checkable = []
+
+    # For each unerased pseudo-superclass of this generic...
+    for hint_base in get_hint_pep_generic_bases_unerased(hint_type):
+        # If this pseudo-superclass is an actual class that is *NOT* a
+        # PEP-compliant pseudo-superclass, this class is effectively
+        # ignorable. Why? Because code type-checking this generic already
+        # type-checks each pith against this generic and thus this superclass
+        # as well with a trivial isinstance() call.
+        #
+        # Note that merely testing whether this pseudo-superclass is a class
+        # does *NOT* suffice. Under Python 3.9 and 3.10, subscripted generics
+        # (e.g., "Ozymandias[str]") and PEP 585-compliant pseudo-superclasses
+        # (e.g., "list[int]") are misreported as classes by isinstance().
+        if isinstance(hint_base, type) and not is_hint_pep(hint_base):
+            continue
+        # Else, this pseudo-superclass is *NOT* an actual class.
+
+        # Tuple of all type variables parametrizing this pseudo-superclass.
+        hint_base_typevars = getattr(hint_base, '__parameters__', ())
+
+        # If this generic is subscripted *AND* this pseudo-superclass is
+        # parametrized by one or more type variables, propagate the child
+        # hints subscripting this generic to this pseudo-superclass by
+        # subscripting this pseudo-superclass by these hints. Type variables
+        # parametrizing this pseudo-superclass but *NOT* this generic are
+        # preserved as is.
+        if typevar_to_hint and hint_base_typevars:
+            try:
+                hint_base = hint_base[tuple(
+                    typevar_to_hint.get(hint_base_typevar, hint_base_typevar)
+                    for hint_base_typevar in hint_base_typevars
+                )]
+            # If this pseudo-superclass prohibits subscription by child hints
+            # other than type variables (e.g., "typing.Generic[T]"), preserve
+            # this pseudo-superclass as is.
+            except TypeError:
+                pass
+
+        # If this pseudo-superclass is neither a PEP 585-compliant type hint,
+        # a PEP-compliant type hint defined by the "typing" module, *NOR* a
+        # generic in its own right, reduce this pseudo-superclass to the real
+        # superclass originating this pseudo-superclass. See commentary in
+        # the "beartype._decor._code._pep._pephint" submodule.
+        if not (
+            is_hint_pep585_builtin(hint_base) or
+            is_hint_pep_typing(hint_base) or
+            is_hint_pep_generic(hint_base)
+        ):
+            hint_base = get_hint_pep484_generic_base_erased_from_unerased(
+                hint_base)
+        # Else, this pseudo-superclass is directly type-checkable.
+        #
+        # If this pseudo-superclass is a standard sequence subscripted by
+        # more than one child hint (e.g., "list[S, T]"), which Python
+        # permissively accepts for PEP 585-compliant builtins, reduce this
+        # pseudo-superclass to its unsubscripted origin type.
+        elif (
+            get_hint_pep_sign(hint_base) in HINT_PEP_SIGNS_SEQUENCE_STANDARD and
+            len(get_hint_pep_args(hint_base)) > 1
+        ):
+            hint_base = get_hint_pep_stdlib_type(hint_base)
+
+        # If this pseudo-superclass is unignorable, record this
+        # pseudo-superclass.
+        if not is_hint_ignorable(hint_base):
+            hint_bases_checkable.append(hint_base)
+
+    # Return a tuple of these pseudo-superclasses.
+    return tuple(hint_bases_checkable)
+
 # ....................{ PRIVATE ~ getters : type          }....................
 # If the active Python interpreter targets at least Python >= 3.7, implement
 # this function to access the standard "__origin__" dunder instance variable
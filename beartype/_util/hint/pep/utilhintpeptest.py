@@ -11,7 +11,7 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                           }....................
-from beartype.cave import HintGenericSubscriptedType
+from beartype._cave._cavefast import HintGenericSubscriptedType
 from beartype.roar import (
     BeartypeDecorHintPepException,
     BeartypeDecorHintPepDeprecatedWarning,
@@ -41,6 +41,7 @@ from beartype._util.hint.pep.proposal.utilhintpep585 import (
     is_hint_pep585_builtin,
     is_hint_pep585_generic,
 )
+from beartype._util.hint.pep.proposal.utilhintpep589 import is_hint_pep589
 from beartype._util.hint.pep.proposal.utilhintpep593 import (
     is_hint_pep593_ignorable_or_none)
 from beartype._util.py.utilpymodule import get_object_module_name
@@ -516,8 +517,10 @@ def is_hint_pep(hint: object) -> bool:
         # unconditionally matching *ALL* forward references as PEP-compliant
         # substantially simplifies logic throughout the codebase, we do so.
         is_hint_forwardref(hint) or
-        # This hint is a PEP 484-compliant new type hint.
-        is_hint_pep484_newtype(hint)
+        # This hint is a PEP 484-compliant new type hint *OR*...
+        is_hint_pep484_newtype(hint) or
+        # This hint is a PEP 589-compliant typed dictionary.
+        is_hint_pep589(hint)
     )
 
 
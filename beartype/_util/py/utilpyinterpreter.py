@@ -10,13 +10,38 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                           }....................
-from platform import python_implementation
+import sys
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
 # ....................{ TESTERS                           }....................
-IS_PYPY = python_implementation() == 'PyPy'
+IS_PYPY = sys.implementation.name == 'pypy'
 '''
 ``True`` only if the current Python interpreter is PyPy.
+
+This tester intentionally inspects the standard :attr:`sys.implementation`
+namespace rather than calling the :func:`platform.python_implementation`
+function, avoiding the cost of importing the :mod:`platform` module at
+:mod:`beartype` importation time.
 '''
+
+# ....................{ TESTERS ~ gil                     }....................
+def is_python_gil_enabled() -> bool:
+    '''
+    ``True`` only if the active Python interpreter is currently guarded by a
+    **Global Interpreter Lock (GIL)** (i.e., is *not* a free-threaded CPython
+    build running with the GIL disabled).
+
+    Since free-threaded CPython builds may dynamically re-enable the GIL at
+    runtime (e.g., on importing a C extension *not* declaring itself
+    free-threading-safe), this tester is intentionally a function rather than
+    a global constant.
+    '''
+
+    # Private tester defined by free-threaded-aware CPython versions if any
+    # *OR* "None" otherwise (i.e., under interpreters always guarded by a GIL).
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+
+    # Return true only if this interpreter is guarded by a GIL.
+    return True if is_gil_enabled is None else is_gil_enabled()
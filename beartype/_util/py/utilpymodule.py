@@ -11,7 +11,7 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                           }....................
 import importlib
-from beartype.cave import ModuleType
+from beartype._cave._cavefast import ModuleType
 from beartype.roar import _BeartypeUtilModuleException
 from typing import Optional
 
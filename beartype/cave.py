@@ -85,18 +85,13 @@ low-level primitive    :func:`isinstance`    :mod:`typing.TypingMeta`
 import functools as _functools
 import numbers as _numbers
 import re as _re
-from argparse import (
-    _SubParsersAction,
-    ArgumentParser as _ArgumentParser,
-)
-from beartype.roar import (
-    BeartypeCallUnavailableTypeException as
-    _BeartypeCallCheckUnavailableTypeException
-)
 from beartype._cave.abc import _BoolType
-from beartype._cave.mapping import _NoneTypeOrType
+from beartype._cave.mapping import NoneTypeOr as _NoneTypeOr
+from beartype._cave._cavefast import UnavailableType
 from beartype._util.py.utilpyversion import (
-    IS_PYTHON_AT_LEAST_3_9 as _IS_PYTHON_AT_LEAST_3_9)
+    IS_PYTHON_AT_LEAST_3_7 as _IS_PYTHON_AT_LEAST_3_7,
+    IS_PYTHON_AT_LEAST_3_9 as _IS_PYTHON_AT_LEAST_3_9,
+)
 from collections import deque as _deque
 from collections.abc import (
     Collection as _Collection,
@@ -119,7 +114,9 @@ from enum import (
 from io import IOBase as _IOBase
 from typing import (
     Any as _Any,
+    Callable as _Callable,
     Dict as _Dict,
+    List as _List,
     Union as _Union,
     Tuple as _Tuple,
     Type as _Type,
@@ -172,21 +169,9 @@ from types import (
 # Unavailable types are defined *BEFORE* any subsequent types, as the latter
 # commonly leverage the former.
 
-class UnavailableType(object):
-    '''
-    **Unavailable type** (i.e., type *not* available under the active Python
-    interpreter, typically due to insufficient Python version or non-installed
-    third-party dependencies).
-    '''
-
-    def __instancecheck__(self, obj) -> None:
-        raise _BeartypeCallCheckUnavailableTypeException(
-            f'{self} not passable as the second parameter to isinstance().')
-
-    def __subclasscheck__(self, cls) -> None:
-        raise _BeartypeCallCheckUnavailableTypeException(
-            f'{self} not passable as the second parameter to issubclass().')
-
+# Note that the "UnavailableType" class is imported above from the private
+# "beartype._cave._cavefast" submodule, which the @beartype decorator imports
+# without importing this submodule.
 
 def _get_type_or_unavailable(cls: type) -> type:
     '''
@@ -1160,20 +1145,6 @@ See Also
     Further details.
 '''
 
-# ....................{ TYPES ~ stdlib : argparse         }....................
-ArgParserType = _ArgumentParser
-'''
-Type of argument parsers parsing all command-line arguments for either
-top-level commands *or* subcommands of those commands.
-'''
-
-
-ArgSubparsersType = _SubParsersAction
-'''
-Type of argument subparser containers parsing subcommands for parent argument
-parsers parsing either top-level commands *or* subcommands of those commands.
-'''
-
 # ....................{ TYPES ~ stdlib : re               }....................
 # Regular expression types are also sufficiently obscure to warrant
 # formalization here.
@@ -1207,31 +1178,6 @@ Type of all **regular expression match objects** (i.e., objects returned by the
 :func:`re.match` function).
 '''
 
-# ....................{ TYPES ~ lib                       }....................
-# Types conditionally dependent upon the importability of third-party
-# dependencies. These types are subsequently redefined by try-except blocks
-# below and initially default to "UnavailableType" for simple types.
-
-# ....................{ TYPES ~ lib : numpy               }....................
-# Conditionally redefined by the "TUPLES ~ init" subsection below.
-NumpyArrayType: type = UnavailableType
-'''
-Type of all **NumPy arrays** (i.e., instances of the concrete
-:class:`numpy.ndarray` class implemented in low-level C and Fortran) if
-:mod:`numpy` is importable *or* :class:`UnavailableType` otherwise (i.e., if
-:mod:`numpy` is unimportable).
-'''
-
-
-# Conditionally redefined by the "TUPLES ~ init" subsection below.
-NumpyScalarType: type = UnavailableType
-'''
-Type of all **NumPy scalars** (i.e., instances of the abstract
-:class:`numpy.generic` base class implemented in low-level C and Fortran) if
-:mod:`numpy` is importable *or* :class:`UnavailableType` otherwise (i.e., if
-:mod:`numpy` is unimportable).
-'''
-
 # ....................{ TUPLES ~ unavailable              }....................
 # Unavailable types are defined *BEFORE* any subsequent types, as the latter
 # commonly leverage the former.
@@ -1265,7 +1211,7 @@ Specifically, for any callable parameter or return type annotated with:
 '''
 
 # ....................{ TUPLES ~ core                     }....................
-NoneTypeOr: _Any = _NoneTypeOrType()
+NoneTypeOr: _Any = _NoneTypeOr
 '''
 **:class:``NoneType`` tuple factory** (i.e., dictionary mapping from arbitrary
 types or tuples of types to the same types or tuples of types concatenated with
@@ -1509,150 +1455,6 @@ Perl) typically implicitly convert:
 * ``True`` to ``1`` and vice versa.
 '''
 
-# ....................{ TUPLES ~ version                  }....................
-# Conditionally expanded by the "TUPLES ~ init" subsection below.
-VersionComparableTypes: _Tuple[type, ...] = (tuple,)
-'''
-Tuple of all **comparable version types** (i.e., types suitable for use both as
-parameters to callables accepting arbitrary version specifiers *and* as
-operands to numeric operators comparing such specifiers) if
-:mod:`pkg_resources` is importable *or* ``(tuple,)`` otherwise.
-
-This is the proper subset of types listed by the :data:`VersionTypes` tuple
-that are directly comparable, thus excluding the :class:`str` type.
-``.``-delimited version specifier strings are only indirectly comparable after
-conversion to a comparable version type.
-
-Caveats
-----------
-Note that all types listed by this tuple are *only* safely comparable with
-versions of the same type. In particular, the types listed by the
-:class:`SetuptoolsVersionTypes` tuple do *not* necessarily support direct
-comparison with either the :class:`tuple` *or* `class:`str` version types;
-ironically, those types supported both under older but *not* newer versions of
-:mod:`setuptools`. This is why we can't have good things.
-'''
-
-# ....................{ TUPLES ~ lib                      }....................
-# Types conditionally dependent upon the importability of third-party
-# dependencies. These types are subsequently redefined by try-except blocks
-# below and initially default to "UnavailableTypes" for tuples of simple types.
-
-# ....................{ TUPLES ~ lib : numpy              }....................
-# Conditionally expanded by the "TUPLES ~ init" subsection below.
-SequenceOrNumpyArrayTypes: _Tuple[type, ...] = (SequenceType,)
-'''
-Tuple of all **mutable** and **immutable sequence types** (i.e., both concrete
-and structural subclasses of the abstract :class:`collections.abc.Sequence`
-base class; reversible collections whose items are efficiently accessible but
-*not* necessarily modifiable with 0-based integer-indexed lookup) as well as
-the **NumPy array type** (i.e., :class:`numpy.ndarray`) if :mod:`numpy` is
-importable.
-
-The NumPy array type satisfies most but not all of the
-:class:`collections.abc.Sequence` API and *must* thus be matched explicitly.
-
-See Also
-----------
-:class:`ContainerType`
-    Further details on structural subtyping.
-:class:`SequenceType`
-    Further details on the :class:`collections.abc.Sequence` mismatch.
-'''
-
-
-# Conditionally expanded by the "TUPLES ~ init" subsection below.
-SequenceMutableOrNumpyArrayTypes: _Tuple[type, ...] = (SequenceMutableType,)
-'''
-Tuple of all **mutable sequence types** (i.e., both concrete and structural
-subclasses of the abstract :class:`collections.abc.Sequence` base class;
-reversible collections whose items are both efficiently accessible *and*
-modifiable with 0-based integer-indexed lookup) as well as the the **NumPy
-array type** (i.e., :class:`numpy.ndarray`) if :mod:`numpy` is importable.
-
-The NumPy array type satisfies most but not all of the
-:class:`collections.abc.MutableSequence` API and *must* thus be matched
-explicitly.
-
-See Also
-----------
-:class:`ContainerType`
-    Further details on structural subtyping.
-:class:`SequenceMutableType`
-    Further details on the :class:`collections.abc.MutableSequence` mismatch.
-'''
-
-# ....................{ TUPLES ~ lib : setuptools         }....................
-# Conditionally redefined by the "TUPLES ~ init" subsection below.
-SetuptoolsVersionTypes: _Tuple[type, ...] = UnavailableTypes
-'''
-Tuple of all **:mod:`setuptools`-specific version types** (i.e., types
-instantiated and returned by both the third-party
-:func:`packaging.version.parse` *and* :func:`pkg_resources.parse_version`
-functions bundled with :mod:`setuptools`) if :mod:`pkg_resources` is importable
-*or* :data:`UnavailableTypes` otherwise (i.e., if :mod:`pkg_resources` is
-unimportable).
-
-This tuple matches these types if :mod:`pkg_resources` is importable:
-
-* **Strict `PEP 440`_-compliant versions** (i.e., instances of the
-  :class:`packaging.version.Version` or
-  :class:`pkg_resources.packaging.version.Version` classes).
-* **Less strict `PEP 440`_-noncompliant versions** (i.e., instances of the
-  :class:`packaging.version.LegacyVersion` or
-  :class:`pkg_resources.packaging.version.LegacyVersion` classes).
-
-.. _PEP 440:
-    https://www.python.org/dev/peps/pep-0440
-'''
-
-# ....................{ TUPLES ~ init                     }....................
-# Conditionally define dependency-specific types.
-#
-# Since this submodule is often imported early in application startup, the
-# importability of *ANY* dependency (mandatory or not) at the top level of this
-# submodule remains undecided. Since subsequent logic in application startup is
-# guaranteed to raise human-readable exceptions on missing mandatory
-# dependencies, their absence here is ignorable.
-
-#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
-# WARNING: To avoid polluting the public module namespace, external attributes
-# should be locally imported at module scope *ONLY* under alternate private
-# names (e.g., "from argparse import ArgumentParser as _ArgumentParser" rather
-# than merely "from argparse import ArgumentParser").
-#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
-
-# If NumPy is importable...
-try:
-    import numpy as _numpy  # type: ignore
-
-    # Define NumPy-specific types.
-    NumpyArrayType  = _numpy.ndarray
-    NumpyScalarType = _numpy.generic
-
-    # Extend NumPy-agnostic types with NumPy-specific types.
-    SequenceOrNumpyArrayTypes        += (NumpyArrayType,)
-    SequenceMutableOrNumpyArrayTypes += (NumpyArrayType,)
-# Else, NumPy is unimportable. We're done here, folks.
-except:
-    pass
-
-
-# If setuptools is importable, conditionally define setuptools-specific types.
-try:
-    import pkg_resources as _pkg_resources  # type: ignore
-
-    # Define setuptools-specific types.
-    SetuptoolsVersionTypes = (
-        _pkg_resources.packaging.version.Version,        # type: ignore[attr-defined]
-        _pkg_resources.packaging.version.LegacyVersion,  # type: ignore[attr-defined]
-    )
-    VersionComparableTypes += SetuptoolsVersionTypes
-# Else, setuptools is unimportable. While this should typically *NEVER* be the
-# case, edge cases gonna edge case.
-except:
-    pass
-
 # ....................{ TUPLES ~ post-init : container    }....................
 # Tuples of types assuming the above initialization to have been performed.
 
@@ -1714,24 +1516,266 @@ This tuple matches:
   tuple).
 '''
 
-# ....................{ TUPLES ~ post-init : version      }....................
-VersionTypes = (StrType,) + VersionComparableTypes
-'''
-Tuple of all **version types** (i.e., types suitable for use as parameters to
-callables accepting arbitrary version specifiers) if :mod:`pkg_resources` is
-importable *or* ``(StrType, tuple,)`` otherwise.
+# ....................{ LAZY                              }....................
+# Types and tuples of types whose definitions require importing comparatively
+# expensive stdlib modules (e.g., "argparse") *OR* optional third-party
+# dependencies (e.g., "numpy", "pkg_resources"). Since this submodule is often
+# imported early in application startup (e.g., by command-line interfaces and
+# serverless functions), these attributes are *NOT* defined at importation
+# time. Instead, each such attribute is defined on the first access of that
+# attribute by the module-scoped PEP 562-compliant __getattr__() dunder
+# function defined below, which calls the private initializer defining that
+# attribute and all related attributes as globals of this submodule. Since
+# this dunder function is only called on accessing undefined attributes, each
+# such initializer is called at most once.
+#
+# The importability of *ANY* dependency (mandatory or not) at the time these
+# attributes are first accessed remains undecided. Since subsequent logic in
+# application startup is guaranteed to raise human-readable exceptions on
+# missing mandatory dependencies, their absence here is ignorable.
+
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To avoid polluting the public module namespace, external attributes
+# should be locally imported *ONLY* within the initializers defined below.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ LAZY ~ stdlib : argparse          }....................
+def _init_types_argparse() -> None:
+    '''
+    Define all :mod:`argparse`-specific types, including:
+
+    * ``ArgParserType``, the type of argument parsers parsing all command-line
+      arguments for either top-level commands *or* subcommands of those
+      commands.
+    * ``ArgSubparsersType``, the type of argument subparser containers parsing
+      subcommands for parent argument parsers parsing either top-level
+      commands *or* subcommands of those commands.
+    '''
 
-This includes:
+    # Defer heavyweight imports.
+    from argparse import _SubParsersAction, ArgumentParser
 
-* :class:`StrType`, specifying versions in ``.``-delimited positive integer
-  format (e.g., ``2.4.14.2.1.356.23``).
-* :class:`tuple`, specifying versions as one or more positive integers (e.g.,
-  ``(2, 4, 14, 2, 1, 356, 23)``),
-* :class:`SetuptoolsVersionTypes`, whose :mod:`setuptools`-specific types
-  specify versions as instance variables convertible into both of the prior
-  formats (e.g., ``SetuptoolsVersionTypes[0]('2.4.14.2.1.356.23')``).
+    # Define these types.
+    globals().update(
+        ArgParserType=ArgumentParser,
+        ArgSubparsersType=_SubParsersAction,
+    )
+
+# ....................{ LAZY ~ lib : numpy                }....................
+def _init_types_numpy() -> None:
+    '''
+    Define all :mod:`numpy`-specific types and tuples of types, including:
+
+    * ``NumpyArrayType``, the type of all **NumPy arrays** (i.e., instances of
+      the concrete :class:`numpy.ndarray` class implemented in low-level C and
+      Fortran) if :mod:`numpy` is importable *or* :class:`UnavailableType`
+      otherwise (i.e., if :mod:`numpy` is unimportable).
+    * ``NumpyScalarType``, the type of all **NumPy scalars** (i.e., instances
+      of the abstract :class:`numpy.generic` base class implemented in
+      low-level C and Fortran) if :mod:`numpy` is importable *or*
+      :class:`UnavailableType` otherwise.
+    * ``SequenceOrNumpyArrayTypes``, the tuple of all **mutable** and
+      **immutable sequence types** (i.e., both concrete and structural
+      subclasses of the abstract :class:`collections.abc.Sequence` base class)
+      as well as the **NumPy array type** (i.e., :class:`numpy.ndarray`) if
+      :mod:`numpy` is importable. The NumPy array type satisfies most but not
+      all of the :class:`collections.abc.Sequence` API and *must* thus be
+      matched explicitly.
+    * ``SequenceMutableOrNumpyArrayTypes``, the tuple of all **mutable
+      sequence types** (i.e., both concrete and structural subclasses of the
+      abstract :class:`collections.abc.MutableSequence` base class) as well as
+      the **NumPy array type** if :mod:`numpy` is importable. The NumPy array
+      type satisfies most but not all of the
+      :class:`collections.abc.MutableSequence` API and *must* thus be matched
+      explicitly.
+
+    See Also
+    ----------
+    :class:`ContainerType`
+        Further details on structural subtyping.
+    :class:`SequenceType`
+        Further details on the :class:`collections.abc.Sequence` mismatch.
+    '''
+
+    # Default these types and tuples of types to NumPy-agnostic values.
+    NumpyArrayType: type = UnavailableType
+    NumpyScalarType: type = UnavailableType
+    SequenceOrNumpyArrayTypes: _Tuple[type, ...] = (SequenceType,)
+    SequenceMutableOrNumpyArrayTypes: _Tuple[type, ...] = (
+        SequenceMutableType,)
+
+    # If NumPy is importable...
+    try:
+        import numpy  # type: ignore
+
+        # Define NumPy-specific types.
+        NumpyArrayType  = numpy.ndarray
+        NumpyScalarType = numpy.generic
+
+        # Extend NumPy-agnostic types with NumPy-specific types.
+        SequenceOrNumpyArrayTypes        += (NumpyArrayType,)
+        SequenceMutableOrNumpyArrayTypes += (NumpyArrayType,)
+    # Else, NumPy is unimportable. We're done here, folks.
+    except:
+        pass
+
+    # Define these types and tuples of types.
+    globals().update(
+        NumpyArrayType=NumpyArrayType,
+        NumpyScalarType=NumpyScalarType,
+        SequenceOrNumpyArrayTypes=SequenceOrNumpyArrayTypes,
+        SequenceMutableOrNumpyArrayTypes=SequenceMutableOrNumpyArrayTypes,
+    )
+
+# ....................{ LAZY ~ lib : setuptools           }....................
+def _init_types_setuptools() -> None:
+    '''
+    Define all :mod:`setuptools`-specific tuples of types, including:
+
+    * ``SetuptoolsVersionTypes``, the tuple of all **:mod:`setuptools`-specific
+      version types** (i.e., types instantiated and returned by both the
+      third-party :func:`packaging.version.parse` *and*
+      :func:`pkg_resources.parse_version` functions bundled with
+      :mod:`setuptools`) if :mod:`pkg_resources` is importable *or*
+      :data:`UnavailableTypes` otherwise. If :mod:`pkg_resources` is
+      importable, this tuple matches both **strict** `PEP 440`_**-compliant
+      versions** (i.e., instances of the :class:`packaging.version.Version`
+      class) *and* **less strict** `PEP 440`_**-noncompliant versions** (i.e.,
+      instances of the :class:`packaging.version.LegacyVersion` class).
+    * ``VersionComparableTypes``, the tuple of all **comparable version
+      types** (i.e., types suitable for use both as parameters to callables
+      accepting arbitrary version specifiers *and* as operands to numeric
+      operators comparing such specifiers) if :mod:`pkg_resources` is
+      importable *or* ``(tuple,)`` otherwise. This is the proper subset of
+      types listed by the ``VersionTypes`` tuple that are directly comparable,
+      thus excluding the :class:`str` type.
+    * ``VersionTypes``, the tuple of all **version types** (i.e., types
+      suitable for use as parameters to callables accepting arbitrary version
+      specifiers), including :class:`StrType` (e.g., ``2.4.14.2.1.356.23``),
+      :class:`tuple` (e.g., ``(2, 4, 14, 2, 1, 356, 23)``), and
+      ``SetuptoolsVersionTypes`` if :mod:`pkg_resources` is importable.
+
+    Caveats
+    ----------
+    Note that all comparable version types are *only* safely comparable with
+    versions of the same type. In particular, the types listed by the
+    ``SetuptoolsVersionTypes`` tuple do *not* necessarily support direct
+    comparison with either the :class:`tuple` *or* `class:`str` version types;
+    ironically, those types supported both under older but *not* newer
+    versions of :mod:`setuptools`. This is why we can't have good things.
+
+    .. _PEP 440:
+        https://www.python.org/dev/peps/pep-0440
+    '''
+
+    # Default these tuples of types to setuptools-agnostic values.
+    SetuptoolsVersionTypes: _Tuple[type, ...] = UnavailableTypes
+    VersionComparableTypes: _Tuple[type, ...] = (tuple,)
+
+    # If setuptools is importable, conditionally define setuptools-specific
+    # types.
+    try:
+        import pkg_resources  # type: ignore
+
+        # Define setuptools-specific types.
+        SetuptoolsVersionTypes = (
+            pkg_resources.packaging.version.Version,        # type: ignore[attr-defined]
+            pkg_resources.packaging.version.LegacyVersion,  # type: ignore[attr-defined]
+        )
+        VersionComparableTypes += SetuptoolsVersionTypes
+    # Else, setuptools is unimportable. While this should typically *NEVER* be
+    # the case, edge cases gonna edge case.
+    except:
+        pass
+
+    # Define these tuples of types.
+    globals().update(
+        SetuptoolsVersionTypes=SetuptoolsVersionTypes,
+        VersionComparableTypes=VersionComparableTypes,
+        VersionTypes=(StrType,) + VersionComparableTypes,
+    )
+
+# ....................{ LAZY ~ getter                     }....................
+_LAZY_ATTR_NAME_TO_INITIALIZER: _Dict[str, _Callable[[], None]] = {
+    'ArgParserType': _init_types_argparse,
+    'ArgSubparsersType': _init_types_argparse,
+    'NumpyArrayType': _init_types_numpy,
+    'NumpyScalarType': _init_types_numpy,
+    'SequenceOrNumpyArrayTypes': _init_types_numpy,
+    'SequenceMutableOrNumpyArrayTypes': _init_types_numpy,
+    'SetuptoolsVersionTypes': _init_types_setuptools,
+    'VersionComparableTypes': _init_types_setuptools,
+    'VersionTypes': _init_types_setuptools,
+}
+'''
+Dictionary mapping from the name of each **lazy attribute** (i.e., public
+attribute of this submodule defined only on the first access of that
+attribute) to the private initializer defining that attribute.
 '''
 
+
+def __getattr__(attr_name: str) -> object:
+    '''
+    Dynamically define and return the **lazy attribute** (i.e., public
+    attribute of this submodule defined only on the first access of that
+    attribute) with the passed name if any *or* raise an exception otherwise.
+
+    This `PEP 562`_-compliant dunder function is implicitly called by the
+    active Python interpreter *only* on accessing an undefined attribute of
+    this submodule, which lazy attributes are until first accessed.
+
+    Parameters
+    ----------
+    attr_name : str
+        Unqualified name of the attribute to be accessed.
+
+    Returns
+    ----------
+    object
+        Lazy attribute with this name.
+
+    Raises
+    ----------
+    AttributeError
+        If this name is *not* that of a lazy attribute.
+
+    .. _PEP 562:
+        https://www.python.org/dev/peps/pep-0562
+    '''
+
+    # Initializer defining this lazy attribute if any *OR* "None" otherwise.
+    attr_initializer = _LAZY_ATTR_NAME_TO_INITIALIZER.get(attr_name)
+
+    # If this attribute is *NOT* lazy, raise the standard exception.
+    if attr_initializer is None:
+        raise AttributeError(
+            f'module {repr(__name__)} has no attribute {repr(attr_name)}')
+    # Else, this attribute is lazy.
+
+    # Define this attribute and all related attributes as globals, preventing
+    # this dunder function from being called on subsequently accessing these
+    # attributes.
+    attr_initializer()
+
+    # Return this attribute.
+    return globals()[attr_name]
+
+
+def __dir__() -> _List[str]:
+    '''
+    List of the names of all public and private attributes of this submodule,
+    including lazy attributes *not* defined yet.
+    '''
+
+    return sorted(set(globals()) | set(_LAZY_ATTR_NAME_TO_INITIALIZER))
+
+
+# If the active Python interpreter targets Python 3.6 and thus fails to
+# support PEP 562, define all lazy attributes at importation time instead.
+if not _IS_PYTHON_AT_LEAST_3_7:
+    for _attr_initializer in set(_LAZY_ATTR_NAME_TO_INITIALIZER.values()):
+        _attr_initializer()
+
 # ....................{ DUNDERS                           }....................
 # Intentionally defined last, as nobody wants to stumble into a full-bore rant
 # first thing in the morning.
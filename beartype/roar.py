@@ -8,6 +8,19 @@
 
 This submodule defines hierarchies of :mod:`beartype`-specific exceptions
 and warnings emitted by the :func:`beartype.beartype` decorator.
+
+Design
+----------
+All classes defined below are plain classes rather than classes whose
+metaclass is :class:`abc.ABCMeta`, despite superclasses of these hierarchies
+being documented as abstract. Since these superclasses declare *no* abstract
+methods, that metaclass prohibits nothing while measurably slowing the
+definition of these classes at importation time, raising and catching these
+exceptions, *and* explicitly testing these exceptions with the
+:func:`isinstance` and :func:`issubclass` builtins (e.g., from hot loops in
+downstream validation layers), which that metaclass otherwise routes through
+the comparatively slow :meth:`abc.ABCMeta.__instancecheck__` and
+:meth:`abc.ABCMeta.__subclasscheck__` dunder methods.
 '''
 
 # ....................{ IMPORTS                           }....................
@@ -18,13 +31,11 @@ and warnings emitted by the :func:`beartype.beartype` decorator.
 # than merely "from argparse import ArgumentParser").
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-from abc import ABCMeta as _ABCMeta
-
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
 # ....................{ SUPERCLASS                        }....................
-class BeartypeException(Exception, metaclass=_ABCMeta):
+class BeartypeException(Exception):
     '''
     Abstract base class of all **beartype exceptions.**
 
@@ -38,7 +49,7 @@ class BeartypeException(Exception, metaclass=_ABCMeta):
     pass
 
 # ....................{ CAVE                              }....................
-class BeartypeCaveException(BeartypeException, metaclass=_ABCMeta):
+class BeartypeCaveException(BeartypeException):
     '''
     Abstract base class of all **beartype cave exceptions.**
 
@@ -49,8 +60,7 @@ class BeartypeCaveException(BeartypeException, metaclass=_ABCMeta):
     pass
 
 # ....................{ CAVE ~ NoneTypeOr                 }....................
-class BeartypeCaveNoneTypeOrException(
-    BeartypeCaveException, metaclass=_ABCMeta):
+class BeartypeCaveNoneTypeOrException(BeartypeCaveException):
     '''
     Abstract base class of all **beartype cave** ``None`` **tuple factory
     exceptions.**
@@ -91,8 +101,20 @@ class BeartypeCaveNoneTypeOrMutabilityException(
 
     pass
 
+# ....................{ CONF                              }....................
+class BeartypeConfException(BeartypeException):
+    '''
+    **Beartype configuration exception.**
+
+    This exception is raised on attempting to instantiate the
+    :class:`beartype.BeartypeConf` class with one or more invalid parameters
+    (e.g., a non-positive sampling interval).
+    '''
+
+    pass
+
 # ....................{ DECORATOR                         }....................
-class BeartypeDecorException(BeartypeException, metaclass=_ABCMeta):
+class BeartypeDecorException(BeartypeException):
     '''
     Abstract base class of all **beartype decorator exceptions.**
 
@@ -128,7 +150,7 @@ class BeartypeDecorWrapperException(BeartypeDecorException):
     pass
 
 # ....................{ DECORATOR ~ hint                  }....................
-class BeartypeDecorHintException(BeartypeDecorException, metaclass=_ABCMeta):
+class BeartypeDecorHintException(BeartypeDecorException):
     '''
     Abstract base class of all **beartype decorator type hint exceptions.**
 
@@ -191,8 +213,7 @@ class BeartypeDecorHintNonPepException(BeartypeDecorHintException):
     pass
 
 # ....................{ DECORATOR ~ hint : pep            }....................
-class BeartypeDecorHintPepException(
-    BeartypeDecorHintException, metaclass=_ABCMeta):
+class BeartypeDecorHintPepException(BeartypeDecorHintException):
     '''
     Abstract base class of all **beartype decorator PEP-compliant type hint
     value exceptions.**
@@ -289,7 +310,7 @@ class BeartypeDecorHintPep585Exception(BeartypeDecorHintPepException):
     pass
 
 # ....................{ DECORATOR ~ param                 }....................
-class BeartypeDecorParamException(BeartypeDecorException, metaclass=_ABCMeta):
+class BeartypeDecorParamException(BeartypeDecorException):
     '''
     Abstract base class of all **beartype decorator parameter exceptions.**
 
@@ -314,7 +335,7 @@ class BeartypeDecorParamNameException(BeartypeDecorParamException):
     pass
 
 # ....................{ DECORATOR ~ pep                   }....................
-class BeartypeDecorPepException(BeartypeDecorException, metaclass=_ABCMeta):
+class BeartypeDecorPepException(BeartypeDecorException):
     '''
     Abstract base class of all **beartype decorator Python Enhancement Proposal
     (PEP) exceptions.**
@@ -343,7 +364,7 @@ class BeartypeDecorHintPep563Exception(BeartypeDecorPepException):
     pass
 
 # ....................{ CALL                              }....................
-class BeartypeCallException(BeartypeException, metaclass=_ABCMeta):
+class BeartypeCallException(BeartypeException):
     '''
     Abstract base class of all **beartyped callable exceptions.**
 
@@ -369,7 +390,7 @@ class BeartypeCallUnavailableTypeException(BeartypeCallException):
     pass
 
 # ....................{ CALL ~ hint                       }....................
-class BeartypeCallHintException(BeartypeCallException, metaclass=_ABCMeta):
+class BeartypeCallHintException(BeartypeCallException):
     '''
     Abstract base class of all **beartyped callable type-checking exceptions.**
 
@@ -397,8 +418,7 @@ class BeartypeCallHintForwardRefException(BeartypeCallHintException):
     pass
 
 # ....................{ CALL ~ hint : pep                 }....................
-class BeartypeCallHintPepException(
-    BeartypeCallHintException, metaclass=_ABCMeta):
+class BeartypeCallHintPepException(BeartypeCallHintException):
     '''
     Abstract base class of all **beartyped callable PEP-compliant type
     exceptions.**
@@ -436,8 +456,31 @@ class BeartypeCallHintPepReturnException(BeartypeCallHintPepException):
 
     pass
 
+# ....................{ VALE                              }....................
+class BeartypeValeException(BeartypeException):
+    '''
+    Abstract base class of all **beartype validator exceptions.**
+
+    Instances of subclasses of this exception are raised at usage (e.g.,
+    instantiation, subscription) time from the :mod:`beartype.vale` API.
+    '''
+
+    pass
+
+
+class BeartypeValeSubscriptionException(BeartypeValeException):
+    '''
+    **Beartype validator subscription exception.**
+
+    This exception is raised on attempting to subscript a beartype validator
+    factory (e.g., :attr:`beartype.vale.Is`) by invalid arguments (e.g., a
+    non-callable object *or* a callable accepting no positional parameters).
+    '''
+
+    pass
+
 # ....................{ WARNINGS                          }....................
-class BeartypeWarning(UserWarning, metaclass=_ABCMeta):
+class BeartypeWarning(UserWarning):
     '''
     Abstract base class of all **beartype warnings.**
 
@@ -466,7 +509,7 @@ class BeartypeDependencyOptionalMissingWarning(BeartypeWarning):
     pass
 
 # ....................{ WARNINGS ~ decor : hint : pep     }....................
-class BeartypeDecorHintPepWarning(BeartypeWarning, metaclass=_ABCMeta):
+class BeartypeDecorHintPepWarning(BeartypeWarning):
     '''
     Abstract base class of all **beartype decorator PEP-compliant type hint
     warnings.**
@@ -535,7 +578,7 @@ class BeartypeDecorHintPepDeprecatedWarning(BeartypeDecorHintPepWarning):
 
 # ....................{ WARNINGS ~ sphinx                 }....................
 #FIXME: Consider removal.
-# class BeartypeSphinxWarning(BeartypeWarning, metaclass=_ABCMeta):
+# class BeartypeSphinxWarning(BeartypeWarning):
 #     '''
 #     Abstract base class of all **beartype Sphinx warnings.**
 #
@@ -563,7 +606,7 @@ class _BeartypeDecorBeartypistryException(BeartypeDecorException):
     pass
 
 # ....................{ PRIVATE ~ util                    }....................
-class _BeartypeUtilException(BeartypeException, metaclass=_ABCMeta):
+class _BeartypeUtilException(BeartypeException):
     '''
     Abstract base class of all **beartype utility exceptions.**
 
@@ -636,8 +679,7 @@ class _BeartypeUtilTextException(_BeartypeUtilException):
     pass
 
 # ....................{ PRIVATE ~ util : call               }..................
-class _BeartypeCallHintRaiseException(
-    _BeartypeUtilException, metaclass=_ABCMeta):
+class _BeartypeCallHintRaiseException(_BeartypeUtilException):
     '''
     Abstract base class of all **beartype human-readable exception raiser
     exceptions.**
@@ -699,7 +741,7 @@ class _BeartypeCallHintPepRaiseDesynchronizationException(
     pass
 
 # ....................{ PRIVATE ~ util : cache              }..................
-class _BeartypeUtilCachedException(_BeartypeUtilException, metaclass=_ABCMeta):
+class _BeartypeUtilCachedException(_BeartypeUtilException):
     '''
     Abstract base class of all **beartype caching utility exceptions.**
 
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype callable validators** (i.e., subscriptable factories creating
+validators validating arbitrary objects against arbitrary callables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype.roar import BeartypeValeSubscriptionException
+from beartype._util.func.utilfunclambda import get_func_lambda_source_or_none
+from inspect import signature
+from typing import Any, Callable, Optional, Tuple
+
+# See the "beartype.cave" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ PRIVATE ~ constants               }....................
+_IS_VALID_OPERATOR_AND = 'and'
+'''
+Python operator combining two validators such that objects satisfy the
+combined validator only if these objects satisfy both validators.
+'''
+
+
+_IS_VALID_OPERATOR_OR = 'or'
+'''
+Python operator combining two validators such that objects satisfy the
+combined validator only if these objects satisfy either validator.
+'''
+
+
+_IS_VALID_OPERATOR_NOT = 'not'
+'''
+Python operator negating a validator such that objects satisfy the negated
+validator only if these objects fail to satisfy that validator.
+'''
+
+# ....................{ CLASSES ~ subscripted             }....................
+class _SubscriptedIs(object):
+    '''
+    **Beartype validator** (i.e., object encapsulating a caller-defined
+    validation callable returning ``True`` only if an arbitrary object passed
+    to that callable satisfies an arbitrary constraint, suitable for
+    subscripting (indexing) `PEP 593`_-compliant :attr:`typing.Annotated` type
+    hints enforcing that validation on :func:`beartype.beartype`-decorated
+    callable parameters and returns annotated by those hints).
+
+    Validators are instantiated by subscripting the :attr:`Is` factory (e.g.,
+    ``Is[lambda text: bool(text)]``) *and* by combining existing validators
+    with the ``&``, ``|``, and ``~`` operators (e.g.,
+    ``Is[lambda text: bool(text)] & ~Is[str.isspace]``).
+
+    Attributes
+    ----------
+    is_valid : Callable[[Any], bool]
+        **Validator tester** (i.e., caller-defined callable accepting a single
+        arbitrary object and returning either ``True`` if that object
+        satisfies an arbitrary constraint *or* ``False`` otherwise).
+    _is_valid_operator : Optional[str]
+        Either:
+
+        * If this validator combines one or more other validators, the Python
+          operator combining these validators (e.g., ``"and"``).
+        * Else, ``None``.
+    _is_valid_operands : Tuple[_SubscriptedIs, ...]
+        Tuple of the zero or more validators combined by this validator.
+    _repr : str
+        Machine-readable representation of this validator.
+
+    .. _PEP 593:
+       https://www.python.org/dev/peps/pep-0593
+    '''
+
+    # ..................{ CLASS VARIABLES                   }..................
+    # Slot *ALL* instance variables defined on this object to minimize space
+    # and time complexity across frequently called @beartype-generated
+    # wrappers type-checking objects against this validator.
+    __slots__ = (
+        'is_valid',
+        '_is_valid_operator',
+        '_is_valid_operands',
+        '_repr',
+    )
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(
+        self,
+        is_valid: Callable,
+        is_valid_repr: str,
+        is_valid_operator: Optional[str] = None,
+        is_valid_operands: Tuple['_SubscriptedIs', ...] = (),
+    ) -> None:
+        '''
+        Initialize this validator.
+
+        Parameters
+        ----------
+        is_valid : Callable[[Any], bool]
+            Validator tester.
+        is_valid_repr : str
+            Machine-readable representation of this validator.
+        is_valid_operator : Optional[str]
+            Python operator combining the passed validators if any *or*
+            ``None`` otherwise. Defaults to ``None``.
+        is_valid_operands : Tuple[_SubscriptedIs, ...]
+            Tuple of the zero or more validators combined by this validator.
+            Defaults to the empty tuple.
+        '''
+        assert callable(is_valid), f'{repr(is_valid)} uncallable.'
+        assert isinstance(is_valid_repr, str), (
+            f'{repr(is_valid_repr)} not string.')
+
+        # Classify all passed parameters.
+        self.is_valid = is_valid
+        self._is_valid_operator = is_valid_operator
+        self._is_valid_operands = is_valid_operands
+        self._repr = is_valid_repr
+
+    # ..................{ DUNDERS ~ operator                }..................
+    def __and__(self, other: '_SubscriptedIs') -> '_SubscriptedIs':
+        '''
+        Validator satisfied only by objects satisfying both this and the passed
+        validator.
+
+        Parameters
+        ----------
+        other : _SubscriptedIs
+            Validator to be combined with this validator.
+
+        Returns
+        ----------
+        _SubscriptedIs
+            Validator combining this and the passed validator.
+        '''
+
+        # If the passed object is *NOT* a validator, defer to that object.
+        if not isinstance(other, _SubscriptedIs):
+            return NotImplemented
+        # Else, the passed object is a validator.
+
+        # Localize these testers for efficiency in the closure below.
+        is_valid_this = self.is_valid
+        is_valid_that = other.is_valid
+
+        # Return a new validator combining these validators.
+        return _SubscriptedIs(
+            is_valid=lambda obj: is_valid_this(obj) and is_valid_that(obj),
+            is_valid_repr=f'({repr(self)} & {repr(other)})',
+            is_valid_operator=_IS_VALID_OPERATOR_AND,
+            is_valid_operands=(self, other),
+        )
+
+
+    def __or__(self, other: '_SubscriptedIs') -> '_SubscriptedIs':
+        '''
+        Validator satisfied only by objects satisfying either this or the
+        passed validator.
+
+        Parameters
+        ----------
+        other : _SubscriptedIs
+            Validator to be combined with this validator.
+
+        Returns
+        ----------
+        _SubscriptedIs
+            Validator combining this and the passed validator.
+        '''
+
+        # If the passed object is *NOT* a validator, defer to that object.
+        if not isinstance(other, _SubscriptedIs):
+            return NotImplemented
+        # Else, the passed object is a validator.
+
+        # Localize these testers for efficiency in the closure below.
+        is_valid_this = self.is_valid
+        is_valid_that = other.is_valid
+
+        # Return a new validator combining these validators.
+        return _SubscriptedIs(
+            is_valid=lambda obj: is_valid_this(obj) or is_valid_that(obj),
+            is_valid_repr=f'({repr(self)} | {repr(other)})',
+            is_valid_operator=_IS_VALID_OPERATOR_OR,
+            is_valid_operands=(self, other),
+        )
+
+
+    def __invert__(self) -> '_SubscriptedIs':
+        '''
+        Validator satisfied only by objects *not* satisfying this validator.
+
+        Returns
+        ----------
+        _SubscriptedIs
+            Validator negating this validator.
+        '''
+
+        # Localize this tester for efficiency in the closure below.
+        is_valid_this = self.is_valid
+
+        # Return a new validator negating this validator.
+        return _SubscriptedIs(
+            is_valid=lambda obj: not is_valid_this(obj),
+            is_valid_repr=f'~{repr(self)}',
+            is_valid_operator=_IS_VALID_OPERATOR_NOT,
+            is_valid_operands=(self,),
+        )
+
+    # ..................{ DUNDERS                           }..................
+    def __repr__(self) -> str:
+        '''
+        Machine-readable representation of this validator.
+        '''
+
+        return self._repr
+
+# ....................{ CLASSES ~ factory                 }....................
+class _IsFactory(object):
+    '''
+    **Beartype callable validator factory** (i.e., object creating and
+    returning a new beartype validator when subscripted (indexed) by any
+    caller-defined callable accepting a single arbitrary object and returning
+    either ``True`` if that object satisfies an arbitrary constraint *or*
+    ``False`` otherwise).
+
+    This factory is exposed to callers as the public :attr:`Is` singleton.
+
+    Expression-only lambda functions referencing no names other than their
+    parameter and builtins (e.g., ``Is[lambda text: len(text) > 0]``) are
+    inlined directly into the code generated by the :func:`beartype.beartype`
+    decorator and thus incur *no* call overhead. All other callables are
+    called from that code.
+    '''
+
+    # ..................{ CLASS VARIABLES                   }..................
+    __slots__ = ()
+
+    # ..................{ DUNDERS                           }..................
+    def __getitem__(self, is_valid: Callable[[Any], bool]) -> _SubscriptedIs:
+        '''
+        Create and return a new beartype validator validating objects against
+        the passed validator tester.
+
+        Parameters
+        ----------
+        is_valid : Callable[[Any], bool]
+            Validator tester (i.e., callable accepting a single arbitrary
+            object and returning ``True`` only if that object satisfies an
+            arbitrary constraint).
+
+        Returns
+        ----------
+        _SubscriptedIs
+            New beartype validator encapsulating this validator tester.
+
+        Raises
+        ----------
+        BeartypeValeSubscriptionException
+            If this factory was subscripted by either:
+
+            * *No* arguments.
+            * Two or more arguments.
+            * One non-callable argument.
+            * One callable argument *not* accepting exactly one positional
+              argument.
+        '''
+
+        # If this factory was subscripted by either no arguments *OR* two or
+        # more arguments, raise an exception. Python implicitly packs two or
+        # more subscripted arguments into a tuple.
+        if isinstance(is_valid, tuple):
+            raise BeartypeValeSubscriptionException(
+                f'{repr(self)}[...] subscripted by {len(is_valid)} arguments '
+                f'rather than one callable.'
+            )
+        # Else, this factory was subscripted by one argument.
+        #
+        # If this argument is uncallable, raise an exception.
+        elif not callable(is_valid):
+            raise BeartypeValeSubscriptionException(
+                f'{repr(self)}[...] subscripted by '
+                f'uncallable object {repr(is_valid)}.'
+            )
+        # Else, this argument is callable.
+
+        # Attempt to bind a single positional argument to this callable.
+        try:
+            signature(is_valid).bind(None)
+        # If this callable does *NOT* accept a single positional argument,
+        # raise an exception.
+        except TypeError as exception:
+            raise BeartypeValeSubscriptionException(
+                f'{repr(self)}[...] subscripted by callable {repr(is_valid)} '
+                f'not accepting exactly one positional argument.'
+            ) from exception
+        # If this callable has *NO* introspectable signature (e.g., due to
+        # being a C-based builtin), silently assume this callable to be valid.
+        except ValueError:
+            pass
+
+        # Source code declaring this callable if this callable is a lambda
+        # function whose source code is accessible *OR* "None" otherwise.
+        is_valid_source = get_func_lambda_source_or_none(is_valid)
+
+        # Return a new validator encapsulating this callable, represented by
+        # this source code if accessible *OR* the representation of this
+        # callable otherwise.
+        return _SubscriptedIs(
+            is_valid=is_valid,
+            is_valid_repr=(
+                f'{repr(self)}[{is_valid_source}]'
+                if is_valid_source is not None else
+                f'{repr(self)}[{repr(is_valid)}]'
+            ),
+        )
+
+
+    def __repr__(self) -> str:
+        '''
+        Machine-readable representation of this factory.
+        '''
+
+        return 'Is'
+
+# ....................{ SINGLETONS                        }....................
+Is = _IsFactory()
+'''
+**Beartype callable validator factory** (i.e., object creating and returning a
+new beartype validator when subscripted (indexed) by any caller-defined
+callable accepting a single arbitrary object and returning either ``True`` if
+that object satisfies an arbitrary constraint *or* ``False`` otherwise).
+
+Beartype validators are only valid as the second or later subscripted
+arguments of `PEP 593`_-compliant :attr:`typing.Annotated` type hints: e.g.,
+
+.. code-block:: python
+
+   from beartype import beartype
+   from beartype.vale import Is
+   from typing import Annotated
+
+   @beartype
+   def the_sea_of_time(
+       waves: Annotated[int, Is[lambda waves: waves > 0]]) -> int:
+       return waves
+
+The :func:`beartype.beartype` decorator type-checks each object against the
+first subscripted argument (e.g., ``int``) *before* validating that object
+against these validators, which may thus safely assume that object to satisfy
+that argument.
+
+.. _PEP 593:
+   https://www.python.org/dev/peps/pep-0593
+'''
@@ -128,3 +128,63 @@ def test_key_pool_fail() -> None:
     with raises(_BeartypeUtilCachedKeyPoolException):
         key_pool.release(key="I should roar", item=object())
 
+
+# ....................{ TESTS ~ thread-local              }....................
+def test_thread_local_key_pool_pass() -> None:
+    '''
+    Test successful usage of the
+    :class:`beartype._util.cache.pool.utilcachepool.ThreadLocalKeyPool` type.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._util.cache.pool.utilcachepool import (
+        THREAD_LOCAL_POOL_LEN_MAX, ThreadLocalKeyPool)
+    from beartype.roar import _BeartypeUtilCachedKeyPoolException
+    from threading import Thread
+
+    # Thread-local key pool to be tested, seeding empty pools keyed on the
+    # "newline" parameter passed to the StringIO.__init__() method.
+    key_pool = ThreadLocalKeyPool(
+        item_maker=lambda newline: StringIO(newline=newline))
+
+    # Assert that a release-reacquire cycle in the same thread returns the
+    # same object.
+    windows_stringio = key_pool.acquire(key='\r\n')
+    key_pool.release(key='\r\n', item=windows_stringio)
+    assert key_pool.acquire(key='\r\n') is windows_stringio
+
+    # Assert that a different key acquires a different object.
+    posix_stringio = key_pool.acquire(key='\n')
+    assert posix_stringio is not windows_stringio
+
+    # Assert that objects acquired in one thread are releasable from another
+    # thread and then reacquirable from that other thread.
+    stringios_reacquired = []
+    def release_reacquire() -> None:
+        key_pool.release(key='\r\n', item=windows_stringio)
+        stringios_reacquired.append(key_pool.acquire(key='\r\n'))
+    thread = Thread(target=release_reacquire)
+    thread.start()
+    thread.join()
+    assert stringios_reacquired == [windows_stringio]
+    key_pool.release(key='\r\n', item=windows_stringio)
+
+    # Assert that objects released beyond the capacity of the free lists of
+    # the current thread overflow to the shared pool and are thus acquirable
+    # from other threads.
+    stringios = [
+        key_pool.acquire(key='\n')
+        for _ in range(THREAD_LOCAL_POOL_LEN_MAX + 1)
+    ]
+    for stringio in stringios:
+        key_pool.release(key='\n', item=stringio)
+    stringios_reacquired.clear()
+    thread = Thread(
+        target=lambda: stringios_reacquired.append(key_pool.acquire(key='\n')))
+    thread.start()
+    thread.join()
+    assert stringios_reacquired == [stringios[-1]]
+
+    # Assert that releasing an already released object elicits a roar.
+    with raises(_BeartypeUtilCachedKeyPoolException):
+        key_pool.release(key='\n', item=stringios[0])
@@ -36,6 +36,45 @@ def test_get_hint_pep_sign_pass() -> None:
             hint_pep_meta.pep_sign)
 
 
+def test_get_hint_pep_sign_origin() -> None:
+    '''
+    Test successful usage of the
+    :func:`beartype._util.hint.pep.utilhintpepget.get_hint_pep_sign` getter
+    for PEP-compliant type hints whose signs are resolved by origin rather
+    than by representation.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._util.hint.pep.utilhintpepget import get_hint_pep_sign
+    from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
+    from typing import (
+        ClassVar, ContextManager, Dict, List, Optional, Tuple, Union)
+
+    # Assert this getter resolves the signs of hints originating from types.
+    assert get_hint_pep_sign(Dict[str, List[int]]) is Dict
+    assert get_hint_pep_sign(Tuple[int, ...]) is Tuple
+
+    # Assert this getter resolves the signs of hints whose representations
+    # erroneously refer to non-existing "typing" attributes.
+    assert get_hint_pep_sign(ContextManager[str]) is ContextManager
+
+    # Assert this getter resolves the signs of special forms.
+    assert get_hint_pep_sign(ClassVar[str]) is ClassVar
+    assert get_hint_pep_sign(Union[int, str, None]) is Union
+
+    # Assert this getter resolves the signs of optional hints consistently
+    # with the representations of these hints under this Python version.
+    assert get_hint_pep_sign(Optional[int]) is (
+        Optional if IS_PYTHON_AT_LEAST_3_9 else Union)
+
+    # Assert this getter resolves the signs of PEP 593-compliant type
+    # metahints whose origins are hints originating from types.
+    if IS_PYTHON_AT_LEAST_3_9:
+        from typing import Annotated
+        assert get_hint_pep_sign(Annotated[List[int], 'of death']) is (
+            Annotated)
+
+
 def test_get_hint_pep_sign_fail() -> None:
     '''
     Test unsuccessful usage of the
@@ -211,6 +250,46 @@ def test_get_hint_pep_generic_bases_unerased() -> None:
         with raises(BeartypeDecorHintPepException):
             assert get_hint_pep_generic_bases_unerased(not_hint_pep) is None
 
+
+def test_get_hint_pep_generic_bases_checkable() -> None:
+    '''
+    Test the
+    :func:`beartype._util.hint.pep.utilhintpepget.get_hint_pep_generic_bases_checkable`
+    getter.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._util.hint.pep.utilhintpepget import (
+        get_hint_pep_generic_bases_checkable)
+    from typing import Generic, List, Sequence, TypeVar
+
+    # Type variables parametrizing the generics declared below.
+    S = TypeVar('S')
+    T = TypeVar('T')
+
+    # Generics subclassing pseudo-superclasses parametrized by these type
+    # variables, directly subscripted pseudo-superclasses, and other generics.
+    class Ozymandias(List[T], Generic[T]): pass
+    class TwoVastAndTrunklessLegs(List[int]): pass
+    class OfStone(Ozymandias[str]): pass
+    class HalfSunk(Sequence[S], Generic[S, T]): pass
+
+    # Assert this getter ignores ignorable and actual superclasses.
+    assert get_hint_pep_generic_bases_checkable(Ozymandias) == (List[T],)
+
+    # Assert this getter preserves directly subscripted pseudo-superclasses.
+    assert get_hint_pep_generic_bases_checkable(TwoVastAndTrunklessLegs) == (
+        List[int],)
+
+    # Assert this getter propagates child hints subscripting generics to the
+    # pseudo-superclasses parametrized by the same type variables, preserving
+    # subscripted generic pseudo-superclasses as is.
+    assert get_hint_pep_generic_bases_checkable(Ozymandias[bytes]) == (
+        List[bytes],)
+    assert get_hint_pep_generic_bases_checkable(OfStone) == (Ozymandias[str],)
+    assert get_hint_pep_generic_bases_checkable(HalfSunk[int, str]) == (
+        Sequence[int],)
+
 # ....................{ TESTS ~ subtype : typevar         }....................
 def test_get_hint_pep_typevars() -> None:
     '''
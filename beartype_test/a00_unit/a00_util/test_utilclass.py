@@ -57,3 +57,29 @@ def test_is_classname_builtin() -> None:
     for class_non_builtin in CLASSES_NON_BUILTIN:
         assert is_classname_builtin(
             get_object_type_name(class_non_builtin)) is False
+
+
+def test_type_abc_to_types_concrete() -> None:
+    '''
+    Test the
+    :data:`beartype._util.cls.utilclsabc.TYPE_ABC_TO_TYPES_CONCRETE`
+    dictionary.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._util.cls.utilclsabc import TYPE_ABC_TO_TYPES_CONCRETE
+    from collections import deque
+    from collections.abc import Mapping, MutableSequence, Sequence
+
+    # Assert this dictionary maps standard ABCs to the expected concrete types.
+    assert {list, tuple, str, range}.issubset(
+        TYPE_ABC_TO_TYPES_CONCRETE[Sequence])
+    assert dict in TYPE_ABC_TO_TYPES_CONCRETE[Mapping]
+    assert deque in TYPE_ABC_TO_TYPES_CONCRETE[MutableSequence]
+    assert tuple not in TYPE_ABC_TO_TYPES_CONCRETE[MutableSequence]
+
+    # Assert each such type to actually be a subclass of its ABC.
+    for type_abc, types_concrete in TYPE_ABC_TO_TYPES_CONCRETE.items():
+        assert isinstance(types_concrete, frozenset)
+        for type_concrete in types_concrete:
+            assert issubclass(type_concrete, type_abc)
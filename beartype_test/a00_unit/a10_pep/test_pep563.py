@@ -19,7 +19,7 @@ This submodule unit tests `PEP 563`_ support implemented in the
 # package-specific submodules at module scope.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
-# from pytest import raises
+from pytest import raises
 
 # ....................{ TESTS ~ type                      }....................
 @skip_if_python_version_less_than('3.7.0')
@@ -85,27 +85,39 @@ def test_pep563() -> None:
     assert isinstance(get_minecraft_end_txt_typed(player_name='Notch'), str)
 
 
-#FIXME: Hilariously, we can't even unit test whether the
-#beartype._decor._pep563._die_if_hint_repr_exceeds_child_limit() function
-#behaves as expected. See commentary in the
-#"beartype_test.a00_unit.data.data_pep563" submodule for all the appalling details.
-
-# @skip_if_python_version_less_than('3.7.0')
-# def test_die_if_hint_repr_exceeds_child_limit() -> None:
-#     '''
-#     Test the private
-#     :func:`beartype._decor._pep563._die_if_hint_repr_exceeds_child_limit`
-#     function if the active Python interpreter targets at least Python 3.7.0
-#     (i.e., the first major Python version to support PEP 563) *or* skip
-#     otherwise.
-#     '''
-#
-#     # Defer heavyweight imports.
-#     from beartype import beartype
-#     from beartype.roar import BeartypeDecorHintPepException
-#     from beartype_test.a00_unit.data.data_pep563 import player_was_love
-#
-#     # Assert @beartype raises the expected exception when decorating a
-#     # callable violating this limit.
-#     with raises(BeartypeDecorHintPepException):
-#         beartype(player_was_love)
+@skip_if_python_version_less_than('3.7.0')
+def test_pep563_hint_big() -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator type-checks postponed
+    PEP-compliant type hints subscripted by more child hints than the 256-child
+    limit previously imposed by that decorator if the active Python interpreter
+    targets at least Python 3.7.0 (i.e., the first major Python version to
+    support PEP 563) *or* skip otherwise.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype_test.a00_unit.data.data_pep563 import (
+        _HINT_BIG_CHILDS_LEN, player_was_love)
+
+    # Assert this callable to be annotated by a postponed hint.
+    assert isinstance(
+        player_was_love.__annotations__['player_was_the_universe'], str)
+
+    # Decorate this callable with @beartype.
+    player_was_love_typed = beartype(player_was_love)
+
+    # Valid pith satisfying this hint.
+    pith_good = tuple(
+        child_index if child_index % 2 else str(child_index)
+        for child_index in range(_HINT_BIG_CHILDS_LEN)
+    )
+
+    # Assert this callable to accept this valid pith.
+    assert player_was_love_typed(pith_good) is pith_good
+
+    # Assert this callable to reject an invalid pith violating only the last
+    # child hint of this hint.
+    with raises(BeartypeCallHintPepParamException):
+        player_was_love_typed(pith_good[:-1] + ('Player was the universe.',))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** `PEP 570`_ **unit tests.**
+
+This submodule unit tests `PEP 570`_ support implemented in the
+:func:`beartype.beartype` decorator.
+
+.. _PEP 570:
+   https://www.python.org/dev/peps/pep-0570
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
+from pytest import raises
+
+# ....................{ TESTS                             }....................
+@skip_if_python_version_less_than('3.8.0')
+def test_pep570() -> None:
+    '''
+    Test `PEP 570`_ support implemented in the :func:`beartype.beartype`
+    decorator if the active Python interpreter targets at least Python 3.8.0
+    (i.e., the first major Python version to support `PEP 570`_) *or* skip
+    otherwise.
+
+    .. _PEP 570:
+       https://www.python.org/dev/peps/pep-0570
+    '''
+
+    # Defer heavyweight imports.
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype_test.a00_unit.data.data_pep570 import the_fish, the_swan
+
+    # Assert that wrappers mirroring signatures accept valid positional-only
+    # parameters *AND* forward unpassed default values as is.
+    assert the_fish('The fish in the stream, ') == 'still'
+    assert the_fish('like a lamp', 2, stillness='!') == (
+        'like a lamplike a lamp!')
+
+    # Assert that these wrappers reject invalid positional-only parameters.
+    with raises(BeartypeCallHintPepParamException):
+        the_fish(b'stillness')
+    with raises(BeartypeCallHintPepParamException):
+        the_fish('holds', 'the breath')
+
+    # Assert that wrappers repacking parameters accept valid positional-only
+    # parameters, including a variadic keyword parameter of the same name.
+    assert the_swan('The swan on the lake', type='.') == (
+        'The swan on the lake.')
+
+    # Assert that these wrappers reject invalid positional-only parameters.
+    with raises(BeartypeCallHintPepParamException):
+        the_swan(b'waits', type='.')
@@ -28,5 +28,98 @@ def test_api_beartype() -> None:
 
     # Assert this package's public attributes to be of the expected types.
     assert isinstance(beartype.beartype, DecoratorTypes)
+    assert callable(beartype.clear_protocol_types)
     assert isinstance(beartype.__version__, str)
     assert isinstance(beartype.__version_info__, tuple)
+
+# ....................{ TESTS ~ import                    }....................
+def test_api_beartype_import_lazy() -> None:
+    '''
+    Test that importing the :mod:`beartype` package imports *only* the
+    submodules required by the :func:`beartype.beartype` decorator, deferring
+    the :mod:`beartype.cave` submodule and comparatively expensive stdlib and
+    third-party modules until explicitly required by downstream callers.
+    '''
+
+    # Defer heavyweight imports.
+    import beartype, subprocess, sys
+    from os import environ
+    from os.path import dirname
+
+    # Dictionary of all environment variables passed to the Python
+    # subprocesses run below, prepending the absolute dirname of this package
+    # onto the module search path to import this package rather than any
+    # installed package of the same name.
+    env = environ.copy()
+    env['PYTHONPATH'] = dirname(dirname(beartype.__file__))
+
+    def _get_module_names_imported(code: str) -> frozenset:
+        '''
+        Frozen set of the fully-qualified names of all modules newly imported
+        by running the passed code in a new Python subprocess, parsed from the
+        import timing table printed to stderr by the ``-X importtime`` option.
+        '''
+
+        # Run this code with import timing enabled.
+        result = subprocess.run(
+            (sys.executable, '-X', 'importtime', '-c', code),
+            env=env,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+
+        # Each line of this table resembles:
+        #     import time:       124 |        124 |     beartype.roar
+        return frozenset(
+            line.rpartition('|')[2].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith('import time:')
+        )
+
+    # Set of all modules imported by importing this package.
+    module_names = _get_module_names_imported('import beartype')
+
+    # Assert this package to have been imported.
+    assert 'beartype' in module_names
+
+    # Assert this package to have deferred the importation of all modules only
+    # required by the public beartype cave.
+    assert not module_names & {
+        'argparse', 'beartype.cave', 'numpy', 'pkg_resources', 'platform'}
+
+    # Assert this package to have deferred the importation of all modules only
+    # required by wrapper functions type-checking comparatively uncommon hints
+    # until the code generator first generates code type-checking such hints.
+    assert not module_names & {
+        'beartype.vale',
+        'beartype._decor._cache.cachefield',
+        'beartype._decor._cache.cacheiterator',
+        'beartype._decor._cache.cacheprotocol',
+        'beartype._decor._cache.cachetypeddict',
+        'beartype._decor._cache.cacheunion',
+        'beartype._decor._cache.cachevalidator',
+        'beartype._util.func.utilfunclambda',
+        'weakref',
+    }
+
+    # Assert that decorating a callable annotated by a union imports only the
+    # submodule caching the wrapper global accessed when type-checking unions.
+    module_names = _get_module_names_imported(
+        'from beartype import beartype\n'
+        'from typing import Union\n'
+        '@beartype\n'
+        'def f(x: Union[int, str]) -> object: return x\n'
+        'f(1)\n'
+    )
+    assert 'beartype._decor._cache.cacheunion' in module_names
+    assert 'beartype._decor._cache.cachetypeddict' not in module_names
+
+    # Assert that importing the public beartype cave also defers these modules
+    # until the lazy types requiring these modules are first accessed.
+    module_names = _get_module_names_imported('import beartype.cave')
+    assert not module_names & {'argparse', 'numpy', 'pkg_resources'}
+    module_names = _get_module_names_imported(
+        'import beartype.cave; beartype.cave.ArgParserType')
+    assert 'argparse' in module_names
+    assert 'pkg_resources' not in module_names
@@ -835,3 +835,29 @@ def test_api_cave_lib_setuptools() -> None:
         # PEP 440-noncompliant version object.
         pkg_resources.parse_version('6.9.6t'),
     )
+
+# ....................{ TESTS ~ lazy                      }....................
+def test_api_cave_lazy() -> None:
+    '''
+    Test all **lazy types** (i.e., types dynamically defined on first access
+    by the :func:`beartype.cave.__getattr__` dunder function) published by the
+    :mod:`beartype.cave` submodule.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import cave
+
+    # Assert these types to be listed by the dir() builtin *BEFORE* access.
+    cave_attr_names = dir(cave)
+    assert 'ArgParserType' in cave_attr_names
+    assert 'VersionTypes' in cave_attr_names
+    assert 'NumpyArrayType' in cave_attr_names
+
+    # Assert these types to be accessible and then globally cached.
+    assert cave.ArgParserType is argparse.ArgumentParser
+    assert vars(cave)['ArgParserType'] is argparse.ArgumentParser
+    assert isinstance(cave.VersionTypes, tuple)
+
+    # Assert accessing an undefined attribute to raise the expected exception.
+    with raises(AttributeError):
+        cave.ThisIsNotTheTypeYouAreLookingFor
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype exception API unit tests.**
+
+This submodule unit tests (and coarsely benchmarks) the public API of the
+:mod:`beartype.roar` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
+
+# ....................{ TESTS                             }....................
+def test_api_roar_type() -> None:
+    '''
+    Test that all exception and warning classes published by the
+    :mod:`beartype.roar` submodule are plain classes whose metaclass is the
+    root :class:`type` metaclass rather than the :class:`abc.ABCMeta`
+    metaclass.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import roar
+
+    # Tuple of all exception and warning classes defined by this submodule.
+    roar_types = tuple(
+        attr for attr in vars(roar).values()
+        if isinstance(attr, type) and attr.__module__ == roar.__name__
+    )
+
+    # Assert this submodule to define one or more such classes.
+    assert roar_types
+
+    # Assert each such class to be a plain class.
+    for roar_type in roar_types:
+        assert type(roar_type) is type
+
+    # Assert these hierarchies to remain intact.
+    assert issubclass(
+        roar.BeartypeCallHintPepParamException, roar.BeartypeException)
+    assert issubclass(
+        roar.BeartypeDecorHintPepDeprecatedWarning, roar.BeartypeWarning)
+
+# ....................{ TESTS ~ bench                     }....................
+# Note that these benchmarks intentionally assert *NO* timings, which are too
+# noisy to gate this test suite on. Timings are instead printed to standard
+# output and thus reported by running "pytest -s".
+
+@skip_if_python_version_less_than('3.7.0')
+def test_api_roar_bench_import() -> None:
+    '''
+    Benchmark importing the :mod:`beartype.roar` submodule in a new Python
+    subprocess, reporting the time spent importing that submodule itself
+    (excluding the submodules it imports) as parsed from the import timing
+    table printed to stderr by the ``-X importtime`` option.
+    '''
+
+    # Defer heavyweight imports.
+    import beartype, subprocess, sys
+    from os import environ
+    from os.path import dirname
+
+    # Dictionary of all environment variables passed to this subprocess,
+    # prepending the absolute dirname of this package onto the module search
+    # path to import this package rather than any installed package of the
+    # same name.
+    env = environ.copy()
+    env['PYTHONPATH'] = dirname(dirname(beartype.__file__))
+
+    # Run this import with import timing enabled.
+    result = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', 'import beartype.roar'),
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    # Tuple of the self times in microseconds of all rows of this table
+    # describing this submodule, each resembling:
+    #     import time:       124 |        124 |     beartype.roar
+    times_self = tuple(
+        int(line.partition(':')[2].partition('|')[0])
+        for line in result.stderr.splitlines()
+        if (
+            line.startswith('import time:') and
+            line.rpartition('|')[2].strip() == 'beartype.roar'
+        )
+    )
+
+    # Assert this submodule to have been imported.
+    assert times_self
+
+    # Report the time spent importing this submodule.
+    print(f'beartype.roar import self time: {max(times_self)}us')
+
+
+def test_api_roar_bench_raise() -> None:
+    '''
+    Benchmark raising, catching, and explicitly testing exceptions published by
+    the :mod:`beartype.roar` submodule, asserting these operations to *never*
+    defer to the comparatively slow :class:`abc.ABCMeta` machinery.
+    '''
+
+    # Defer heavyweight imports.
+    from abc import ABCMeta
+    from beartype import roar
+    from beartype.roar import (
+        BeartypeCallHintPepException,
+        BeartypeCallHintPepParamException,
+    )
+    from timeit import repeat
+
+    # List of all classes passed to the ABC instance and subclass checks
+    # instrumented below.
+    abc_types_checked = []
+
+    # Original ABC instance and subclass checks.
+    abc_instancecheck = ABCMeta.__instancecheck__
+    abc_subclasscheck = ABCMeta.__subclasscheck__
+
+    def instancecheck_recorded(cls, instance) -> bool:
+        abc_types_checked.append(cls)
+        return abc_instancecheck(cls, instance)
+
+    def subclasscheck_recorded(cls, subclass) -> bool:
+        abc_types_checked.append(cls)
+        return abc_subclasscheck(cls, subclass)
+
+    def raise_beartype() -> None:
+        try:
+            raise BeartypeCallHintPepParamException('Stormwind')
+        except BeartypeCallHintPepException as exception:
+            isinstance(exception, BeartypeCallHintPepException)
+            issubclass(type(exception), BeartypeCallHintPepException)
+
+    # Instrument these checks for the duration of this benchmark.
+    ABCMeta.__instancecheck__ = instancecheck_recorded  # type: ignore[assignment]
+    ABCMeta.__subclasscheck__ = subclasscheck_recorded  # type: ignore[assignment]
+    try:
+        # Minimum time in seconds required to call this callable.
+        time_beartype = min(repeat(raise_beartype, number=2000, repeat=5))
+    finally:
+        ABCMeta.__instancecheck__ = abc_instancecheck  # type: ignore[assignment]
+        ABCMeta.__subclasscheck__ = abc_subclasscheck  # type: ignore[assignment]
+
+    # Assert these checks to have *NEVER* been passed exception classes
+    # published by this submodule.
+    assert not [
+        abc_type_checked
+        for abc_type_checked in abc_types_checked
+        if abc_type_checked.__module__ == roar.__name__
+    ]
+
+    # Report the time spent raising and catching these exceptions.
+    print(f'beartype.roar raise/catch time (2000 calls): {time_beartype}s')
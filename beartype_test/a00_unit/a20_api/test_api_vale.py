@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype validator API unit tests.**
+
+This submodule unit tests the public API of the :mod:`beartype.vale`
+subpackage.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
+from pytest import raises
+
+# ....................{ TESTS                             }....................
+def test_api_vale_is_pass() -> None:
+    '''
+    Test successful usage of the :attr:`beartype.vale.Is` factory.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
+    from beartype.vale import Is
+
+    # Validators subscripted by arbitrary callables.
+    IsLengthy = Is[lambda text: len(text) > 30]
+    IsSentence = Is[lambda text: text and text[-1] == '.']
+
+    # Assert these validators to validate objects as expected.
+    assert IsLengthy.is_valid('Plunged in the stream of moonlight.') is True
+    assert IsLengthy.is_valid('Wintry.') is False
+
+    # Assert validators combined by boolean operators to validate objects as
+    # expected.
+    IsLengthyOrUnsentence = IsLengthy | ~IsSentence
+    IsLengthySentence = IsLengthy & IsSentence
+    assert IsLengthySentence.is_valid(
+        'Like steps of thunder through the dead.') is True
+    assert IsLengthySentence.is_valid('Dead.') is False
+    assert IsLengthyOrUnsentence.is_valid('Dead') is True
+    assert IsLengthyOrUnsentence.is_valid('Dead.') is False
+
+    # Assert these validators to be represented by their source code if the
+    # active Python interpreter is able to unparse AST nodes back into source
+    # code (i.e., targets Python >= 3.9).
+    if IS_PYTHON_AT_LEAST_3_9:
+        assert repr(IsLengthy) == 'Is[lambda text: len(text) > 30]'
+    assert repr(IsLengthySentence) == f'({IsLengthy!r} & {IsSentence!r})'
+
+
+def test_api_vale_is_fail() -> None:
+    '''
+    Test unsuccessful usage of the :attr:`beartype.vale.Is` factory.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype.roar import BeartypeValeSubscriptionException
+    from beartype.vale import Is
+
+    # Assert that subscripting this factory by two or more arguments raises
+    # the expected exception.
+    with raises(BeartypeValeSubscriptionException):
+        Is[bool, bool]
+
+    # Assert that subscripting this factory by a non-callable object raises
+    # the expected exception.
+    with raises(BeartypeValeSubscriptionException):
+        Is['Dark wreath of mountains, that with shadowy hue']
+
+    # Assert that subscripting this factory by a callable accepting *NO*
+    # positional arguments raises the expected exception.
+    with raises(BeartypeValeSubscriptionException):
+        Is[lambda: True]
+
+
+@skip_if_python_version_less_than('3.9.0')
+def test_api_vale_is_decor() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on callables annotated by
+    `PEP 593`_-compliant type metahints subscripted by :attr:`beartype.vale.Is`
+    validators.
+
+    .. _PEP 593:
+       https://www.python.org/dev/peps/pep-0593
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype._decor._cache.cachevalidator import validators
+    from beartype._decor._code._pep._pephint import pep_code_check_hint
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype.vale import Is
+    from typing import Annotated
+
+    # Global variable referenced by a validator below.
+    WAVES = ('The', 'wandering', 'waves')
+
+    # Metahints subscripted by inlinable validators referencing only their
+    # parameters and builtins.
+    Lengthy = Annotated[str, Is[lambda text: len(text) > 8]]
+    Brace = Annotated[str, Is[lambda text: text in {'{', '}'}]]
+
+    # Metahint subscripted by an uninlinable validator referencing a closure
+    # variable.
+    Wavy = Annotated[str, Is[lambda text: text in WAVES]]
+
+    # Assert inlinable validators to be inlined into type-checking code.
+    validators_len = len(validators)
+    lengthy_code = pep_code_check_hint(Lengthy, False)[0]
+    assert '__beartype_builtins.len(' in lengthy_code
+    assert len(validators) == validators_len
+
+    # Assert uninlinable validators to be called from type-checking code.
+    wavy_code = pep_code_check_hint(Wavy, False)[0]
+    assert '__beartype_validators[' in wavy_code
+    assert len(validators) == validators_len + 1
+
+    # Callable annotated by these metahints, including a parameter whose name
+    # shadows a builtin referenced by an inlined validator.
+    @beartype
+    def the_sky(len: Lengthy, brace: Brace, wavy: Wavy) -> Lengthy:
+        return len
+
+    # Assert this callable accepts objects satisfying these metahints.
+    assert the_sky('Below, far lands are seen', '{', 'waves') == (
+        'Below, far lands are seen')
+
+    # Assert this callable rejects objects violating these metahints with
+    # exceptions describing the violated validators.
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        the_sky('tremblingly', '(', 'waves')
+    assert 'violates validator' in str(exception_info.value)
+    with raises(BeartypeCallHintPepParamException):
+        the_sky('Tremble', '{', 'waves')
+    with raises(BeartypeCallHintPepParamException):
+        the_sky('tremblingly', '}', 'particles')
+    with raises(BeartypeCallHintPepParamException):
+        the_sky(b'tremblingly', '}', 'waves')
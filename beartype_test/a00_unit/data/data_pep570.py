@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** `PEP 570`_ **data submodule.**
+
+This submodule exercises `PEP 570`_ support implemented in the
+:func:`beartype.beartype` decorator by declaring callables accepting
+positional-only parameters decorated by that decorator. External unit tests
+are expected to conditionally import this submodule if the active Python
+interpreter targets at least Python 3.8.0 and then call those callables.
+
+Caveats
+----------
+**This submodule requires the active Python interpreter to target at least
+Python 3.8.0.** If this is *not* the case, importing this submodule raises a
+:class:`SyntaxError` exception.
+
+.. _PEP 570:
+   https://www.python.org/dev/peps/pep-0570
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype import beartype
+
+# ....................{ CALLABLES                         }....................
+@beartype
+def the_fish(
+    in_the_stream: str, like_a_lamp: int = 0, /, *, stillness: str = 'still',
+) -> str:
+    '''
+    Callable accepting mandatory and optional positional-only parameters,
+    whose wrapper function mirrors the signature of this callable.
+    '''
+
+    return in_the_stream * like_a_lamp + stillness
+
+
+@beartype
+def the_swan(type: str, /, **kwargs) -> str:
+    '''
+    Callable accepting a positional-only parameter shadowing a builtin, whose
+    wrapper function thus repacks all passed parameters into variadic
+    parameters, *and* variadic keyword parameters passing a parameter of the
+    same name as that positional-only parameter.
+    '''
+
+    return type + kwargs.get('type', '')
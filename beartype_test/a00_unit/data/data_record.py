@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype record data submodule.**
+
+This submodule declares **records** (i.e., :class:`typing.NamedTuple`
+subclasses and dataclasses) whose annotated fields are deeply type-checked by
+the :func:`beartype.beartype` decorator under configurations enabling the
+:attr:`beartype.BeartypeConf.is_check_fields` option. These records are
+declared at module scope, enabling forward references to these records to be
+resolved against this submodule.
+
+Caveats
+----------
+**This submodule requires the active Python interpreter to target at least
+Python 3.7.0.** If this is *not* the case, importing this submodule raises an
+:class:`ImportError` exception.
+'''
+
+# ....................{ IMPORTS                           }....................
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional
+
+# ....................{ CLASSES                           }....................
+class Pipe(NamedTuple):
+    '''
+    :class:`typing.NamedTuple` subclass declaring annotated fields.
+    '''
+
+    piper: str
+    notes: int
+
+
+@dataclass
+class Glade(object):
+    '''
+    Dataclass declaring annotated fields, including a field annotated by a
+    container of records *and* a field annotated by a forward reference to
+    this dataclass.
+    '''
+
+    name: str
+    pipes: List[Pipe]
+    beyond: Optional['Glade'] = None
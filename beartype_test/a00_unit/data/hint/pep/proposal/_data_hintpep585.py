@@ -44,6 +44,7 @@ def add_data(data_module: 'ModuleType') -> None:
     # Defer Python >= 3.8-specific imports.
     import re
     from beartype.cave import IntType
+    from collections import deque
     from collections.abc import (
         ByteString,
         Callable,
@@ -62,6 +63,7 @@ def add_data(data_module: 'ModuleType') -> None:
         Any,
         Generic,
         TypeVar,
+        Union,
     )
 
     # ..................{ TYPEVARS                          }..................
@@ -334,6 +336,50 @@ def add_data(data_module: 'ModuleType') -> None:
             ),
         ),
 
+        # ................{ DEQUE                             }................
+        # Deque of non-"typing" objects.
+        PepHintMetadata(
+            hint=deque[str],
+            pep_sign=deque,
+            stdlib_type=deque,
+            is_pep585_builtin=True,
+            piths_satisfied_meta=(
+                # Empty deque, which satisfies all hint arguments by
+                # definition.
+                PepHintPithSatisfiedMetadata(deque()),
+                # Deque of strings.
+                PepHintPithSatisfiedMetadata(deque((
+                    'Of rudder‐shorn, deque‐dequeued pennants',
+                    'Unfurled at either end of a middling',
+                ))),
+                # Deque whose first and last items are strings. Since only the
+                # first and last items of deques are type-checked, this deque
+                # is intentionally accepted despite its middling integer.
+                PepHintPithSatisfiedMetadata(deque((
+                    'Mid‐muddied tenure',
+                    0xBABE,
+                    'unattended by its ends',
+                ))),
+            ),
+            piths_unsatisfied_meta=(
+                # String constant.
+                PepHintPithUnsatisfiedMetadata(
+                    'Dequeing the quayside’s queueing equanimity'),
+                # Deque whose last item is an integer.
+                PepHintPithUnsatisfiedMetadata(
+                    pith=deque(('Enqueued at either end,', 73)),
+                    # Match that the exception message raised for this object...
+                    exception_str_match_regexes=(
+                        # Declares the index of the last deque item *NOT*
+                        # satisfying this hint.
+                        r'\sdeque item 1\s',
+                        # Double-quotes the value of this item.
+                        r'\s"73"\s',
+                    ),
+                ),
+            ),
+        ),
+
         # ................{ DICT                              }................
         # Flat dictionary.
         PepHintMetadata(
@@ -654,6 +700,42 @@ def add_data(data_module: 'ModuleType') -> None:
             ),
         ),
 
+        # List of unions of non-"typing" abstract base classes (ABCs), whose
+        # code localizes each list item to a pith that the first child of
+        # this union then itself localizes to a nested pith.
+        PepHintMetadata(
+            hint=list[Union[Iterable, Sized]],
+            pep_sign=list,
+            stdlib_type=list,
+            is_pep585_builtin=True,
+            piths_satisfied_meta=(
+                # Empty list, which satisfies all hint arguments by definition.
+                PepHintPithSatisfiedMetadata([]),
+                # List of iterables and sized objects.
+                PepHintPithSatisfiedMetadata([
+                    'Heavily iterable,',
+                    ('sizable', 'tuples',),
+                ]),
+            ),
+            piths_unsatisfied_meta=(
+                # String constant.
+                PepHintPithUnsatisfiedMetadata(
+                    'Unsizably uniterable, unsized fables'),
+                # List containing exactly one integer. Since list items are only
+                # randomly type-checked, only a list of exactly one item enables us
+                # to match the explicit index at fault below.
+                PepHintPithUnsatisfiedMetadata(
+                    pith=[0xFABE,],
+                    # Match that the exception message raised for this object...
+                    exception_str_match_regexes=(
+                        # Declares the index of a random list item *NOT*
+                        # satisfying this hint.
+                        r'\s[Ll]ist item \d+\s',
+                    ),
+                ),
+            ),
+        ),
+
         # Generic list.
         PepHintMetadata(
             hint=list[T],
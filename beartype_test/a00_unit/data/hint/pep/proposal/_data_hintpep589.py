@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** `PEP 589`_**-compliant type hint test data.**
+
+.. _PEP 589:
+    https://www.python.org/dev/peps/pep-0589
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
+from beartype_test.a00_unit.data.hint.data_hintmeta import (
+    PepHintMetadata,
+    PepHintPithSatisfiedMetadata,
+    PepHintPithUnsatisfiedMetadata,
+)
+
+# ....................{ ADDERS                            }....................
+def add_data(data_module: 'ModuleType') -> None:
+    '''
+    Add `PEP 589`_**-compliant type hint test data to various global containers
+    declared by the passed module.
+
+    Parameters
+    ----------
+    data_module : ModuleType
+        Module to be added to.
+
+    .. _PEP 589:
+        https://www.python.org/dev/peps/pep-0589
+    '''
+
+    # If the active Python interpreter targets less than Python < 3.8, this
+    # interpreter fails to support PEP 589. In this case, reduce to a noop.
+    if not IS_PYTHON_AT_LEAST_3_8:
+        return
+    # Else, the active Python interpreter targets at least Python >= 3.8 and
+    # thus supports PEP 589.
+
+    # Defer Python >= 3.8-specific imports.
+    from typing import TypedDict
+
+    # ..................{ TYPEDDICTS                        }..................
+    class TypedDictTotal(TypedDict):
+        '''
+        Typed dictionary requiring exactly one key, ensuring that piths
+        violating the type hint annotating that key are deterministically
+        detected despite only one key being type-checked per call.
+        '''
+
+        pale_purple_even: str
+
+
+    class TypedDictPartial(TypedDict, total=False):
+        '''
+        Typed dictionary requiring no keys.
+        '''
+
+        as_the_wave: int
+        the_stars: str
+
+    # ..................{ TUPLES                            }..................
+    # Add PEP 589-specific test type hints to this dictionary global.
+    data_module.HINTS_PEP_META.extend((
+        # ................{ TYPEDDICT                         }................
+        # Typed dictionary requiring all keys.
+        PepHintMetadata(
+            hint=TypedDictTotal,
+            pep_sign=TypedDict,
+            is_subscripted=False,
+            is_type_typing=False,
+            piths_satisfied_meta=(
+                # Dictionary mapping the required key to a string constant.
+                PepHintPithSatisfiedMetadata({
+                    'pale_purple_even': 'Beneath the deep blue sky'}),
+            ),
+            piths_unsatisfied_meta=(
+                # String constant.
+                PepHintPithUnsatisfiedMetadata(
+                    pith='Sleeps by the deep blue sea',
+                    # Match that the exception message raised for this object
+                    # declares the types *NOT* satisfied by this object.
+                    exception_str_match_regexes=(r'\bnot dict\b',),
+                ),
+                # Dictionary *NOT* containing the required key.
+                PepHintPithUnsatisfiedMetadata(
+                    pith={'the_stars': 'Beneath the wave'},
+                    # Match that the exception message raised for this object
+                    # declares the missing key.
+                    exception_str_match_regexes=(
+                        r"\bmissing TypedDictTotal required key\(s\) "
+                        r"'pale_purple_even'",
+                    ),
+                ),
+                # Dictionary mapping the required key to an integer constant.
+                PepHintPithUnsatisfiedMetadata(
+                    pith={'pale_purple_even': 0xBEEF},
+                    # Match that the exception message raised for this object
+                    # declares the key whose value violates its hint.
+                    exception_str_match_regexes=(
+                        r"\bTypedDictTotal key 'pale_purple_even' "
+                        r"value \"48879\" not str\b",
+                    ),
+                ),
+            ),
+        ),
+
+        # Typed dictionary requiring no keys.
+        PepHintMetadata(
+            hint=TypedDictPartial,
+            pep_sign=TypedDict,
+            is_subscripted=False,
+            is_type_typing=False,
+            piths_satisfied_meta=(
+                # Empty dictionary.
+                PepHintPithSatisfiedMetadata({}),
+                # Dictionary mapping all keys to valid values.
+                PepHintPithSatisfiedMetadata({
+                    'as_the_wave': 0xFEED,
+                    'the_stars': 'Sing to the sea beneath the moon',
+                }),
+            ),
+            piths_unsatisfied_meta=(
+                # List of string constants.
+                PepHintPithUnsatisfiedMetadata(
+                    pith=['By the sea of the blue', 'The dawn is deep'],
+                    # Match that the exception message raised for this object
+                    # declares the types *NOT* satisfied by this object.
+                    exception_str_match_regexes=(r'\bnot dict\b',),
+                ),
+            ),
+        ),
+    ))
@@ -41,6 +41,7 @@ def add_data(data_module: 'ModuleType') -> None:
     # thus supports PEP 593.
 
     # Defer Python >= 3.9-specific imports.
+    from beartype.vale import Is
     from typing import (
         Annotated,
         Any,
@@ -129,4 +130,64 @@ def add_data(data_module: 'ModuleType') -> None:
                 PepHintPithUnsatisfiedMetadata('Of a Spicily sated',),
             ),
         ),
+
+        # ................{ ANNOTATED ~ beartype : is         }................
+        # Annotated of a non-"typing" type annotated by a beartype validator
+        # inlinable as an expression-only lambda function.
+        PepHintMetadata(
+            hint=Annotated[str, Is[lambda text: bool(text)]],
+            pep_sign=Annotated,
+            piths_satisfied_meta=(
+                # Non-empty string constant.
+                PepHintPithSatisfiedMetadata(
+                    'Amid the ruins of a wraith‐worn world'),
+            ),
+            piths_unsatisfied_meta=(
+                # Empty string constant.
+                PepHintPithUnsatisfiedMetadata(''),
+                # List of string constants.
+                PepHintPithUnsatisfiedMetadata([
+                    'Of unbeknownst, unlovely lovelorn loss',]),
+            ),
+        ),
+
+        # Annotated of a "typing" type annotated by two beartype validators
+        # combined by a boolean operator, one of which is *NOT* inlinable.
+        PepHintMetadata(
+            hint=Annotated[
+                list[str],
+                Is[lambda lst: len(lst) == 2] & ~Is[callable],
+            ],
+            pep_sign=Annotated,
+            piths_satisfied_meta=(
+                # List of two string constants.
+                PepHintPithSatisfiedMetadata([
+                    'Unhallowed, hollowed horizons',
+                    'Of a harrowing, sorrowed sky',
+                ]),
+            ),
+            piths_unsatisfied_meta=(
+                # List of one string constant.
+                PepHintPithUnsatisfiedMetadata([
+                    'Of sorrow‐tossed, unrighteous rust',]),
+                # String constant.
+                PepHintPithUnsatisfiedMetadata(
+                    'Where wrought‐iron wrath unwrites the wind'),
+            ),
+        ),
+
+        # Annotated of an ignorable type hint annotated by a beartype
+        # validator, which is thus unignorable.
+        PepHintMetadata(
+            hint=Annotated[Any, Is[lambda obj: obj is not None]],
+            pep_sign=Annotated,
+            piths_satisfied_meta=(
+                # String constant.
+                PepHintPithSatisfiedMetadata('Of gloaming‐glutted graves'),
+            ),
+            piths_unsatisfied_meta=(
+                # The "None" singleton.
+                PepHintPithUnsatisfiedMetadata(None),
+            ),
+        ),
     ))
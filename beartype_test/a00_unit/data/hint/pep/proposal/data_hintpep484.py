@@ -47,7 +47,7 @@ from beartype_test.a00_unit.data.hint.data_hintmeta import (
     PepHintPithSatisfiedMetadata,
     PepHintPithUnsatisfiedMetadata,
 )
-from collections import abc as collections_abc
+from collections import abc as collections_abc, deque
 from contextlib import contextmanager
 from typing import (
     Any,
@@ -56,6 +56,7 @@ from typing import (
     Callable,
     Container,
     ContextManager,
+    Deque,
     Dict,
     Generator,
     Generic,
@@ -462,6 +463,49 @@ def add_data(data_module: 'ModuleType') -> None:
             ),
         ),
 
+        # ................{ DEQUE                             }................
+        # Deque of non-"typing" objects.
+        PepHintMetadata(
+            hint=Deque[str],
+            pep_sign=Deque,
+            stdlib_type=deque,
+            piths_satisfied_meta=(
+                # Empty deque, which satisfies all hint arguments by
+                # definition.
+                PepHintPithSatisfiedMetadata(deque()),
+                # Deque of strings.
+                PepHintPithSatisfiedMetadata(deque((
+                    'Of rudder‐shorn, deque‐dequeued pennants',
+                    'Unfurled at either end of a middling',
+                ))),
+                # Deque whose first and last items are strings. Since only the
+                # first and last items of deques are type-checked, this deque
+                # is intentionally accepted despite its middling integer.
+                PepHintPithSatisfiedMetadata(deque((
+                    'Mid‐muddied tenure',
+                    0xBABE,
+                    'unattended by its ends',
+                ))),
+            ),
+            piths_unsatisfied_meta=(
+                # String constant.
+                PepHintPithUnsatisfiedMetadata(
+                    'Dequeing the quayside’s queueing equanimity'),
+                # Deque whose last item is an integer.
+                PepHintPithUnsatisfiedMetadata(
+                    pith=deque(('Enqueued at either end,', 73)),
+                    # Match that the exception message raised for this object...
+                    exception_str_match_regexes=(
+                        # Declares the index of the last deque item *NOT*
+                        # satisfying this hint.
+                        r'\sdeque item 1\s',
+                        # Double-quotes the value of this item.
+                        r'\s"73"\s',
+                    ),
+                ),
+            ),
+        ),
+
         # ................{ DICT                              }................
         # Unsubscripted "Dict" attribute.
         PepHintMetadata(
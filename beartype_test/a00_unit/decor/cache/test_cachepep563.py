@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype postponed hint cache unit tests.**
+
+This submodule unit tests the
+:func:`beartype._decor._cache.cachepep563.eval_hint_postponed` function.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from pytest import raises
+
+# ....................{ TESTS                             }....................
+def test_eval_hint_postponed() -> None:
+    '''
+    Test the :func:`beartype._decor._cache.cachepep563.eval_hint_postponed`
+    function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._cache.cachepep563 import (
+        _MODULE_TO_HINT_POSTPONED_TO_ENTRY,
+        eval_hint_postponed,
+    )
+    from sys import modules as sys_modules
+    from types import ModuleType
+    from typing import Tuple
+
+    # Arbitrary module registered with the "sys.modules" dictionary.
+    module_name = 'beartype_test._the_spirit_of_beauty'
+    module = ModuleType(module_name)
+    module.__dict__.update(Floating=int, Tuple=Tuple, Unseen=str)
+    module_globals = module.__dict__
+    sys_modules[module_name] = module
+
+    # Postponed hint referencing both globals of this module and a builtin.
+    hint_str = 'Tuple[Floating, Unseen, float]'
+
+    try:
+        # Assert this function evaluates a postponed hint against this module.
+        hint = eval_hint_postponed(hint_str, module_globals, module_name)
+        assert hint == Tuple[int, str, float]
+
+        # Assert this function returns the same hint on subsequent evaluations
+        # of the same string against the same unchanged module.
+        assert eval_hint_postponed(
+            hint_str, module_globals, module_name) is hint
+        assert hint_str in _MODULE_TO_HINT_POSTPONED_TO_ENTRY[module]
+
+        # Assert this function re-evaluates this string after rebinding a
+        # global referenced by this string.
+        module.Unseen = bytes
+        assert eval_hint_postponed(hint_str, module_globals, module_name) == (
+            Tuple[int, bytes, float])
+
+        # Assert this function re-evaluates this string after shadowing a
+        # builtin referenced by this string by a global.
+        module.float = complex
+        assert eval_hint_postponed(hint_str, module_globals, module_name) == (
+            Tuple[int, bytes, complex])
+
+        # Assert this function propagates exceptions raised by evaluating
+        # strings referencing undefined globals without caching these strings.
+        with raises(NameError):
+            eval_hint_postponed('Among', module_globals, module_name)
+        assert 'Among' not in _MODULE_TO_HINT_POSTPONED_TO_ENTRY[module]
+
+        # Assert this function evaluates strings against global scopes *NOT*
+        # owned by this module without caching these strings.
+        assert eval_hint_postponed(
+            'Floating', {'Floating': float}, module_name) is float
+        assert 'Floating' not in _MODULE_TO_HINT_POSTPONED_TO_ENTRY[module]
+    finally:
+        del sys_modules[module_name]
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype protocol conformance cache unit tests.**
+
+This submodule unit tests the
+:attr:`beartype._decor._cache.cacheprotocol.protocol_types` singleton.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
+from pytest import raises
+
+# ....................{ TESTS                             }....................
+@skip_if_python_version_less_than('3.8.0')
+def test_protocol_types_register() -> None:
+    '''
+    Test the
+    :func:`beartype._decor._cache.cacheprotocol.register_protocol_types`
+    function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._cache.cacheprotocol import (
+        PROTOCOL_TYPES_NAME,
+        protocol_types,
+        register_protocol_types,
+    )
+    from typing import Protocol, runtime_checkable
+    from weakref import WeakSet
+
+    # Runtime-checkable protocol declaring only callable members.
+    @runtime_checkable
+    class TheSunIsWarm(Protocol):
+        def the_sky_is_clear(self) -> str: ...
+
+    # Runtime-checkable protocol declaring a data member.
+    @runtime_checkable
+    class TheWavesAreDancing(Protocol):
+        fast_and_bright: str
+
+    # Protocol *NOT* decorated by @runtime_checkable.
+    class BlueIslesAndSnowyMountains(Protocol):
+        def wear_the_purple_noon(self) -> str: ...
+
+    # Concrete subclass of a protocol.
+    class TransparentMight(TheSunIsWarm):
+        def the_sky_is_clear(self) -> str:
+            return 'The breath of the moist earth is light'
+
+    # Assert this function registers a weak set for cacheable protocols.
+    protocol_types_expr = register_protocol_types(TheSunIsWarm)
+    hint_types = eval(
+        protocol_types_expr, {PROTOCOL_TYPES_NAME: protocol_types})
+    assert isinstance(hint_types, WeakSet)
+
+    # Assert this function shares this set between all callers.
+    assert register_protocol_types(TheSunIsWarm) == protocol_types_expr
+
+    # Assert this function declines to register uncacheable generics.
+    assert register_protocol_types(TheWavesAreDancing) is None
+    assert register_protocol_types(BlueIslesAndSnowyMountains) is None
+    assert register_protocol_types(TransparentMight) is None
+
+
+@skip_if_python_version_less_than('3.8.0')
+def test_protocol_types_decor() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on callables annotated by
+    cacheable protocols.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype._decor._cache.cacheprotocol import (
+        clear_protocol_types,
+        protocol_types,
+        register_protocol_types,
+    )
+    from beartype.roar import BeartypeCallHintPepParamException
+    from typing import Protocol, runtime_checkable
+    import gc
+
+    # Runtime-checkable protocol declaring only callable members.
+    @runtime_checkable
+    class AroundIts(Protocol):
+        def unexpanded_buds(self) -> str: ...
+
+    # Class structurally satisfying this protocol.
+    class LikeManyAVoice(object):
+        def unexpanded_buds(self) -> str:
+            return 'of one delight'
+
+    # Class failing to satisfy this protocol.
+    class TheWindsTheBirds(object):
+        pass
+
+    # Callable annotated by this protocol.
+    @beartype
+    def the_ocean_floods(pith: AroundIts) -> AroundIts:
+        return pith
+
+    # Weak set of the types of all objects found to satisfy this protocol.
+    hint_types = eval(
+        register_protocol_types(AroundIts),
+        {'__beartype_protocol_types': protocol_types},
+    )
+
+    # Assert this callable accepts objects whose types satisfy this protocol,
+    # caching these types.
+    the_city_voice = LikeManyAVoice()
+    assert the_ocean_floods(the_city_voice) is the_city_voice
+    assert LikeManyAVoice in hint_types
+
+    # Assert this callable accepts objects whose instance variables satisfy
+    # this protocol *WITHOUT* caching the types of these objects.
+    the_solitude = TheWindsTheBirds()
+    the_solitude.unexpanded_buds = lambda: 'from noon'
+    assert the_ocean_floods(the_solitude) is the_solitude
+    assert TheWindsTheBirds not in hint_types
+
+    # Assert this callable rejects objects failing to satisfy this protocol.
+    with raises(BeartypeCallHintPepParamException):
+        the_ocean_floods(TheWindsTheBirds())
+
+    # Assert that clearing this cache clears this set.
+    clear_protocol_types()
+    assert LikeManyAVoice not in hint_types
+    assert the_ocean_floods(the_city_voice) is the_city_voice
+    assert LikeManyAVoice in hint_types
+
+    # Assert this set only weakly refers to these types.
+    hint_types_len = len(hint_types)
+    del the_city_voice, LikeManyAVoice
+    gc.collect()
+    assert len(hint_types) == hint_types_len - 1
+
+
+@skip_if_python_version_less_than('3.8.0')
+def test_protocol_types_clear_public() -> None:
+    '''
+    Test the public :func:`beartype.clear_protocol_types` function on types
+    monkey-patched to no longer satisfy cacheable protocols.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype, clear_protocol_types
+    from beartype.roar import BeartypeCallHintPepParamException
+    from typing import Protocol, runtime_checkable
+
+    # Runtime-checkable protocol declaring only callable members.
+    @runtime_checkable
+    class TheSkylark(Protocol):
+        def pour_thy_full_heart(self) -> str: ...
+
+    # Class structurally satisfying this protocol until monkey-patched below.
+    class BlitheSpirit(object):
+        def pour_thy_full_heart(self) -> str:
+            return 'in profuse strains of unpremeditated art'
+
+    # Callable annotated by this protocol.
+    @beartype
+    def hail_to_thee(pith: TheSkylark) -> str:
+        return 'Bird thou never wert'
+
+    # Assert this callable accepts objects whose types satisfy this protocol,
+    # caching these types.
+    assert hail_to_thee(BlitheSpirit()) == 'Bird thou never wert'
+
+    # Monkey-patch this type to no longer satisfy this protocol. Since this
+    # cache is *NOT* invalidated on class mutation, this callable continues to
+    # accept objects of this type.
+    del BlitheSpirit.pour_thy_full_heart
+    assert hail_to_thee(BlitheSpirit()) == 'Bird thou never wert'
+
+    # Assert that clearing this cache publicly forces this callable to
+    # reinspect this type and thus reject objects of this type.
+    clear_protocol_types()
+    with raises(BeartypeCallHintPepParamException):
+        hail_to_thee(BlitheSpirit())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype union type mask cache unit tests.**
+
+This submodule unit tests the
+:attr:`beartype._decor._cache.cacheunion.union_type_masks` singleton.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.roar import BeartypeDecorHintPepDeprecatedWarning
+from beartype_test.util.mark.pytmark import ignore_warnings
+from pytest import raises
+
+# ....................{ TESTS                             }....................
+def test_union_type_masks_register() -> None:
+    '''
+    Test the
+    :func:`beartype._decor._cache.cacheunion.register_union_type_masks`
+    function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._cache.cacheunion import (
+        UNION_TYPE_MASKS_NAME,
+        union_type_masks,
+        register_union_type_masks,
+    )
+    from beartype_test.a00_unit.data.data_type import NonIsinstanceableClass
+    from collections.abc import Sequence
+    from typing import Dict, List, Tuple, TypeVar
+
+    # Assert this function masks each origin type of a wide union by the bits
+    # selecting all child hints that objects of exactly that type could
+    # satisfy, including PEP-noncompliant child hints.
+    type_masks_expr = register_union_type_masks(
+        (Sequence,), (List[int], Dict[str, int], Tuple[str, ...]))
+    type_masks = eval(
+        type_masks_expr, {UNION_TYPE_MASKS_NAME: union_type_masks})
+    assert type_masks == {list: 0b0011, dict: 0b0100, tuple: 0b1001}
+
+    # Assert this function declines to dispatch on narrow unions.
+    assert register_union_type_masks(
+        (), (List[int], Dict[str, int])) is None
+
+    # Assert this function declines to dispatch on unions subscripted by
+    # PEP-compliant child hints originating from no standard type.
+    assert register_union_type_masks(
+        (), (List[int], Dict[str, int], TypeVar('T'))) is None
+
+    # Assert this function declines to dispatch on unions subscripted by
+    # PEP-noncompliant child hints performing non-standard instance checks.
+    assert register_union_type_masks(
+        (NonIsinstanceableClass,),
+        (List[int], Dict[str, int], Tuple[str, ...]),
+    ) is None
+
+
+# Since the "typing" hints subscripted below are deprecated by PEP 585 under
+# Python >= 3.9 but remain the only subscriptable container hints under older
+# Python versions, ignore the warnings emitted by decorating callables
+# annotated by these hints.
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_union_type_masks_dispatch() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on callables annotated by
+    unions dispatchable on the types of objects.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from typing import Dict, List, Tuple, Union
+
+    # Subclass of a type dispatched on below.
+    class FlockOfLists(list):
+        pass
+
+    # Callable annotated by a union dispatchable on the types of objects,
+    # including a parameter whose name shadows the "type" builtin.
+    @beartype
+    def shallow_sea(
+        type: Union[List[int], Dict[str, int], Tuple[str, ...], None],
+    ) -> object:
+        return type
+
+    # Assert this callable accepts objects satisfying each child hint,
+    # including instances of subclasses of the types dispatched on.
+    for pith in (
+        [0xBEEF],
+        {'Where the': 0xF0E},
+        ('leaps', 'through'),
+        None,
+        [],
+        FlockOfLists((0xFEED,)),
+    ):
+        assert shallow_sea(pith) is pith
+
+    # Assert this callable rejects objects violating all child hints,
+    # including instances of subclasses of the types dispatched on.
+    for pith in (
+        ['the foam'],
+        (0xFADE,),
+        'of the waves',
+        FlockOfLists(('wings',)),
+    ):
+        with raises(BeartypeCallHintPepParamException):
+            shallow_sea(pith)
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype decorator code generation benchmarks.**
+
+This submodule benchmarks the :func:`beartype.beartype` decorator with respect
+to the efficiency of code dynamically generated by the
+:mod:`beartype._decor._code` subpackage. Since wall-clock timings are
+inherently noisy, these benchmarks only assert structural properties of that
+code (e.g., the presence of fast paths, the number of characters scanned while
+generating that code) rather than timings.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.roar import BeartypeDecorHintPepDeprecatedWarning
+from beartype_test.util.mark.pytmark import ignore_warnings
+from beartype_test.util.pyterror import raises_uncached
+from typing import Dict, List, Tuple, Union
+
+# ....................{ PRIVATE ~ factories               }....................
+def _make_hint_nested_list_union(depth: int) -> object:
+    '''
+    PEP-compliant type hint nesting the passed number of
+    ``List[Union[..., str]]`` hints, bottoming out at :class:`int`.
+    '''
+
+    hint = int
+    for _ in range(depth):
+        hint = List[Union[hint, str]]
+    return hint
+
+
+def _get_hint_nested_depths() -> tuple:
+    '''
+    Tuple of the nesting depths of the hints created by the
+    :func:`_make_hint_nested_list_union` factory to be benchmarked under the
+    active Python interpreter.
+
+    Since Python < 3.8 lacks `PEP 572`_-compliant assignment expressions, code
+    generated under these interpreters repeats the expression yielding each
+    child pith once for each member of each union rather than localizing that
+    pith once, doubling the length of that code with each nesting level. Code
+    generated for deeper hints is then too large to compile (or even
+    generate) in reasonable space, reducing these depths accordingly.
+
+    .. _PEP 572:
+       https://www.python.org/dev/peps/pep-0572
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
+
+    return (10, 20, 40) if IS_PYTHON_AT_LEAST_3_8 else (4, 6, 8)
+
+# ....................{ TESTS                             }....................
+# Since the "typing" hints subscripted below are deprecated by PEP 585 under
+# Python >= 3.9 but remain the only subscriptable container hints under older
+# Python versions, ignore the warnings emitted by decorating callables
+# annotated by these hints.
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_codebench_hint_abc_pass() -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator successfully generates
+    working code type-checking standard abstract base classes (ABCs) against
+    both common concrete types short-circuited by a fast path *and* other
+    types deferring to the :func:`isinstance` builtin.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.cave import MappingType, SequenceType
+    from beartype.roar import BeartypeCallHintPepParamException
+    from collections import UserList
+    from collections.abc import Iterable, Sequence
+
+    # Sequence subclass *NOT* short-circuited by this fast path.
+    class StillSnowyAndSerene(Sequence):
+        def __getitem__(self, index): return 'Mont Blanc'
+        def __len__(self): return 1
+
+    @beartype
+    def the_everlasting_universe(
+        things: SequenceType,
+        flows: MappingType,
+        through: List[Iterable],
+    ) -> Sequence:
+        return things
+
+    # Assert this callable to accept concrete types on the fast path.
+    assert the_everlasting_universe(
+        ('Now dark',), {'now glittering': 0}, [range(3)]) == ('Now dark',)
+
+    # Assert this callable to accept other types on the slow path.
+    assert the_everlasting_universe(
+        UserList(), {}, [StillSnowyAndSerene()]) == UserList()
+    ravine = StillSnowyAndSerene()
+    assert the_everlasting_universe(ravine, {}, []) is ravine
+
+    # Assert this callable to reject types satisfying neither path.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_everlasting_universe({'now reflecting gloom'}, {}, [])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_everlasting_universe((), ['now lending splendour'], [])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_everlasting_universe((), {}, [0xDEADBEEF])
+
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_codebench_hint_abc_fast() -> None:
+    '''
+    Benchmark the code generated by the :func:`beartype.beartype` decorator
+    type-checking a standard abstract base class (ABC), asserting that code to
+    test whether the type of the current pith is a common concrete type
+    subclassing that ABC in constant time *before* deferring to the
+    comparatively slow :meth:`abc.ABCMeta.__instancecheck__` dunder method.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._code._pep._pephint import pep_code_check_hint
+    from beartype._util.cls.utilclsabc import TYPE_ABC_TO_TYPES_CONCRETE
+    from collections.abc import Sequence
+
+    # Assert common concrete sequence types to be short-circuited.
+    assert list in TYPE_ABC_TO_TYPES_CONCRETE[Sequence]
+
+    # For both this ABC and a container of this ABC...
+    for hint in (Sequence, List[Sequence]):
+        # Python code type-checking this hint.
+        func_code = pep_code_check_hint(hint, False)[0]
+
+        # Assert this code to test the type of the pith against the frozen set
+        # of concrete types subclassing this ABC *BEFORE* calling isinstance().
+        func_code_fast_index = func_code.find(
+            ') in __beartype_types_concrete_Sequence or isinstance(')
+        assert func_code_fast_index != -1
+        assert func_code.rfind('type(', 0, func_code_fast_index) != -1
+
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_codebench_hint_nested_pass() -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator successfully generates
+    working code type-checking a deeply nested PEP-compliant type hint.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+
+    # Hint nested to the median depth benchmarked below.
+    hint = _make_hint_nested_list_union(_get_hint_nested_depths()[1])
+
+    @beartype
+    def ever_deeper(pith: hint) -> None:
+        pass
+
+    # Assert valid piths at various nesting levels to satisfy this hint.
+    ever_deeper([])
+    ever_deeper(['Down and down'])
+    ever_deeper([[[['and down']]]])
+
+    # Assert invalid piths at various nesting levels to violate this hint.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        ever_deeper([b'and down'])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        ever_deeper([[[[b'and down']]]])
+
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_codebench_hint_nested_linear() -> None:
+    '''
+    Benchmark the
+    :func:`beartype._decor._code._pep._pephint.pep_code_check_hint` code
+    generator against deeply nested PEP-compliant type hints, asserting the
+    number of characters scanned while assembling the generated code to grow
+    linearly with the length of that code.
+
+    Assembling code by repeatedly replacing placeholders in the entire code
+    generated thus far would instead scan a number of characters growing
+    linearly with both the length of that code *and* the nesting depth.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._code._pep import _pephint
+
+    # Unmemoized code generator, avoiding memoization across depths.
+    pep_code_check_hint_uncached = _pephint.pep_code_check_hint.__wrapped__
+
+    # Regular expression splitting snippets on child hint placeholders.
+    hint_child_placeholder_regex = _pephint._HINT_CHILD_PLACEHOLDER_REGEX
+
+    class _PlaceholderRegexCounted(object):
+        '''
+        Proxy of this regular expression counting the number of characters
+        scanned by all calls to the :meth:`re.Pattern.split` method.
+        '''
+
+        def __init__(self) -> None:
+            self.chars_scanned = 0
+
+        def split(self, text: str) -> list:
+            self.chars_scanned += len(text)
+            return hint_child_placeholder_regex.split(text)
+
+    # For each nesting depth to be benchmarked...
+    for depth in _get_hint_nested_depths():
+        # Proxy counting the characters scanned while generating code.
+        regex_counted = _PlaceholderRegexCounted()
+
+        # Python code type-checking a hint nested to this depth, generated
+        # while this proxy replaces this regular expression.
+        _pephint._HINT_CHILD_PLACEHOLDER_REGEX = regex_counted
+        try:
+            func_code = pep_code_check_hint_uncached(
+                _make_hint_nested_list_union(depth))[0]
+        finally:
+            _pephint._HINT_CHILD_PLACEHOLDER_REGEX = (
+                hint_child_placeholder_regex)
+
+        # Assert that each snippet was scanned exactly once, with slack for
+        # the placeholders replaced by child snippets.
+        assert 0 < regex_counted.chars_scanned <= len(func_code) * 2
+
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_codebench_hint_newtype_pass() -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator successfully generates
+    working code type-checking chains of `PEP 484`_-compliant new types
+    subscripting container hints, reducing these new types to the classes
+    ultimately aliased by these chains.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype._decor._code._pep._pephint import pep_code_check_hint
+    from beartype.roar import BeartypeCallHintPepParamException
+    from typing import NewType
+
+    # Identifier domain model of new types aliasing other new types.
+    UserId = NewType('UserId', int)
+    AuthorId = NewType('AuthorId', UserId)
+    PoemId = NewType('PoemId', int)
+
+    # Assert code type-checking these new types to be identical to code
+    # type-checking the classes ultimately aliased by these new types.
+    assert pep_code_check_hint(
+        List[Tuple[PoemId, AuthorId]], False)[0] == pep_code_check_hint(
+        List[Tuple[int, int]], False)[0]
+    assert pep_code_check_hint(Union[AuthorId, str], False)[0] == (
+        pep_code_check_hint(Union[int, str], False)[0])
+
+    @beartype
+    def alastor(
+        poet: AuthorId, poems: List[Tuple[PoemId, UserId]]) -> AuthorId:
+        return poet
+
+    # Assert this callable to accept objects of the aliased classes.
+    assert alastor(1816, [(1, 1816)]) == 1816
+
+    # Assert this callable to reject objects of other classes.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        alastor('The Spirit of Solitude', [])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        alastor(1816, [(1, 'The Spirit of Solitude')])
+
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_codebench_hint_newtype_fast() -> None:
+    '''
+    Benchmark the code generated by the :func:`beartype.beartype` decorator
+    type-checking a domain model of identifiers typed as chains of `PEP
+    484`_-compliant new types, asserting that code to be identical to code
+    type-checking the classes ultimately aliased by these new types.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from typing import NewType
+
+    # Identifier domain model of new types aliasing other new types.
+    UserId = NewType('UserId', int)
+    AuthorId = NewType('AuthorId', UserId)
+    PoemId = NewType('PoemId', int)
+    StanzaId = NewType('StanzaId', PoemId)
+
+    @beartype
+    def by_newtypes(
+        author: AuthorId,
+        poems: Dict[PoemId, List[StanzaId]],
+        reader: Union[UserId, str],
+    ) -> List[AuthorId]:
+        return [author]
+
+    @beartype
+    def by_classes(
+        author: int,
+        poems: Dict[int, List[int]],
+        reader: Union[int, str],
+    ) -> List[int]:
+        return [author]
+
+    # Code objects of the wrappers type-checking both callables.
+    code_newtypes = by_newtypes.__code__
+    code_classes = by_classes.__code__
+
+    # Assert these wrappers to be identical and thus equally fast.
+    assert code_newtypes.co_code == code_classes.co_code
+    assert code_newtypes.co_consts == code_classes.co_consts
+    assert code_newtypes.co_names == code_classes.co_names
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype decorator NumPy type hint unit tests.**
+
+This submodule unit tests the :func:`beartype.beartype` decorator with respect
+to :mod:`numpy`-specific **array type hints** (i.e., subscriptions of the
+:class:`numpy.ndarray` type, including ``numpy.typing.NDArray[...]`` hints).
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import (
+    skip_if_python_version_less_than,
+    skip_unless_package,
+)
+from pytest import raises
+
+# ....................{ TESTS                             }....................
+@skip_if_python_version_less_than('3.9.0')
+@skip_unless_package('numpy', '1.22.0')
+def test_numpy_ndarray_code() -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator generates code
+    type-checking :mod:`numpy` array type hints by array metadata alone.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._code._pep._pephint import pep_code_check_hint
+    from numpy.typing import NDArray
+    import numpy
+
+    # Code type-checking a hint constraining both dtype and dimensionality.
+    hint_code = pep_code_check_hint(
+        numpy.ndarray[tuple[int, int], numpy.dtype[numpy.floating]], False)[0]
+    assert '.dtype.type' in hint_code
+    assert '.ndim == 2' in hint_code
+
+    # Code type-checking a hint constraining neither.
+    hint_code = pep_code_check_hint(NDArray, False)[0]
+    assert '.dtype' not in hint_code
+    assert '.ndim' not in hint_code
+
+
+@skip_if_python_version_less_than('3.9.0')
+@skip_unless_package('numpy', '1.22.0')
+def test_numpy_ndarray_decor() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on callables annotated by
+    :mod:`numpy` array type hints.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from numpy.typing import NDArray
+    import numpy
+
+    # Callable annotated by array type hints constraining dtypes and shapes.
+    @beartype
+    def the_wilderness(
+        mysterious_tongue: NDArray[numpy.float64],
+        awful_doubt: numpy.ndarray[
+            tuple[int, int], numpy.dtype[numpy.integer]],
+        mild_faith: list[NDArray[numpy.bool_]],
+    ) -> NDArray[numpy.float64]:
+        return mysterious_tongue
+
+    # Arrays satisfying these hints.
+    great_mountain = numpy.linspace(0., 1., 8)
+    codes_of_fraud = numpy.zeros((2, 4), dtype=numpy.int8)
+    woe = [numpy.ones(3, dtype=numpy.bool_)]
+
+    # Assert this callable accepts these arrays.
+    assert the_wilderness(great_mountain, codes_of_fraud, woe) is (
+        great_mountain)
+
+    # Assert this callable rejects objects that are not arrays.
+    with raises(BeartypeCallHintPepParamException):
+        the_wilderness([0.5, 1.0], codes_of_fraud, woe)
+
+    # Assert this callable rejects arrays of the wrong dtype.
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        the_wilderness(
+            great_mountain.astype(numpy.float32), codes_of_fraud, woe)
+    assert 'dtype' in str(exception_info.value)
+    with raises(BeartypeCallHintPepParamException):
+        the_wilderness(great_mountain, codes_of_fraud, [great_mountain])
+
+    # Assert this callable rejects arrays of the wrong dimensionality.
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        the_wilderness(great_mountain, codes_of_fraud.ravel(), woe)
+    assert '1-dimensional' in str(exception_info.value)
@@ -24,6 +24,9 @@ See Also
 # WARNING: To raise human-readable test errors, avoid importing from
 # package-specific submodules at module scope.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.roar import BeartypeDecorHintPepDeprecatedWarning
+from beartype_test.util.mark.pytmark import ignore_warnings
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
 from beartype_test.util.pyterror import raises_uncached
 from typing import Any, Union
 
@@ -140,3 +143,164 @@ def test_pep_param_kind_variadic_fail() -> None:
             'The teeth tearing into it',
             'The tongue tasting its savour',
             teeth_tearing_into_it='And the hunger for that taste')
+
+# ....................{ TESTS ~ union                     }....................
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_pep_union_order() -> None:
+    '''
+    Test that the code generated by the :func:`beartype.beartype` decorator to
+    type-check unions deterministically type-checks cheaper child hints of
+    those unions before more expensive child hints.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._code._pep._pephint import pep_code_check_hint
+    from collections.abc import Sized
+    from typing import Callable, List
+
+    # Code type-checking a union whose child hints are listed in descending
+    # order of cost.
+    func_code = pep_code_check_hint(
+        Union[List[str], Callable[[], str], Sized, str, None], False)[0]
+
+    # Assert this code identifies the "None" singleton first, type-checks
+    # PEP-noncompliant child hints second, shallowly type-checks PEP-compliant
+    # child hints third, and deeply type-checks PEP-compliant child hints last.
+    assert (
+        func_code.index(') is None') <
+        func_code.index("__beartypistry['+") <
+        func_code.index("__beartypistry['collections.abc.Callable']") <
+        func_code.index(', list)')
+    )
+
+    # Assert this code is identical to the code type-checking an equivalent
+    # union whose child hints of differing costs are listed in reverse order.
+    assert pep_code_check_hint(
+        Union[None, str, Sized, Callable[[], str], List[str]], False)[0] == (
+        func_code)
+
+# ....................{ PRIVATE ~ generic                 }....................
+def _check_generic_subscription_propagated(
+    generic_typevar: type,
+    generic_subscripted: type,
+    generic_generic: type,
+    generic_unparametrized: type,
+    hint_base: object,
+) -> None:
+    '''
+    Assert the :func:`beartype.beartype` decorator to deeply type-check the
+    items of the passed user-defined sequence generics.
+
+    Parameters
+    ----------
+    generic_typevar : type
+        Generic subclassing both a list hint subscripted by a type variable
+        *and* :class:`typing.Generic` subscripted by that type variable.
+    generic_subscripted : type
+        Generic subclassing ``hint_base``.
+    generic_generic : type
+        Generic subclassing ``generic_typevar`` subscripted by :class:`str`.
+    generic_unparametrized : type
+        Generic subclassing *only* a list hint subscripted by a type variable.
+    hint_base : object
+        List hint subscripted by :class:`int`, expected to be embedded in the
+        message of the exception raised on violating
+        ``generic_typevar[int]``.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+
+    @beartype
+    def boundless_and_bare(
+        lone: generic_typevar[int],
+        level: generic_subscripted,
+        sands: generic_generic,
+        stretch: generic_unparametrized[bytes],
+    ) -> None:
+        pass
+
+    # Assert this callable to accept generics whose items satisfy these child
+    # hints.
+    boundless_and_bare(
+        generic_typevar([1]),
+        generic_subscripted([2]),
+        generic_generic(['far away']),
+        generic_unparametrized([b'stretch']),
+    )
+
+    # Assert this callable to reject generics whose items violate these child
+    # hints.
+    with raises_uncached(BeartypeCallHintPepParamException) as exception_info:
+        boundless_and_bare(
+            generic_typevar(['lone']), generic_subscripted(),
+            generic_generic(), generic_unparametrized())
+    assert f'generic base {repr(hint_base)}' in str(exception_info.value)
+    with raises_uncached(BeartypeCallHintPepParamException):
+        boundless_and_bare(
+            generic_typevar(), generic_subscripted(['level']),
+            generic_generic(), generic_unparametrized())
+    with raises_uncached(BeartypeCallHintPepParamException):
+        boundless_and_bare(
+            generic_typevar(), generic_subscripted(),
+            generic_generic([0xDECAF]), generic_unparametrized())
+    with raises_uncached(BeartypeCallHintPepParamException):
+        boundless_and_bare(
+            generic_typevar(), generic_subscripted(),
+            generic_generic(), generic_unparametrized(['bare']))
+
+# ....................{ TESTS ~ generic                   }....................
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_pep_generic_subscription_propagated() -> None:
+    '''
+    Test that the code generated by the :func:`beartype.beartype` decorator to
+    type-check user-defined generics propagates child hints subscripting
+    these generics to their :mod:`typing` pseudo-superclasses, deeply
+    type-checking the items of user-defined sequence generics.
+    '''
+
+    # Defer heavyweight imports.
+    from typing import Generic, List, TypeVar
+
+    # Type variable parametrizing the generics declared below.
+    T = TypeVar('T')
+
+    # User-defined sequence generics.
+    class Nothing(List[T], Generic[T]): pass
+    class BesideRemains(List[int]): pass
+    class RoundTheDecay(Nothing[str]): pass
+    class ThatColossalWreck(List[T]): pass
+
+    # Assert these generics to be type-checked as expected.
+    _check_generic_subscription_propagated(
+        Nothing, BesideRemains, RoundTheDecay, ThatColossalWreck, List[int])
+
+
+@skip_if_python_version_less_than('3.9.0')
+def test_pep585_generic_subscription_propagated() -> None:
+    '''
+    Test that the code generated by the :func:`beartype.beartype` decorator to
+    type-check user-defined generics propagates child hints subscripting
+    these generics to their `PEP 585`_-compliant pseudo-superclasses, deeply
+    type-checking the items of user-defined sequence generics.
+
+    .. _PEP 585:
+       https://www.python.org/dev/peps/pep-0585
+    '''
+
+    # Defer heavyweight imports.
+    from typing import Generic, TypeVar
+
+    # Type variable parametrizing the generics declared below.
+    T = TypeVar('T')
+
+    # User-defined sequence generics.
+    class LoneAndLevel(list[T], Generic[T]): pass
+    class TheSands(list[int]): pass
+    class StretchFarAway(LoneAndLevel[str]): pass
+    class KingOfKings(list[T]): pass
+
+    # Assert these generics to be type-checked as expected.
+    _check_generic_subscription_propagated(
+        LoneAndLevel, TheSands, StretchFarAway, KingOfKings, list[int])
@@ -113,6 +113,152 @@ def test_decor_param_name_fail() -> None:
         def jokaero(weaponsmith: str, __beartype_func: str) -> str:
             return weaponsmith + __beartype_func
 
+
+def test_decor_param_sig_mirrored() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables whose wrapper functions mirror the signatures of those callables
+    *and* callables whose wrapper functions fallback to repacking all passed
+    parameters into variadic parameters.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from functools import wraps
+
+    # Decorated callable accepting parameters of all kinds, including an
+    # optional parameter whose default value violates its type hint.
+    @beartype
+    def craftworld(
+        eldar: str,
+        farseer: int = None,
+        *warlocks: str,
+        autarch: str,
+        avatar: str = 'Khaine',
+        **aspects
+    ) -> tuple:
+        return (eldar, farseer, warlocks, autarch, avatar, aspects)
+
+    # Assert that this wrapper mirrors the signature of this callable.
+    assert craftworld.__code__.co_varnames[:2] == ('eldar', 'farseer')
+
+    # Assert that this wrapper forwards unpassed default values as is
+    # *WITHOUT* type-checking these values.
+    assert craftworld('Ulthwé', autarch='Yriel') == (
+        'Ulthwé', None, (), 'Yriel', 'Khaine', {})
+
+    # Assert that this wrapper forwards all passed parameters as is.
+    assert craftworld(
+        'Biel-Tan', 7, 'Eldrad', autarch='Taldeer', avatar='Asuryan',
+        banshee='Jain Zar',
+    ) == (
+        'Biel-Tan', 7, ('Eldrad',), 'Taldeer', 'Asuryan',
+        {'banshee': 'Jain Zar'},
+    )
+
+    # Assert that this wrapper type-checks passed parameters of all kinds.
+    with raises(BeartypeCallHintPepParamException):
+        craftworld('Saim-Hann', 'Jetbike', autarch='Nuadhu')
+    with raises(BeartypeCallHintPepParamException):
+        craftworld('Iyanden', 3, b'Wraithlord', autarch='Yriel')
+    with raises(BeartypeCallHintPepParamException):
+        craftworld('Alaitoc', autarch=b'Illic')
+
+    # Decorated callable type-checking only every other call.
+    @beartype(conf=BeartypeConf(sample_every=2))
+    def exodite(dragon: str = 'Wyrm', *, knight: str = 'Lance') -> tuple:
+        return (dragon, knight)
+
+    # Assert that both type-checked and unchecked calls forward unpassed
+    # default values as is.
+    assert exodite() == ('Wyrm', 'Lance')
+    assert exodite() == ('Wyrm', 'Lance')
+
+    # Assert that both type-checked and unchecked calls forward the current
+    # default values of this callable rather than those at decoration time.
+    exodite.__wrapped__.__defaults__ = ('Wraith',)
+    exodite.__wrapped__.__kwdefaults__ = {'knight': 'Shining Spear'}
+    assert exodite() == ('Wraith', 'Shining Spear')
+    assert exodite() == ('Wraith', 'Shining Spear')
+
+    # Decorated callable accepting a parameter shadowing a builtin referenced
+    # by type-checking code, preventing this wrapper from mirroring.
+    @beartype
+    def harlequin(isinstance: str, troupe: int = 0) -> str:
+        return isinstance * troupe
+
+    # Assert that this wrapper still type-checks and forwards parameters.
+    assert harlequin('Cegorach', troupe=2) == 'CegorachCegorach'
+    with raises(BeartypeCallHintPepParamException):
+        harlequin(b'Laughing God')
+
+    # Callable wrapping another callable with a differing signature, also
+    # preventing this wrapper from mirroring.
+    def corsair(reaver: str) -> str:
+        return reaver
+
+    @beartype
+    @wraps(corsair)
+    def corsair_prince(*args, **kwargs) -> str:
+        return corsair(*args, **kwargs)
+
+    # Assert that this wrapper still type-checks and forwards parameters.
+    assert corsair_prince(reaver='Yriel') == 'Yriel'
+    with raises(BeartypeCallHintPepParamException):
+        corsair_prince(0xBADC0DE)
+
+def test_decor_param_kind_var_keyword() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables accepting annotated variadic keyword parameters, type-checked in
+    either constant time by default *or* linear time when configured to.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+
+    # Callable accepting annotated variadic keyword parameters.
+    def librarium(codex: str, **scrolls: int) -> int:
+        return len(scrolls)
+
+    # Callable accepting a parameter shadowing a builtin referenced by
+    # type-checking code, preventing its wrapper from mirroring and thus
+    # repacking these parameters into the variadic "**kwargs" parameter.
+    def scriptorium(isinstance: str, **scrolls: int) -> int:
+        return len(scrolls)
+
+    # Wrappers type-checking one *OR* all such parameters.
+    librarium_one = beartype(librarium)
+    librarium_all = beartype(
+        conf=BeartypeConf(is_check_kwargs_all=True))(librarium)
+    scriptorium_one = beartype(scriptorium)
+
+    # Assert that all wrappers accept valid variadic keyword parameters,
+    # including *NO* such parameters.
+    for librarium_wrapper in (librarium_one, librarium_all, scriptorium_one):
+        assert librarium_wrapper('Astartes') == 0
+        assert librarium_wrapper('Astartes', codex_i=1, codex_ii=2) == 2
+
+        # Assert that all wrappers reject an invalid sole such parameter.
+        with raises(BeartypeCallHintPepParamException):
+            librarium_wrapper('Astartes', apocrypha='Heresy')
+
+    # Assert that only the wrapper type-checking all such parameters rejects
+    # an invalid non-first such parameter.
+    assert librarium_one('Astartes', codex_i=1, apocrypha='Heresy') == 2
+    assert scriptorium_one('Astartes', codex_i=1, apocrypha='Heresy') == 2
+    with raises(BeartypeCallHintPepParamException):
+        librarium_all('Astartes', codex_i=1, apocrypha='Heresy')
+
+    # Assert that wrappers type-checking one such parameter do so in constant
+    # time by *NOT* copying these parameters into a per-call container.
+    for librarium_wrapper in (librarium_one, scriptorium_one):
+        wrapper_code = librarium_wrapper.__code__
+        assert not {'tuple', 'list'} & set(wrapper_code.co_names)
+        assert '__beartype_kwargs_values' not in wrapper_code.co_varnames
+
 # ....................{ TESTS ~ fail : param : call       }....................
 def test_decor_param_call_keyword_unknown_fail() -> None:
     '''
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype bulk decorator unit tests.**
+
+This submodule unit tests the :func:`beartype.beartype_all` function.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.roar import BeartypeDecorHintPepDeprecatedWarning
+from beartype_test.util.mark.pytmark import ignore_warnings
+from pytest import raises
+
+# ....................{ PRIVATE ~ classes                 }....................
+class _FearfulSymmetry(object):
+    '''
+    Arbitrary user-defined class, concurrently registered by multiple threads
+    decorating callables annotated by this class.
+    '''
+
+    def __len__(self) -> int:
+        return 0
+
+# ....................{ PRIVATE ~ factories               }....................
+def _make_funcs(funcs_len: int) -> list:
+    '''
+    List of the passed number of callables alternately annotated by distinct
+    PEP-compliant hints, PEP-noncompliant hints, and *no* hints.
+    '''
+
+    # Defer heavyweight imports.
+    from typing import List, Tuple, Union
+
+    # List of these callables.
+    funcs = []
+
+    for func_index in range(funcs_len):
+        if func_index % 3 == 0:
+            # Hint unique to this callable.
+            hint = List[Union[str, Tuple[(int,)*(func_index % 7 + 1)]]]
+            def the_tyger(burning_bright: hint) -> int:
+                return len(burning_bright)
+        elif func_index % 3 == 1:
+            def the_tyger(
+                burning_bright: Union[str, _FearfulSymmetry]) -> int:
+                return len(burning_bright)
+        else:
+            def the_tyger(burning_bright):
+                return len(burning_bright)
+
+        funcs.append(the_tyger)
+
+    # Return these callables.
+    return funcs
+
+# ....................{ TESTS                             }....................
+# Since the "typing" hints subscripted below are deprecated by PEP 585 under
+# Python >= 3.9 but remain the only subscriptable container hints under older
+# Python versions, ignore the warnings emitted by decorating callables
+# annotated by these hints.
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_decor_all() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype_all` function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype_all
+    from beartype.roar import BeartypeCallHintPepParamException
+
+    # Assert the empty iterable to be decorated as the empty list.
+    assert beartype_all(()) == []
+
+    # Callables to be decorated.
+    funcs = _make_funcs(300)
+
+    # For each number of workers...
+    for workers in (1, 4, None):
+        # Wrappers decorating these callables, in the same order.
+        funcs_typed = beartype_all(iter(funcs), workers=workers)
+        assert len(funcs_typed) == len(funcs)
+
+        for func_index, (func, func_typed) in enumerate(
+            zip(funcs, funcs_typed)):
+            # Assert unannotated callables to be preserved as is.
+            if func_index % 3 == 2:
+                assert func_typed is func
+                continue
+
+            # Assert annotated callables to be wrapped in the caller's order.
+            assert func_typed is not func
+            assert func_typed.__wrapped__ is func
+
+            # Assert these wrappers to type-check as expected.
+            if func_index % 3 == 0:
+                assert func_typed(['Tyger Tyger,', 'burning bright']) == 2
+                with raises(BeartypeCallHintPepParamException):
+                    func_typed([b'In the forests of the night'])
+            else:
+                assert func_typed('What immortal hand or eye') == 25
+                assert func_typed(_FearfulSymmetry()) == 0
+                with raises(BeartypeCallHintPepParamException):
+                    func_typed(b'Could frame thy fearful symmetry?')
+
+    # Assert configured wrappers to respect this configuration.
+    funcs_typed = beartype_all(
+        funcs[:2], conf=BeartypeConf(sample_every=2), workers=2)
+    with raises(BeartypeCallHintPepParamException):
+        funcs_typed[1](b'In what distant deeps or skies.')
+    assert funcs_typed[1](b'Burnt the fire of thine eyes?') == 29
+
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_decor_all_fail() -> None:
+    '''
+    Test unsuccessful usage of the :func:`beartype.beartype_all` function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype_all
+    from beartype.roar import (
+        BeartypeConfException,
+        BeartypeDecorWrappeeException,
+    )
+
+    # Assert invalid parameters to be rejected.
+    with raises(BeartypeConfException):
+        beartype_all((), conf={'sample_every': 2})
+    for workers in (0, True, 2.0):
+        with raises(BeartypeConfException):
+            beartype_all((), workers=workers)
+
+    # Assert undecoratable callables to be rejected.
+    with raises(BeartypeDecorWrappeeException):
+        beartype_all(_make_funcs(4) + [str])
@@ -0,0 +1,616 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype decorator configuration unit tests.**
+
+This submodule unit tests the :class:`beartype.BeartypeConf` class and the
+:func:`beartype.beartype` decorator when passed instances of that class.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.roar import BeartypeDecorHintPepDeprecatedWarning
+from beartype_test.util.mark.pytmark import ignore_warnings
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
+from pytest import raises
+
+# ....................{ TESTS ~ conf                      }....................
+def test_decor_conf() -> None:
+    '''
+    Test successful usage of the :class:`beartype.BeartypeConf` class.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf
+
+    # Assert this class to be self-caching.
+    assert BeartypeConf() is BeartypeConf()
+    assert BeartypeConf(sample_every=4) is BeartypeConf(sample_every=4)
+    assert BeartypeConf(sample_every=4) is not BeartypeConf(sample_every=5)
+
+    # Assert configurations to be hashable.
+    assert hash(BeartypeConf(sample_ratio=0.5)) == hash(
+        BeartypeConf(sample_ratio=0.5))
+
+    # Assert configurations to expose the expected read-only properties.
+    conf = BeartypeConf(sample_ratio=0.25)
+    assert conf.sample_every == 1
+    assert conf.sample_ratio == 0.25
+    assert conf.sample_ratio_bound == 1 << 30
+    assert conf.is_sampled is True
+    assert conf.is_check_kwargs_all is False
+    assert BeartypeConf(is_check_kwargs_all=True).is_check_kwargs_all is True
+    assert conf.is_check_fields is False
+    assert BeartypeConf(is_check_fields=True).is_check_fields is True
+    assert conf.is_proxy_iterators is False
+    assert BeartypeConf(is_proxy_iterators=True).is_proxy_iterators is True
+    assert conf.is_check_typevars is False
+    assert conf.is_check_typevar_bindings is False
+    assert BeartypeConf(
+        is_check_typevars=True,
+        is_check_typevar_bindings=True,
+    ).is_check_typevar_bindings is True
+    assert conf.is_lazy is False
+    assert BeartypeConf(is_lazy=True).is_lazy is True
+    assert BeartypeConf().is_sampled is False
+    with raises(AttributeError):
+        conf.sample_ratio = 0.5
+    assert 'sample_ratio=0.25' in repr(conf)
+
+
+def test_decor_conf_fail() -> None:
+    '''
+    Test unsuccessful usage of the :class:`beartype.BeartypeConf` class.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import BeartypeConfException
+
+    # Assert invalid sampling intervals to be rejected.
+    with raises(BeartypeConfException):
+        BeartypeConf(sample_every=0)
+    with raises(BeartypeConfException):
+        BeartypeConf(sample_every=True)
+    with raises(BeartypeConfException):
+        BeartypeConf(sample_every=2.0)
+
+    # Assert invalid sampling ratios to be rejected.
+    with raises(BeartypeConfException):
+        BeartypeConf(sample_ratio=0.0)
+    with raises(BeartypeConfException):
+        BeartypeConf(sample_ratio=1.5)
+
+    # Assert non-boolean variadic keyword checking flags to be rejected.
+    with raises(BeartypeConfException):
+        BeartypeConf(is_check_kwargs_all=1)
+    with raises(BeartypeConfException):
+        BeartypeConf(is_check_fields='True')
+    with raises(BeartypeConfException):
+        BeartypeConf(is_proxy_iterators=None)
+    with raises(BeartypeConfException):
+        BeartypeConf(is_check_typevars=0)
+    with raises(BeartypeConfException):
+        BeartypeConf(is_lazy='eventually')
+
+    # Assert type variable bindings to require type variable checking.
+    with raises(BeartypeConfException):
+        BeartypeConf(is_check_typevar_bindings=True)
+
+    # Assert mutually exclusive sampling strategies to be rejected.
+    with raises(BeartypeConfException):
+        BeartypeConf(sample_every=2, sample_ratio=0.5)
+
+    # Assert @beartype to reject non-configurations.
+    with raises(BeartypeConfException):
+        beartype(conf={'sample_every': 2})
+
+# ....................{ TESTS ~ sample                    }....................
+def test_decor_conf_sample_every() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed a configuration
+    type-checking only every ``N``-th call.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+
+    # Decorator type-checking only every third call.
+    beartype_every_3 = beartype(conf=BeartypeConf(sample_every=3))
+
+    # Assert this decorator to be memoized.
+    assert beartype_every_3 is beartype(conf=BeartypeConf(sample_every=3))
+
+    @beartype_every_3
+    def dance_of_the_reed(reed: str) -> str:
+        return reed
+
+    # Assert the first call to be type-checked.
+    with raises(BeartypeCallHintPepParamException):
+        dance_of_the_reed(0xBADBEEF)
+
+    # Assert the next two calls to be unchecked.
+    assert dance_of_the_reed(1) == 1
+    assert dance_of_the_reed(2) == 2
+
+    # Assert the next call to be type-checked.
+    with raises(BeartypeCallHintPepParamException):
+        dance_of_the_reed(3)
+
+    # Assert valid calls to remain valid regardless of sampling.
+    assert dance_of_the_reed('Inkling') == 'Inkling'
+
+    # Assert that separately decorated callables maintain separate counters.
+    @beartype_every_3
+    def dance_of_the_weed(weed: str) -> str:
+        return weed
+    with raises(BeartypeCallHintPepParamException):
+        dance_of_the_weed(0xFEEDFACE)
+
+    # Assert that unannotated and ignorable callables still reduce to noops.
+    def dance_of_the_seed(seed: object) -> object:
+        return seed
+    assert beartype_every_3(dance_of_the_seed) is dance_of_the_seed
+
+
+def test_decor_conf_sample_ratio() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed a configuration
+    type-checking only a pseudo-random fraction of calls.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import BeartypeCallHintPepReturnException
+
+    @beartype(conf=BeartypeConf(sample_ratio=0.5))
+    def sometimes_gray(item: object) -> str:
+        return item
+
+    # Number of calls whose return values were type-checked below.
+    checked_count = 0
+    for _ in range(400):
+        try:
+            sometimes_gray(42)
+        except BeartypeCallHintPepReturnException:
+            checked_count += 1
+
+    # Assert that roughly half of all calls were type-checked. Since this
+    # count is binomially distributed with mean 200 and standard deviation
+    # 10, these bounds are exceeded with negligible probability.
+    assert 100 < checked_count < 300
+
+# ....................{ TESTS ~ fields                    }....................
+# Since the "typing" hints subscripted below are deprecated by PEP 585 under
+# Python >= 3.9 but remain the only subscriptable container hints under older
+# Python versions, ignore the warnings emitted by type-checking these hints.
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+@skip_if_python_version_less_than('3.7.0')
+def test_decor_conf_check_fields() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed a configuration deeply
+    type-checking all annotated fields of records (i.e.,
+    :class:`typing.NamedTuple` subclasses and dataclasses).
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import (
+        BeartypeCallHintPepParamException,
+        BeartypeCallHintPepReturnException,
+    )
+    from beartype._decor._cache.cachefield import (
+        _TYPE_RECORD_TO_IS_FIELDS_VALID)
+    from beartype_test.a00_unit.data.data_record import Glade, Pipe
+    from dataclasses import dataclass
+    from typing import List, Optional
+
+    # Decorator deeply type-checking records.
+    beartype_fields = beartype(conf=BeartypeConf(is_check_fields=True))
+
+    @beartype_fields
+    def piper_at_the_gates(
+        glade: Glade, pipe: Optional[Pipe] = None) -> List[Glade]:
+        return [glade]
+
+    # Assert this callable to accept records whose fields are all valid.
+    glade = Glade('Pan', [Pipe('Otter', 7)], Glade('Island', []))
+    assert piper_at_the_gates(glade, Pipe('Mole', 3)) == [glade]
+
+    # Assert the fields validators of these records to have been cached.
+    assert Glade in _TYPE_RECORD_TO_IS_FIELDS_VALID
+    assert Pipe in _TYPE_RECORD_TO_IS_FIELDS_VALID
+
+    # Assert this callable to reject records whose fields are invalid, both
+    # directly and when nested in other records, containers, and unions.
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        piper_at_the_gates(Glade(b'Pan', []))
+    assert 'Glade field "name"' in str(exception_info.value)
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        piper_at_the_gates(Glade('Pan', [Pipe('Otter', 'seven')]))
+    assert 'Pipe field "notes"' in str(exception_info.value)
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        piper_at_the_gates(glade, Pipe(b'Mole', 3))
+    assert 'Pipe field "piper"' in str(exception_info.value)
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        piper_at_the_gates(
+            Glade('Pan', [], Glade('Island', [Pipe('Rat', None)])))
+    assert 'Glade field "beyond"' in str(exception_info.value)
+
+    # Assert this callable to accept self-referential records whose fields
+    # are all valid *AND* reject such records whose fields are invalid rather
+    # than recursing infinitely.
+    glade_cyclic = Glade('Pan', [Pipe('Otter', 7)])
+    glade_cyclic.beyond = glade_cyclic
+    assert piper_at_the_gates(glade_cyclic) == [glade_cyclic]
+    glade_cyclic.name = b'Pan'
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        piper_at_the_gates(glade_cyclic)
+    assert 'Glade field "name"' in str(exception_info.value)
+
+    # Dataclass subclassing a dataclass annotated above.
+    @dataclass
+    class Backwater(Glade):
+        reeds: int = 0
+
+    # Assert this callable to type-check all fields of records passed where a
+    # record superclass is expected, including fields declared only by the
+    # subclass.
+    backwater = Backwater('Pan', [], None, 7)
+    assert piper_at_the_gates(backwater) == [backwater]
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        piper_at_the_gates(Backwater('Pan', [], None, 'seven'))
+    assert 'Backwater field "reeds"' in str(exception_info.value)
+
+    # Assert this callable to reject returned records whose fields are
+    # invalid.
+    @beartype_fields
+    def dawn(glade: object) -> Glade:
+        return glade
+    with raises(BeartypeCallHintPepReturnException):
+        dawn(Glade('Pan', None))
+
+    # Assert the default configuration to only shallowly type-check records.
+    @beartype
+    def wind_in_the_willows(glade: Glade) -> Glade:
+        return glade
+    glade_invalid = Glade(0xBADF00D, None)
+    assert wind_in_the_willows(glade_invalid) is glade_invalid
+
+
+@skip_if_python_version_less_than('3.8.0')
+def test_decor_conf_check_fields_typeddict() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed a configuration deeply
+    type-checking all keys of `PEP 589`_-compliant typed dictionaries (i.e.,
+    :class:`typing.TypedDict` subclasses).
+
+    .. _PEP 589:
+        https://www.python.org/dev/peps/pep-0589
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._cache.cachetypeddict import typeddict_validators
+    from typing import TypedDict
+
+    class Reed(TypedDict):
+        piper: str
+        notes: int
+
+    @beartype(conf=BeartypeConf(is_check_fields=True))
+    def the_wild_wood(reed: Reed) -> Reed:
+        return reed
+
+    @beartype
+    def the_river_bank(reed: Reed) -> Reed:
+        return reed
+
+    # Assert both callables to accept dictionaries whose keys are all valid.
+    reed = {'piper': 'Pan', 'notes': 7}
+    assert the_wild_wood(reed) is reed
+    assert the_river_bank(reed) is reed
+
+    # Assert the validators of this typed dictionary to have been cached.
+    assert len([
+        validator_name
+        for validator_name in typeddict_validators
+        if validator_name.startswith(f'{Reed.__module__}.Reed')
+    ]) == 2
+
+    # Assert both callables to reject dictionaries missing required keys.
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        the_river_bank({'piper': 'Pan'})
+    assert "missing Reed required key(s) 'notes'" in str(
+        exception_info.value)
+
+    # Assert the former callable to reject dictionaries whose keys are invalid
+    # on every call.
+    reed_invalid = {'piper': 'Pan', 'notes': 'seven'}
+    for _ in range(16):
+        with raises(BeartypeCallHintPepParamException) as exception_info:
+            the_wild_wood(reed_invalid)
+        assert "Reed key 'notes'" in str(exception_info.value)
+
+    # Assert the latter callable to reject these dictionaries on only the
+    # subset of calls pseudo-randomly type-checking the invalid key. Since
+    # each call does so with probability 0.5, these bounds are exceeded with
+    # negligible probability.
+    checked_count = 0
+    for _ in range(400):
+        try:
+            the_river_bank(reed_invalid)
+        except BeartypeCallHintPepParamException:
+            checked_count += 1
+    assert 100 < checked_count < 300
+
+# ....................{ TESTS ~ iterators                 }....................
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_decor_conf_proxy_iterators() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed a configuration
+    proxying iterators annotated by iterator hints, lazily type-checking each
+    item of these iterators as that item is consumed.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import (
+        BeartypeCallHintPepParamException,
+        BeartypeCallHintPepReturnException,
+    )
+    from typing import Generator, Iterable, Iterator, List
+
+    # Decorator proxying iterators.
+    beartype_proxy = beartype(conf=BeartypeConf(is_proxy_iterators=True))
+
+    @beartype_proxy
+    def the_open_road(
+        lines: Iterator[str], *, tolls: Iterable[int] = ()) -> int:
+        return len(list(lines)) + sum(tolls)
+
+    # Assert this callable to accept iterators whose items are all valid,
+    # including iterators passed as optional keyword-only parameters.
+    assert the_open_road(iter(('Toad', 'Hall'))) == 2
+    assert the_open_road(iter(()), tolls=iter((1, 2))) == 3
+
+    # Assert this callable to reject iterators yielding invalid items on
+    # consuming those items.
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        the_open_road(iter(('Toad', b'Hall')))
+    assert 'Iterator[str] item "b\'Hall\'"' in str(exception_info.value)
+    with raises(BeartypeCallHintPepParamException):
+        the_open_road(iter(()), tolls=iter((1, 'two')))
+
+    # Assert this callable to pass reiterable iterables as is.
+    assert the_open_road(iter(()), tolls=[1, 2, 3]) == 6
+
+    @beartype_proxy
+    def the_wayfarers(caravans: Iterable[List[int]]) -> Iterable[List[int]]:
+        return caravans
+
+    # Assert this callable to preserve the identities of reiterable
+    # iterables, including empty sequences and unindexable containers whose
+    # items are *NOT* type-checked.
+    caravans = [[1], [2, 3]]
+    assert the_wayfarers(caravans) is caravans
+    assert the_wayfarers([]) == []
+    assert the_wayfarers({'Toad'}) == {'Toad'}
+
+    # Assert this callable to reject sequences whose pseudo-randomly sampled
+    # item violates the item hint, including violations nested in that item.
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        the_wayfarers([5])
+    assert 'Iterable[typing.List[int]] item "5"' in str(exception_info.value)
+    with raises(BeartypeCallHintPepParamException):
+        the_wayfarers([['a']])
+
+    @beartype_proxy
+    def mr_toad(motor_cars: int) -> Generator[List[int], None, None]:
+        for motor_car in range(motor_cars):
+            yield [motor_car]
+        yield ['poop-poop']
+
+    # Assert this callable to return a generator proxy type-checking each
+    # yielded item as that item is consumed *AND* preserving the generator
+    # API.
+    motor_cars = mr_toad(2)
+    assert isinstance(motor_cars, Generator)
+    assert next(motor_cars) == [0]
+    assert motor_cars.send(None) == [1]
+    with raises(BeartypeCallHintPepReturnException) as exception_info:
+        next(motor_cars)
+    assert "list item 0 value 'poop-poop'" in str(exception_info.value)
+
+    # Assert the default configuration to only shallowly type-check
+    # iterators, preserving their identities.
+    @beartype
+    def the_wild_wood(lines: Iterator[str]) -> Iterator[str]:
+        return lines
+    lines = iter((0xBADBEEF,))
+    assert the_wild_wood(lines) is lines
+
+# ....................{ TESTS ~ typevars                  }....................
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_decor_conf_check_typevars() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed a configuration
+    type-checking the bounds, constraints, and per-call bindings of type
+    variables.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype
+    from beartype.roar import (
+        BeartypeCallHintPepParamException,
+        BeartypeCallHintPepReturnException,
+    )
+    from typing import List, TypeVar
+
+    # Type variables bounded, constrained, and neither.
+    Pond = TypeVar('Pond')
+    Rat = TypeVar('Rat', bound=int)
+    Mole = TypeVar('Mole', str, bytes)
+
+    # Assert the default configuration to reduce type variables to their
+    # bounds *WITHOUT* enforcing these bounds.
+    @beartype
+    def the_river_bank(rat: Rat) -> Rat:
+        return rat
+    assert the_river_bank('Ratty') == 'Ratty'
+
+    # Decorator type-checking type variable bounds and constraints.
+    beartype_bounds = beartype(conf=BeartypeConf(is_check_typevars=True))
+
+    @beartype_bounds
+    def messing_about(rat: Rat, moles: List[Mole], pond: Pond) -> Rat:
+        return rat
+
+    # Assert this callable to accept objects satisfying these bounds and
+    # constraints.
+    assert messing_about(1, ['Mole', b'Mole'], 'Toad') == 1
+
+    # Assert this callable to reject objects violating these bounds and
+    # constraints.
+    with raises(BeartypeCallHintPepParamException):
+        messing_about('Ratty', ['Mole'], 'Toad')
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        messing_about(1, [0xBADBEEF], 'Toad')
+    assert 'list item 0' in str(exception_info.value)
+
+    # Decorator additionally type-checking type variable bindings.
+    beartype_bindings = beartype(conf=BeartypeConf(
+        is_check_typevars=True, is_check_typevar_bindings=True))
+
+    @beartype_bindings
+    def the_open_river(upstream: Pond, downstream: Pond = None) -> Pond:
+        return b'Badger' if upstream == 'Otter' else upstream
+
+    # Assert this callable to accept parameters of the same type, including
+    # when omitting optional parameters.
+    assert the_open_river(1, 2) == 1
+    assert the_open_river(b'Portly') == b'Portly'
+
+    # Assert this callable to reject parameters of differing types.
+    with raises(BeartypeCallHintPepParamException) as exception_info:
+        the_open_river(1, 'Portly')
+    assert 'type variable ~Pond bound to int' in str(exception_info.value)
+    with raises(BeartypeCallHintPepParamException):
+        the_open_river(True, 1)
+
+    # Assert this callable to reject returns of differing types.
+    with raises(BeartypeCallHintPepReturnException):
+        the_open_river('Otter')
+
+
+# ....................{ TESTS ~ lazy                      }....................
+def test_decor_conf_lazy() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed a configuration
+    deferring decoration to the first call of each decorated callable.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeConf, beartype, beartype_all
+    from beartype.roar import (
+        BeartypeCallHintPepParamException,
+        BeartypeDecorHintPep563Exception,
+        BeartypeDecorWrappeeException,
+    )
+    from sys import modules as sys_modules
+    from types import ModuleType
+
+    # Source code of a module declaring lazily decorated callables annotated
+    # by postponed hints referring to a class declared after these callables.
+    MODULE_CODE = (
+        'from __future__ import annotations\n'
+        'from beartype import BeartypeConf, beartype\n'
+        'beartype_lazy = beartype(conf=BeartypeConf(is_lazy=True))\n'
+        '@beartype_lazy\n'
+        'def she_dwelt(among: Untrodden) -> Untrodden:\n'
+        '    return among\n'
+        '@beartype_lazy\n'
+        'def beside_the_springs(of: Dove) -> Dove:\n'
+        '    return of\n'
+        'class Untrodden(object):\n'
+        '    @beartype_lazy\n'
+        '    def ways(self, maid: str) -> str:\n'
+        '        return maid\n'
+        '    @staticmethod\n'
+        '    @beartype_lazy\n'
+        '    def whom(there: int) -> int:\n'
+        '        return there\n'
+    )
+
+    # Module declaring these callables, registered with "sys.modules" so as
+    # to be found by the trampolines rebinding these callables.
+    module_name = 'beartype_test._she_dwelt_among_the_untrodden_ways'
+    module = ModuleType(module_name)
+    sys_modules[module_name] = module
+
+    try:
+        exec(MODULE_CODE, module.__dict__)
+
+        # Trampolines and descriptors declared by this module.
+        she_dwelt = module.she_dwelt
+        ways = module.Untrodden.__dict__['ways']
+        whom = module.Untrodden.__dict__['whom']
+
+        # Assert these trampolines to masquerade as these callables.
+        assert she_dwelt.__name__ == 'she_dwelt'
+        assert isinstance(she_dwelt.__annotations__['among'], str)
+
+        # Assert the first call of a trampoline to resolve postponed hints
+        # referring to a class declared after that callable, rebinding the
+        # module attribute declaring that callable to a wrapper.
+        untrodden = module.Untrodden()
+        assert she_dwelt(untrodden) is untrodden
+        assert module.she_dwelt is not she_dwelt
+        assert she_dwelt.__annotations__['among'] is module.Untrodden
+
+        # Assert both this trampoline and this wrapper to type-check calls.
+        with raises(BeartypeCallHintPepParamException):
+            she_dwelt('A Maid whom there were none to praise')
+        with raises(BeartypeCallHintPepParamException):
+            module.she_dwelt('And very few to love')
+
+        # Assert trampolines of methods to rebind their class attributes.
+        assert untrodden.ways('A violet') == 'A violet'
+        assert module.Untrodden.__dict__['ways'] is not ways
+        with raises(BeartypeCallHintPepParamException):
+            untrodden.ways(0xBEEF)
+
+        # Assert trampolines wrapped by other decorators to preserve these
+        # decorators as is.
+        assert module.Untrodden.whom(1) == 1
+        assert module.Untrodden.__dict__['whom'] is whom
+        with raises(BeartypeCallHintPepParamException):
+            module.Untrodden.whom('by a mossy stone')
+
+        # Assert exceptions raised by decoration to be deferred to the first
+        # call of a trampoline.
+        with raises(BeartypeDecorHintPep563Exception):
+            module.beside_the_springs(untrodden)
+    finally:
+        del sys_modules[module_name]
+
+    # Configuration deferring decoration.
+    conf = BeartypeConf(is_lazy=True)
+
+    # Assert callables requiring *NO* type-checking to be returned as is.
+    def half_hidden(from_the_eye): pass
+    assert beartype(half_hidden, conf=conf) is half_hidden
+    assert beartype_all((half_hidden,), conf=conf) == [half_hidden]
+
+    # Assert uncallables to still be rejected at decoration time.
+    with raises(BeartypeDecorWrappeeException):
+        beartype('Fair as a star, when only one', conf=conf)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2021 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype decorator thread safety unit tests.**
+
+This submodule unit tests the :func:`beartype.beartype` decorator when
+concurrently called from multiple threads.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.roar import BeartypeDecorHintPepDeprecatedWarning
+from beartype_test.util.mark.pytmark import ignore_warnings
+from pytest import raises
+
+# ....................{ TESTS                             }....................
+# Since the "typing" hints subscripted below are deprecated by PEP 585 under
+# Python >= 3.9 but remain the only subscriptable container hints under older
+# Python versions, ignore the warnings emitted by decorating callables
+# annotated by these hints.
+
+@ignore_warnings(BeartypeDecorHintPepDeprecatedWarning)
+def test_decor_thread_stress() -> None:
+    '''
+    Stress test the :func:`beartype.beartype` decorator by concurrently
+    decorating and calling callables from 32 threads released at once.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from threading import Barrier, Thread
+    from typing import List, Tuple, Union
+
+    # Number of threads to concurrently decorate from.
+    THREADS_LEN = 32
+
+    # Number of callables decorated by each thread.
+    DECORATIONS_LEN = 50
+
+    # Barrier releasing all threads at once, maximizing contention.
+    barrier = Barrier(THREADS_LEN)
+
+    # List of all exceptions unexpectedly raised by these threads.
+    exceptions = []
+
+    def decorate_concurrently(thread_index: int) -> None:
+        '''
+        Repeatedly decorate and call callables annotated by hints shared
+        between all threads, nested to a depth depending on the passed thread
+        index.
+        '''
+
+        try:
+            barrier.wait()
+
+            for decoration_index in range(DECORATIONS_LEN):
+                # Hint unique to this iteration but shared between all
+                # threads, racing these threads to generate and memoize code
+                # type-checking this hint.
+                hint_unique = List[Union[
+                    str, Tuple[(int,)*(decoration_index + 1)]]]
+                if (thread_index + decoration_index) % 2:
+                    hint_unique = List[hint_unique]
+
+                # Valid pith satisfying this hint.
+                pith_good = [(thread_index,)*(decoration_index + 1)]
+                if (thread_index + decoration_index) % 2:
+                    pith_good = [pith_good]
+
+                @beartype
+                def sunset(
+                    twilight: hint_unique, dusk: Union[int, str]) -> str:
+                    return str(dusk)
+
+                # Assert this wrapper to accept valid parameters.
+                assert sunset(pith_good, thread_index) == str(thread_index)
+
+                # Assert this wrapper to reject invalid parameters.
+                with raises(BeartypeCallHintPepParamException):
+                    sunset([], b'evening')
+                with raises(BeartypeCallHintPepParamException):
+                    sunset([[b'evening']], thread_index)
+        except BaseException as exception:
+            exceptions.append(exception)
+
+    # Start all threads and then wait for all threads to finish.
+    threads = [
+        Thread(target=decorate_concurrently, args=(thread_index,))
+        for thread_index in range(THREADS_LEN)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert that no thread raised an exception.
+    assert not exceptions, exceptions
@@ -18,14 +18,13 @@ and warnings emitted by unit and functional tests and fixtures.
 # than merely "from argparse import ArgumentParser").
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-from abc import ABCMeta as _ABCMeta
 from beartype.roar import BeartypeException
 
 # See the "beartype.cave" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
 # ....................{ SUPERCLASS                        }....................
-class BeartypeTestException(BeartypeException, metaclass=_ABCMeta):
+class BeartypeTestException(BeartypeException):
     '''
     Abstract base class of all **beartype test exceptions.**
 